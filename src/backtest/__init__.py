@@ -1,5 +1,13 @@
 """Backtesting engine for historical strategy replay."""
 
 from src.backtest.engine import BacktestConfig, BacktestEngine, BacktestResult
+from src.backtest.sweep import BacktestSweepRunner, SweepResult, expand_grid
 
-__all__ = ["BacktestConfig", "BacktestEngine", "BacktestResult"]
+__all__ = [
+    "BacktestConfig",
+    "BacktestEngine",
+    "BacktestResult",
+    "BacktestSweepRunner",
+    "SweepResult",
+    "expand_grid",
+]
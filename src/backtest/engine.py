@@ -208,25 +208,11 @@ class BacktestEngine:
             Number of candles processed.
         """
         count = 0
-
-        # Collect all remaining candles across symbols/intervals
-        # and replay in chronological order
-        replay_queue: List[Candle] = []
-
-        for symbol, intervals in self._data_provider._data.items():
-            for interval, candles in intervals.items():
-                skip = self._data_provider._init_counts.get(symbol, {}).get(
-                    interval, 0
-                )
-                replay_queue.extend(candles[skip:])
-
-        # Sort by close_time for chronological replay
-        replay_queue.sort(key=lambda c: c.close_time)
-
-        total = len(replay_queue)
+        total = self._data_provider.remaining_count()
         self.logger.info("Replaying %d candles...", total)
 
-        for candle in replay_queue:
+        # Lazy k-way merge of the per-series lists in close_time order
+        for candle in self._data_provider.iter_chronological():
             await self._process_candle(candle)
             count += 1
             self._candle_index += 1
@@ -298,15 +284,16 @@ class BacktestEngine:
             return
 
         # Check at low price first (catches SL for longs)
-        filled_at_low = self._exchange.check_pending_orders(symbol, candle.low)
-        if filled_at_low:
-            self._record_tp_sl_fill(symbol, filled_at_low, candle)
-            return  # Position closed
-
-        # Check at high price (catches TP for longs, SL for shorts)
-        filled_at_high = self._exchange.check_pending_orders(symbol, candle.high)
-        if filled_at_high:
-            self._record_tp_sl_fill(symbol, filled_at_high, candle)
+        filled = self._exchange.check_pending_orders(symbol, candle.low)
+        if not filled:
+            # Check at high price (catches TP for longs, SL for shorts)
+            filled = self._exchange.check_pending_orders(symbol, candle.high)
+
+        if filled:
+            self._record_tp_sl_fill(symbol, filled, candle)
+            # Position closed: drop the leftover TP/SL leg so it cannot fire
+            # against the next position on this symbol
+            self._exchange.cancel_all_orders(symbol)
 
     def _record_tp_sl_fill(
         self, symbol: str, filled_orders: List, candle: Candle
@@ -0,0 +1,322 @@
+"""Parallel parameter sweeps over BacktestEngine.
+
+Expands a parameter grid (ICT profile, displacement_ratio,
+fvg_min_gap_percent, exit strategy, ...) into independent backtest runs and
+fans them out over a ProcessPoolExecutor.
+
+- Candle data is loaded once per worker process (pool initializer) and
+  shared read-only by every run that worker executes.
+- Each run builds fresh strategies, so runs never share state.
+- Every run returns a flat metrics row; rows are collected into one table.
+
+Grid keys are routed by name: ExitConfig fields (exit_strategy,
+trailing_distance, ...) go to the exit config, BacktestConfig fields
+(leverage, risk_per_trade, ...) to the backtest config, and everything else
+(active_profile, displacement_ratio, fvg_min_gap_percent, ...) to the
+strategy config.
+
+Usage:
+    runner = BacktestSweepRunner(
+        csv_paths={"BTCUSDT": {"1m": "btc_1m.csv", "5m": "btc_5m.csv"}},
+        base_strategy_config={"ltf_interval": "1m", "mtf_interval": "5m"},
+        max_workers=32,
+    )
+    sweep = runner.run({
+        "active_profile": ["strict", "balanced", "relaxed"],
+        "displacement_ratio": [1.2, 1.5, 2.0],
+        "exit_strategy": ["trailing_stop", "breakeven"],
+    })
+    for row in sweep.sorted_by("total_pnl")[:10]:
+        print(row)
+"""
+
+import asyncio
+import csv
+import itertools
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field, fields
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from src.backtest.engine import BacktestConfig, BacktestEngine, BacktestResult
+from src.data.historical import HistoricalDataProvider
+from src.models.candle import Candle
+from src.strategies.base import BaseStrategy
+from src.utils.config_manager import ExitConfig
+
+CandleData = Dict[str, Dict[str, List[Candle]]]
+CsvPaths = Dict[str, Dict[str, str]]
+ParamGrid = Mapping[str, Sequence[Any]]
+
+_EXIT_KEYS = frozenset(f.name for f in fields(ExitConfig))
+_BACKTEST_KEYS = frozenset(f.name for f in fields(BacktestConfig))
+
+METRIC_COLUMNS: Tuple[str, ...] = (
+    "total_trades",
+    "winning_trades",
+    "losing_trades",
+    "win_rate",
+    "total_pnl",
+    "total_fees",
+    "return_pct",
+    "profit_factor",
+    "max_drawdown",
+    "final_balance",
+    "candles_processed",
+    "elapsed_seconds",
+)
+
+
+def expand_grid(grid: ParamGrid) -> List[Dict[str, Any]]:
+    """Cartesian product of a parameter grid, in key order.
+
+    An empty grid yields a single run with no overrides.
+    """
+    keys = list(grid)
+    return [dict(zip(keys, values)) for values in itertools.product(*(grid[k] for k in keys))]
+
+
+def split_params(
+    params: Mapping[str, Any],
+) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+    """Route run parameters to (strategy, exit, backtest) config overrides."""
+    strategy: Dict[str, Any] = {}
+    exit_: Dict[str, Any] = {}
+    backtest: Dict[str, Any] = {}
+    for key, value in params.items():
+        if key in _EXIT_KEYS:
+            exit_[key] = value
+        elif key in _BACKTEST_KEYS:
+            backtest[key] = value
+        else:
+            strategy[key] = value
+    return strategy, exit_, backtest
+
+
+def summarize_result(result: BacktestResult) -> Dict[str, Any]:
+    """Flatten BacktestResult into the metric columns of a sweep row."""
+    return {name: getattr(result, name) for name in METRIC_COLUMNS}
+
+
+@dataclass(frozen=True)
+class SweepTask:
+    """Picklable description of one sweep run."""
+
+    run_id: int
+    params: Dict[str, Any]
+    strategy_name: str
+    base_strategy_config: Dict[str, Any]
+    base_exit_config: Dict[str, Any]
+    base_backtest_config: Dict[str, Any]
+
+
+@dataclass
+class SweepResult:
+    """Aggregated sweep output: one row per successful run."""
+
+    rows: List[Dict[str, Any]] = field(default_factory=list)
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    def sorted_by(self, metric: str, descending: bool = True) -> List[Dict[str, Any]]:
+        """Rows ordered by a metric column."""
+        return sorted(self.rows, key=lambda row: row[metric], reverse=descending)
+
+    def best(self, metric: str = "total_pnl") -> Optional[Dict[str, Any]]:
+        """Row with the highest value of ``metric`` (None if no runs succeeded)."""
+        return max(self.rows, key=lambda row: row[metric]) if self.rows else None
+
+    def to_dataframe(self):
+        """Rows as a pandas DataFrame (one column per parameter and metric)."""
+        import pandas as pd
+
+        return pd.DataFrame(self.rows)
+
+    def to_csv(self, path: str) -> None:
+        """Write rows to CSV (parameter columns first, then metrics)."""
+        columns: List[str] = []
+        for row in self.rows:
+            for key in row:
+                if key not in columns:
+                    columns.append(key)
+        with open(path, "w", newline="", encoding="utf-8") as fh:
+            writer = csv.DictWriter(fh, fieldnames=columns)
+            writer.writeheader()
+            writer.writerows(self.rows)
+
+
+# ----------------------------------------------------------------------
+# Worker side
+# ----------------------------------------------------------------------
+
+# Candle data loaded once per worker process by _init_worker
+_WORKER_DATA: Optional[CandleData] = None
+
+
+def _init_worker(candle_data: Optional[CandleData], csv_paths: Optional[CsvPaths]) -> None:
+    """Pool initializer: load candle data once for every run in this process."""
+    global _WORKER_DATA
+    if csv_paths is not None:
+        _WORKER_DATA = HistoricalDataProvider.load_csv_data(csv_paths)
+    else:
+        _WORKER_DATA = candle_data
+
+
+def build_strategies(
+    symbols: Sequence[str],
+    strategy_name: str,
+    strategy_config: Dict[str, Any],
+    exit_config: ExitConfig,
+) -> Dict[str, BaseStrategy]:
+    """Fresh ComposableStrategy per symbol from a registered strategy builder."""
+    from src.strategies import StrategyFactory
+    from src.strategies.module_config_builder import build_module_config
+
+    strategies: Dict[str, BaseStrategy] = {}
+    for symbol in symbols:
+        module_config, intervals, min_rr_ratio = build_module_config(
+            strategy_name, strategy_config, exit_config
+        )
+        strategies[symbol] = StrategyFactory.create_composed(
+            symbol=symbol,
+            config=strategy_config,
+            module_config=module_config,
+            intervals=intervals,
+            min_rr_ratio=min_rr_ratio,
+        )
+    return strategies
+
+
+def execute_task(task: SweepTask, candle_data: CandleData) -> Dict[str, Any]:
+    """Run one backtest configuration and return its metrics row."""
+    strategy_overrides, exit_overrides, backtest_overrides = split_params(task.params)
+    strategy_config = {**task.base_strategy_config, **strategy_overrides}
+    exit_config = ExitConfig(**{**task.base_exit_config, **exit_overrides})
+    backtest_config = BacktestConfig(**{**task.base_backtest_config, **backtest_overrides})
+
+    strategies = build_strategies(
+        list(candle_data), task.strategy_name, strategy_config, exit_config
+    )
+    engine = BacktestEngine(strategies, HistoricalDataProvider(candle_data), backtest_config)
+    result = asyncio.run(engine.run())
+
+    return {"run_id": task.run_id, **task.params, **summarize_result(result)}
+
+
+def _run_in_worker(task: SweepTask) -> Dict[str, Any]:
+    """ProcessPoolExecutor entry point (uses the per-worker candle data)."""
+    if _WORKER_DATA is None:
+        raise RuntimeError("Sweep worker used without initializer")
+    return execute_task(task, _WORKER_DATA)
+
+
+# ----------------------------------------------------------------------
+# Runner
+# ----------------------------------------------------------------------
+
+
+class BacktestSweepRunner:
+    """Fans a parameter grid out over worker processes.
+
+    Args:
+        candle_data: In-memory ``{symbol: {interval: [candles]}}`` (sent once
+            to each worker). Mutually exclusive with ``csv_paths``.
+        csv_paths: ``{symbol: {interval: path}}``; each worker loads the CSVs
+            itself, so nothing large crosses the process boundary.
+        strategy_name: Registered strategy builder (default: ict_strategy).
+        base_strategy_config: Strategy config shared by all runs.
+        base_exit_config: ExitConfig fields shared by all runs.
+        backtest_config: BacktestConfig shared by all runs.
+        max_workers: Worker processes (default: os.cpu_count()). 1 runs
+            serially in-process, which is handy for debugging.
+    """
+
+    def __init__(
+        self,
+        candle_data: Optional[CandleData] = None,
+        csv_paths: Optional[CsvPaths] = None,
+        strategy_name: str = "ict_strategy",
+        base_strategy_config: Optional[Dict[str, Any]] = None,
+        base_exit_config: Optional[Dict[str, Any]] = None,
+        backtest_config: Optional[BacktestConfig] = None,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        if (candle_data is None) == (csv_paths is None):
+            raise ValueError("Provide exactly one of candle_data or csv_paths")
+
+        self._candle_data = candle_data
+        self._csv_paths = csv_paths
+        self.strategy_name = strategy_name
+        self.base_strategy_config = {"buffer_size": 100, **(base_strategy_config or {})}
+        self.base_exit_config = dict(base_exit_config or {})
+        self.backtest_config = backtest_config or BacktestConfig()
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.logger = logging.getLogger(__name__)
+
+    def build_tasks(self, grid: ParamGrid) -> List[SweepTask]:
+        """One SweepTask per grid combination."""
+        base_backtest = asdict(self.backtest_config)
+        return [
+            SweepTask(
+                run_id=run_id,
+                params=params,
+                strategy_name=self.strategy_name,
+                base_strategy_config=self.base_strategy_config,
+                base_exit_config=self.base_exit_config,
+                base_backtest_config=base_backtest,
+            )
+            for run_id, params in enumerate(expand_grid(grid))
+        ]
+
+    def run(self, grid: ParamGrid) -> SweepResult:
+        """Execute every grid combination and aggregate the metrics.
+
+        Failed runs are logged and reported in ``SweepResult.errors``; they
+        do not abort the sweep.
+        """
+        tasks = self.build_tasks(grid)
+        start = time.monotonic()
+        workers = min(self.max_workers, len(tasks))
+        self.logger.info("Starting sweep: %d runs on %d worker(s)", len(tasks), workers)
+
+        sweep = SweepResult()
+        if workers <= 1:
+            candle_data = self._candle_data
+            if candle_data is None:
+                candle_data = HistoricalDataProvider.load_csv_data(self._csv_paths)
+            for task in tasks:
+                try:
+                    sweep.rows.append(execute_task(task, candle_data))
+                except Exception as e:
+                    self._record_error(sweep, task, e)
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(self._candle_data, self._csv_paths),
+            ) as executor:
+                futures = {executor.submit(_run_in_worker, task): task for task in tasks}
+                for done, future in enumerate(as_completed(futures), start=1):
+                    task = futures[future]
+                    try:
+                        sweep.rows.append(future.result())
+                    except Exception as e:
+                        self._record_error(sweep, task, e)
+                    self.logger.info("Sweep progress: %d/%d runs", done, len(tasks))
+
+        sweep.rows.sort(key=lambda row: row["run_id"])
+        sweep.errors.sort(key=lambda row: row["run_id"])
+        sweep.elapsed_seconds = time.monotonic() - start
+        self.logger.info(
+            "Sweep complete: %d ok, %d failed, %.2fs",
+            len(sweep.rows),
+            len(sweep.errors),
+            sweep.elapsed_seconds,
+        )
+        return sweep
+
+    def _record_error(self, sweep: SweepResult, task: SweepTask, error: Exception) -> None:
+        self.logger.warning("Sweep run %d failed (%s): %s", task.run_id, task.params, error)
+        sweep.errors.append({"run_id": task.run_id, **task.params, "error": repr(error)})
@@ -0,0 +1,270 @@
+"""
+Non-blocking Binance Futures REST client on a pooled aiohttp session.
+
+The synchronous BinanceServiceClient (requests-based UMFutures) blocks the
+event loop for a full round-trip per call. AsyncBinanceClient signs and sends
+the same requests over one keep-alive ``aiohttp.ClientSession``, so order
+placement for one symbol never stalls candle processing for another.
+
+Errors are raised as the connector's ``ClientError``/``ServerError`` so the
+existing error handling and retry classification apply unchanged.
+"""
+
+import hashlib
+import hmac
+import json
+import logging
+import time
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlencode
+
+import aiohttp
+from binance.error import ClientError, ServerError
+
+from src.core.binance_service import BinanceServiceClient, RequestWeightTracker
+
+
+class AsyncBinanceClient:
+    """
+    Async counterpart of BinanceServiceClient for the order hot path.
+
+    Args:
+        api_key: Binance API key
+        api_secret: Binance API secret (HMAC-SHA256 signing)
+        is_testnet: Whether to use testnet (default: True)
+        base_url: Optional custom REST API base URL
+        weight_tracker: Tracker fed from ``X-MBX-USED-WEIGHT-1M`` headers.
+            Pass the BinanceServiceClient's tracker to share one budget.
+        timeout: Total per-request timeout in seconds
+        pool_size: Maximum concurrent connections in the session pool
+        recv_window: ``recvWindow`` sent with signed requests (ms)
+
+    The session is created lazily on first use (it must be bound to the
+    running loop) and released by ``close()``.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        api_secret: str,
+        is_testnet: bool = True,
+        base_url: Optional[str] = None,
+        weight_tracker: Optional[RequestWeightTracker] = None,
+        timeout: float = 10.0,
+        pool_size: int = 32,
+        recv_window: int = 5000,
+    ) -> None:
+        self.api_key = api_key
+        self._secret = api_secret.encode("utf-8")
+        if base_url:
+            self.base_url = base_url.rstrip("/")
+        else:
+            self.base_url = (
+                BinanceServiceClient.DEFAULT_TESTNET_URL
+                if is_testnet
+                else BinanceServiceClient.DEFAULT_MAINNET_URL
+            )
+
+        self.weight_tracker = weight_tracker or RequestWeightTracker()
+        self._timeout = aiohttp.ClientTimeout(total=timeout)
+        self._pool_size = pool_size
+        self._recv_window = recv_window
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        self.logger = logging.getLogger(__name__)
+
+    @classmethod
+    def from_service(cls, service: BinanceServiceClient, **kwargs: Any) -> "AsyncBinanceClient":
+        """Build with the credentials, endpoint and weight tracker of a sync client."""
+        return cls(
+            api_key=service.api_key,
+            api_secret=service.api_secret,
+            is_testnet=service.is_testnet,
+            base_url=service.base_url,
+            weight_tracker=service.weight_tracker,
+            **kwargs,
+        )
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self._pool_size, keepalive_timeout=60)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=self._timeout,
+                headers={"X-MBX-APIKEY": self.api_key},
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the pooled session (idempotent)."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    # Request plumbing
+
+    @staticmethod
+    def _encode(payload: Dict[str, Any]) -> str:
+        """URL-encode payload the way the connector does (None dropped, bools lowercase)."""
+        params = {}
+        for key, value in payload.items():
+            if value is None:
+                continue
+            if isinstance(value, bool):
+                value = "true" if value else "false"
+            params[key] = value
+        return urlencode(params, True).replace("%40", "@")
+
+    def _sign(self, query_string: str) -> str:
+        return hmac.new(self._secret, query_string.encode("utf-8"), hashlib.sha256).hexdigest()
+
+    async def sign_request(
+        self, http_method: str, url_path: str, payload: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """
+        Send a SIGNED (HMAC-SHA256) request.
+
+        ``timestamp`` and ``recvWindow`` are added, the query string is signed
+        and the signature appended, matching the connector's wire format.
+        """
+        params = dict(payload or {})
+        params.setdefault("recvWindow", self._recv_window)
+        params["timestamp"] = int(time.time() * 1000)
+        query_string = self._encode(params)
+        query_string = f"{query_string}&signature={self._sign(query_string)}"
+        return await self._request(http_method, url_path, query_string)
+
+    async def send_request(
+        self, http_method: str, url_path: str, payload: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """Send an unsigned (market data) request."""
+        return await self._request(http_method, url_path, self._encode(payload or {}))
+
+    async def _request(self, http_method: str, url_path: str, query_string: str) -> Any:
+        session = await self._get_session()
+        url = f"{self.base_url}{url_path}"
+        if query_string:
+            url = f"{url}?{query_string}"
+
+        async with session.request(http_method, url) as response:
+            self.weight_tracker.update_from_headers(dict(response.headers))
+            text = await response.text()
+            status = response.status
+
+            if status >= 500:
+                raise ServerError(status, text)
+            if status >= 400:
+                try:
+                    err = json.loads(text)
+                except ValueError:
+                    raise ClientError(status, None, text, dict(response.headers))
+                raise ClientError(status, err.get("code"), err.get("msg"), dict(response.headers))
+
+        try:
+            return json.loads(text)
+        except ValueError:
+            return text
+
+    # Account / order endpoints (same names and parameters as UMFutures)
+
+    async def new_order(self, symbol: str, side: str, type: str, **kwargs: Any) -> Dict[str, Any]:
+        """POST /fapi/v1/order"""
+        payload = {"symbol": symbol, "side": side, "type": type, **kwargs}
+        return await self.sign_request("POST", "/fapi/v1/order", payload)
+
+    async def cancel_order(self, symbol: str, **kwargs: Any) -> Dict[str, Any]:
+        """DELETE /fapi/v1/order"""
+        return await self.sign_request("DELETE", "/fapi/v1/order", {"symbol": symbol, **kwargs})
+
+    async def cancel_open_orders(self, symbol: str, **kwargs: Any) -> Any:
+        """DELETE /fapi/v1/allOpenOrders"""
+        payload = {"symbol": symbol, **kwargs}
+        return await self.sign_request("DELETE", "/fapi/v1/allOpenOrders", payload)
+
+    async def get_orders(self, **kwargs: Any) -> List[Dict[str, Any]]:
+        """GET /fapi/v1/openOrders"""
+        return await self.sign_request("GET", "/fapi/v1/openOrders", kwargs)
+
+    async def account(self, **kwargs: Any) -> Dict[str, Any]:
+        """GET /fapi/v3/account"""
+        return await self.sign_request("GET", "/fapi/v3/account", kwargs)
+
+    async def get_position_risk(self, **kwargs: Any) -> List[Dict[str, Any]]:
+        """GET /fapi/v3/positionRisk"""
+        return await self.sign_request("GET", "/fapi/v3/positionRisk", kwargs)
+
+    async def change_leverage(self, symbol: str, leverage: int, **kwargs: Any) -> Dict[str, Any]:
+        """POST /fapi/v1/leverage"""
+        payload = {"symbol": symbol, "leverage": leverage, **kwargs}
+        return await self.sign_request("POST", "/fapi/v1/leverage", payload)
+
+    async def change_margin_type(
+        self, symbol: str, marginType: str, **kwargs: Any
+    ) -> Dict[str, Any]:
+        """POST /fapi/v1/marginType"""
+        payload = {"symbol": symbol, "marginType": marginType, **kwargs}
+        return await self.sign_request("POST", "/fapi/v1/marginType", payload)
+
+    async def exchange_info(self) -> Dict[str, Any]:
+        """GET /fapi/v1/exchangeInfo"""
+        return await self.send_request("GET", "/fapi/v1/exchangeInfo")
+
+    async def get_mark_price(self, symbol: str) -> float:
+        """GET /fapi/v1/premiumIndex, returning the mark price as float."""
+        data = await self.send_request("GET", "/fapi/v1/premiumIndex", {"symbol": symbol})
+        return float(data.get("markPrice", 0))
+
+    # Algo order endpoints (conditional TP/SL orders)
+
+    async def new_algo_order(
+        self, symbol: str, side: str, type: str, **kwargs: Any
+    ) -> Dict[str, Any]:
+        """POST /fapi/v1/algoOrder (see BinanceServiceClient.new_algo_order)."""
+        payload = {"algoType": "CONDITIONAL", "symbol": symbol, "side": side, "type": type}
+        payload.update(kwargs)
+        return await self.sign_request("POST", "/fapi/v1/algoOrder", payload)
+
+    async def query_open_algo_orders(self, symbol: Optional[str] = None) -> list:
+        """GET /fapi/v1/openAlgoOrders"""
+        payload = {"symbol": symbol} if symbol else {}
+        return await self.sign_request("GET", "/fapi/v1/openAlgoOrders", payload)
+
+    async def cancel_algo_order(self, symbol: str, algo_id: int) -> Dict[str, Any]:
+        """DELETE /fapi/v1/algoOrder"""
+        payload = {"symbol": symbol, "algoId": algo_id}
+        return await self.sign_request("DELETE", "/fapi/v1/algoOrder", payload)
+
+    async def cancel_all_algo_orders(self, symbol: str) -> list:
+        """Cancel every open algo order for a symbol, one request per order."""
+        return await self.cancel_algo_orders_by_type(symbol, None)
+
+    async def cancel_algo_orders_by_type(
+        self, symbol: str, order_types: Optional[List[str]]
+    ) -> list:
+        """
+        Cancel open algo orders whose ``orderType`` is in ``order_types``.
+
+        Args:
+            symbol: Trading pair symbol
+            order_types: Types to cancel (e.g. ["STOP", "STOP_MARKET"]);
+                None cancels all
+
+        Returns:
+            List of cancellation results
+        """
+        open_orders = await self.query_open_algo_orders(symbol)
+        if not open_orders:
+            return []
+
+        results = []
+        for order in open_orders:
+            algo_id = order.get("algoId")
+            if not algo_id:
+                continue
+            if order_types is not None and order.get("orderType", "") not in order_types:
+                continue
+            try:
+                results.append(await self.cancel_algo_order(symbol, algo_id))
+            except Exception as e:
+                self.logger.warning(f"Failed to cancel algo order {algo_id}: {e}")
+        return results
@@ -0,0 +1,199 @@
+"""Concurrent, rate-limit-aware historical backfill.
+
+BackfillScheduler fans kline requests for many (symbol, interval) pairs out
+over a bounded thread pool, so the blocking REST client never runs on the
+event loop. Before each request it checks the shared RequestWeightTracker
+(fed from Binance ``X-MBX-USED-WEIGHT-1M`` headers) plus the weight of
+requests still in flight. When the next request would exceed the budget it
+waits for the 1-minute weight window to roll over. Results are handed to
+``on_result`` on the event loop as each request completes, so strategies
+start warming up while later requests are still running.
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+from src.core.binance_service import RequestWeightTracker
+from src.models.candle import Candle
+
+FetchFn = Callable[..., List[Candle]]
+ResultFn = Callable[["BackfillJob", List[Candle]], None]
+
+
+def kline_request_weight(limit: int) -> int:
+    """Binance USDⓈ-M ``GET /fapi/v1/klines`` request weight for ``limit``."""
+    if limit < 100:
+        return 1
+    if limit < 500:
+        return 2
+    if limit <= 1000:
+        return 5
+    return 10
+
+
+@dataclass(frozen=True)
+class BackfillJob:
+    """One kline request."""
+
+    symbol: str
+    interval: str
+    limit: int
+
+    @property
+    def weight(self) -> int:
+        return kline_request_weight(self.limit)
+
+
+@dataclass
+class BackfillReport:
+    """Outcome of a backfill run."""
+
+    succeeded: List[BackfillJob] = field(default_factory=list)
+    failed: Dict[BackfillJob, str] = field(default_factory=dict)
+    elapsed_seconds: float = 0.0
+    throttled_seconds: float = 0.0
+
+
+class BackfillScheduler:
+    """Runs backfill jobs concurrently within the exchange weight budget.
+
+    Args:
+        fetch: Blocking ``fetch(symbol=..., interval=..., limit=...)`` returning
+            candles (e.g. ``BinanceDataCollector.get_historical_candles``).
+        weight_tracker: Shared tracker updated from response headers. Without
+            one, only the weight issued by this scheduler is counted.
+        max_workers: Maximum concurrent requests (thread pool size).
+        budget_ratio: Fraction of the weight limit the backfill may use,
+            leaving headroom for order and account traffic.
+        clock: Wall-clock source (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        fetch: FetchFn,
+        weight_tracker: Optional[RequestWeightTracker] = None,
+        max_workers: int = 8,
+        budget_ratio: float = 0.8,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+        if not 0 < budget_ratio <= 1:
+            raise ValueError(f"budget_ratio must be in (0, 1], got {budget_ratio}")
+
+        self._fetch = fetch
+        self._tracker = weight_tracker
+        self._max_workers = max_workers
+        self._budget_ratio = budget_ratio
+        self._clock = clock
+
+        # Weight of requests sent but not yet reflected in tracker headers
+        self._in_flight_weight = 0
+        # Weight issued by this scheduler in the current window. Lower bound on
+        # the used weight even when the tracker lags behind (or is never fed)
+        self._window_id = -1
+        self._window_weight = 0
+
+        self.logger = logging.getLogger(__name__)
+
+    @property
+    def budget(self) -> int:
+        """Maximum weight per 1-minute window this scheduler may consume."""
+        limit = self._tracker.weight_limit if self._tracker else 2400
+        return int(limit * self._budget_ratio)
+
+    def _used_weight(self, now: float) -> int:
+        if self._tracker is not None:
+            reported = self._tracker.used_weight(now) + self._in_flight_weight
+            return max(reported, self._window_weight)
+        return self._window_weight
+
+    async def _reserve(self, weight: int, report: BackfillReport) -> None:
+        """Wait until ``weight`` fits in the current window, then claim it."""
+        while True:
+            now = self._clock()
+            window_id = int(now // RequestWeightTracker.WINDOW_SECONDS)
+            if window_id != self._window_id:
+                self._window_id = window_id
+                self._window_weight = 0
+
+            used = self._used_weight(now)
+            # A single request always goes out in a fresh window
+            if used + weight <= self.budget or used == 0:
+                self._in_flight_weight += weight
+                self._window_weight += weight
+                return
+
+            delay = RequestWeightTracker.seconds_until_reset(now)
+            self.logger.info(
+                f"Backfill throttled: weight {used}/{self.budget} used, "
+                f"waiting {delay:.1f}s for window reset"
+            )
+            report.throttled_seconds += delay
+            await asyncio.sleep(delay)
+
+    async def run(self, jobs: Iterable[BackfillJob], on_result: ResultFn) -> BackfillReport:
+        """
+        Execute all jobs and stream results to ``on_result``.
+
+        ``on_result`` runs on the event loop thread, once per successful job,
+        in completion order. Fetch or callback errors are logged and recorded
+        in the report; they never abort the remaining jobs.
+
+        Args:
+            jobs: Requests to issue (dispatched in this order).
+            on_result: Consumer for each job's candles.
+
+        Returns:
+            BackfillReport with per-job outcome and timing.
+        """
+        loop = asyncio.get_running_loop()
+        report = BackfillReport()
+        start = time.monotonic()
+        slots = asyncio.Semaphore(self._max_workers)
+        pending: Set[asyncio.Task] = set()
+
+        async def execute(job: BackfillJob, executor: ThreadPoolExecutor) -> None:
+            try:
+                candles = await loop.run_in_executor(
+                    executor,
+                    lambda: self._fetch(symbol=job.symbol, interval=job.interval, limit=job.limit),
+                )
+            except Exception as e:
+                self.logger.error(f"Failed to fetch {job.symbol} {job.interval}: {e}")
+                report.failed[job] = str(e)
+                return
+            finally:
+                # Response headers (if any) now account for this request
+                self._in_flight_weight -= job.weight
+                slots.release()
+
+            try:
+                on_result(job, candles)
+                report.succeeded.append(job)
+            except Exception as e:
+                self.logger.error(
+                    f"Failed to apply backfill for {job.symbol} {job.interval}: {e}",
+                    exc_info=True,
+                )
+                report.failed[job] = str(e)
+
+        with ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="backfill"
+        ) as executor:
+            for job in jobs:
+                await slots.acquire()
+                await self._reserve(job.weight, report)
+                task = asyncio.create_task(execute(job, executor))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+
+            if pending:
+                await asyncio.gather(*pending)
+
+        report.elapsed_seconds = time.monotonic() - start
+        return report
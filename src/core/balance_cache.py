@@ -0,0 +1,186 @@
+"""WebSocket-authoritative account balance cache.
+
+The user data stream pushes the USDT wallet balance in every ACCOUNT_UPDATE
+(fills, fees, funding, transfers), so the entry path does not need a REST
+``GET /fapi/v3/account`` (weight 5) before sizing each trade. BalanceCache
+keeps the last pushed value and serves it in O(1) while it is younger than
+``max_age``.
+
+A background task reconciles over REST only when the stream has been
+silent for ``reconcile_after`` seconds. A quiet account therefore costs one
+request per interval off the hot path, and a dead stream degrades to
+"stale": ``get()`` returns None and callers fall back to a direct query.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Optional, Tuple
+
+from src.execution.base import AsyncExecutionGateway
+
+SOURCE_WEBSOCKET = "websocket"
+SOURCE_REST = "rest"
+
+
+class BalanceCache:
+    """
+    Latest USDT wallet balance, fed by ACCOUNT_UPDATE and reconciled over REST.
+
+    Args:
+        order_gateway: Gateway used for reconciliation. An
+            AsyncExecutionGateway is awaited; a blocking gateway runs in a
+            worker thread.
+        max_age: Seconds after which a cached balance is no longer served
+        reconcile_after: Stream silence (seconds since the last update of
+            any source) that triggers a background REST query. Must be
+            below ``max_age`` so a healthy cache never expires.
+
+    Thread safety:
+        ``update_from_websocket`` is called from the WebSocket thread. The
+        entry is a single tuple replaced atomically, so readers on the event
+        loop never see a torn update.
+    """
+
+    def __init__(
+        self,
+        order_gateway,
+        max_age: float = 120.0,
+        reconcile_after: float = 60.0,
+    ) -> None:
+        if reconcile_after >= max_age:
+            raise ValueError(
+                f"reconcile_after ({reconcile_after}) must be below max_age ({max_age})"
+            )
+
+        self._order_gateway = order_gateway
+        self._max_age = max_age
+        self._reconcile_after = reconcile_after
+
+        # (balance, monotonic timestamp, source)
+        self._entry: Optional[Tuple[float, float, str]] = None
+        self._ws_updates = 0
+
+        self._reconcile_task: Optional[asyncio.Task] = None
+        self._running = False
+
+        self.reconciliations = 0
+        self.logger = logging.getLogger(__name__)
+
+    # Reads
+
+    def get(self) -> Optional[float]:
+        """
+        Cached wallet balance, or None if missing or older than ``max_age``.
+
+        Callers treat None as "unknown" and query the exchange directly.
+        """
+        entry = self._entry
+        if entry is None:
+            return None
+        balance, updated_at, _ = entry
+        if time.monotonic() - updated_at >= self._max_age:
+            return None
+        return balance
+
+    @property
+    def latest(self) -> Optional[float]:
+        """Last known balance regardless of age (for logging, not sizing)."""
+        entry = self._entry
+        return entry[0] if entry is not None else None
+
+    @property
+    def age(self) -> Optional[float]:
+        """Seconds since the last update, None if never updated."""
+        entry = self._entry
+        return time.monotonic() - entry[1] if entry is not None else None
+
+    @property
+    def source(self) -> Optional[str]:
+        """Source of the current value ("websocket" or "rest")."""
+        entry = self._entry
+        return entry[2] if entry is not None else None
+
+    # Writes
+
+    def update_from_websocket(self, wallet_balance: float) -> None:
+        """
+        Store the wallet balance pushed by an ACCOUNT_UPDATE event.
+
+        Args:
+            wallet_balance: USDT wallet balance (``wb``)
+        """
+        self._entry = (wallet_balance, time.monotonic(), SOURCE_WEBSOCKET)
+        self._ws_updates += 1
+
+    def invalidate(self) -> None:
+        """Drop the cached value (next read falls back to REST)."""
+        self._entry = None
+
+    async def reconcile(self) -> bool:
+        """
+        Refresh the balance over REST.
+
+        A WebSocket update that arrives while the request is in flight is
+        newer than the REST snapshot, so the REST result is discarded then.
+
+        Returns:
+            True if the cache was updated from REST
+        """
+        ws_updates_before = self._ws_updates
+        try:
+            if isinstance(self._order_gateway, AsyncExecutionGateway):
+                balance = await self._order_gateway.get_account_balance_async()
+            else:
+                balance = await asyncio.to_thread(self._order_gateway.get_account_balance)
+        except Exception as e:
+            self.logger.warning(f"Balance reconciliation failed: {e}")
+            return False
+
+        self.reconciliations += 1
+        if self._ws_updates != ws_updates_before:
+            self.logger.debug("Balance reconciliation superseded by WebSocket update")
+            return False
+
+        previous = self.latest
+        self._entry = (balance, time.monotonic(), SOURCE_REST)
+        if previous is not None and abs(previous - balance) > 1e-9:
+            self.logger.warning(
+                f"Balance reconciled over REST: {previous:.4f} -> {balance:.4f} USDT"
+            )
+        return True
+
+    # Background reconciliation
+
+    async def start(self) -> None:
+        """Start the background reconciliation task (idempotent)."""
+        if self._running:
+            return
+        self._running = True
+        self._reconcile_task = asyncio.create_task(self._reconcile_loop(), name="balance_reconcile")
+
+    async def stop(self) -> None:
+        """Stop the background reconciliation task (idempotent)."""
+        self._running = False
+        task, self._reconcile_task = self._reconcile_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _reconcile_loop(self) -> None:
+        """Query REST whenever the stream has been silent for ``reconcile_after``."""
+        while self._running:
+            age = self.age
+            if age is None or age >= self._reconcile_after:
+                await self.reconcile()
+                age = self.age
+
+            # Sleep until the current value reaches the silence threshold
+            if age is None or age >= self._reconcile_after:
+                delay = self._reconcile_after
+            else:
+                delay = self._reconcile_after - age
+            await asyncio.sleep(delay)
@@ -3,6 +3,7 @@ Centralized Binance API client service with rate limit tracking.
 """
 
 import logging
+import time
 from typing import Any, Dict, Optional
 
 from binance.um_futures import UMFutures
@@ -17,10 +18,14 @@ class RequestWeightTracker:
     approaching limits.
     """
 
+    # Binance weight counters reset at every wall-clock minute boundary
+    WINDOW_SECONDS = 60
+
     def __init__(self):
         """Initialize weight tracker."""
         self.current_weight = 0
         self.weight_limit = 2400  # Binance limit: 2400 requests/minute
+        self.updated_at = 0.0  # Wall-clock time of last header update
         self.logger = logging.getLogger(__name__)
 
     def update_from_headers(self, headers: Optional[Dict] = None):
@@ -36,11 +41,17 @@ class RequestWeightTracker:
         if not headers:
             return
 
-        # Extract weight from headers
+        # Extract weight from headers (plain dicts are case-sensitive and the
+        # exchange may send the name in lowercase)
         weight_str = headers.get("X-MBX-USED-WEIGHT-1M")
+        if weight_str is None:
+            weight_str = next(
+                (v for k, v in headers.items() if k.lower() == "x-mbx-used-weight-1m"), None
+            )
         if weight_str:
             try:
                 self.current_weight = int(weight_str)
+                self.updated_at = time.time()
 
                 # Log warning if approaching limit (80% threshold)
                 if self.current_weight > self.weight_limit * 0.8:
@@ -61,6 +72,39 @@ class RequestWeightTracker:
         # Allow up to 90% of limit
         return self.current_weight < self.weight_limit * 0.9
 
+    def used_weight(self, now: Optional[float] = None) -> int:
+        """
+        Weight used in the current 1-minute window.
+
+        The last reported value only applies while we are still in the
+        window it was reported in; after the minute boundary it is stale.
+
+        Args:
+            now: Wall-clock time (default: time.time())
+
+        Returns:
+            Used weight, 0 if the last report belongs to an earlier window
+        """
+        now = time.time() if now is None else now
+        window = self.WINDOW_SECONDS
+        if self.updated_at // window != now // window:
+            return 0
+        return self.current_weight
+
+    @classmethod
+    def seconds_until_reset(cls, now: Optional[float] = None) -> float:
+        """
+        Seconds until the current 1-minute weight window resets.
+
+        The window is aligned to wall-clock minutes, so this needs no
+        tracker state and can be called on the class.
+
+        Args:
+            now: Wall-clock time (default: time.time())
+        """
+        now = time.time() if now is None else now
+        return cls.WINDOW_SECONDS - (now % cls.WINDOW_SECONDS)
+
     def get_status(self) -> Dict[str, Any]:
         """
         Get current weight tracking status.
@@ -122,7 +166,7 @@ class BinanceServiceClient:
             )
 
         # Initialize underlying UMFutures client
-        # show_limit_usage=True ensures weight information is returned in headers
+        # show_limit_usage=True returns the weight headers under "limit_usage"
         self.client = UMFutures(
             key=api_key,
             secret=api_secret,
@@ -143,9 +187,13 @@ class BinanceServiceClient:
         Returns:
             Unwrapped data content
         """
-        # Update weight tracker if headers are present
-        if isinstance(response, dict) and "headers" in response:
-            self.weight_tracker.update_from_headers(response["headers"])
+        # Update weight tracker: show_limit_usage=True wraps responses as
+        # {"limit_usage": {"x-mbx-used-weight-1m": ...}, "data": ...}
+        if isinstance(response, dict):
+            if "limit_usage" in response:
+                self.weight_tracker.update_from_headers(response["limit_usage"])
+            elif "headers" in response:
+                self.weight_tracker.update_from_headers(response["headers"])
 
         # Unwrap data if present
         if isinstance(response, dict) and "data" in response:
@@ -0,0 +1,188 @@
+"""Per-stream emission policy for intra-candle kline updates.
+
+Binance pushes a kline update for every stream roughly every 250ms, but
+strategies only act on closed candles. CandleUpdateFilter decides, from the
+raw decoded ``k`` payload, whether an open-candle update is worth turning
+into a Candle at all, so suppressed ticks never reach the thread bridge or
+the EventBus. Closed candles are always emitted.
+
+Policies (per symbol, or per symbol and interval):
+    - ALL: every update (previous behaviour)
+    - CLOSED_ONLY: no intra-candle updates
+    - THROTTLE: at most one update every ``min_interval_ms``
+    - PRICE_CHANGE: only when close moved ``min_change_bps`` from the last
+      emitted close
+"""
+
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
+
+PolicyKey = Union[str, Tuple[str, str]]
+
+
+class UpdateMode(Enum):
+    """Which open-candle updates a stream emits."""
+
+    ALL = "all"
+    CLOSED_ONLY = "closed_only"
+    THROTTLE = "throttle"
+    PRICE_CHANGE = "price_change"
+
+
+@dataclass(frozen=True)
+class CandleUpdatePolicy:
+    """
+    Emission policy for one stream.
+
+    Attributes:
+        mode: UpdateMode
+        min_interval_ms: Minimum spacing between updates (THROTTLE)
+        min_change_bps: Minimum close-price move in basis points (PRICE_CHANGE)
+    """
+
+    mode: UpdateMode = UpdateMode.ALL
+    min_interval_ms: int = 0
+    min_change_bps: float = 0.0
+
+    def __post_init__(self) -> None:
+        if self.mode == UpdateMode.THROTTLE and self.min_interval_ms <= 0:
+            raise ValueError(f"THROTTLE requires min_interval_ms > 0, got {self.min_interval_ms}")
+        if self.mode == UpdateMode.PRICE_CHANGE and self.min_change_bps <= 0:
+            raise ValueError(f"PRICE_CHANGE requires min_change_bps > 0, got {self.min_change_bps}")
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "CandleUpdatePolicy":
+        """Build from a config mapping, e.g. ``{"mode": "throttle", "min_interval_ms": 500}``."""
+        return cls(
+            mode=UpdateMode(data.get("mode", UpdateMode.ALL.value)),
+            min_interval_ms=int(data.get("min_interval_ms", 0)),
+            min_change_bps=float(data.get("min_change_bps", 0.0)),
+        )
+
+
+class _StreamGate:
+    """Mutable per-stream state for one policy."""
+
+    __slots__ = ("policy", "last_emit_ms", "last_close")
+
+    def __init__(self, policy: CandleUpdatePolicy) -> None:
+        self.policy = policy
+        self.last_emit_ms: Optional[int] = None
+        self.last_close: Optional[float] = None
+
+
+class CandleUpdateFilter:
+    """
+    Gate deciding which kline updates become candles.
+
+    Args:
+        default: Policy for streams without an override.
+        overrides: Policies keyed by symbol ("BTCUSDT") or by
+            (symbol, interval) (("BTCUSDT", "1m")); the latter wins.
+
+    Thread safety:
+        Called only from the WebSocket thread(s). Each stream is served by a
+        single connection, so per-stream state is never shared.
+    """
+
+    def __init__(
+        self,
+        default: Optional[CandleUpdatePolicy] = None,
+        overrides: Optional[Mapping[PolicyKey, CandleUpdatePolicy]] = None,
+    ) -> None:
+        self._default = default or CandleUpdatePolicy()
+        self._overrides = dict(overrides or {})
+        self._gates: Dict[Tuple[str, str], _StreamGate] = {}
+        self.suppressed = 0
+
+    @classmethod
+    def from_config(cls, config: Optional[Mapping[str, Any]]) -> "CandleUpdateFilter":
+        """
+        Build from the ``candle_updates`` config section.
+
+        Example:
+            ```yaml
+            candle_updates:
+              mode: "closed_only"
+              overrides:
+                BTCUSDT@1m: {mode: "throttle", min_interval_ms: 1000}
+                ETHUSDT: {mode: "price_change", min_change_bps: 5}
+            ```
+        """
+        config = config or {}
+        overrides: Dict[PolicyKey, CandleUpdatePolicy] = {}
+        for key, policy in (config.get("overrides") or {}).items():
+            symbol, _, interval = key.partition("@")
+            target: PolicyKey = (symbol.upper(), interval) if interval else symbol.upper()
+            overrides[target] = CandleUpdatePolicy.from_dict(policy)
+        return cls(CandleUpdatePolicy.from_dict(config), overrides)
+
+    @property
+    def passes_everything(self) -> bool:
+        """True when no stream is filtered (callers can skip the gate)."""
+        policies = [self._default, *self._overrides.values()]
+        return all(policy.mode == UpdateMode.ALL for policy in policies)
+
+    def policy_for(self, symbol: str, interval: str) -> CandleUpdatePolicy:
+        """Effective policy for a stream."""
+        policy = self._overrides.get((symbol, interval))
+        if policy is None:
+            policy = self._overrides.get(symbol, self._default)
+        return policy
+
+    def admit(self, kline: Mapping[str, Any], event_time_ms: Optional[int] = None) -> bool:
+        """
+        Decide whether a raw kline payload should be emitted.
+
+        Args:
+            kline: Decoded ``k`` object of a kline event
+            event_time_ms: Exchange event time (``E``); local monotonic
+                time is used when absent
+
+        Returns:
+            True to build and emit the candle, False to drop it
+        """
+        key = (kline["s"], kline["i"])
+        gate = self._gates.get(key)
+        if gate is None:
+            gate = self._gates[key] = _StreamGate(self.policy_for(*key))
+
+        mode = gate.policy.mode
+        if mode == UpdateMode.ALL:
+            return True
+
+        if kline["x"]:
+            # Closed candles always pass and reset the reference point
+            if mode == UpdateMode.THROTTLE:
+                gate.last_emit_ms = self._now_ms(event_time_ms)
+            elif mode == UpdateMode.PRICE_CHANGE:
+                gate.last_close = float(kline["c"])
+            return True
+
+        if mode == UpdateMode.THROTTLE:
+            now_ms = self._now_ms(event_time_ms)
+            last = gate.last_emit_ms
+            if last is None or now_ms - last >= gate.policy.min_interval_ms:
+                gate.last_emit_ms = now_ms
+                return True
+
+        elif mode == UpdateMode.PRICE_CHANGE:
+            close = float(kline["c"])
+            last_close = gate.last_close
+            if (
+                last_close is None
+                or abs(close - last_close) * 10_000 >= gate.policy.min_change_bps * last_close
+            ):
+                gate.last_close = close
+                return True
+
+        self.suppressed += 1
+        return False
+
+    @staticmethod
+    def _now_ms(event_time_ms: Optional[int]) -> int:
+        if event_time_ms is not None:
+            return event_time_ms
+        return time.monotonic_ns() // 1_000_000
@@ -53,6 +53,39 @@ class CircuitBreaker:
         Raises:
             OrderExecutionError: When circuit is OPEN
         """
+        self._check_open(func)
+
+        try:
+            result = func(*args, **kwargs)
+            if self.state == "HALF_OPEN":
+                self.reset()
+            return result
+        except Exception as e:
+            self.record_failure()
+            raise
+
+    async def call_async(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Await coroutine function through circuit breaker.
+
+        Same state handling as call(), for async API clients.
+
+        Raises:
+            OrderExecutionError: When circuit is OPEN
+        """
+        self._check_open(func)
+
+        try:
+            result = await func(*args, **kwargs)
+            if self.state == "HALF_OPEN":
+                self.reset()
+            return result
+        except Exception:
+            self.record_failure()
+            raise
+
+    def _check_open(self, func: Callable) -> None:
+        """Raise if OPEN, or move to HALF_OPEN once the recovery timeout passed."""
         if self.state == "OPEN":
             if time.time() - self.last_failure_time > self.recovery_timeout:
                 self.state = "HALF_OPEN"
@@ -65,15 +98,6 @@ class CircuitBreaker:
                     f"Recovery in {self.recovery_timeout - (time.time() - self.last_failure_time):.1f}s"
                 )
 
-        try:
-            result = func(*args, **kwargs)
-            if self.state == "HALF_OPEN":
-                self.reset()
-            return result
-        except Exception as e:
-            self.record_failure()
-            raise
-
     def record_failure(self) -> None:
         """Record a failure and potentially open the circuit."""
         self.failure_count += 1
@@ -124,6 +124,11 @@ class BinanceDataCollector(MarketDataProvider):
     def intervals(self) -> List[str]:
         return self._intervals
 
+    @property
+    def suppressed_updates(self) -> int:
+        """Intra-candle kline updates dropped at the streamer edge."""
+        return self.market_streamer.suppressed_updates
+
     @property
     def is_connected(self) -> bool:
         """
@@ -224,6 +229,7 @@ class BinanceDataCollector(MarketDataProvider):
         order_fill_callback: Optional[Callable] = None,
         funding_fee_callback: Optional[Callable] = None,
         balance_update_callback: Optional[Callable] = None,
+        algo_update_callback: Optional[Callable] = None,
     ) -> None:
         """
         Start user data stream WebSocket for real-time order updates.
@@ -241,6 +247,8 @@ class BinanceDataCollector(MarketDataProvider):
                 ORDER_TRADE_UPDATE events (Issue #41 rate limit fix)
             order_fill_callback: Optional callback for order fill events from
                 ORDER_TRADE_UPDATE events (Issue #107 - callback pattern alignment)
+            algo_update_callback: Optional callback for conditional (TP/SL)
+                order updates from ALGO_UPDATE events
 
         Raises:
             ConnectionError: If WebSocket connection fails
@@ -272,6 +280,10 @@ class BinanceDataCollector(MarketDataProvider):
         if balance_update_callback:
             self.user_streamer.set_balance_update_callback(balance_update_callback)
 
+        # Configure algo update callback (TP/SL placement confirmation)
+        if algo_update_callback:
+            self.user_streamer.set_algo_update_callback(algo_update_callback)
+
         # Start the streamer
         await self.user_streamer.start()
 
@@ -5,10 +5,137 @@ Event-driven system coordinator with multi-queue support
 import asyncio
 
 import logging
-from collections import defaultdict
-from typing import Callable, Dict, List
+import time
+import zlib
+from collections import OrderedDict, defaultdict, deque
+from typing import Any, Callable, Deque, Dict, Hashable, List, NamedTuple, Optional, Set, Tuple
 
 from src.models.event import Event, EventType, QueueType
+from src.monitoring.event_ids import EventID
+from src.monitoring.metrics_collector import MetricsCollector
+
+# Queue item used to wake an idle processor so it re-checks _running
+_WAKE = object()
+
+
+def order_independent(handler: Callable) -> Callable:
+    """
+    Mark an async handler as independent of other handlers' ordering.
+
+    Order-independent async handlers subscribed to the same event type run
+    concurrently (asyncio.gather) alongside the ordered handler chain
+    instead of after it. Use for side-effect-only consumers such as audit,
+    metrics or UI updates.
+
+    Example:
+        ```python
+        @order_independent
+        async def record_metrics(event: Event) -> None:
+            ...
+        ```
+    """
+    handler.order_independent = True
+    return handler
+
+
+class _HandlerRecord(NamedTuple):
+    """Handler metadata resolved once at subscription time."""
+
+    callable: Callable
+    is_async: bool
+    name: str
+    label: int  # Metrics label id for EVENT_BUS_HANDLE
+
+
+class _DispatchTable(NamedTuple):
+    """Immutable handler tables for one event type."""
+
+    ordered: Tuple[_HandlerRecord, ...]
+    concurrent: Tuple[_HandlerRecord, ...]
+
+
+_EMPTY_TABLE = _DispatchTable((), ())
+
+
+# Queues whose events are sharded by symbol into concurrent lanes
+_SHARDED_QUEUES = (QueueType.CANDLE_CLOSED, QueueType.SIGNAL)
+
+
+class ConflatingQueue(asyncio.Queue):
+    """
+    asyncio.Queue that keeps only the newest pending event per stream.
+
+    Events whose payload has ``symbol`` and ``interval`` (Candle) are keyed
+    by (event_type, symbol, interval). Publishing an event for a key that is
+    already pending replaces it in place: the stale tick is never processed
+    and queue.join() accounting counts the key once. Keys are served in the
+    order they first became pending. Events without a stream key are queued
+    individually, as in a plain FIFO queue.
+
+    A put never blocks: when maxsize distinct keys are pending, a new key
+    evicts the oldest pending event. conflated_count counts every event
+    discarded unprocessed, whether replaced or evicted.
+    """
+
+    def _init(self, maxsize: int) -> None:
+        self._queue: "OrderedDict[Hashable, Event]" = OrderedDict()
+        self.conflated_count = 0
+
+    @staticmethod
+    def _key(event: Event) -> Hashable:
+        data = getattr(event, "data", None)  # Wake sentinel has no payload
+        symbol = getattr(data, "symbol", None)
+        interval = getattr(data, "interval", None)
+        if symbol is None or interval is None:
+            return id(event)  # Unique while pending: never conflated
+        return (event.event_type, symbol, interval)
+
+    def _put(self, event: Event) -> None:
+        self._queue[self._key(event)] = event
+
+    def _get(self) -> Event:
+        return self._queue.popitem(last=False)[1]
+
+    def _replace(self, event: Event) -> bool:
+        """Take the slot of a pending event instead of adding one, if possible.
+
+        Overwrites the pending event of the same stream or, when the queue
+        is full, evicts the oldest pending event. The number of pending
+        events (and unfinished tasks) is unchanged either way.
+        """
+        key = self._key(event)
+        if key in self._queue:
+            self._queue[key] = event
+        elif self.full():
+            self._queue.popitem(last=False)
+            self._queue[key] = event
+        else:
+            return False
+        self.conflated_count += 1
+        return True
+
+    def put_nowait(self, event: Event) -> None:
+        if not self._replace(event):
+            super().put_nowait(event)
+
+    async def put(self, event: Event) -> None:
+        self.put_nowait(event)
+
+
+class _Lane:
+    """One ordered worker lane of a sharded queue."""
+
+    __slots__ = ("queue", "enqueued_at", "task")
+
+    def __init__(self, maxsize: int) -> None:
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        # Monotonic enqueue times, parallel to the events in self.queue
+        self.enqueued_at: Deque[float] = deque()
+        self.task: Optional[asyncio.Task] = None
+
+    def lag(self, now: float) -> float:
+        """Seconds the oldest pending event has been waiting."""
+        return now - self.enqueued_at[0] if self.enqueued_at else 0.0
 
 
 class EventBus:
@@ -25,20 +152,38 @@ class EventBus:
         - Thread-safe subscriber storage with defaultdict
         - Three priority queues (DATA, SIGNAL, ORDER) for different event criticalities
         - Asynchronous queue processors for non-blocking event handling
+        - CANDLE_CLOSED and SIGNAL sharded by symbol into ordered worker lanes
         - Graceful lifecycle management for start, stop, and shutdown
+        - Queue-wait, handler-latency and backlog metrics (MetricsCollector)
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        shard_lanes: int = 4,
+        metrics: Optional[MetricsCollector] = None,
+        backlog_sample_interval: float = 1.0,
+    ):
         """
         Initialize EventBus with subscriber registry and multi-queue system.
 
+        Args:
+            shard_lanes: Worker lanes per sharded queue (CANDLE_CLOSED, SIGNAL).
+                Events are routed to a lane by symbol, so each symbol stays
+                strictly ordered while different symbols run concurrently.
+                1 disables sharding (single sequential processor).
+            metrics: Collector receiving EVENT_BUS_PUBLISH (queue wait) and
+                QUEUE_BACKLOG per queue, and EVENT_BUS_HANDLE per handler.
+                Defaults to the process-wide MetricsCollector.
+            backlog_sample_interval: Seconds between QUEUE_BACKLOG samples
+                while running (0 disables sampling).
+
         Attributes:
             _subscribers: Maps EventType to list of handler functions
             _queues: Three priority queues (DATA, SIGNAL, ORDER) - created in start()
             logger: Logger instance for debug/error tracking
             _running: Lifecycle flag for processor control
-            _drop_count: Counter for dropped events per queue (monitoring)
             _processor_tasks: List of processor task references for cancellation
+            _lanes: Per-symbol worker lanes of sharded queues (created by their processor)
 
         Notes:
             - Queues are created lazily in start() to ensure proper event loop binding
@@ -48,6 +193,9 @@ class EventBus:
         # defaultdict automatically creates empty list for new EventTypes
         self._subscribers: Dict[EventType, List[Callable]] = defaultdict(list)
 
+        # Compiled per-EventType handler tables, rebuilt on (un)subscribe
+        self._dispatch_tables: Dict[EventType, _DispatchTable] = {}
+
         # Three priority queues - will be created in start() with proper event loop
         # Creating them here causes RuntimeError when event loop changes
         self._queues: Dict[QueueType, asyncio.Queue] = {}
@@ -55,23 +203,33 @@ class EventBus:
         # Logger for debugging subscription events
         self.logger = logging.getLogger(__name__)
 
-        # Lifecycle flag for processor control
-        self._running: bool = False
+        # Lifecycle flag for processor control (see _running property)
+        self._running_flag: bool = False
+
+        # Queues whose processor is currently blocked on an empty queue
+        self._idle_queues: Set[QueueType] = set()
 
         # Processor task references for cancellation during shutdown
         self._processor_tasks: List[asyncio.Task] = []
 
-        # Monitoring: track dropped events per queue
-        self._drop_count: Dict[QueueType, int] = {
-            QueueType.CANDLE_UPDATE: 0,
-            QueueType.CANDLE_CLOSED: 0,
-            QueueType.SIGNAL: 0,
-            QueueType.ORDER: 0,
+        # Symbol-sharded worker lanes for CANDLE_CLOSED and SIGNAL
+        if shard_lanes < 1:
+            raise ValueError(f"shard_lanes must be >= 1, got {shard_lanes}")
+        self._shard_lanes = shard_lanes
+        self._lanes: Dict[QueueType, List[_Lane]] = {}
+        self._lane_index: Dict[Any, int] = {}
+
+        # Latency/backlog instrumentation (label ids resolved once, off the hot path)
+        self._metrics = metrics if metrics is not None else MetricsCollector()
+        self._backlog_sample_interval = backlog_sample_interval
+        self._queue_labels: Dict[QueueType, int] = {
+            queue_type: self._metrics.label_id(f"queue:{queue_type.value}")
+            for queue_type in QueueType
         }
 
         # Define timeout strategy per queue type at class level for reusability and clarity.
+        # CANDLE_UPDATE has none: its ConflatingQueue never reports full.
         self._TIMEOUT_MAP: Dict[QueueType, Optional[float]] = {
-            QueueType.CANDLE_UPDATE: 1.0,  # High freq, drop quickly
             QueueType.CANDLE_CLOSED: 5.0,  # Critical, wait longer like SIGNAL
             QueueType.SIGNAL: 5.0,  # Wait longer for important signals (e.g., 5 seconds)
             QueueType.ORDER: None,  # Never timeout for critical orders (block indefinitely)
@@ -79,6 +237,31 @@ class EventBus:
 
         self.logger.info("EventBus initialized (queues will be created in start())")
 
+    # Max events a processor handles back-to-back before yielding to the loop
+    _MAX_BATCH = 64
+
+    @property
+    def _running(self) -> bool:
+        return self._running_flag
+
+    @_running.setter
+    def _running(self, value: bool) -> None:
+        """
+        Set the lifecycle flag; clearing it wakes idle processors.
+
+        Processors block directly on queue.get() while idle, so they would not
+        notice the flag change until the next event. A wake sentinel is queued
+        for each idle processor so it exits immediately.
+        """
+        self._running_flag = value
+        if not value:
+            idle, self._idle_queues = self._idle_queues, set()
+            for queue_type in idle:
+                try:
+                    self._queues[queue_type].put_nowait(_WAKE)
+                except asyncio.QueueFull:
+                    pass  # Queue has events, so the processor is waking anyway
+
     def subscribe(self, event_type: EventType, handler: Callable) -> None:
         """
         Register a handler function for a specific event type.
@@ -94,7 +277,8 @@ class EventBus:
 
         Notes:
             - No duplicate checking: Same handler can subscribe multiple times
-            - Both sync and async handlers supported (checked at execution time)
+            - Both sync and async handlers supported (resolved at subscription)
+            - Handlers marked @order_independent (async only) run concurrently
             - Thread-safe: defaultdict handles concurrent subscriptions
 
         Example:
@@ -114,11 +298,55 @@ class EventBus:
         """
         # Add handler to the list for this event type
         self._subscribers[event_type].append(handler)
+        self._rebuild_dispatch_table(event_type)
 
         # Log subscription for debugging
         handler_name = getattr(handler, "__name__", repr(handler))
         self.logger.debug(f"Handler '{handler_name}' subscribed to {event_type.value}")
 
+    def unsubscribe(self, event_type: EventType, handler: Callable) -> bool:
+        """
+        Remove one registration of a handler for an event type.
+
+        Args:
+            event_type: The event type the handler was subscribed to
+            handler: Previously subscribed callable
+
+        Returns:
+            True if a registration was removed, False if none was found
+        """
+        handlers = self._subscribers.get(event_type)
+        if not handlers or handler not in handlers:
+            return False
+
+        handlers.remove(handler)
+        self._rebuild_dispatch_table(event_type)
+
+        handler_name = getattr(handler, "__name__", repr(handler))
+        self.logger.debug(f"Handler '{handler_name}' unsubscribed from {event_type.value}")
+        return True
+
+    def _rebuild_dispatch_table(self, event_type: EventType) -> None:
+        """Compile the handler list of an event type into immutable records."""
+        ordered: List[_HandlerRecord] = []
+        concurrent: List[_HandlerRecord] = []
+        for handler in self._subscribers[event_type]:
+            name = getattr(handler, "__name__", repr(handler))
+            record = _HandlerRecord(
+                callable=handler,
+                is_async=asyncio.iscoroutinefunction(handler),
+                name=name,
+                label=self._metrics.label_id(
+                    f"handler:{getattr(handler, '__qualname__', name)}"
+                ),
+            )
+            if record.is_async and getattr(handler, "order_independent", False):
+                concurrent.append(record)
+            else:
+                ordered.append(record)
+        # Swapped in one assignment: a dispatch in progress keeps its snapshot
+        self._dispatch_tables[event_type] = _DispatchTable(tuple(ordered), tuple(concurrent))
+
     def _get_handlers(self, event_type: EventType) -> List[Callable]:
         """
         Retrieve all handlers registered for a specific event type.
@@ -163,7 +391,9 @@ class EventBus:
             asyncio.TimeoutError: For signal/order queues if timeout exceeded
 
         Overflow Handling:
-            - CANDLE_UPDATE queue: Drop event on timeout, log warning, increment drop_count
+            - CANDLE_UPDATE queue: Conflating, never blocks - replaces the pending
+              update of the same (symbol, interval) stream, or evicts the oldest
+              pending update when full, and increments the conflated count.
             - CANDLE_CLOSED queue: Block for up to 5s, raise TimeoutError if full
             - SIGNAL queue: Block for up to 5s, raise TimeoutError if full
             - ORDER queue: Block indefinitely (no timeout), never drop
@@ -172,7 +402,7 @@ class EventBus:
             ```python
             bus = EventBus()
 
-            # High-frequency data (may drop under load)
+            # High-frequency data (conflated per stream under load)
             await bus.publish(
                 Event(EventType.CANDLE_UPDATE, candle),
                 queue_type=QueueType.CANDLE_UPDATE
@@ -192,9 +422,9 @@ class EventBus:
             ```
 
         Notes:
-            - Candle update queue drops are expected under high load (design feature)
+            - Candle update ticks are conflated, never waited on (see ConflatingQueue)
             - Signal/order timeouts indicate system overload (needs investigation)
-            - Monitor drop_count via get_queue_stats() for operational alerts
+            - Monitor 'conflated' via get_queue_stats() for operational alerts
         """
         # 1. Validate queues are initialized
         if not self._queues:
@@ -211,6 +441,16 @@ class EventBus:
 
         queue = self._queues[queue_type]
 
+        # Stamp enqueue time for queue-wait metrics (measured at dispatch)
+        event.enqueued_at_ns = time.perf_counter_ns()
+
+        # Fast path: queue has room (or conflates), no timeout wrapper needed
+        try:
+            queue.put_nowait(event)
+            return
+        except asyncio.QueueFull:
+            pass
+
         # Get timeout strategy from class-level map
         timeout = self._TIMEOUT_MAP[queue_type]
 
@@ -221,141 +461,276 @@ class EventBus:
                 await queue.put(event)
                 # Note: Debug logging removed from hot path for performance
             else:
-                # Data/Signal queues: timeout-based overflow handling
+                # Candle-closed/Signal queues: timeout-based overflow handling
                 await asyncio.wait_for(queue.put(event), timeout=timeout)
                 # Note: Debug logging removed from hot path for performance
 
         except asyncio.TimeoutError:
-            # Handle timeout based on queue criticality
-            if queue_type == QueueType.CANDLE_UPDATE:
-                # Candle update queue: dropping events is acceptable under high load
-                self.logger.warning(
-                    f"Dropped {event.event_type.value} from {queue_type.value} queue "
-                    f"(full, timeout={timeout}s). "
-                    f"Total drops: {self._drop_count[queue_type]}"
-                )
-                self._drop_count[queue_type] += 1
-            else:
-                # Signal/Order queues: timeout is a serious indication of system overload
-                self.logger.error(
-                    f"Failed to publish {event.event_type.value} to "
-                    f"{queue_type.value} queue (timeout={timeout}s, "
-                    f"qsize={queue.qsize()}). System overloaded or blocked!"
-                )
-                raise
+            # Timeout is a serious indication of system overload
+            self.logger.error(
+                f"Failed to publish {event.event_type.value} to "
+                f"{queue_type.value} queue (timeout={timeout}s, "
+                f"qsize={queue.qsize()}). System overloaded or blocked!"
+            )
+            raise
 
     async def _process_queue(self, queue_type: QueueType) -> None:
         """
         Continuously process events from the specified queue.
 
-        This is the core event processing loop. It runs continuously while
-        _running=True, polling the queue for events and dispatching them to
-        registered handlers with comprehensive error isolation.
+        This is the core event processing loop. It runs while _running=True,
+        blocking on the queue when idle and dispatching events to registered
+        handlers with comprehensive error isolation.
 
         Args:
             queue_type: Queue to process (QueueType.CANDLE_UPDATE, QueueType.CANDLE_CLOSED, QueueType.SIGNAL, or QueueType.ORDER)
 
         Process Flow:
-            1. Poll queue with 0.1s timeout (non-blocking)
-            2. Get handlers registered for event type
-            3. Execute each handler sequentially (sync or async)
-            4. Isolate handler errors (one fails → others continue)
-            5. Mark queue task as done
-            6. Repeat until _running=False
+            1. Block on queue.get() until an event arrives (no polling)
+            2. Dispatch it, then drain further queued events with get_nowait()
+               (micro-batch of up to _MAX_BATCH events)
+            3. Yield to the event loop after a full batch so other processors run
+            4. Repeat until _running=False
 
         Error Handling:
             - Handler exceptions: Logged with exc_info=True, continue processing
-            - Queue TimeoutError: Expected when empty, continue loop
             - Other exceptions: Logged as critical, continue loop
 
         Performance:
+            - Idle processors are parked on the queue (zero wakeups)
+            - No per-event timeout handle or task wrapper
             - Handler execution is sequential (guarantees ordering)
-            - Empty queue polling: 10 iterations/sec (0.1s timeout)
             - Handlers should be fast (<10ms); heavy work → spawn tasks
 
-        Example:
-            ```python
-            # In Subtask 4.4, start() will spawn processor tasks:
-            async def start(self):
-                self._running = True
-                tasks = [
-                    asyncio.create_task(self._process_queue(QueueType.CANDLE_UPDATE)),
-                    asyncio.create_task(self._process_queue(QueueType.CANDLE_CLOSED)),
-                    asyncio.create_task(self._process_queue(QueueType.SIGNAL)),
-                    asyncio.create_task(self._process_queue(QueueType.ORDER))
-                ]
-                await asyncio.gather(*tasks, return_exceptions=True)
-            ```
-
         Notes:
-            - Sequential handler execution prevents race conditions
-            - Handler isolation prevents cascade failures
-            - 0.1s timeout allows responsive shutdown (checks _running flag)
+            - Clearing _running wakes an idle processor via a sentinel item
+            - Cancellation (shutdown) also exits the loop immediately
             - Method is private (internal to EventBus lifecycle)
         """
         queue = self._queues[queue_type]
+        lanes = self._start_lanes(queue_type)
 
         self.logger.info(f"Starting {queue_type.value} queue processor")
 
-        while self._running:
-            try:
-                # 1. Poll queue with timeout (non-blocking)
-                event = await asyncio.wait_for(
-                    queue.get(), timeout=0.1  # Check _running flag 10x per second
-                )
-
-                # 2. Get handlers for this event type
-                handlers = self._get_handlers(event.event_type)
-
-                # Note: "No handlers" debug log removed from hot path for performance
+        try:
+            await self._run_processor(queue_type, queue, lanes)
+        finally:
+            for lane in lanes:
+                lane.task.cancel()
+            self._lanes.pop(queue_type, None)
 
-                # 3. Execute each handler sequentially with error isolation
-                for handler in handlers:
-                    handler_name = getattr(handler, "__name__", repr(handler))
+        self.logger.info(f"Stopped {queue_type.value} queue processor")
 
+    async def _run_processor(
+        self, queue_type: QueueType, queue: asyncio.Queue, lanes: List[_Lane]
+    ) -> None:
+        """Processor loop body (see _process_queue)."""
+        while self._running:
+            try:
+                # 1. Park on the queue until an event (or wake sentinel) arrives
+                self._idle_queues.add(queue_type)
+                try:
+                    event = await queue.get()
+                finally:
+                    self._idle_queues.discard(queue_type)
+
+                # 2. Drain the burst without re-entering the scheduler
+                batch = 0
+                while True:
+                    if event is _WAKE:
+                        queue.task_done()
+                    elif lanes:
+                        # Lane worker calls queue.task_done() once handled
+                        await self._route_to_lane(lanes, event)
+                    else:
+                        await self._dispatch(event, queue_type)
+                        # Mark task as done (for queue.join() in shutdown)
+                        queue.task_done()
+                    batch += 1
+
+                    if not self._running or batch >= self._MAX_BATCH:
+                        break
                     try:
-                        # Detect async vs sync handler
-                        # Note: Handler execution debug logs removed from hot path for performance
-                        if asyncio.iscoroutinefunction(handler):
-                            await handler(event)
-                        else:
-                            handler(event)  # Direct call for sync handlers
-
-                    except Exception as e:
-                        # Handler error: log but continue processing other handlers
-                        self.logger.error(
-                            f"Handler '{handler_name}' failed for "
-                            f"{event.event_type.value} in {queue_type.value} queue: {e}",
-                            exc_info=True,  # Include full traceback
-                        )
-                        # Don't raise - continue to next handler
-
-                # 4. Mark task as done (for queue.join() in shutdown)
-                queue.task_done()
+                        event = queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        break
 
-            except asyncio.TimeoutError:
-                # No event available - not an error, continue loop
-                continue
+                # 3. Full batch: give the other processors a turn
+                if batch >= self._MAX_BATCH:
+                    await asyncio.sleep(0)
 
             except Exception as e:
                 # Unexpected processor error (shouldn't happen, but be defensive)
                 self.logger.critical(f"Processor error in {queue_type.value} queue: {e}", exc_info=True)
                 # Don't crash processor - continue loop
 
-        self.logger.info(f"Stopped {queue_type.value} queue processor")
+    def _start_lanes(self, queue_type: QueueType) -> List[_Lane]:
+        """Create and start the worker lanes of a sharded queue (empty if not sharded)."""
+        if queue_type not in _SHARDED_QUEUES or self._shard_lanes <= 1:
+            return []
+
+        source = self._queues[queue_type]
+        lanes = [_Lane(maxsize=source.maxsize) for _ in range(self._shard_lanes)]
+        for index, lane in enumerate(lanes):
+            lane.task = asyncio.create_task(
+                self._process_lane(queue_type, source, lane),
+                name=f"{queue_type.value}_lane_{index}",
+            )
+        self._lanes[queue_type] = lanes
+        return lanes
+
+    def _lane_for(self, event: Event) -> int:
+        """Lane index for an event, keyed by the symbol of its payload."""
+        data = event.data
+        symbol = data.get("symbol") if isinstance(data, dict) else getattr(data, "symbol", None)
+        index = self._lane_index.get(symbol)
+        if index is None:
+            key = symbol if isinstance(symbol, str) else repr(symbol)
+            index = zlib.crc32(key.encode()) % self._shard_lanes
+            self._lane_index[symbol] = index
+        return index
+
+    async def _route_to_lane(self, lanes: List[_Lane], event: Event) -> None:
+        """Hand an event to its symbol's lane (waits if that lane is full)."""
+        lane = lanes[self._lane_for(event)]
+        await lane.queue.put(event)
+        lane.enqueued_at.append(time.monotonic())
+
+    async def _process_lane(
+        self, queue_type: QueueType, source: asyncio.Queue, lane: _Lane
+    ) -> None:
+        """
+        Dispatch one lane's events in order until cancelled.
+
+        The source queue's task_done() is called only after the handlers
+        finish, so queue.join() (used by shutdown) still means "all handled".
+        """
+        while True:
+            event = await lane.queue.get()
+            lane.enqueued_at.popleft()
+            try:
+                await self._dispatch(event, queue_type)
+            finally:
+                lane.queue.task_done()
+                source.task_done()
 
-    def get_queue_stats(self) -> Dict[QueueType, Dict[str, int]]:
+    async def _dispatch(self, event: Event, queue_type: QueueType) -> None:
+        """
+        Execute every handler for an event with error isolation.
+
+        Ordered handlers run sequentially in subscription order. Handlers
+        marked @order_independent run concurrently with that chain.
+
+        Args:
+            event: Event taken from the queue
+            queue_type: Queue the event came from (for error context)
+        """
+        # Queue wait: publish() until the first handler starts
+        if event.enqueued_at_ns:
+            self._metrics.record_value(
+                EventID.EVENT_BUS_PUBLISH,
+                time.perf_counter_ns() - event.enqueued_at_ns,
+                self._queue_labels[queue_type],
+            )
+
+        table = self._dispatch_tables.get(event.event_type, _EMPTY_TABLE)
+        if not table.concurrent:
+            await self._run_ordered(table.ordered, event, queue_type)
+            return
+
+        await asyncio.gather(
+            self._run_ordered(table.ordered, event, queue_type),
+            *(self._run_handler(record, event, queue_type) for record in table.concurrent),
+        )
+
+    async def _run_ordered(
+        self, records: Tuple[_HandlerRecord, ...], event: Event, queue_type: QueueType
+    ) -> None:
+        """Run handlers one after another (each failure isolated)."""
+        for record in records:
+            started = time.perf_counter_ns()
+            try:
+                if record.is_async:
+                    await record.callable(event)
+                else:
+                    record.callable(event)  # Direct call for sync handlers
+
+            except Exception as e:
+                # Handler error: log but continue processing other handlers
+                self._log_handler_error(record, event, queue_type, e)
+                # Don't raise - continue to next handler
+
+            self._metrics.record_value(
+                EventID.EVENT_BUS_HANDLE, time.perf_counter_ns() - started, record.label
+            )
+
+    async def _run_handler(
+        self, record: _HandlerRecord, event: Event, queue_type: QueueType
+    ) -> None:
+        """Run one async handler, logging instead of raising on failure."""
+        started = time.perf_counter_ns()
+        try:
+            await record.callable(event)
+        except Exception as e:
+            self._log_handler_error(record, event, queue_type, e)
+
+        self._metrics.record_value(
+            EventID.EVENT_BUS_HANDLE, time.perf_counter_ns() - started, record.label
+        )
+
+    def _log_handler_error(
+        self, record: _HandlerRecord, event: Event, queue_type: QueueType, error: Exception
+    ) -> None:
+        self.logger.error(
+            f"Handler '{record.name}' failed for "
+            f"{event.event_type.value} in {queue_type.value} queue: {error}",
+            exc_info=True,  # Include full traceback
+        )
+
+    def _backlog_depth(self, queue_type: QueueType) -> int:
+        """Events waiting in a queue, including its lanes' pending events."""
+        depth = self._queues[queue_type].qsize()
+        for lane in self._lanes.get(queue_type, ()):
+            depth += lane.queue.qsize()
+        return depth
+
+    def _record_backlog(self) -> None:
+        """Record one QUEUE_BACKLOG sample per queue."""
+        for queue_type in self._queues:
+            self._metrics.record_value(
+                EventID.QUEUE_BACKLOG,
+                self._backlog_depth(queue_type),
+                self._queue_labels[queue_type],
+            )
+
+    async def _sample_backlog(self) -> None:
+        """Sample queue depths every backlog_sample_interval while running."""
+        while self._running:
+            self._record_backlog()
+            await asyncio.sleep(self._backlog_sample_interval)
+
+    def get_queue_stats(self) -> Dict[QueueType, Dict[str, Any]]:
         """
         Get current queue statistics for monitoring.
 
-        Returns dict with queue sizes, capacities, and drop counts:
+        Returns dict with queue sizes and capacities:
         {
-            QueueType.CANDLE_UPDATE: {'size': 42, 'maxsize': 1000, 'drops': 5},
-            QueueType.CANDLE_CLOSED: {'size': 1, 'maxsize': 100, 'drops': 0},
-            QueueType.SIGNAL: {'size': 3, 'maxsize': 100, 'drops': 0},
-            QueueType.ORDER: {'size': 0, 'maxsize': 50, 'drops': 0}
+            QueueType.CANDLE_UPDATE: {'size': 42, 'maxsize': 1000, 'conflated': 1250},
+            QueueType.CANDLE_CLOSED: {'size': 1, 'maxsize': 100,
+                                      'lanes': [{'depth': 2, 'lag': 0.013}, ...]},
+            QueueType.SIGNAL: {'size': 3, 'maxsize': 100, 'lanes': [...]},
+            QueueType.ORDER: {'size': 0, 'maxsize': 50}
         }
 
+        The conflating CANDLE_UPDATE queue adds 'conflated': updates discarded
+        before being processed, replaced by a newer tick of the same stream
+        or evicted to make room for a new stream. The other queues never
+        discard events; they apply backpressure instead.
+
+        Sharded queues with running lanes add 'lanes': per-lane 'depth'
+        (events routed but not yet handled) and 'lag' (seconds the oldest
+        of them has been waiting).
+
         Useful for:
         - Operational monitoring and alerting
         - Performance tuning (queue sizing)
@@ -370,19 +745,26 @@ class EventBus:
             if stats[QueueType.CANDLE_UPDATE]['size'] > 900:
                 logger.warning("CANDLE_UPDATE queue near capacity!")
 
-            # Alert on any SIGNAL drops (should never happen)
-            if stats[QueueType.SIGNAL]['drops'] > 0:
-                logger.critical("SIGNAL queue dropped events!")
+            # Alert if SIGNAL backpressure is building up
+            if stats[QueueType.SIGNAL]['size'] > 90:
+                logger.critical("SIGNAL queue near capacity!")
             ```
         """
-        return {
-            queue_type: {
+        now = time.monotonic()
+        stats: Dict[QueueType, Dict[str, Any]] = {}
+        for queue_type, queue in self._queues.items():
+            stats[queue_type] = {
                 "size": queue.qsize(),
                 "maxsize": queue.maxsize,
-                "drops": self._drop_count[queue_type],
             }
-            for queue_type, queue in self._queues.items()
-        }
+            if isinstance(queue, ConflatingQueue):
+                stats[queue_type]["conflated"] = queue.conflated_count
+            lanes = self._lanes.get(queue_type)
+            if lanes:
+                stats[queue_type]["lanes"] = [
+                    {"depth": lane.queue.qsize(), "lag": lane.lag(now)} for lane in lanes
+                ]
+        return stats
 
     async def start(self) -> None:
         """
@@ -419,7 +801,7 @@ class EventBus:
             asyncio.create_task(bus.start())
 
             # Later, to stop:
-            bus.stop()  # Processors exit within 0.5s
+            bus.stop()  # Idle processors exit immediately
             ```
 
         Notes:
@@ -431,14 +813,14 @@ class EventBus:
         # Create queues with current event loop (prevents "different loop" errors)
         if not self._queues:
             self._queues = {
-                QueueType.CANDLE_UPDATE: asyncio.Queue(maxsize=1000),  # High freq, can drop
+                QueueType.CANDLE_UPDATE: ConflatingQueue(maxsize=1000),  # Latest tick per stream
                 QueueType.CANDLE_CLOSED: asyncio.Queue(maxsize=100),  # Low freq, critical
                 QueueType.SIGNAL: asyncio.Queue(maxsize=100),  # Medium priority, must process
                 QueueType.ORDER: asyncio.Queue(maxsize=50),  # Critical, never drop
             }
             self.logger.info(
                 "Created queues with current event loop: "
-                "CANDLE_UPDATE(1000), CANDLE_CLOSED(100), SIGNAL(100), ORDER(50)"
+                "CANDLE_UPDATE(1000, conflating), CANDLE_CLOSED(100), SIGNAL(100), ORDER(50)"
             )
 
         self._running = True
@@ -454,9 +836,18 @@ class EventBus:
             asyncio.create_task(self._process_queue(QueueType.ORDER), name="order_processor"),
         ]
 
+        # Backlog sampler runs beside the processors (not one of them)
+        sampler = None
+        if self._backlog_sample_interval > 0:
+            sampler = asyncio.create_task(self._sample_backlog(), name="backlog_sampler")
+
         # Wait for all processors (runs until stop() called)
         # return_exceptions=True prevents single task error from crashing EventBus
-        await asyncio.gather(*self._processor_tasks, return_exceptions=True)
+        try:
+            await asyncio.gather(*self._processor_tasks, return_exceptions=True)
+        finally:
+            if sampler is not None:
+                sampler.cancel()
 
         self.logger.info("EventBus processors stopped")
 
@@ -465,18 +856,17 @@ class EventBus:
         Signal all processors to stop by setting _running flag.
 
         This is a non-blocking operation that signals processors to exit
-        their loops. Processors will finish their current event and exit
-        within approximately 0.1s (the queue polling timeout).
+        their loops. Busy processors finish their current event and exit;
+        idle processors are woken by a sentinel and exit immediately.
 
         Process Flow:
             1. Log stop request
-            2. Set _running=False
+            2. Set _running=False (wakes idle processors)
             3. Return immediately
 
         Timing:
             - Non-blocking call (returns immediately)
-            - Processors check _running every 0.1s (timeout period)
-            - Expect processors to exit within 0.5s
+            - Processors exit on their next loop iteration
 
         Usage:
             ```python
@@ -563,7 +953,8 @@ class EventBus:
         self.stop()
 
         # Wait briefly for processors to exit gracefully
-        await asyncio.sleep(0.5)
+        if self._processor_tasks:
+            await asyncio.wait(self._processor_tasks, timeout=0.5)
 
         # Cancel processor tasks if still running (defensive check)
         if hasattr(self, "_processor_tasks") and self._processor_tasks:
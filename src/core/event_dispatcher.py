@@ -24,6 +24,7 @@ if TYPE_CHECKING:
     from src.execution.base import ExecutionGateway, PositionProvider
 
 from src.core.exceptions import EngineState
+from src.core.loop_bridge import BatchingLoopBridge
 from src.models.candle import Candle
 from src.models.event import Event, EventType, QueueType
 from src.models.signal import Signal
@@ -69,6 +70,10 @@ class EventDispatcher:
         self._log_live_data = log_live_data
         self._event_drop_count = 0
         self._last_exchange_sl: Dict[str, float] = {}
+        # WebSocket thread → event loop hand-off (batched wakeups)
+        self._loop_bridge = BatchingLoopBridge(
+            lambda event, queue_type: self._event_bus.publish(event, queue_type=queue_type)
+        )
         self.logger = logging.getLogger(__name__)
 
     async def on_candle_closed(self, event: Event) -> None:
@@ -113,24 +118,17 @@ class EventDispatcher:
         current_position = self._position_cache_manager.get(candle.symbol)
 
         # Issue #41: Handle uncertain position state.
-        # If _position_cache.get returns None, it could be "No Position" or "API Failure".
-        # We must skip analysis if the state is uncertain to prevent incorrect entries.
-        if current_position is None:
-            # Check if cache was actually updated successfully (confirmed None state)
-            if candle.symbol not in self._position_cache_manager.cache:
-                self.logger.warning(
-                    f"Position state unknown for {candle.symbol}, skipping analysis"
-                )
-                return
-
-            _, cache_time = self._position_cache_manager.cache[candle.symbol]
-            if time.time() - cache_time >= self._position_cache_manager._ttl:
-                # Cache is stale, meaning _position_cache.get failed to refresh it
-                self.logger.warning(
-                    f"Position state uncertain for {candle.symbol} (cache expired and refresh failed), "
-                    f"skipping analysis to prevent incorrect entry"
-                )
-                return
+        # If _position_cache.get returns None, it could be "No Position" or "API Failure"
+        # (or, in push mode, "not confirmed yet"). Skip analysis while the state is
+        # uncertain to prevent incorrect entries.
+        if current_position is None and self._position_cache_manager.is_uncertain(
+            candle.symbol
+        ):
+            self.logger.warning(
+                f"Position state uncertain for {candle.symbol}, "
+                f"skipping analysis to prevent incorrect entry"
+            )
+            return
 
         if current_position is not None:
             # Position exists - check exit conditions first (Issue #25)
@@ -386,9 +384,9 @@ class EventDispatcher:
             candle: Candle data from WebSocket stream
 
         Thread Safety:
-            Called from WebSocket thread. Uses stored event loop reference
-            with asyncio.run_coroutine_threadsafe() to schedule coroutine
-            in main thread's event loop.
+            Called from WebSocket thread. Events are handed to a
+            BatchingLoopBridge, which wakes the stored event loop at most
+            once per batch and publishes the batch from the loop.
         """
 
         # Step 1: Check engine state
@@ -436,10 +434,7 @@ class EventDispatcher:
             QueueType.CANDLE_CLOSED if candle.is_closed else QueueType.CANDLE_UPDATE
         )
         try:
-            asyncio.run_coroutine_threadsafe(
-                self._event_bus.publish(event, queue_type=candle_queue),
-                event_loop,
-            )
+            accepted = self._loop_bridge.submit(event_loop, event, candle_queue)
 
         except Exception as e:
             self._event_drop_count += 1
@@ -451,6 +446,15 @@ class EventDispatcher:
             )
             return
 
+        if not accepted:
+            self._event_drop_count += 1
+            self.logger.warning(
+                f"Bridge backlog full ({self._loop_bridge.pending} pending), "
+                f"dropped live update: {candle.symbol} {candle.interval}. "
+                f"Drops: {self._event_drop_count}"
+            )
+            return
+
         # Step 6: Log success
         if candle.is_closed:
             self.logger.info(
@@ -0,0 +1,367 @@
+"""Persistent, precompiled exchange-info cache.
+
+``GET /fapi/v1/exchangeInfo`` is a large document that only changes when
+Binance lists a symbol or adjusts its filters. ExchangeInfoCache keeps the
+PRICE_FILTER/LOT_SIZE values per symbol and compiles each symbol into a
+SymbolQuantizer: tick and step sizes become integers at a fixed decimal
+scale and the output format is fixed once, so quantizing and formatting a
+price or quantity is O(1) with no per-order precision computation.
+
+The parsed filters are persisted to a local JSON file. A restart loads them
+instantly instead of downloading the document again, and a background task
+refreshes them when they reach the TTL.
+
+OrderGateway (price/quantity formatting) and RiskGuard (position size
+rounding) share one instance, so both round a quantity identically.
+"""
+
+import asyncio
+import json
+import logging
+import math
+import os
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Union
+
+CACHE_FILE_VERSION = 1
+
+# Tolerance (in ticks) for float error when flooring to a step multiple
+_FLOOR_EPSILON = 1e-6
+
+
+def precision_of(increment: float) -> int:
+    """
+    Decimal places of a tick/step size (0.01 -> 2, 1.0 -> 0).
+
+    Args:
+        increment: Tick or step size
+
+    Returns:
+        Number of decimal places
+    """
+    text = f"{increment:.10f}".rstrip("0")
+    if "." not in text:
+        return 0
+    return len(text.split(".")[1])
+
+
+class SymbolQuantizer:
+    """
+    Price/quantity rounding for one symbol in integer tick arithmetic.
+
+    Args:
+        symbol: Trading pair symbol
+        tick_size: PRICE_FILTER tickSize
+        step_size: LOT_SIZE stepSize
+        min_price/max_price/min_qty/max_qty: Remaining filter bounds (0 if unknown)
+
+    Prices round to the nearest tick; quantities are floored to the step so
+    a sized position never grows by rounding.
+    """
+
+    __slots__ = (
+        "symbol",
+        "tick_size",
+        "step_size",
+        "min_price",
+        "max_price",
+        "min_qty",
+        "max_qty",
+        "price_precision",
+        "quantity_precision",
+        "_price_scale",
+        "_tick_units",
+        "_qty_scale",
+        "_step_units",
+        "_price_format",
+        "_qty_format",
+    )
+
+    def __init__(
+        self,
+        symbol: str,
+        tick_size: float,
+        step_size: float,
+        min_price: float = 0.0,
+        max_price: float = 0.0,
+        min_qty: float = 0.0,
+        max_qty: float = 0.0,
+    ) -> None:
+        self.symbol = symbol
+        self.tick_size = tick_size
+        self.step_size = step_size
+        self.min_price = min_price
+        self.max_price = max_price
+        self.min_qty = min_qty
+        self.max_qty = max_qty
+
+        self.price_precision = precision_of(tick_size)
+        self._price_scale = 10**self.price_precision
+        self._tick_units = max(round(tick_size * self._price_scale), 1)
+        self._price_format = f"{{:.{self.price_precision}f}}".format
+
+        self.quantity_precision = precision_of(step_size)
+        self._qty_scale = 10**self.quantity_precision
+        self._step_units = max(round(step_size * self._qty_scale), 1)
+        self._qty_format = f"{{:.{self.quantity_precision}f}}".format
+
+    @classmethod
+    def from_filters(cls, symbol: str, filters: Dict[str, float]) -> "SymbolQuantizer":
+        """Build from a cached filter dict (tickSize, stepSize, minPrice, ...)."""
+        return cls(
+            symbol=symbol,
+            tick_size=filters.get("tickSize", 0.01),
+            step_size=filters.get("stepSize", 0.001),
+            min_price=filters.get("minPrice", 0.0),
+            max_price=filters.get("maxPrice", 0.0),
+            min_qty=filters.get("minQty", 0.0),
+            max_qty=filters.get("maxQty", 0.0),
+        )
+
+    # Prices
+
+    def price_units(self, price: float) -> int:
+        """Price in units of 10^-price_precision, on the nearest tick."""
+        ticks = round(price * self._price_scale / self._tick_units)
+        return ticks * self._tick_units
+
+    def quantize_price(self, price: float) -> float:
+        """Round a price to the nearest tick."""
+        return self.price_units(price) / self._price_scale
+
+    def format_price(self, price: float) -> str:
+        """Nearest-tick price as the exchange expects it (e.g. '50123.40')."""
+        return self._price_format(self.price_units(price) / self._price_scale)
+
+    # Quantities
+
+    def quantity_units(self, quantity: float) -> int:
+        """Quantity in units of 10^-quantity_precision, floored to the step."""
+        steps = math.floor(quantity * self._qty_scale / self._step_units + _FLOOR_EPSILON)
+        return steps * self._step_units
+
+    def floor_quantity(self, quantity: float) -> float:
+        """Floor a quantity to a multiple of the step size."""
+        return self.quantity_units(quantity) / self._qty_scale
+
+    def format_quantity(self, quantity: float) -> str:
+        """Step-floored quantity as the exchange expects it (e.g. '0.012')."""
+        return self._qty_format(self.quantity_units(quantity) / self._qty_scale)
+
+
+class ExchangeInfoCache:
+    """
+    Symbol filters from exchangeInfo, compiled to quantizers and persisted.
+
+    Args:
+        path: JSON file for warm starts. Relative paths resolve against the
+            project root; None keeps the cache in memory only.
+        source: REST base URL the data came from. A persisted file from a
+            different source (e.g. testnet vs mainnet) is ignored.
+        ttl: Seconds after which the data is refreshed (default 24h)
+        retry_interval: Seconds between background refresh attempts after
+            a failure
+
+    Example:
+        >>> cache = ExchangeInfoCache(path="data/exchange_info.json")
+        >>> cache.load()
+        >>> cache.get("BTCUSDT").format_price(50123.456)
+        '50123.50'
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        source: Optional[str] = None,
+        ttl: float = 24 * 3600,
+        retry_interval: float = 60.0,
+    ) -> None:
+        if path is not None:
+            path = Path(path)
+            if not path.is_absolute():
+                path = Path(__file__).resolve().parent.parent.parent / path
+        self.path: Optional[Path] = path
+        self.source = source
+        self.ttl = ttl
+        self.retry_interval = retry_interval
+
+        self.filters: Dict[str, Dict[str, float]] = {}
+        self._quantizers: Dict[str, SymbolQuantizer] = {}
+        self.updated_at: Optional[float] = None  # Wall-clock (persisted across restarts)
+
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._running = False
+        self.logger = logging.getLogger(__name__)
+
+    # Reads
+
+    def get(self, symbol: str) -> Optional[SymbolQuantizer]:
+        """Compiled quantizer for a symbol, None if unknown."""
+        return self._quantizers.get(symbol)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._quantizers
+
+    def __len__(self) -> int:
+        return len(self._quantizers)
+
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        """True if never populated or older than ``ttl``."""
+        if self.updated_at is None:
+            return True
+        now = time.time() if now is None else now
+        return now - self.updated_at > self.ttl
+
+    def seconds_until_expiry(self, now: Optional[float] = None) -> float:
+        """Seconds until ``is_expired`` turns True (0 if already expired)."""
+        if self.updated_at is None:
+            return 0.0
+        now = time.time() if now is None else now
+        return max(self.updated_at + self.ttl - now, 0.0)
+
+    # Writes
+
+    def update_from_exchange_info(self, exchange_data: Dict[str, Any]) -> int:
+        """
+        Parse an exchangeInfo payload, recompile quantizers and persist.
+
+        Args:
+            exchange_data: Unwrapped GET /fapi/v1/exchangeInfo response
+                (must contain 'symbols')
+
+        Returns:
+            Number of symbols cached
+        """
+        filters: Dict[str, Dict[str, float]] = {}
+        for symbol_data in exchange_data["symbols"]:
+            price_filter = None
+            lot_filter = None
+            for filter_item in symbol_data["filters"]:
+                if filter_item["filterType"] == "PRICE_FILTER":
+                    price_filter = filter_item
+                elif filter_item["filterType"] == "LOT_SIZE":
+                    lot_filter = filter_item
+
+            if price_filter or lot_filter:
+                filters[symbol_data["symbol"]] = {
+                    "tickSize": float(price_filter["tickSize"]) if price_filter else 0.01,
+                    "minPrice": float(price_filter["minPrice"]) if price_filter else 0.0,
+                    "maxPrice": float(price_filter["maxPrice"]) if price_filter else 0.0,
+                    "stepSize": float(lot_filter["stepSize"]) if lot_filter else 0.001,
+                    "minQty": float(lot_filter["minQty"]) if lot_filter else 0.0,
+                    "maxQty": float(lot_filter["maxQty"]) if lot_filter else 0.0,
+                }
+
+        self._install(filters, time.time())
+        self.save()
+        return len(filters)
+
+    def _install(self, filters: Dict[str, Dict[str, float]], updated_at: float) -> None:
+        # Build the new tables first, then swap, so readers never see a partial set
+        quantizers = {
+            symbol: SymbolQuantizer.from_filters(symbol, values)
+            for symbol, values in filters.items()
+        }
+        self.filters = filters
+        self._quantizers = quantizers
+        self.updated_at = updated_at
+
+    # Persistence
+
+    def load(self) -> bool:
+        """
+        Load persisted filters (warm start).
+
+        Returns:
+            True if a file from the same source was loaded. Expired data is
+            still loaded (better than defaults) and refreshed on first use.
+        """
+        if self.path is None or not self.path.exists():
+            return False
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != CACHE_FILE_VERSION:
+                self.logger.info(f"Ignoring exchange info cache {self.path}: version mismatch")
+                return False
+            if self.source is not None and data.get("source") != self.source:
+                self.logger.info(
+                    f"Ignoring exchange info cache {self.path}: "
+                    f"written for {data.get('source')}, not {self.source}"
+                )
+                return False
+            self._install(data["symbols"], float(data["updated_at"]))
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self.logger.warning(f"Failed to load exchange info cache {self.path}: {e}")
+            return False
+
+        self.logger.info(
+            f"Exchange info loaded from {self.path}: {len(self)} symbols, "
+            f"age {time.time() - self.updated_at:.0f}s"
+        )
+        return True
+
+    def save(self) -> None:
+        """Persist the current filters (atomic replace; failures are logged)."""
+        if self.path is None or self.updated_at is None:
+            return
+
+        payload = {
+            "version": CACHE_FILE_VERSION,
+            "source": self.source,
+            "updated_at": self.updated_at,
+            "symbols": self.filters,
+        }
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(payload, f, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            self.logger.warning(f"Failed to persist exchange info cache {self.path}: {e}")
+
+    # Background refresh
+
+    async def start(self, refresh: Callable[[], Awaitable[Any]]) -> None:
+        """
+        Start refreshing in the background whenever the data expires (idempotent).
+
+        Args:
+            refresh: Coroutine function that fetches exchangeInfo and feeds
+                ``update_from_exchange_info`` (e.g. the gateway's refresh)
+        """
+        if self._running:
+            return
+        self._running = True
+        self._refresh_task = asyncio.create_task(
+            self._refresh_loop(refresh), name="exchange_info_refresh"
+        )
+
+    async def stop(self) -> None:
+        """Stop the background refresh task (idempotent)."""
+        self._running = False
+        task, self._refresh_task = self._refresh_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _refresh_loop(self, refresh: Callable[[], Awaitable[Any]]) -> None:
+        while self._running:
+            delay = self.seconds_until_expiry()
+            if self.is_expired():
+                try:
+                    await refresh()
+                    delay = (
+                        self.retry_interval if self.is_expired() else self.seconds_until_expiry()
+                    )
+                except Exception as e:
+                    self.logger.warning(f"Background exchange info refresh failed: {e}")
+                    delay = self.retry_interval
+            # Wake just after expiry (is_expired is strict)
+            await asyncio.sleep(max(delay, 1.0))
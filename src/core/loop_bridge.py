@@ -0,0 +1,96 @@
+"""Batching bridge from WebSocket threads to the asyncio event loop.
+
+``asyncio.run_coroutine_threadsafe`` costs a coroutine object, a
+concurrent Future and a loop callback per message, and during reconnect
+storms the un-awaited futures pile up without bound. BatchingLoopBridge
+instead appends ``(event, queue_type)`` pairs to a deque (append/popleft
+are atomic under the GIL) and wakes the loop with ``call_soon_threadsafe``
+at most once per batch. A single drain task on the loop then publishes
+everything that accumulated, in arrival order.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from typing import Awaitable, Callable, Deque, Optional, Tuple
+
+from src.models.event import Event, QueueType
+
+PublishFn = Callable[[Event, QueueType], Awaitable[None]]
+
+
+class BatchingLoopBridge:
+    """
+    Hands events from foreign threads to an async publisher in batches.
+
+    Args:
+        publish: Coroutine function run on the loop for each event
+            (e.g. ``lambda e, q: event_bus.publish(e, queue_type=q)``).
+        max_pending: Backlog bound. Once reached, CANDLE_UPDATE events are
+            rejected (they are superseded by the next tick anyway); all other
+            queue types are always accepted.
+    """
+
+    def __init__(self, publish: PublishFn, max_pending: int = 10_000) -> None:
+        self._publish = publish
+        self._max_pending = max_pending
+        self._pending: Deque[Tuple[Event, QueueType]] = deque()
+
+        # True while a wakeup is scheduled but its drain has not started
+        self._wakeup_scheduled = False
+        self._drain_task: Optional[asyncio.Task] = None
+
+        self.wakeups = 0
+        self.rejected = 0
+        self.logger = logging.getLogger(__name__)
+
+    @property
+    def pending(self) -> int:
+        """Events submitted but not yet handed to the publisher."""
+        return len(self._pending)
+
+    def submit(self, loop: asyncio.AbstractEventLoop, event: Event, queue_type: QueueType) -> bool:
+        """
+        Queue an event for publishing on ``loop`` (safe from any thread).
+
+        Returns:
+            False if the event was rejected because the backlog is full
+        """
+        if queue_type == QueueType.CANDLE_UPDATE and len(self._pending) >= self._max_pending:
+            self.rejected += 1
+            return False
+
+        self._pending.append((event, queue_type))
+        if not self._wakeup_scheduled:
+            self._wakeup_scheduled = True
+            self.wakeups += 1
+            loop.call_soon_threadsafe(self._on_wakeup, loop)
+        return True
+
+    def _on_wakeup(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Loop-side wakeup: make sure a drain task is running."""
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = loop.create_task(self._drain(), name="loop_bridge_drain")
+        else:
+            # Running drain picks up the new events; re-arm wakeups now
+            self._wakeup_scheduled = False
+
+    async def _drain(self) -> None:
+        """Publish pending events in order until the deque is empty."""
+        pending = self._pending
+        while True:
+            # Clear before draining: anything appended after this point
+            # either gets drained below or schedules a fresh wakeup
+            self._wakeup_scheduled = False
+            if not pending:
+                return
+            while pending:
+                event, queue_type = pending.popleft()
+                try:
+                    await self._publish(event, queue_type)
+                except Exception as e:
+                    self.logger.error(
+                        f"Failed to publish {event.event_type.value} "
+                        f"to {queue_type.value} queue: {e}",
+                        exc_info=True,
+                    )
@@ -9,16 +9,22 @@ Key features:
 - WebSocket-driven cache updates for sub-second freshness
 - Graceful handling of API failures (Issue #41)
 - Signal cooldown tracking coupled with cache invalidation (Issue #101)
+- Push mode: once start() runs, ACCOUNT_UPDATE is authoritative, one
+  background task reconciles all symbols with a single batched
+  positionRisk query, and reads never touch REST. Symbols that were
+  invalidated, never loaded, or not confirmed within the TTL are
+  "uncertain" (see is_uncertain).
 """
 
+import asyncio
 import logging
 import time
-from typing import TYPE_CHECKING, Dict, Optional
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
 
 if TYPE_CHECKING:
     from src.models.position import Position
 
-from src.execution.base import PositionProvider
+from src.execution.base import AsyncExecutionGateway, PositionProvider
 
 
 class PositionCacheManager(PositionProvider):
@@ -33,6 +39,13 @@ class PositionCacheManager(PositionProvider):
         _cache: Position cache with timestamps (symbol -> (Position|None, timestamp))
         _ttl: Cache time-to-live in seconds
         _last_signal_time: Signal cooldown tracking (symbol -> timestamp)
+
+    Modes:
+        Pull (default): get() refreshes over REST when the TTL lapses.
+        Push (after start()): get() never blocks. An entry is confirmed by
+        WebSocket updates or by the background reconciliation, which runs
+        every ``reconcile_interval`` seconds and right after invalidate().
+        Entries not confirmed within ``ttl`` become uncertain.
     """
 
     def __init__(
@@ -40,6 +53,7 @@ class PositionCacheManager(PositionProvider):
         order_gateway,
         config_manager,
         ttl: float = 60.0,
+        reconcile_interval: float = 20.0,
     ):
         self._order_gateway = order_gateway
         self._config_manager = config_manager
@@ -48,6 +62,23 @@ class PositionCacheManager(PositionProvider):
         self._last_signal_time: Dict[str, float] = {}
         self.logger = logging.getLogger(__name__)
 
+        # Push mode (background reconciliation)
+        self._reconcile_interval = reconcile_interval
+        self._symbols: List[str] = []
+        # Bumped on every WebSocket update or invalidation, so a REST snapshot
+        # taken before the change never overwrites it
+        self._versions: Dict[str, int] = {}
+        self._running = False
+        self._reconcile_task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self.reconciliations = 0
+        self.drift_corrections = 0
+
+    @property
+    def push_mode(self) -> bool:
+        """True while background reconciliation is running."""
+        return self._running
+
     @property
     def cache(self) -> dict[str, tuple[Optional["Position"], float]]:
         """Access internal cache dict (needed by EventDispatcher for uncertain state check)."""
@@ -66,7 +97,15 @@ class PositionCacheManager(PositionProvider):
         Returns:
             Position if exists and cache valid, None otherwise
             (Returns None on API failure to prevent using stale/uncertain data - Issue #41)
+
+        In push mode this is a pure cache read: None is returned for
+        uncertain symbols instead of querying REST.
         """
+        if self._running:
+            if self.is_uncertain(symbol):
+                return None
+            return self._cache[symbol][0]
+
         current_time = time.time()
 
         # Check if cache exists and is still valid
@@ -102,10 +141,84 @@ class PositionCacheManager(PositionProvider):
 
         Returns:
             Position if exists, None otherwise
+
+        In push mode this is a pure cache read, like get(): a confirmed
+        entry is already exchange state, and None is returned for uncertain
+        symbols. Callers that need REST for an uncertain symbol must use
+        get_fresh_async(). Outside push mode it blocks on REST, so it must
+        not be called on the event loop.
         """
+        if self._running:
+            return self.get(symbol)
+
         self.invalidate(symbol)
         return self.get(symbol)
 
+    async def get_fresh_async(self, symbol: str) -> Optional["Position"]:
+        """Awaitable get_fresh() that never blocks the event loop.
+
+        Like get_fresh(), except that in push mode an uncertain symbol is
+        queried over REST instead of returning None. REST goes through the
+        gateway's get_position_async, or a worker thread for a blocking
+        gateway. A WebSocket update that arrives while the query is in
+        flight is newer than the REST snapshot and wins.
+
+        Args:
+            symbol: Trading pair to get position for
+
+        Returns:
+            Position if exists, None otherwise (None also on query failure,
+            as in get() - Issue #41)
+        """
+        if self._running:
+            if not self.is_uncertain(symbol):
+                return self._cache[symbol][0]
+        else:
+            self.invalidate(symbol)
+
+        version = self._versions.get(symbol, 0)
+        try:
+            position = await self._query_position(symbol)
+        except Exception as e:
+            self.logger.error(
+                f"Fresh position query failed for {symbol}: {e}. "
+                f"Returning None to indicate uncertain state (Issue #41)."
+            )
+            return None
+
+        if self._versions.get(symbol, 0) != version:
+            cached = self._cache.get(symbol)
+            return cached[0] if cached is not None else position
+        self._store(symbol, position)
+        return position
+
+    async def _query_position(self, symbol: str) -> Optional["Position"]:
+        """Query one symbol's position over REST without blocking the loop."""
+        if isinstance(self._order_gateway, AsyncExecutionGateway):
+            return await self._order_gateway.get_position_async(symbol)
+        return await asyncio.to_thread(self._order_gateway.get_position, symbol)
+
+    async def _query_all_positions(self, symbols: List[str]) -> List[dict]:
+        """One batched positionRisk query that never blocks the loop."""
+        if isinstance(self._order_gateway, AsyncExecutionGateway):
+            return await self._order_gateway.get_all_positions(symbols, quiet=True)
+        return await asyncio.to_thread(
+            self._order_gateway.get_all_positions_sync, symbols, quiet=True
+        )
+
+    def is_uncertain(self, symbol: str) -> bool:
+        """
+        Whether the cached state for symbol cannot be trusted (Issue #41).
+
+        True if the symbol was never loaded, was invalidated, or was not
+        confirmed (WebSocket update or successful refresh) within the TTL.
+        A None position from get() is only "no position" when this is False.
+        """
+        entry = self._cache.get(symbol)
+        if entry is None:
+            return True
+        return time.time() - entry[1] >= self._ttl
+
     def invalidate(self, symbol: str) -> None:
         """
         Invalidate position cache for symbol.
@@ -116,9 +229,13 @@ class PositionCacheManager(PositionProvider):
         Args:
             symbol: Trading pair to invalidate cache for
         """
+        self._versions[symbol] = self._versions.get(symbol, 0) + 1
         if symbol in self._cache:
             del self._cache[symbol]
             self.logger.debug(f"Position cache invalidated for {symbol}")
+        if self._wakeup is not None:
+            # Push mode: reconcile now rather than at the next interval
+            self._wakeup.set()
         # Clear signal cooldown so new entries are possible after position close (Issue #101)
         if symbol in self._last_signal_time:
             del self._last_signal_time[symbol]
@@ -150,6 +267,7 @@ class PositionCacheManager(PositionProvider):
             # Skip if symbol not in our configured symbols
             if symbol not in allowed_symbols:
                 continue
+            self._versions[symbol] = self._versions.get(symbol, 0) + 1
 
             # Create Position object from WebSocket data
             if abs(update.position_amt) > 0:
@@ -188,3 +306,127 @@ class PositionCacheManager(PositionProvider):
 
         _, cache_time = self._cache[symbol]
         return (time.time() - cache_time) >= self._ttl
+
+    # Push mode: background reconciliation
+
+    async def start(self, symbols: Iterable[str]) -> None:
+        """
+        Switch to push mode and start background reconciliation.
+
+        The first reconciliation runs immediately, so symbols are loaded
+        without a per-symbol REST call on the candle path.
+
+        Args:
+            symbols: Symbols to reconcile (the active strategies)
+        """
+        if self._running:
+            return
+        self._symbols = sorted(set(symbols))
+        self._wakeup = asyncio.Event()
+        self._running = True
+        self._reconcile_task = asyncio.create_task(
+            self._reconcile_loop(), name="position_reconcile"
+        )
+        self.logger.info(
+            f"Position cache push mode started for {len(self._symbols)} symbols "
+            f"(reconcile every {self._reconcile_interval}s)"
+        )
+
+    async def stop(self) -> None:
+        """Stop background reconciliation and return to pull mode (idempotent)."""
+        self._running = False
+        self._wakeup = None
+        task, self._reconcile_task = self._reconcile_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def reconcile(self) -> bool:
+        """
+        Confirm every tracked symbol with one batched positionRisk query.
+
+        Symbols updated over WebSocket (or invalidated) while the query was
+        in flight keep their newer state. A REST result that disagrees with
+        a confirmed WebSocket state is logged as drift and wins.
+
+        Returns:
+            True if the query succeeded
+        """
+        symbols = list(self._symbols)
+        if not symbols:
+            return True
+
+        versions = {symbol: self._versions.get(symbol, 0) for symbol in symbols}
+        try:
+            open_positions = await self._query_all_positions(symbols)
+        except Exception as e:
+            self.logger.warning(
+                f"Position reconciliation failed: {e}. "
+                f"Entries become uncertain after {self._ttl:.0f}s without confirmation."
+            )
+            return False
+
+        self.reconciliations += 1
+        by_symbol = {p["symbol"]: p for p in open_positions}
+        for symbol in symbols:
+            if self._versions.get(symbol, 0) != versions[symbol]:
+                continue  # Newer WebSocket state or invalidation since the snapshot
+
+            try:
+                position = self._position_from_risk(by_symbol.get(symbol))
+            except (KeyError, ValueError, TypeError) as e:
+                self.logger.warning(f"Failed to parse reconciled position for {symbol}: {e}")
+                continue
+
+            cached = self._cache.get(symbol)
+            if cached is not None and _position_key(cached[0]) != _position_key(position):
+                self.drift_corrections += 1
+                self.logger.warning(
+                    f"Position drift for {symbol}: cached {_position_key(cached[0])}, "
+                    f"exchange {_position_key(position)}. Using exchange state."
+                )
+            self._store(symbol, position)
+        return True
+
+    async def _reconcile_loop(self) -> None:
+        """Reconcile on a fixed schedule, or right away after invalidate()."""
+        wakeup = self._wakeup
+        while self._running:
+            await self.reconcile()
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout=self._reconcile_interval)
+            except asyncio.TimeoutError:
+                pass
+            wakeup.clear()
+
+    def _store(self, symbol: str, position: Optional["Position"]) -> None:
+        self._cache[symbol] = (position, time.time())
+
+    def _position_from_risk(self, data: Optional[dict]) -> Optional["Position"]:
+        """Position from a get_all_positions entry (None means flat)."""
+        if data is None:
+            return None
+
+        from src.models.position import Position
+
+        position_amt = float(data["positionAmt"])
+        if position_amt == 0:
+            return None
+        return Position(
+            symbol=data["symbol"],
+            side="LONG" if position_amt > 0 else "SHORT",
+            quantity=abs(position_amt),
+            entry_price=float(data["entryPrice"]),
+            leverage=self._config_manager.trading_config.leverage,
+            unrealized_pnl=float(data.get("unrealizedProfit") or 0.0),
+        )
+
+
+def _position_key(position: Optional["Position"]) -> Optional[Tuple[str, float]]:
+    """Side and quantity, the fields that matter for drift detection."""
+    if position is None:
+        return None
+    return (position.side, position.quantity)
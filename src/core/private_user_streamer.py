@@ -14,6 +14,7 @@ from binance.websocket.um_futures.websocket_client import UMFuturesWebsocketClie
 
 from src.core.streamer_protocol import IDataStreamer
 from src.core.listen_key_manager import ListenKeyManager
+from src.core.ws_decoder import decode_message
 from src.models.position import PositionUpdate
 
 # Imports for type hinting only; prevents circular dependency at runtime
@@ -112,6 +113,9 @@ class PrivateUserStreamer(IDataStreamer):
         # Balance update callback for equity tracking
         self._balance_update_callback: Optional[Callable[[float], None]] = None
 
+        # Algo (conditional TP/SL) order update callback for placement confirmation
+        self._algo_update_callback: Optional[Callable[[dict], None]] = None
+
         # State management
         self._running = False
         self._is_connected = False
@@ -201,6 +205,19 @@ class PrivateUserStreamer(IDataStreamer):
         self._balance_update_callback = callback
         self.logger.debug("Balance update callback configured for PrivateUserStreamer")
 
+    def set_algo_update_callback(self, callback: Callable[[dict], None]) -> None:
+        """Set callback for conditional order updates from ALGO_UPDATE.
+
+        TP/SL orders are placed through the Algo Order API, so their
+        lifecycle (NEW, CANCELED, TRIGGERED, ...) arrives as ALGO_UPDATE
+        rather than ORDER_TRADE_UPDATE until they trigger.
+
+        Args:
+            callback: Function to call with the raw 'o' payload
+        """
+        self._algo_update_callback = callback
+        self.logger.debug("Algo update callback configured for PrivateUserStreamer")
+
     async def start(self) -> None:
         """
         Start User Data Stream WebSocket for real-time order updates.
@@ -300,6 +317,7 @@ class PrivateUserStreamer(IDataStreamer):
         Routes messages by event type:
         - ORDER_TRADE_UPDATE: Order status changes (fills, cancellations)
         - ACCOUNT_UPDATE: Position and balance changes
+        - ALGO_UPDATE: Conditional (TP/SL) order status changes
         - Other events: Ignored
 
         Args:
@@ -311,11 +329,8 @@ class PrivateUserStreamer(IDataStreamer):
             WebSocket library. Event publishing must be thread-safe.
         """
         try:
-            # Parse JSON string if needed
-            if isinstance(message, str):
-                data = json.loads(message)
-            else:
-                data = message
+            # Parse JSON string if needed (shared fast decoder)
+            data = decode_message(message)
 
             # Identify official exchange event type from the parsed message
             event_type = data.get("e")
@@ -324,6 +339,8 @@ class PrivateUserStreamer(IDataStreamer):
                 self._handle_order_trade_update(data)
             elif event_type == "ACCOUNT_UPDATE":
                 self._handle_account_update(data)
+            elif event_type == "ALGO_UPDATE":
+                self._handle_algo_update(data)
             # Ignore other event types
 
         except json.JSONDecodeError as e:
@@ -451,6 +468,39 @@ class PrivateUserStreamer(IDataStreamer):
             except Exception as e:
                 self.logger.error(f"Funding fee callback failed: {e}", exc_info=True)
 
+    def _handle_algo_update(self, data: dict) -> None:
+        """
+        Relay an ALGO_UPDATE event (conditional order status change).
+
+        Binance ALGO_UPDATE structure (fields used downstream):
+            {
+                "e": "ALGO_UPDATE",
+                "o": {
+                    "caid": "tpsl-...",           // Client algo ID
+                    "aid": 2148719,               // Algo ID
+                    "o": "TAKE_PROFIT_MARKET",    // Order type
+                    "s": "BTCUSDT",               // Symbol
+                    "S": "SELL",                  // Side
+                    "X": "NEW",                   // Algo status
+                    "tp": "52000.00"              // Trigger price
+                }
+            }
+
+        Args:
+            data: ALGO_UPDATE event data from Binance
+        """
+        order_data = data.get("o", {})
+        self.logger.info(
+            f"Algo order update: {order_data.get('s')} {order_data.get('o')} -> "
+            f"{order_data.get('X')} (algoId: {order_data.get('aid')})"
+        )
+
+        if self._algo_update_callback:
+            try:
+                self._algo_update_callback(order_data)
+            except Exception as e:
+                self.logger.error(f"Algo update callback failed: {e}", exc_info=True)
+
     def _handle_order_trade_update(self, data: dict) -> None:
         """
         Process official ORDER_TRADE_UPDATE event and relay via callbacks.
@@ -6,15 +6,16 @@ This module provides the PublicMarketStreamer class for streaming live market da
 """
 
 import asyncio
-import json
 import logging
 import time
-from datetime import datetime, timezone
-from typing import Callable, List, Optional
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
 
 from binance.websocket.um_futures.websocket_client import UMFuturesWebsocketClient
 
+from src.core.candle_update_filter import CandleUpdateFilter
 from src.core.streamer_protocol import IDataStreamer
+from src.core.ws_decoder import decode_message, kline_to_candle
 from src.models.candle import Candle
 
 
@@ -23,11 +24,12 @@ class PublicMarketStreamer(IDataStreamer):
     Public market data streamer for Binance USDT-M Futures.
 
     Handles WebSocket connections for receiving real-time kline (candlestick)
-    data from Binance. Supports multiple symbols with separate connections
-    per symbol for reliability.
+    data from Binance. All symbol/interval streams are packed into as few
+    combined-stream connections as the per-connection stream limit allows,
+    so socket and thread count no longer grow with the symbol list.
 
     Responsibilities (Issue #96 - Pure Data Relay, #107 - Callback Pattern):
-        - WebSocket connection management (one per symbol)
+        - WebSocket connection management (combined streams, chunked)
         - Kline message parsing and Candle object creation
         - Connection heartbeat monitoring
         - Graceful cleanup on shutdown
@@ -49,12 +51,16 @@ class PublicMarketStreamer(IDataStreamer):
     Attributes:
         TESTNET_WS_URL: Binance Futures testnet WebSocket endpoint
         MAINNET_WS_URL: Binance Futures mainnet WebSocket endpoint
+        MAX_STREAMS_PER_CONNECTION: Binance limit of streams per connection
     """
 
     # Default WebSocket URLs for fallback when no config provided (Issue #92)
     DEFAULT_TESTNET_WS_URL = "wss://stream.binancefuture.com"
     DEFAULT_MAINNET_WS_URL = "wss://fstream.binance.com"
 
+    # Binance USDT-M Futures: a single connection can listen to max 1024 streams
+    MAX_STREAMS_PER_CONNECTION = 1024
+
     def __init__(
         self,
         symbols: List[str],
@@ -62,6 +68,8 @@ class PublicMarketStreamer(IDataStreamer):
         is_testnet: bool = True,
         on_candle_callback: Optional[Callable[[Candle], None]] = None,
         ws_url: Optional[str] = None,
+        streams_per_connection: int = MAX_STREAMS_PER_CONNECTION,
+        update_filter: Optional[CandleUpdateFilter] = None,
     ) -> None:
         """
         Initialize PublicMarketStreamer.
@@ -74,12 +82,22 @@ class PublicMarketStreamer(IDataStreamer):
                                Signature: callback(candle: Candle) -> None
             ws_url: Optional custom WebSocket URL (Issue #92).
                     If None, uses default Binance endpoints.
+            streams_per_connection: Maximum kline streams multiplexed on one
+                    combined-stream connection (1 to MAX_STREAMS_PER_CONNECTION).
+            update_filter: Optional per-stream emission policy for open-candle
+                    updates. Suppressed updates are dropped right after JSON
+                    parsing, before a Candle is built. Closed candles always pass.
         """
         # Validate inputs
         if not symbols:
             raise ValueError("symbols list cannot be empty")
         if not intervals:
             raise ValueError("intervals list cannot be empty")
+        if not 1 <= streams_per_connection <= self.MAX_STREAMS_PER_CONNECTION:
+            raise ValueError(
+                f"streams_per_connection must be between 1 and "
+                f"{self.MAX_STREAMS_PER_CONNECTION}, got {streams_per_connection}"
+            )
 
         self.symbols = [s.upper() for s in symbols]
         self.intervals = intervals
@@ -96,7 +114,28 @@ class PublicMarketStreamer(IDataStreamer):
                 else self.DEFAULT_MAINNET_WS_URL
             )
 
-        # WebSocket clients (one per symbol)
+        # Stream name → (symbol, interval), used to route combined-stream payloads
+        self._stream_routes: Dict[str, Tuple[str, str]] = {
+            f"{symbol.lower()}@kline_{interval}": (symbol, interval)
+            for symbol in self.symbols
+            for interval in self.intervals
+        }
+
+        # Stream names grouped per connection (symbol-major, chunked)
+        stream_names = list(self._stream_routes)
+        self._connection_streams: List[List[str]] = [
+            stream_names[i : i + streams_per_connection]
+            for i in range(0, len(stream_names), streams_per_connection)
+        ]
+
+        # Intra-candle update gate (None = emit every update)
+        self._update_filter = (
+            update_filter
+            if update_filter is not None and not update_filter.passes_everything
+            else None
+        )
+
+        # WebSocket clients (one per combined-stream connection)
         self.ws_clients: dict[str, UMFuturesWebsocketClient] = {}
 
         # State management
@@ -116,19 +155,24 @@ class PublicMarketStreamer(IDataStreamer):
             f"environment={'TESTNET' if is_testnet else 'MAINNET'}"
         )
 
+    @property
+    def suppressed_updates(self) -> int:
+        """Open-candle updates dropped by the update filter."""
+        return self._update_filter.suppressed if self._update_filter else 0
+
     @property
     def is_connected(self) -> bool:
         """
         Check if WebSocket connections are active.
 
         Returns:
-            True if all required symbol connections are active, False otherwise.
+            True if all required stream connections are active, False otherwise.
         """
         if not self._is_connected or not self.ws_clients:
             return False
 
-        # Consider connected if we have clients for all symbols
-        return len(self.ws_clients) == len(self.symbols)
+        # Consider connected if every stream chunk has its client
+        return len(self.ws_clients) == len(self._connection_streams)
 
     def _handle_kline_message(self, _, message) -> None:
         """
@@ -136,6 +180,8 @@ class PublicMarketStreamer(IDataStreamer):
 
         Parses Binance WebSocket kline messages into Candle objects.
         Invokes callback if configured and logs parsing errors gracefully.
+        Combined-stream payloads ({"stream": ..., "data": ...}) are routed by
+        their stream name; streams this streamer did not subscribe are ignored.
 
         Args:
             _: Unused first parameter (WebSocket client passes it)
@@ -146,9 +192,16 @@ class PublicMarketStreamer(IDataStreamer):
             WebSocket disconnection on malformed messages.
         """
         try:
-            # Parse JSON string if needed
-            if isinstance(message, str):
-                message = json.loads(message)
+            # Parse JSON string if needed (orjson when available)
+            message = decode_message(message)
+
+            # Unwrap combined-stream envelope
+            stream = message.get("stream")
+            if stream is not None:
+                if stream not in self._stream_routes:
+                    self.logger.debug(f"Ignoring message for unsubscribed stream: {stream}")
+                    return
+                message = message["data"]
 
             # Validate message type
             event_type = message.get("e")
@@ -162,23 +215,13 @@ class PublicMarketStreamer(IDataStreamer):
                 self.logger.error(f"Message missing 'k' (kline data): {message}")
                 return
 
-            # Parse and convert all fields
-            candle = Candle(
-                symbol=kline["s"],
-                interval=kline["i"],
-                open_time=datetime.fromtimestamp(
-                    kline["t"] / 1000, tz=timezone.utc
-                ).replace(tzinfo=None),
-                close_time=datetime.fromtimestamp(
-                    kline["T"] / 1000, tz=timezone.utc
-                ).replace(tzinfo=None),
-                open=float(kline["o"]),
-                high=float(kline["h"]),
-                low=float(kline["l"]),
-                close=float(kline["c"]),
-                volume=float(kline["v"]),
-                is_closed=kline["x"],
-            )
+            # Drop suppressed intra-candle updates before building a Candle
+            update_filter = self._update_filter
+            if update_filter is not None and not update_filter.admit(kline, message.get("E")):
+                return
+
+            # Parse fields (trusted exchange data: no validation, lazy datetimes)
+            candle = kline_to_candle(kline)
 
             # Invoke user callback if configured
             if self.on_candle_callback:
@@ -204,8 +247,10 @@ class PublicMarketStreamer(IDataStreamer):
         """
         Start WebSocket streaming for all configured symbol/interval pairs.
 
-        Establishes separate WebSocket connections for each symbol to ensure
-        reliability on Binance Testnet.
+        Opens one combined-stream connection per chunk of
+        streams_per_connection streams and subscribes the whole chunk with a
+        single SUBSCRIBE request. Connections are opened off the event loop
+        (the client's handshake is blocking).
 
         Raises:
             ConnectionError: If WebSocket connection fails
@@ -219,34 +264,27 @@ class PublicMarketStreamer(IDataStreamer):
             stream_url = self._ws_url
 
             self.logger.info(
-                f"Initializing {len(self.symbols)} WebSocket connections to {stream_url}"
+                f"Initializing {len(self._connection_streams)} combined-stream "
+                f"WebSocket connections to {stream_url}"
             )
 
             total_stream_count = 0
 
-            # Create a separate client for each symbol
-            for symbol in self.symbols:
-                self.logger.info(f"Establishing connection for {symbol}...")
-
-                client = UMFuturesWebsocketClient(
-                    stream_url=stream_url, on_message=self._handle_kline_message
+            # One combined-stream client per chunk of streams
+            for index, streams in enumerate(self._connection_streams):
+                connection_id = f"conn-{index}"
+                self.logger.info(
+                    f"Establishing {connection_id} for {len(streams)} streams..."
                 )
 
-                # Subscribe to all intervals for this symbol
-                symbol_stream_count = 0
-                for interval in self.intervals:
-                    stream_name = f"{symbol.lower()}@kline_{interval}"
-                    self.logger.debug(f"[{symbol}] Subscribing to: {stream_name}")
-
-                    client.kline(symbol=symbol.lower(), interval=interval)
-                    symbol_stream_count += 1
+                client = await asyncio.to_thread(self._open_connection, stream_url, streams)
 
                 # Store the client
-                self.ws_clients[symbol] = client
-                total_stream_count += symbol_stream_count
+                self.ws_clients[connection_id] = client
+                total_stream_count += len(streams)
 
                 # Small delay to prevent connection rate limiting
-                if len(self.symbols) > 1:
+                if index < len(self._connection_streams) - 1:
                     await asyncio.sleep(0.1)
 
             # Update state flags
@@ -269,6 +307,19 @@ class PublicMarketStreamer(IDataStreamer):
             await self.stop()
             raise ConnectionError(f"WebSocket initialization failed: {e}")
 
+    def _open_connection(
+        self, stream_url: str, streams: List[str]
+    ) -> UMFuturesWebsocketClient:
+        """Open a combined-stream connection and subscribe it to ``streams``."""
+        client = UMFuturesWebsocketClient(
+            stream_url=stream_url,
+            on_message=self._handle_kline_message,
+            is_combined=True,
+        )
+        self.logger.debug(f"Subscribing to: {', '.join(streams)}")
+        client.subscribe(streams)
+        return client
+
     async def stop(self, timeout: float = 5.0) -> None:
         """
         Gracefully stop streaming and cleanup resources.
@@ -303,7 +354,7 @@ class PublicMarketStreamer(IDataStreamer):
                 )
 
                 stop_tasks = []
-                for symbol, client in self.ws_clients.items():
+                for client in self.ws_clients.values():
                     stop_tasks.append(asyncio.to_thread(client.stop))
 
                 if stop_tasks:
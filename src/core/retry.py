@@ -6,10 +6,11 @@ backoff for API operations that may fail due to transient errors like rate
 limits or temporary server issues.
 """
 
+import asyncio
 import logging
 import time
 from functools import wraps
-from typing import Callable, Tuple, Type
+from typing import Any, Callable, Dict, Tuple, Type
 
 from binance.error import ClientError, ServerError
 
@@ -29,6 +30,32 @@ RETRYABLE_HTTP_STATUS = {
 }
 
 
+def _classify_error(e: Exception) -> Tuple[bool, Dict[str, Any]]:
+    """
+    Decide whether an API error is transient.
+
+    Returns:
+        (should_retry, error_info) where error_info is used for logging
+    """
+    if isinstance(e, ClientError):
+        error_info = {
+            "status_code": e.status_code,
+            "error_code": e.error_code,
+            "error_message": e.error_message,
+        }
+        # Retry only on retryable error codes or HTTP status
+        should_retry = (
+            e.error_code in RETRYABLE_ERROR_CODES or e.status_code in RETRYABLE_HTTP_STATUS
+        )
+        return should_retry, error_info
+
+    if isinstance(e, ServerError):
+        # Retry on all server errors (5xx)
+        return True, {"status_code": e.status_code, "message": e.message}
+
+    return False, {}
+
+
 def retry_with_backoff(
     max_retries: int = 3,
     initial_delay: float = 1.0,
@@ -81,29 +108,7 @@ def retry_with_backoff(
 
                 except retryable_exceptions as e:
                     last_exception = e
-
-                    # Check if this error should be retried
-                    should_retry = False
-                    error_info = {}
-
-                    if isinstance(e, ClientError):
-                        error_info = {
-                            "status_code": e.status_code,
-                            "error_code": e.error_code,
-                            "error_message": e.error_message,
-                        }
-
-                        # Retry only on retryable error codes or HTTP status
-                        should_retry = (
-                            e.error_code in RETRYABLE_ERROR_CODES
-                            or e.status_code in RETRYABLE_HTTP_STATUS
-                        )
-
-                    elif isinstance(e, ServerError):
-                        error_info = {"status_code": e.status_code, "message": e.message}
-
-                        # Retry on all server errors (5xx)
-                        should_retry = True
+                    should_retry, error_info = _classify_error(e)
 
                     # If this is the last attempt or error is not retryable, re-raise
                     if attempt == max_retries or not should_retry:
@@ -128,3 +133,53 @@ def retry_with_backoff(
         return wrapper
 
     return decorator
+
+
+def async_retry_with_backoff(
+    max_retries: int = 3,
+    initial_delay: float = 1.0,
+    backoff_factor: float = 2.0,
+    retryable_exceptions: Tuple[Type[Exception], ...] = (ClientError, ServerError),
+):
+    """
+    Coroutine counterpart of retry_with_backoff.
+
+    Same retry policy and logging, but waits with ``asyncio.sleep`` so other
+    tasks keep running on the event loop between attempts.
+
+    Usage:
+        @async_retry_with_backoff(max_retries=3, initial_delay=1.0)
+        async def place_order(self, symbol: str, side: str, ...):
+            return await self.client.new_order(...)
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            logger = logging.getLogger(func.__module__)
+            delay = initial_delay
+
+            for attempt in range(max_retries + 1):
+                try:
+                    return await func(*args, **kwargs)
+
+                except retryable_exceptions as e:
+                    should_retry, error_info = _classify_error(e)
+
+                    if attempt == max_retries or not should_retry:
+                        logger.error(
+                            f"{func.__name__} failed after {attempt + 1} attempts: {error_info}"
+                        )
+                        raise
+
+                    logger.warning(
+                        f"{func.__name__} attempt {attempt + 1}/{max_retries} failed: "
+                        f"{error_info}. Retrying in {delay}s..."
+                    )
+
+                    await asyncio.sleep(delay)
+                    delay *= backoff_factor
+
+        return wrapper
+
+    return decorator
@@ -9,6 +9,8 @@ Coordinates:
 
 Refactored (Issue #110): Delegates to specialized modules:
 - PositionCacheManager: Position state caching with TTL
+- BalanceCache: WebSocket-fed wallet balance for sizing
+- ExchangeInfoCache: Persisted symbol filters shared by OrderGateway/RiskGuard
 - TradeCoordinator: Signal validation and order execution
 - EventDispatcher: Candle routing and strategy analysis
 """
@@ -25,8 +27,13 @@ if TYPE_CHECKING:
 from src.data.base import MarketDataProvider
 from src.core.event_bus import EventBus
 from src.core.exceptions import EngineState
+from src.core.backfill_scheduler import BackfillJob, BackfillScheduler
+from src.core.balance_cache import BalanceCache
+from src.core.binance_service import RequestWeightTracker
+from src.core.exchange_info_cache import ExchangeInfoCache
 from src.core.position_cache_manager import PositionCacheManager
 from src.core.event_dispatcher import EventDispatcher
+from src.execution.base import AsyncExecutionGateway
 from src.execution.order_gateway import OrderGateway
 from src.execution.trade_coordinator import TradeCoordinator
 from src.models.candle import Candle
@@ -85,6 +92,10 @@ class TradingEngine:
 
         # Balance tracking for cost analysis
         self._latest_wallet_balance: Optional[float] = None
+        # WebSocket-fed balance for position sizing (REST fallback when stale)
+        self.balance_cache: Optional[BalanceCache] = None
+        # Symbol filters/quantizers (warm-started from disk, refreshed in background)
+        self.exchange_info: Optional[ExchangeInfoCache] = None
 
         # Runtime state
         self._running: bool = False
@@ -155,13 +166,29 @@ class TradingEngine:
             base_url=binance_config.get_rest_url(is_testnet),
         )
 
-        # Step 2: Initialize OrderGateway
-        self.logger.info("Creating OrderGateway...")
+        # Step 1.6: Load persisted exchange info (no exchangeInfo download on restart)
+        self.exchange_info = ExchangeInfoCache(
+            path=binance_config.exchange_info_cache_path,
+            source=binance_config.get_rest_url(is_testnet),
+        )
+        self.exchange_info.load()
+
+        # Step 2: Initialize OrderGateway (non-blocking variant if configured)
         from src.execution.order_gateway import OrderGateway
 
-        self.order_gateway = OrderGateway(
+        gateway_cls = OrderGateway
+        if binance_config.async_rest:
+            from src.execution.async_order_gateway import AsyncOrderGateway
+
+            gateway_cls = AsyncOrderGateway
+
+        self.logger.info(
+            f"Creating {'AsyncOrderGateway' if binance_config.async_rest else 'OrderGateway'}..."
+        )
+        self.order_gateway = gateway_cls(
             audit_logger=self.audit_logger,
             binance_service=self.binance_service,
+            exchange_info=self.exchange_info,
         )
 
         # Step 3: Initialize RiskGuard
@@ -176,6 +203,7 @@ class TradingEngine:
                 "max_position_size_percent": 0.1,  # 10% of account
             },
             audit_logger=self.audit_logger,
+            exchange_info=self.exchange_info,
         )
 
         # Step 4/4.5: Create strategy instances via DynamicAssembler
@@ -218,6 +246,7 @@ class TradingEngine:
         self.logger.info("Creating data collection components...")
 
         # Step 5a: Create PublicMarketStreamer for kline WebSocket
+        from src.core.candle_update_filter import CandleUpdateFilter
         from src.core.public_market_streamer import PublicMarketStreamer
 
         self.logger.info("  Creating PublicMarketStreamer...")
@@ -227,6 +256,8 @@ class TradingEngine:
             is_testnet=is_testnet,
             on_candle_callback=self.on_candle_received,
             ws_url=binance_config.get_ws_url(is_testnet),
+            streams_per_connection=binance_config.ws_streams_per_connection,
+            update_filter=CandleUpdateFilter.from_config(trading_config.candle_updates),
         )
 
         # Step 5b: Create PrivateUserStreamer for order updates
@@ -257,6 +288,7 @@ class TradingEngine:
             order_gateway=self.order_gateway,
             config_manager=self.config_manager,
         )
+        self.balance_cache = BalanceCache(order_gateway=self.order_gateway)
 
         # Phase 2: TradeCoordinator
         self.trade_coordinator = TradeCoordinator(
@@ -265,6 +297,7 @@ class TradingEngine:
             config_manager=self.config_manager,
             audit_logger=self.audit_logger,
             position_cache_manager=self.position_cache_manager,
+            balance_cache=self.balance_cache,
         )
         self.trade_coordinator._get_wallet_balance = lambda: self._latest_wallet_balance
         self.trade_coordinator._get_position_metrics = self._get_position_metrics
@@ -362,6 +395,10 @@ class TradingEngine:
         self.logger.info("Starting TradingEngine")
 
         try:
+            # Refresh symbol filters off the order path whenever they expire
+            if self.exchange_info is not None and self.order_gateway is not None:
+                await self.exchange_info.start(self.order_gateway._ensure_exchange_info)
+
             # Start all components concurrently
             tasks = [
                 # EventBus always runs
@@ -387,10 +424,17 @@ class TradingEngine:
                             order_fill_callback=self._on_order_fill_from_websocket,
                             funding_fee_callback=self._on_funding_fee_received,
                             balance_update_callback=self._on_balance_update,
+                            algo_update_callback=self._on_algo_update_from_websocket,
                         )
                         self.logger.info(
                             "User Data Stream enabled for order updates, position cache, and order cache"
                         )
+                        # Balance and positions are authoritative only while
+                        # ACCOUNT_UPDATE flows
+                        if self.balance_cache is not None:
+                            await self.balance_cache.start()
+                        if self.position_cache_manager is not None:
+                            await self.position_cache_manager.start(self.strategies.keys())
                     else:
                         self.logger.warning(
                             "DataCollector does not support start_user_streaming; skipping."
@@ -454,6 +498,20 @@ class TradingEngine:
             self.logger.error(f"Error during shutdown: {e}", exc_info=True)
 
         finally:
+            if self.exchange_info is not None:
+                await self.exchange_info.stop()
+            if self.balance_cache is not None:
+                await self.balance_cache.stop()
+            if self.position_cache_manager is not None:
+                await self.position_cache_manager.stop()
+
+            # Release the order gateway's HTTP connection pool
+            if isinstance(self.order_gateway, AsyncExecutionGateway):
+                try:
+                    await self.order_gateway.close()
+                except Exception as e:
+                    self.logger.warning(f"Failed to close order gateway session: {e}")
+
             # Stop AuditLogger to flush remaining audit logs
             if self.audit_logger:
                 self.logger.info("Stopping AuditLogger and flushing audit logs...")
@@ -503,7 +561,9 @@ class TradingEngine:
                     f"Single-interval strategy with {list(required_intervals)[0]}"
                 )
 
-    async def initialize_strategy_with_backfill(self, default_limit: int = 100) -> None:
+    async def initialize_strategy_with_backfill(
+        self, default_limit: int = 100, max_concurrency: int = 8
+    ) -> None:
         """
         Initialize strategy with historical data by fetching directly from API.
 
@@ -512,6 +572,15 @@ class TradingEngine:
 
         Uses per-interval backfill limits from strategy.data_requirements
         when available, falling back to default_limit.
+
+        Requests for all (symbol, interval) pairs run concurrently through
+        BackfillScheduler (bounded thread pool, budgeted against the shared
+        RequestWeightTracker). Each result is fed to
+        strategy.initialize_with_historical_data as soon as it arrives.
+
+        Args:
+            default_limit: Candles per interval when the strategy declares none
+            max_concurrency: Maximum concurrent kline requests
         """
         if not self.strategies:
             self.logger.warning(
@@ -528,80 +597,67 @@ class TradingEngine:
 
         self.logger.info(
             f"Initializing {len(self.strategies)} strategies "
-            f"with default {default_limit} historical candles per interval (sequential to avoid rate limits)"
+            f"with default {default_limit} historical candles per interval "
+            f"(up to {max_concurrency} concurrent requests)"
         )
 
-        # Initialize each symbol's strategy sequentially (Issue #8 Phase 3)
-        symbol_count = 0
+        jobs = []
         for symbol, strategy in self.strategies.items():
-            symbol_count += 1
             try:
-                self.logger.info(
-                    f"[{symbol_count}/{len(self.strategies)}] "
-                    f"Initializing strategy for {symbol}..."
-                )
-
                 self.logger.info(
                     f"Initializing strategy intervals: "
                     f"{strategy.intervals} for {symbol}"
                 )
-
                 # Use per-interval backfill limits from module requirements
                 requirements = strategy.data_requirements
-
-                initialized_count = 0
                 for interval in strategy.intervals:
-                    try:
-                        limit = requirements.min_candles.get(interval, default_limit)
-                        candles = self.data_collector.get_historical_candles(
-                            symbol=symbol, interval=interval, limit=limit
-                        )
-
-                        if candles:
-                            self.logger.info(
-                                f"Fetched {len(candles)} candles "
-                                f"for {symbol} {interval}"
-                            )
-
-                            strategy.initialize_with_historical_data(
-                                candles, interval=interval
-                            )
-                            initialized_count += 1
-                        else:
-                            self.logger.warning(
-                                f"No candles returned for {symbol} {interval}"
-                            )
-
-                    except Exception as e:
-                        self.logger.error(
-                            f"Failed to fetch {symbol} {interval}: {e}"
-                        )
-
-                if initialized_count > 0:
-                    self.logger.info(
-                        f"✅ Strategy initialization complete: "
-                        f"{initialized_count}/{len(strategy.intervals)} intervals "
-                        f"initialized for {symbol}"
-                    )
-                else:
-                    self.logger.warning(
-                        f"No intervals initialized for strategy '{symbol}'"
-                    )
-
+                    limit = requirements.min_candles.get(interval, default_limit)
+                    jobs.append(BackfillJob(symbol, interval, limit))
             except Exception as e:
                 self.logger.error(
                     f"❌ Failed to initialize strategy for {symbol}: {e}",
                     exc_info=True,
                 )
 
-            # Rate limit protection: Wait between symbols (Issue #8 Phase 3)
-            if symbol_count < len(self.strategies):
-                delay = 0.5
-                self.logger.debug(
-                    f"Waiting {delay}s before next symbol "
-                    f"(rate limit protection)..."
+        initialized: Dict[str, int] = {}
+
+        def on_result(job: BackfillJob, candles) -> None:
+            if not candles:
+                self.logger.warning(f"No candles returned for {job.symbol} {job.interval}")
+                return
+            self.logger.info(f"Fetched {len(candles)} candles for {job.symbol} {job.interval}")
+            self.strategies[job.symbol].initialize_with_historical_data(
+                candles, interval=job.interval
+            )
+            initialized[job.symbol] = initialized.get(job.symbol, 0) + 1
+
+        # Budget against the live REST weight when a BinanceServiceClient exists
+        tracker = getattr(getattr(self, "binance_service", None), "weight_tracker", None)
+        scheduler = BackfillScheduler(
+            fetch=self.data_collector.get_historical_candles,
+            weight_tracker=tracker if isinstance(tracker, RequestWeightTracker) else None,
+            max_workers=max_concurrency,
+        )
+        report = await scheduler.run(jobs, on_result)
+
+        for symbol, strategy in self.strategies.items():
+            count = initialized.get(symbol, 0)
+            if count > 0:
+                self.logger.info(
+                    f"✅ Strategy initialization complete: "
+                    f"{count}/{len(strategy.intervals)} intervals "
+                    f"initialized for {symbol}"
+                )
+            else:
+                self.logger.warning(
+                    f"No intervals initialized for strategy '{symbol}'"
                 )
-                await asyncio.sleep(delay)
+
+        self.logger.info(
+            f"Backfill finished in {report.elapsed_seconds:.2f}s: "
+            f"{len(report.succeeded)}/{len(jobs)} requests succeeded, "
+            f"{len(report.failed)} failed, throttled {report.throttled_seconds:.1f}s"
+        )
 
     def _setup_event_handlers(self) -> None:
         """
@@ -653,6 +709,21 @@ class TradingEngine:
         except Exception as e:
             self.logger.warning(f"Failed to update order cache from WebSocket: {e}")
 
+    def _on_algo_update_from_websocket(self, order_data: dict) -> None:
+        """
+        Handle conditional order updates from WebSocket ALGO_UPDATE events.
+
+        Forwards to the order gateway so in-flight TP/SL placements can be
+        confirmed by the exchange.
+        """
+        if self.order_gateway is None or not hasattr(self.order_gateway, "on_algo_update"):
+            return
+
+        try:
+            self.order_gateway.on_algo_update(order_data)
+        except Exception as e:
+            self.logger.warning(f"Failed to relay algo order update: {e}")
+
     def _on_order_fill_from_websocket(self, order_data: dict) -> None:
         """
         Handle order fill events from WebSocket ORDER_TRADE_UPDATE via callback.
@@ -726,6 +797,8 @@ class TradingEngine:
         from src.core.audit_logger import AuditEventType
 
         self._latest_wallet_balance = wallet_balance
+        if self.balance_cache is not None:
+            self.balance_cache.update_from_websocket(wallet_balance)
 
         self.audit_logger.log_event(
             event_type=AuditEventType.FUNDING_FEE_RECEIVED,
@@ -742,9 +815,12 @@ class TradingEngine:
     def _on_balance_update(self, wallet_balance: float) -> None:
         """Handle balance update from WebSocket ACCOUNT_UPDATE.
 
-        Caches latest wallet balance for inclusion in position closure logs.
+        Caches latest wallet balance for inclusion in position closure logs
+        and feeds the BalanceCache used for position sizing.
         """
         self._latest_wallet_balance = wallet_balance
+        if self.balance_cache is not None:
+            self.balance_cache.update_from_websocket(wallet_balance)
 
     def _get_position_metrics(self, symbol: str, side: str):
         """Retrieve MFE/MAE metrics from the exit determiner for a closed position."""
@@ -0,0 +1,67 @@
+"""Decoding of Binance WebSocket payloads on the ingestion hot path.
+
+Uses orjson when it is installed (``pip install orjson``), falling back to the
+standard library json module. orjson.JSONDecodeError subclasses
+json.JSONDecodeError, so callers catch one exception type either way.
+
+Kline payloads are turned into candles with Candle.from_exchange(): epoch
+millisecond timestamps are kept as-is (datetimes are materialized lazily)
+and coherence validation is skipped for exchange-produced data.
+"""
+
+import json
+from typing import Any, Dict, Union
+
+from src.models.candle import Candle
+
+try:
+    import orjson
+except ImportError:  # Optional speedup
+    orjson = None
+
+RawMessage = Union[str, bytes, bytearray, Dict[str, Any]]
+
+#: Name of the JSON backend in use ("orjson" or "json")
+JSON_BACKEND = "orjson" if orjson is not None else "json"
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def decode_message(message: RawMessage) -> Dict[str, Any]:
+    """
+    Parse a raw WebSocket message into a dict.
+
+    Args:
+        message: JSON text/bytes as received, or an already-parsed dict
+
+    Returns:
+        Parsed message
+
+    Raises:
+        json.JSONDecodeError: If the text is not valid JSON
+    """
+    if isinstance(message, (str, bytes, bytearray)):
+        return _loads(message)
+    return message
+
+
+def kline_to_candle(kline: Dict[str, Any]) -> Candle:
+    """
+    Build a Candle from the ``k`` object of a kline stream event.
+
+    Raises:
+        KeyError: If a required field is missing
+        ValueError, TypeError: If a price/volume field is not numeric
+    """
+    return Candle.from_exchange(
+        symbol=kline["s"],
+        interval=kline["i"],
+        open_time_ms=int(kline["t"]),
+        close_time_ms=int(kline["T"]),
+        open=float(kline["o"]),
+        high=float(kline["h"]),
+        low=float(kline["l"]),
+        close=float(kline["c"]),
+        volume=float(kline["v"]),
+        is_closed=kline["x"],
+    )
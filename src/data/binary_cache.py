@@ -0,0 +1,195 @@
+"""Binary columnar candle cache for backtesting.
+
+Each ``(symbol, interval)`` series is stored as one fixed-width structured
+NumPy file at ``<root>/<symbol>/<interval>.npy``:
+
+    open_time  int64    epoch milliseconds (UTC)
+    close_time int64    epoch milliseconds (UTC)
+    open, high, low, close, volume  float64
+    is_closed  bool
+
+Files are opened memory-mapped, so loading is O(1) regardless of history
+length; pages are read from disk only when a row is touched.
+:class:`CandleArray` exposes a series as a read-only ``Sequence[Candle]``
+and builds each :class:`Candle` only when it is accessed, while the raw
+columns stay available for vectorized consumers via :attr:`CandleArray.data`.
+
+Timestamps are stored as UTC; naive datetimes are taken to be UTC (as the
+CSV loader produces them) and materialized candles carry naive UTC
+datetimes.
+"""
+
+import logging
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterator, List, Sequence, Union, overload
+
+import numpy as np
+
+from src.models.candle import Candle
+
+CANDLE_DTYPE = np.dtype(
+    [
+        ("open_time", "<i8"),
+        ("close_time", "<i8"),
+        ("open", "<f8"),
+        ("high", "<f8"),
+        ("low", "<f8"),
+        ("close", "<f8"),
+        ("volume", "<f8"),
+        ("is_closed", "?"),
+    ]
+)
+
+_EPOCH = datetime(1970, 1, 1)
+_MS = timedelta(milliseconds=1)
+_SUFFIX = ".npy"
+
+logger = logging.getLogger(__name__)
+
+
+def _to_ms(value: datetime) -> int:
+    """Epoch milliseconds for a naive (UTC) or aware datetime."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return (value - _EPOCH) // _MS
+
+
+class CandleArray(Sequence[Candle]):
+    """Read-only candle sequence backed by a structured NumPy array.
+
+    Indexing materializes a :class:`Candle`; slicing returns a list (like a
+    ``list`` slice) so callers of ``get_historical_candles`` see no
+    difference from the in-memory representation.
+
+    Args:
+        data: Structured array with :data:`CANDLE_DTYPE` (usually a memmap).
+        symbol: Trading pair stamped on materialized candles.
+        interval: Timeframe stamped on materialized candles.
+    """
+
+    __slots__ = ("_data", "symbol", "interval")
+
+    def __init__(self, data: np.ndarray, symbol: str, interval: str) -> None:
+        if data.dtype != CANDLE_DTYPE:
+            raise ValueError(f"Unexpected candle dtype {data.dtype}, expected {CANDLE_DTYPE}")
+        self._data = data
+        self.symbol = symbol
+        self.interval = interval
+
+    @property
+    def data(self) -> np.ndarray:
+        """Underlying structured array (columns by field name, no copy)."""
+        return self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @overload
+    def __getitem__(self, index: int) -> Candle: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Candle]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Candle, List[Candle]]:
+        if isinstance(index, slice):
+            return [self._materialize(row) for row in self._data[index].tolist()]
+        return self._materialize(self._data[index].item())
+
+    def __iter__(self) -> Iterator[Candle]:
+        return self.iter_from(0)
+
+    def iter_from(self, start: int) -> Iterator[Candle]:
+        """Lazily yield candles from ``start`` onwards (no rows before it are read)."""
+        for index in range(start, len(self._data)):
+            yield self._materialize(self._data[index].item())
+
+    def _materialize(self, row: tuple) -> Candle:
+        open_time, close_time, open_, high, low, close, volume, is_closed = row
+        return Candle(
+            symbol=self.symbol,
+            interval=self.interval,
+            open_time=_EPOCH + open_time * _MS,
+            open=open_,
+            high=high,
+            low=low,
+            close=close,
+            volume=volume,
+            close_time=_EPOCH + close_time * _MS,
+            is_closed=is_closed,
+        )
+
+
+def candles_to_array(candles: Sequence[Candle]) -> np.ndarray:
+    """Pack candles into a structured array with :data:`CANDLE_DTYPE`."""
+    if isinstance(candles, CandleArray):
+        return np.asarray(candles.data)
+    return np.fromiter(
+        (
+            (
+                _to_ms(c.open_time),
+                _to_ms(c.close_time),
+                c.open,
+                c.high,
+                c.low,
+                c.close,
+                c.volume,
+                c.is_closed,
+            )
+            for c in candles
+        ),
+        dtype=CANDLE_DTYPE,
+        count=len(candles),
+    )
+
+
+def series_path(root: str, symbol: str, interval: str) -> str:
+    """File path of one ``(symbol, interval)`` series under ``root``."""
+    return os.path.join(root, symbol, interval + _SUFFIX)
+
+
+def write_series(root: str, symbol: str, interval: str, candles: Sequence[Candle]) -> str:
+    """Write one series to ``root`` and return its path."""
+    path = series_path(root, symbol, interval)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    np.save(path, candles_to_array(candles), allow_pickle=False)
+    return path
+
+
+def read_series(root: str, symbol: str, interval: str, mmap: bool = True) -> CandleArray:
+    """Open one series; ``mmap=False`` reads it fully into memory instead."""
+    data = np.load(
+        series_path(root, symbol, interval),
+        mmap_mode="r" if mmap else None,
+        allow_pickle=False,
+    )
+    return CandleArray(data, symbol, interval)
+
+
+def write_cache(root: str, candle_data: Dict[str, Dict[str, Sequence[Candle]]]) -> None:
+    """Write every series of ``{symbol: {interval: [candles]}}`` under ``root``."""
+    for symbol, intervals in candle_data.items():
+        for interval, candles in intervals.items():
+            path = write_series(root, symbol, interval, candles)
+            logger.info("Wrote %d candles to %s", len(candles), path)
+
+
+def read_cache(root: str, mmap: bool = True) -> Dict[str, Dict[str, CandleArray]]:
+    """Open every series found under ``root`` as ``{symbol: {interval: CandleArray}}``.
+
+    Symbols and intervals are returned in sorted order so replay tie-breaking
+    is deterministic across filesystems.
+    """
+    candle_data: Dict[str, Dict[str, CandleArray]] = {}
+    for symbol in sorted(os.listdir(root)):
+        symbol_dir = os.path.join(root, symbol)
+        if not os.path.isdir(symbol_dir):
+            continue
+        intervals = sorted(
+            name[: -len(_SUFFIX)] for name in os.listdir(symbol_dir) if name.endswith(_SUFFIX)
+        )
+        if intervals:
+            candle_data[symbol] = {
+                interval: read_series(root, symbol, interval, mmap) for interval in intervals
+            }
+    return candle_data
@@ -2,11 +2,14 @@
 
 import asyncio
 import csv
+import heapq
 import logging
 from datetime import datetime
 from enum import Enum
-from typing import Callable, Dict, List, Optional
+from itertools import islice
+from typing import Callable, Dict, Iterator, List, Optional, Sequence
 
+from src.data import binary_cache
 from src.data.base import MarketDataProvider
 from src.models.candle import Candle
 
@@ -25,6 +28,17 @@ _INTERVAL_SECONDS: Dict[str, float] = {
 _DT_FMT = "%Y-%m-%d %H:%M:%S"
 
 
+def _close_time(candle: Candle) -> datetime:
+    return candle.close_time
+
+
+def _iter_from(candles: Sequence[Candle], start: int) -> Iterator[Candle]:
+    """Iterate a series from ``start`` without copying or touching earlier rows."""
+    if isinstance(candles, binary_cache.CandleArray):
+        return candles.iter_from(start)
+    return islice(candles, start, None)
+
+
 class ReplayMode(Enum):
     INSTANT = "instant"    # No delay between candles
     FAST = "fast"          # 1 ms delay between candles
@@ -34,19 +48,22 @@ class ReplayMode(Enum):
 class HistoricalDataProvider(MarketDataProvider):
     """Replays CSV candle data for backtesting.
 
-    Candles are loaded into memory on construction. ``get_historical_candles``
-    returns an initial window (mirroring the REST API); ``start_streaming``
-    replays the remaining candles through ``on_candle_callback``.
+    Candles are loaded into memory on construction (or memory-mapped via
+    :meth:`from_binary`). ``get_historical_candles`` returns an initial window
+    (mirroring the REST API); ``start_streaming`` replays the remaining
+    candles through ``on_candle_callback``.
 
     Args:
-        candle_data: Nested mapping ``{symbol: {interval: [candles]}}``.
+        candle_data: Nested mapping ``{symbol: {interval: [candles]}}``. Any
+            candle sequence works, e.g. the lazy ``CandleArray`` series
+            returned by :func:`src.data.binary_cache.read_cache`.
         replay_mode: Timing strategy for replay (default: INSTANT).
         on_candle_callback: Called once per replayed candle.
     """
 
     def __init__(
         self,
-        candle_data: Dict[str, Dict[str, List[Candle]]],
+        candle_data: Dict[str, Dict[str, Sequence[Candle]]],
         replay_mode: ReplayMode = ReplayMode.INSTANT,
         on_candle_callback: Optional[Callable[[Candle], None]] = None,
     ) -> None:
@@ -120,6 +137,32 @@ class HistoricalDataProvider(MarketDataProvider):
         )
         return batch
 
+    def remaining_count(self) -> int:
+        """Number of candles not yet consumed by ``get_historical_candles``."""
+        return sum(
+            max(0, len(candles) - self._init_counts.get(symbol, {}).get(interval, 0))
+            for symbol, intervals in self._data.items()
+            for interval, candles in intervals.items()
+        )
+
+    def iter_chronological(self) -> Iterator[Candle]:
+        """Yield all remaining candles across every series in close_time order.
+
+        Each ``(symbol, interval)`` series is already sorted, so this is a
+        lazy k-way heap merge: one heap entry per series, no combined list
+        and no global sort.  Ties on ``close_time`` keep series insertion
+        order (symbol first, then interval), matching a stable sort.
+
+        Candles handed out by ``get_historical_candles`` before iteration
+        starts are skipped.
+        """
+        series = [
+            _iter_from(candles, self._init_counts.get(symbol, {}).get(interval, 0))
+            for symbol, intervals in self._data.items()
+            for interval, candles in intervals.items()
+        ]
+        return heapq.merge(*series, key=_close_time)
+
     async def start_streaming(self) -> None:
         """Replay all candles not yet consumed by ``get_historical_candles``.
 
@@ -141,14 +184,13 @@ class HistoricalDataProvider(MarketDataProvider):
             for symbol, intervals in self._data.items():
                 for interval, candles in intervals.items():
                     skip = self._init_counts.get(symbol, {}).get(interval, 0)
-                    replay_candles = candles[skip:]
 
                     self.logger.info(
                         "Replaying %d candles for %s/%s",
-                        len(replay_candles), symbol, interval,
+                        max(0, len(candles) - skip), symbol, interval,
                     )
 
-                    for candle in replay_candles:
+                    for candle in _iter_from(candles, skip):
                         if self._stop_event and self._stop_event.is_set():
                             self.logger.info("Replay stopped by stop() call")
                             return
@@ -202,6 +244,23 @@ class HistoricalDataProvider(MarketDataProvider):
         Returns:
             Configured :class:`HistoricalDataProvider`.
         """
+        return cls(cls.load_csv_data(file_paths), replay_mode, on_candle_callback)
+
+    @classmethod
+    def load_csv_data(
+        cls, file_paths: Dict[str, Dict[str, str]]
+    ) -> Dict[str, Dict[str, List[Candle]]]:
+        """Load CSV files into the ``{symbol: {interval: [candles]}}`` mapping.
+
+        The returned mapping is never mutated by the provider, so it can be
+        loaded once and shared by many providers (e.g. one per backtest run).
+
+        Args:
+            file_paths: ``{symbol: {interval: "/path/to/file.csv"}}``.
+
+        Returns:
+            Nested candle mapping accepted by the constructor.
+        """
         logger = logging.getLogger(__name__)
         candle_data: Dict[str, Dict[str, List[Candle]]] = {}
 
@@ -215,8 +274,65 @@ class HistoricalDataProvider(MarketDataProvider):
                     len(candles), path, symbol, interval,
                 )
 
+        return candle_data
+
+    # ------------------------------------------------------------------
+    # Binary cache
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_binary(
+        cls,
+        root: str,
+        replay_mode: ReplayMode = ReplayMode.INSTANT,
+        on_candle_callback: Optional[Callable[[Candle], None]] = None,
+        mmap: bool = True,
+    ) -> "HistoricalDataProvider":
+        """Open a binary candle cache written by :meth:`to_binary`.
+
+        Every ``<root>/<symbol>/<interval>.npy`` series is memory-mapped, so
+        construction cost does not depend on history length; candles are
+        materialized only as they are requested or replayed.
+
+        Args:
+            root: Cache directory.
+            replay_mode: Timing strategy for replay.
+            on_candle_callback: Called once per replayed candle.
+            mmap: Memory-map the files (default) instead of reading them
+                fully into memory.
+
+        Returns:
+            Configured :class:`HistoricalDataProvider`.
+        """
+        candle_data = binary_cache.read_cache(root, mmap=mmap)
+        logger = logging.getLogger(__name__)
+        for symbol, intervals in candle_data.items():
+            for interval, candles in intervals.items():
+                logger.info(
+                    "Opened %d candles from binary cache (%s/%s)",
+                    len(candles), symbol, interval,
+                )
         return cls(candle_data, replay_mode, on_candle_callback)
 
+    def to_binary(self, root: str) -> None:
+        """Write all loaded series to a binary cache under ``root``.
+
+        Args:
+            root: Cache directory (created if missing; series files are
+                overwritten).
+        """
+        binary_cache.write_cache(root, self._data)
+
+    @classmethod
+    def convert_csv_to_binary(cls, file_paths: Dict[str, Dict[str, str]], root: str) -> None:
+        """One-time conversion of CSV files (see :meth:`from_csv`) to a binary cache.
+
+        Args:
+            file_paths: ``{symbol: {interval: "/path/to/file.csv"}}``.
+            root: Cache directory to write.
+        """
+        binary_cache.write_cache(root, cls.load_csv_data(file_paths))
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
@@ -0,0 +1,992 @@
+"""
+Non-blocking order execution on a pooled aiohttp session.
+
+AsyncOrderGateway keeps OrderGateway's behaviour (tick/step formatting,
+TP/SL trigger adjustment, -4130 recovery, TP/SL completeness escalation and
+audit events) but sends every request through AsyncBinanceClient and waits
+with ``asyncio.sleep``, so placing an order for one symbol never blocks the
+event loop for the others. The blocking methods inherited from OrderGateway
+stay available for startup configuration and synchronous callers.
+
+Retry policy: read-only requests (mark price, exchange info, account, open
+orders, positions) are retried with async exponential backoff. Order
+placement is not retried blindly, since a 5xx response may still have been
+applied by the exchange.
+
+TP and SL are submitted concurrently right after the entry fills (the
+batchOrders endpoint does not accept algo orders). Each carries a
+``clientAlgoId``; when a submission fails ambiguously (5xx, timeout), the
+ALGO_UPDATE for that ID on the user data stream decides whether it was
+placed before anything is retried.
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from binance.error import ClientError, ServerError
+
+from src.core.async_binance_client import AsyncBinanceClient
+from src.core.audit_logger import AuditEventType, AuditLogger
+from src.core.binance_service import BinanceServiceClient
+from src.core.exceptions import OrderExecutionError, OrderRejectedError, ValidationError
+from src.core.exchange_info_cache import ExchangeInfoCache
+from src.core.retry import async_retry_with_backoff
+from src.execution.base import AsyncExecutionGateway
+from src.execution.order_gateway import (  # noqa: F401  (CLIENT_ALGO_ID_PREFIX re-exported)
+    _EXIT_ORDER_TYPES,
+    _PLACED_ALGO_STATUSES,
+    _SAME_KIND,
+    CLIENT_ALGO_ID_PREFIX,
+    OrderGateway,
+    _missing_exit_types,
+    _new_client_algo_id,
+)
+from src.models.order import Order, OrderSide, OrderType
+from src.models.position import Position
+from src.models.signal import Signal, SignalType
+
+
+class AsyncOrderGateway(OrderGateway, AsyncExecutionGateway):
+    """
+    OrderGateway whose trading hot path is awaitable.
+
+    Args:
+        audit_logger: Optional AuditLogger (default: singleton instance)
+        binance_service: Sync BinanceServiceClient, used by the inherited
+            blocking methods and as the source of credentials for the
+            async client
+        async_client: Optional pre-built AsyncBinanceClient (e.g. pointed at
+            a local stub in tests)
+        confirm_timeout: Seconds to wait for the ALGO_UPDATE of a TP/SL
+            whose submission failed ambiguously before retrying it
+
+    Example:
+        >>> gateway = AsyncOrderGateway(binance_service=service)
+        >>> entry, tpsl = await gateway.execute_signal_async(signal, quantity=0.01)
+        >>> await gateway.close()
+    """
+
+    def __init__(
+        self,
+        audit_logger: Optional[AuditLogger] = None,
+        binance_service: Optional[BinanceServiceClient] = None,
+        async_client: Optional[AsyncBinanceClient] = None,
+        confirm_timeout: float = 1.0,
+        exchange_info: Optional[ExchangeInfoCache] = None,
+    ) -> None:
+        super().__init__(
+            audit_logger=audit_logger,
+            binance_service=binance_service,
+            exchange_info=exchange_info,
+            confirm_timeout=confirm_timeout,
+        )
+
+        if async_client is None:
+            if binance_service is None:
+                raise ValueError("AsyncOrderGateway requires binance_service or async_client")
+            async_client = AsyncBinanceClient.from_service(binance_service)
+
+        self.async_client = async_client
+        if self.weight_tracker is None:
+            self.weight_tracker = async_client.weight_tracker
+
+        # Event-loop waiters for ALGO_UPDATE confirmations, keyed by clientAlgoId
+        self._confirmation_waiters: Dict[str, Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = {}
+
+    async def close(self) -> None:
+        """Close the pooled HTTP session."""
+        await self.async_client.close()
+
+    async def _request_async(self, method: str, **params: Any) -> Any:
+        """Route OrderGateway's async methods through the non-blocking client."""
+        return await getattr(self.async_client, method)(**params)
+
+    # TP/SL placement confirmation
+
+    def _notify_confirmation(self, client_algo_id: str, order_data: Dict[str, Any]) -> None:
+        """Resolve the event-loop waiter (and any blocking waiter) for this ID."""
+        super()._notify_confirmation(client_algo_id, order_data)
+        waiter = self._confirmation_waiters.get(client_algo_id)
+        if waiter is not None:
+            loop, future = waiter
+            loop.call_soon_threadsafe(_resolve_waiter, future, order_data)
+
+    async def _await_confirmation(
+        self, client_algo_id: str, timeout: float
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Wait for the ALGO_UPDATE of a placement.
+
+        Returns:
+            The payload if the order exists on the exchange, None if it was
+            rejected/expired or nothing arrived within ``timeout``
+        """
+        data = self._algo_confirmations.get(client_algo_id)
+        if data is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._confirmation_waiters[client_algo_id] = (loop, future)
+            try:
+                # Re-check: the update may have landed before the waiter existed
+                data = self._algo_confirmations.get(client_algo_id)
+                if data is None:
+                    data = await asyncio.wait_for(future, timeout)
+            except asyncio.TimeoutError:
+                return None
+            finally:
+                self._confirmation_waiters.pop(client_algo_id, None)
+
+        if data.get("X") not in _PLACED_ALGO_STATUSES:
+            return None
+        return data
+
+    # Read-only requests (retried)
+
+    @async_retry_with_backoff(max_retries=3, initial_delay=1.0)
+    async def _fetch_mark_price(self, symbol: str) -> float:
+        return await self.async_client.get_mark_price(symbol)
+
+    @async_retry_with_backoff(max_retries=3, initial_delay=1.0)
+    async def _fetch_account(self) -> Dict[str, Any]:
+        return await self.async_client.account()
+
+    @async_retry_with_backoff(max_retries=3, initial_delay=1.0)
+    async def _fetch_open_orders(self, symbol: str) -> List[Dict[str, Any]]:
+        return await self.async_client.get_orders(symbol=symbol)
+
+    @async_retry_with_backoff(max_retries=3, initial_delay=1.0)
+    async def _fetch_position_risk(self, symbol: str) -> List[Dict[str, Any]]:
+        return await self.async_client.get_position_risk(symbol=symbol)
+
+    @async_retry_with_backoff(max_retries=3, initial_delay=1.0)
+    async def _fetch_exchange_info(self) -> Dict[str, Any]:
+        return await self.async_client.exchange_info()
+
+    @async_retry_with_backoff(max_retries=3, initial_delay=1.0)
+    async def _fetch_open_algo_orders(self, symbol: str) -> List[Dict[str, Any]]:
+        return await self.async_client.query_open_algo_orders(symbol)
+
+    async def _ensure_exchange_info(self) -> None:
+        """
+        Refresh the exchange info cache without blocking, if expired.
+
+        Afterwards the inherited _format_price/_format_quantity are cache hits.
+
+        Raises:
+            OrderExecutionError: Exchange info fetch fails
+        """
+        if not self._is_cache_expired():
+            return
+
+        self.logger.info("Fetching exchange information from Binance")
+        try:
+            exchange_data = await self._fetch_exchange_info()
+            if not isinstance(exchange_data, dict):
+                raise OrderExecutionError(
+                    f"Unexpected exchange info response type: {type(exchange_data).__name__}"
+                )
+            symbols_parsed = self._cache_exchange_info(exchange_data)
+            self.logger.info(f"Exchange info cached: {symbols_parsed} symbols loaded")
+
+        except (ClientError, ServerError) as e:
+            self.audit_logger.log_event(
+                event_type=AuditEventType.API_ERROR,
+                operation="_refresh_exchange_info",
+                error=_error_info(e),
+            )
+            self.logger.error(f"Failed to fetch exchange info: {e}")
+            raise OrderExecutionError(f"Exchange info fetch failed: {_error_info(e)}") from e
+        except OrderExecutionError:
+            raise
+        except Exception as e:
+            self.logger.error(f"Failed to fetch exchange info: {e}")
+            raise OrderExecutionError(f"Exchange info fetch failed: {e}") from e
+
+    # Queries
+
+    async def get_account_balance_async(self) -> float:
+        """Awaitable get_account_balance (USDT wallet balance)."""
+        self.logger.info("Querying account balance")
+
+        try:
+            usdt_balance = self._extract_usdt_balance(await self._fetch_account())
+            if usdt_balance is None:
+                return 0.0
+
+            self.logger.info(f"USDT balance: {usdt_balance:.2f}")
+            try:
+                self.audit_logger.log_event(
+                    event_type=AuditEventType.BALANCE_QUERY,
+                    operation="get_account_balance",
+                    response={"balance": usdt_balance},
+                )
+            except Exception as e:
+                self.logger.warning(f"Audit logging failed: {e}")
+
+            return usdt_balance
+
+        except ClientError as e:
+            if e.error_code == -2015:
+                raise OrderExecutionError(f"API authentication failed: {e.error_message}")
+            raise OrderExecutionError(
+                f"Balance query failed: code={e.error_code}, msg={e.error_message}"
+            )
+        except (KeyError, ValueError, TypeError) as e:
+            raise OrderExecutionError(f"Failed to parse account data: {e}")
+
+    async def get_position_async(self, symbol: str) -> Optional[Position]:
+        """Awaitable get_position (through the same circuit breaker)."""
+        if not symbol or not isinstance(symbol, str):
+            raise ValidationError(f"Invalid symbol: {symbol}")
+
+        self.logger.info(f"Querying position for {symbol}")
+
+        try:
+            response = await self._position_circuit_breaker.call_async(
+                self._fetch_position_risk, symbol
+            )
+            position = self._parse_position_risk(symbol, response)
+            if position is None:
+                return None
+
+            try:
+                self.audit_logger.log_event(
+                    event_type=AuditEventType.POSITION_QUERY,
+                    operation="get_position",
+                    symbol=symbol,
+                    response={
+                        "has_position": True,
+                        "position_amt": position.quantity,
+                        "entry_price": position.entry_price,
+                        "side": position.side,
+                        "unrealized_pnl": position.unrealized_pnl,
+                    },
+                )
+            except Exception as e:
+                self.logger.warning(f"Audit logging failed: {e}")
+
+            return position
+
+        except (ClientError, ServerError) as e:
+            try:
+                self.audit_logger.log_event(
+                    event_type=AuditEventType.API_ERROR,
+                    operation="get_position",
+                    symbol=symbol,
+                    error=_error_info(e),
+                )
+            except Exception:
+                pass  # Don't double-log
+
+            if isinstance(e, ServerError):
+                raise OrderExecutionError(
+                    f"Position query failed: server error {e.status_code}, msg={e.message}"
+                )
+            if e.error_code == -1121:
+                raise ValidationError(f"Invalid symbol: {symbol}")
+            if e.error_code == -2015:
+                raise OrderExecutionError(f"API authentication failed: {e.error_message}")
+            raise OrderExecutionError(
+                f"Position query failed: code={e.error_code}, msg={e.error_message}"
+            )
+        except (KeyError, ValueError, TypeError) as e:
+            try:
+                self.audit_logger.log_event(
+                    event_type=AuditEventType.API_ERROR,
+                    operation="get_position",
+                    symbol=symbol,
+                    error={"error_type": type(e).__name__, "error_message": str(e)},
+                )
+            except Exception:
+                pass  # Don't double-log
+
+            raise OrderExecutionError(f"Failed to parse position data: {e}")
+
+    async def get_open_orders_async(self, symbol: str) -> List[Dict[str, Any]]:
+        """Awaitable get_open_orders (GET /fapi/v1/openOrders)."""
+        if not symbol or not isinstance(symbol, str):
+            raise ValidationError(f"Invalid symbol: {symbol}")
+
+        self.logger.debug(f"Querying open orders for {symbol}")
+
+        try:
+            response = await self._fetch_open_orders(symbol)
+        except ClientError as e:
+            if e.error_code == -1121:
+                raise ValidationError(f"Invalid symbol: {symbol}")
+            if e.error_code == -2015:
+                raise OrderExecutionError(f"API authentication failed: {e.error_message}")
+            raise OrderExecutionError(
+                f"Failed to query open orders: code={e.error_code}, msg={e.error_message}"
+            )
+        except Exception as e:
+            raise OrderExecutionError(f"Unexpected error querying open orders: {e}")
+
+        if isinstance(response, list):
+            self.logger.debug(f"Found {len(response)} open orders for {symbol}")
+            return response
+
+        self.logger.warning(f"Unexpected response format for open orders: {response}")
+        return []
+
+    async def get_open_orders_cached_async(self, symbol: str) -> List[Dict[str, Any]]:
+        """Awaitable get_open_orders_cached (shares the same cache)."""
+        current_time = time.time()
+
+        if symbol in self._open_orders_cache:
+            cached_orders, cache_time = self._open_orders_cache[symbol]
+            if current_time - cache_time < self._open_orders_cache_ttl:
+                return cached_orders
+
+        try:
+            orders = await self.get_open_orders_async(symbol)
+            self._open_orders_cache[symbol] = (orders, current_time)
+            return orders
+        except Exception as e:
+            self.logger.warning(f"Failed to refresh open orders cache for {symbol}: {e}")
+            if symbol in self._open_orders_cache:
+                return self._open_orders_cache[symbol][0]
+            raise
+
+    # Cancellation
+
+    async def _cancel_order_by_id_async(self, symbol: str, order_id: int) -> bool:
+        """Awaitable _cancel_order_by_id (unknown orders count as cancelled)."""
+        try:
+            await self.async_client.cancel_order(symbol=symbol, orderId=order_id)
+            return True
+        except ClientError as e:
+            if e.error_code in (-2011, -2013):  # Unknown order, order does not exist
+                return True
+            self.logger.warning(
+                f"Failed to cancel order {order_id}: code={e.error_code}, msg={e.error_message}"
+            )
+            return False
+        except Exception as e:
+            self.logger.warning(f"Unexpected error cancelling order {order_id}: {e}")
+            return False
+
+    async def cancel_all_orders_async(
+        self,
+        symbol: str,
+        verify: bool = True,
+        max_retries: int = 3,
+    ) -> int:
+        """
+        Awaitable cancel_all_orders.
+
+        Bulk-cancels regular orders, then algo (TP/SL) orders, and optionally
+        verifies with the same retry loop, sleeping without blocking the loop.
+
+        Returns:
+            Number of orders cancelled
+        """
+        if not symbol or not isinstance(symbol, str):
+            raise ValidationError(f"Invalid symbol: {symbol}")
+
+        try:
+            open_orders = await self.get_open_orders_cached_async(symbol)
+            if not open_orders:
+                self.logger.debug(f"No open orders for {symbol}, skipping cancel API call")
+                return 0
+        except Exception as e:
+            self.logger.warning(
+                f"Failed to check open orders for {symbol}: {e}, proceeding with cancel attempt"
+            )
+            open_orders = None
+
+        self.logger.info(
+            f"Cancelling {len(open_orders) if open_orders else 'all'} orders for {symbol}"
+        )
+
+        try:
+            response = await self.async_client.cancel_open_orders(symbol=symbol)
+            cancelled_count = self._count_cancelled(response, symbol)
+
+            # Algo orders (TP/SL) are not covered by allOpenOrders
+            try:
+                algo_results = await self.async_client.cancel_all_algo_orders(symbol)
+                algo_cancelled = len(algo_results) if algo_results else 0
+                if algo_cancelled > 0:
+                    self.logger.info(f"Cancelled {algo_cancelled} algo orders (TP/SL) for {symbol}")
+                    cancelled_count += algo_cancelled
+            except Exception as e:
+                self.logger.debug(f"Algo order cancellation note: {e}")
+
+            self.invalidate_open_orders_cache(symbol)
+
+            if verify:
+                for attempt in range(max_retries):
+                    try:
+                        if attempt > 0:
+                            await asyncio.sleep(0.5)
+
+                        remaining = await self.get_open_orders_async(symbol)
+                        self._open_orders_cache[symbol] = (remaining, time.time())
+                        if not remaining:
+                            break
+
+                        self.logger.warning(
+                            f"Verification attempt {attempt + 1}/{max_retries}: "
+                            f"{len(remaining)} orders still open for {symbol}"
+                        )
+                        for order in remaining:
+                            order_id = order.get("orderId")
+                            if order_id and await self._cancel_order_by_id_async(symbol, order_id):
+                                cancelled_count += 1
+
+                    except OrderExecutionError as e:
+                        if "-1003" in str(e):
+                            self.logger.warning(f"Rate limited during verification, skipping: {e}")
+                            break
+                        self.logger.warning(f"Verification attempt {attempt + 1} failed: {e}")
+                    except Exception as e:
+                        self.logger.warning(f"Verification attempt {attempt + 1} failed: {e}")
+
+            try:
+                self.audit_logger.log_event(
+                    event_type=AuditEventType.ORDER_CANCELLED,
+                    operation="cancel_all_orders",
+                    symbol=symbol,
+                    response={
+                        "cancelled_count": cancelled_count,
+                        "verified": verify,
+                        "order_ids": (
+                            [o.get("orderId") for o in response]
+                            if isinstance(response, list)
+                            else []
+                        ),
+                    },
+                )
+            except Exception as e:
+                self.logger.warning(f"Audit logging failed: {e}")
+
+            return cancelled_count
+
+        except ClientError as e:
+            if e.error_code == -1121:
+                raise ValidationError(f"Invalid symbol: {symbol}")
+            if e.error_code == -2015:
+                raise OrderExecutionError(f"API authentication failed: {e.error_message}")
+            raise OrderExecutionError(
+                f"Order cancellation failed: code={e.error_code}, msg={e.error_message}"
+            )
+        except Exception as e:
+            raise OrderExecutionError(f"Unexpected error during order cancellation: {e}")
+
+    # Order placement
+
+    async def _mark_price_or_entry(self, signal: Signal) -> float:
+        """Mark price for trigger validation, falling back to the entry price."""
+        try:
+            return await self._fetch_mark_price(signal.symbol)
+        except Exception as e:
+            self.logger.warning(f"Failed to get mark price, using entry: {e}")
+            return signal.entry_price if hasattr(signal, "entry_price") else 0.0
+
+    async def _place_exit_order_async(
+        self,
+        signal: Signal,
+        side: OrderSide,
+        order_type: OrderType,
+        mark_price: Optional[float] = None,
+        client_algo_id: Optional[str] = None,
+    ) -> Optional[Order]:
+        """
+        Place a closePosition TAKE_PROFIT_MARKET or STOP_MARKET algo order.
+
+        Awaitable _place_tp_order/_place_sl_order: never raises, returns None
+        on failure (logged and audited the same way).
+
+        Args:
+            signal: Entry signal with take_profit/stop_loss
+            side: Exit side (opposite of entry)
+            order_type: TAKE_PROFIT_MARKET or STOP_MARKET
+            mark_price: Mark price already fetched by the caller (fetched
+                here when None)
+            client_algo_id: clientAlgoId to send. If the request fails
+                without a definite rejection, the ID is recorded as
+                unconfirmed so the caller can wait for its ALGO_UPDATE.
+        """
+        is_tp = order_type == OrderType.TAKE_PROFIT_MARKET
+        label = "TP" if is_tp else "SL"
+        target = signal.take_profit if is_tp else signal.stop_loss
+
+        if target is None:
+            field_name = "take_profit" if is_tp else "stop_loss"
+            self.logger.error(
+                f"Cannot place {label} order: {field_name} is None for {signal.symbol}"
+            )
+            return None
+
+        try:
+            # Triggers use MARK_PRICE, so validate against mark price (code -2021)
+            if mark_price is None:
+                mark_price = await self._mark_price_or_entry(signal)
+
+            if is_tp:
+                trigger = self._adjust_tp_trigger(target, mark_price, side)
+            else:
+                trigger = self._adjust_sl_trigger(target, mark_price, side)
+
+            await self._ensure_exchange_info()
+            stop_price_str = self._format_price(trigger, signal.symbol)
+
+            response = await self.async_client.new_algo_order(
+                symbol=signal.symbol,
+                side=side.value,
+                type=order_type.value,
+                triggerPrice=stop_price_str,
+                closePosition="true",
+                workingType="MARK_PRICE",
+                clientAlgoId=client_algo_id,
+            )
+            order = self._parse_order_response(
+                response=response,
+                symbol=signal.symbol,
+                side=side,
+                expected_order_type=order_type,
+            )
+
+            # Same stop_price the sync path reports: TP keeps the target, SL the trigger
+            reported_stop = target if is_tp else trigger
+            order.stop_price = reported_stop
+
+            self.logger.info(
+                f"{label} order placed: ID={order.order_id}, stopPrice={stop_price_str}"
+            )
+            try:
+                self.audit_logger.log_order_placed(
+                    symbol=signal.symbol,
+                    order_data={
+                        "order_type": order_type.value,
+                        "side": side.value,
+                        "stop_price": reported_stop,
+                        "close_position": True,
+                    },
+                    response={"order_id": order.order_id, "status": order.status.value},
+                )
+            except Exception as e:
+                self.logger.warning(f"Audit logging failed: {e}")
+
+            return order
+
+        except ClientError as e:
+            if e.error_code == -4130 and client_algo_id is not None:
+                # Our own earlier (ambiguous) submission may be the duplicate
+                existing = await self._find_open_exit(signal, side, order_type, client_algo_id)
+                if existing is not None:
+                    self._log_adopted_exit(existing, signal, side, "openAlgoOrders")
+                    return existing
+
+            if e.error_code == -4130:
+                # Duplicate closePosition TP/SL exists: clear it for the next attempt.
+                # Only this type is cancelled, the sibling may have just been placed.
+                self.logger.warning(
+                    f"{label} order rejected (-4130): existing algo order with closePosition "
+                    f"detected for {signal.symbol}. Attempting to cancel existing {label} "
+                    f"algo orders..."
+                )
+                try:
+                    algo_results = await self.async_client.cancel_algo_orders_by_type(
+                        signal.symbol, _SAME_KIND[order_type]
+                    )
+                    if algo_results:
+                        self.logger.info(
+                            f"Cancelled {len(algo_results)} existing algo orders for "
+                            f"{signal.symbol}. Next signal should succeed."
+                        )
+                except Exception as cancel_err:
+                    self.logger.warning(f"Failed to cancel existing algo orders: {cancel_err}")
+
+            self.logger.error(f"{label} order rejected: code={e.error_code}, msg={e.error_message}")
+            try:
+                self.audit_logger.log_order_rejected(
+                    symbol=signal.symbol,
+                    order_data={
+                        "order_type": order_type.value,
+                        "side": side.value,
+                        "stop_price": target,
+                    },
+                    error={"error_code": e.error_code, "error_message": e.error_message},
+                )
+            except Exception:
+                pass  # Don't double-log
+
+            return None
+
+        except Exception as e:
+            if client_algo_id is not None:
+                # 5xx/timeout: the exchange may still have accepted it
+                self._unconfirmed_exits.add(client_algo_id)
+            self.logger.error(f"{label} order placement failed: {type(e).__name__}: {e}")
+            try:
+                self.audit_logger.log_event(
+                    event_type=AuditEventType.API_ERROR,
+                    operation="place_tp_order" if is_tp else "place_sl_order",
+                    symbol=signal.symbol,
+                    error={"error_type": type(e).__name__, "error_message": str(e)},
+                )
+            except Exception:
+                pass  # Don't double-log
+
+            return None
+
+    async def execute_signal_async(
+        self, signal: Signal, quantity: float, reduce_only: bool = False
+    ) -> tuple[Order, list[Order]]:
+        """
+        Awaitable execute_signal: market entry followed by TP/SL orders.
+
+        Same contract as OrderGateway.execute_signal, including pre-entry
+        cancellation, TP/SL completeness retries and emergency close.
+
+        Raises:
+            ValidationError: Invalid signal type or quantity <= 0
+            OrderRejectedError: Binance rejected the entry order
+            OrderExecutionError: Entry order API call failed
+        """
+        if quantity <= 0:
+            raise ValidationError(f"Quantity must be > 0, got {quantity}")
+
+        side = self._determine_order_side(signal)
+
+        self.logger.info(
+            f"Executing {signal.signal_type.value} signal: "
+            f"{signal.symbol} {side.value} {quantity} "
+            f"(strategy: {signal.strategy_name})"
+        )
+
+        await self._ensure_exchange_info()
+        order_params = {
+            "symbol": signal.symbol,
+            "side": side.value,
+            "type": OrderType.MARKET.value,
+            "quantity": self._format_quantity(quantity, signal.symbol),
+            "reduceOnly": reduce_only,
+        }
+
+        try:
+            response = await self.async_client.new_order(**order_params)
+            entry_order = self._parse_order_response(
+                response=response, symbol=signal.symbol, side=side
+            )
+
+            self.audit_logger.log_order_placed(
+                symbol=signal.symbol,
+                order_data=order_params,
+                response={
+                    "order_id": entry_order.order_id,
+                    "status": entry_order.status.value,
+                    "price": str(entry_order.price),
+                    "quantity": str(entry_order.quantity),
+                },
+            )
+            self.logger.info(
+                f"Entry order executed: ID={entry_order.order_id}, "
+                f"status={entry_order.status.value}, "
+                f"filled={entry_order.quantity} @ {entry_order.price}"
+            )
+
+        except ClientError as e:
+            self.audit_logger.log_order_rejected(
+                symbol=signal.symbol,
+                order_data=order_params,
+                error={
+                    "status_code": e.status_code,
+                    "error_code": e.error_code,
+                    "error_message": e.error_message,
+                },
+            )
+            self.logger.error(
+                f"Entry order rejected by Binance: code={e.error_code}, msg={e.error_message}"
+            )
+            raise OrderRejectedError(f"Binance rejected order: {e.error_message}") from e
+
+        except ServerError as e:
+            self.audit_logger.log_event(
+                event_type=AuditEventType.API_ERROR,
+                operation="execute_signal",
+                symbol=signal.symbol,
+                order_data=order_params,
+                error={"status_code": e.status_code, "message": e.message},
+            )
+            self.logger.error(
+                f"Binance server error placing order: status={e.status_code}, msg={e.message}"
+            )
+            raise OrderExecutionError(f"Binance server error: {e.message}") from e
+
+        except Exception as e:
+            self.logger.error(f"Entry order execution failed: {type(e).__name__}: {e}")
+            raise OrderExecutionError(f"Failed to execute order: {e}") from e
+
+        tpsl_side = OrderSide.SELL if side == OrderSide.BUY else OrderSide.BUY
+        is_entry = signal.signal_type in (SignalType.LONG_ENTRY, SignalType.SHORT_ENTRY)
+
+        if is_entry:
+            # Clear orphaned TP/SL from a previous position first
+            try:
+                cancelled_count = await self.cancel_all_orders_async(signal.symbol)
+                if cancelled_count > 0:
+                    self.logger.info(
+                        f"Cancelled {cancelled_count} existing orders "
+                        f"before placing new TP/SL orders"
+                    )
+            except Exception as e:
+                self.logger.warning(
+                    f"Failed to cancel existing orders: {e}. "
+                    f"Proceeding with TP/SL placement anyway."
+                )
+
+        client_algo_ids = {order_type: _new_client_algo_id() for order_type in _EXIT_ORDER_TYPES}
+        self._tracked_client_ids.update(client_algo_ids.values())
+        try:
+            tpsl_orders = await self._place_exit_orders_async(
+                signal, tpsl_side, list(_EXIT_ORDER_TYPES), client_algo_ids
+            )
+            if is_entry:
+                tpsl_orders = await self._ensure_tpsl_completeness_async(
+                    signal=signal,
+                    tpsl_orders=tpsl_orders,
+                    tpsl_side=tpsl_side,
+                    entry_order=entry_order,
+                    client_algo_ids=client_algo_ids,
+                )
+        finally:
+            self._release_client_ids(client_algo_ids)
+
+        if not is_entry:
+            # Position is being closed: remaining TP/SL orders are obsolete (Issue #9)
+            try:
+                cancelled_count = await self.cancel_all_orders_async(signal.symbol)
+                self.logger.info(
+                    f"Position closed: cancelled {cancelled_count} remaining "
+                    f"TP/SL orders for {signal.symbol}"
+                )
+            except Exception as e:
+                self.logger.warning(
+                    f"Failed to cancel remaining orders after position closure: {e}. "
+                    f"Manual cleanup may be required."
+                )
+        return (entry_order, tpsl_orders)
+
+    async def _place_exit_orders_async(
+        self,
+        signal: Signal,
+        side: OrderSide,
+        order_types: List[OrderType],
+        client_algo_ids: Dict[OrderType, str],
+    ) -> list[Order]:
+        """
+        Submit exit orders concurrently, sharing one mark price lookup.
+
+        Returns:
+            Orders that were placed, in ``order_types`` order
+        """
+        await self._ensure_exchange_info()
+        mark_price = await self._mark_price_or_entry(signal)
+        results = await asyncio.gather(
+            *(
+                self._place_exit_order_async(
+                    signal,
+                    side,
+                    order_type,
+                    mark_price=mark_price,
+                    client_algo_id=client_algo_ids.get(order_type),
+                )
+                for order_type in order_types
+            )
+        )
+        return [order for order in results if order]
+
+    async def _ensure_tpsl_completeness_async(
+        self,
+        signal: Signal,
+        tpsl_orders: list[Order],
+        tpsl_side: OrderSide,
+        entry_order: Order,
+        max_retries: int = 2,
+        retry_delay: float = 0.2,
+        client_algo_ids: Optional[Dict[OrderType, str]] = None,
+    ) -> list[Order]:
+        """
+        Awaitable _ensure_tpsl_completeness (retry, then emergency close).
+
+        Instead of sleeping a fixed delay before every retry, a missing order
+        whose submission failed ambiguously is first looked up on the user
+        data stream (ALGO_UPDATE by clientAlgoId, up to ``confirm_timeout``)
+        and only resubmitted, under the same clientAlgoId, if it did not land.
+        Definite rejections are retried after ``retry_delay`` with a fresh
+        mark price.
+        """
+        client_algo_ids = client_algo_ids or {}
+        if len(tpsl_orders) >= 2:
+            self.logger.info("TP/SL placement complete: 2/2 orders placed")
+            return tpsl_orders
+
+        self.logger.warning(
+            f"Partial TP/SL placement: {len(tpsl_orders)}/2 orders placed. "
+            f"Retrying missing orders (max {max_retries} attempts)."
+        )
+
+        missing = _missing_exit_types(tpsl_orders)
+
+        attempt = 0
+        while True:
+            waited = await self._adopt_confirmed_exits(
+                signal, tpsl_side, missing, tpsl_orders, client_algo_ids
+            )
+            if not missing:
+                self.logger.info(
+                    f"TP/SL placement complete after {attempt} retries: 2/2 orders placed"
+                )
+                return tpsl_orders
+            if attempt == max_retries:
+                break
+
+            attempt += 1
+            if not waited:
+                await asyncio.sleep(retry_delay)
+            self.logger.info(f"TP/SL retry attempt {attempt}/{max_retries} for {signal.symbol}")
+            placed = await self._place_exit_orders_async(
+                signal, tpsl_side, list(missing), client_algo_ids
+            )
+            tpsl_orders.extend(placed)
+            placed_types = {o.order_type for o in placed}
+            missing = [order_type for order_type in missing if order_type not in placed_types]
+
+        self.logger.error(
+            f"CRITICAL: TP/SL placement failed after {max_retries} retries "
+            f"for {signal.symbol}. Only {len(tpsl_orders)}/2 placed. "
+            f"Executing emergency market close."
+        )
+
+        close_side = "SELL" if entry_order.side == OrderSide.BUY else "BUY"
+        try:
+            result = await self.execute_market_close(
+                symbol=signal.symbol,
+                position_amt=entry_order.quantity,
+                side=close_side,
+                reduce_only=True,
+            )
+        except Exception as e:
+            self.logger.error(
+                f"Emergency close exception for {signal.symbol}: {e}. "
+                f"Manual intervention required!"
+            )
+            return tpsl_orders
+
+        if not result.get("success"):
+            self.logger.error(
+                f"Emergency close FAILED for {signal.symbol}: "
+                f"{result.get('error')}. Manual intervention required!"
+            )
+            return tpsl_orders
+
+        self.logger.warning(
+            f"Emergency close executed for {signal.symbol}: order_id={result.get('order_id')}"
+        )
+        try:
+            await self.cancel_all_orders_async(signal.symbol)
+        except Exception:
+            pass
+
+        try:
+            self.audit_logger.log_event(
+                event_type=AuditEventType.RISK_REJECTION,
+                operation="ensure_tpsl_completeness",
+                symbol=signal.symbol,
+                response={
+                    "reason": "incomplete_tpsl_emergency_close",
+                    "placed_count": len(tpsl_orders),
+                    "retry_attempts": max_retries,
+                    "close_order_id": result.get("order_id"),
+                },
+            )
+        except Exception:
+            pass
+
+        return []  # Empty — position was closed
+
+    async def _adopt_confirmed_exits(
+        self,
+        signal: Signal,
+        side: OrderSide,
+        missing: List[OrderType],
+        tpsl_orders: list[Order],
+        client_algo_ids: Dict[OrderType, str],
+    ) -> bool:
+        """
+        Resolve ambiguous submissions of missing exit orders from ALGO_UPDATE.
+
+        Confirmed orders are moved from ``missing`` to ``tpsl_orders``.
+
+        Returns:
+            True if any submission was ambiguous (the wait already spaced the
+            next retry)
+        """
+        pending = [
+            order_type
+            for order_type in missing
+            if client_algo_ids.get(order_type) in self._unconfirmed_exits
+        ]
+        if not pending:
+            return False
+
+        confirmations = await asyncio.gather(
+            *(
+                self._await_confirmation(client_algo_ids[order_type], self._confirm_timeout)
+                for order_type in pending
+            )
+        )
+        for order_type, data in zip(pending, confirmations):
+            client_algo_id = client_algo_ids[order_type]
+            self._unconfirmed_exits.discard(client_algo_id)
+            if data is not None:
+                order = self._order_from_confirmation(data, signal, side, order_type)
+                self._log_adopted_exit(order, signal, side, "ALGO_UPDATE")
+            else:
+                # ALGO_UPDATE may just be late: a resubmission under the same
+                # clientAlgoId would hit -4130 on the order that did land
+                order = await self._find_open_exit(signal, side, order_type, client_algo_id)
+                if order is None:
+                    self.logger.warning(
+                        f"{order_type.value} {client_algo_id} not confirmed by ALGO_UPDATE "
+                        f"or open algo orders, resubmitting"
+                    )
+                    continue
+                self._log_adopted_exit(order, signal, side, "openAlgoOrders")
+
+            tpsl_orders.append(order)
+            missing.remove(order_type)
+        return True
+
+    async def _find_open_exit(
+        self, signal: Signal, side: OrderSide, order_type: OrderType, client_algo_id: str
+    ) -> Optional[Order]:
+        """Awaitable _find_open_exit_sync (None on lookup failure)."""
+        try:
+            open_orders = await self._fetch_open_algo_orders(signal.symbol)
+        except Exception as e:
+            self.logger.warning(f"Open algo order lookup failed for {signal.symbol}: {e}")
+            return None
+        return self._match_open_exit(open_orders, signal, side, order_type, client_algo_id)
+
+
+def _resolve_waiter(future: asyncio.Future, order_data: Dict[str, Any]) -> None:
+    if not future.done():
+        future.set_result(order_data)
+
+
+def _error_info(e: Exception) -> Dict[str, Any]:
+    """Audit payload for a connector ClientError/ServerError."""
+    if isinstance(e, ClientError):
+        return {
+            "status_code": e.status_code,
+            "error_code": e.error_code,
+            "error_message": e.error_message,
+        }
+    if isinstance(e, ServerError):
+        return {"status_code": e.status_code, "message": e.message}
+    return {"error_type": type(e).__name__, "error_message": str(e)}
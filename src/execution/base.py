@@ -1,8 +1,9 @@
 """Abstract base classes for execution layer.
 
 Defines interfaces for order execution, exchange state queries, and position
-management. Concrete implementations include OrderGateway (live trading)
-and MockExchange (backtesting/paper trading).
+management. Concrete implementations include OrderGateway (live trading),
+AsyncOrderGateway (live trading, non-blocking) and MockExchange
+(backtesting/paper trading).
 """
 
 from abc import ABC, abstractmethod
@@ -117,6 +118,50 @@ class ExecutionGateway(ABC):
         ...
 
 
+class AsyncExecutionGateway(ABC):
+    """Non-blocking counterpart of the ExecutionGateway hot path.
+
+    TradeCoordinator awaits these instead of the blocking calls when the
+    gateway implements this interface, so a REST round-trip for one symbol
+    does not stall the event loop for every other symbol.
+    Implementations: AsyncOrderGateway (live).
+    """
+
+    @abstractmethod
+    async def execute_signal_async(
+        self, signal: "Signal", quantity: float, reduce_only: bool = False
+    ) -> tuple["Order", list["Order"]]:
+        """Awaitable execute_signal (same contract)."""
+        ...
+
+    @abstractmethod
+    async def get_account_balance_async(self) -> float:
+        """Awaitable get_account_balance (same contract)."""
+        ...
+
+    @abstractmethod
+    async def get_open_orders_async(self, symbol: str) -> List[Dict[str, Any]]:
+        """Awaitable get_open_orders (same contract)."""
+        ...
+
+    @abstractmethod
+    async def cancel_all_orders_async(
+        self, symbol: str, verify: bool = True, max_retries: int = 3
+    ) -> int:
+        """Awaitable cancel_all_orders (same contract)."""
+        ...
+
+    @abstractmethod
+    async def get_position_async(self, symbol: str) -> Optional["Position"]:
+        """Awaitable get_position (same contract)."""
+        ...
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Release network resources (connection pool)."""
+        ...
+
+
 class ExchangeProvider(ABC):
     """Abstract interface for exchange state queries and setup.
 
@@ -163,11 +208,29 @@ class ExchangeProvider(ABC):
         ...
 
     @abstractmethod
-    async def get_all_positions(self, symbols: List[str]) -> List[Dict[str, Any]]:
+    async def get_all_positions(
+        self, symbols: List[str], quiet: bool = False
+    ) -> List[Dict[str, Any]]:
         """Query all open positions for given symbols.
 
         Args:
             symbols: List of trading symbols
+            quiet: Periodic background query; skip INFO logs and audit records
+
+        Returns:
+            List of position dictionaries
+        """
+        ...
+
+    @abstractmethod
+    def get_all_positions_sync(
+        self, symbols: List[str], quiet: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Blocking get_all_positions(), for callers in a worker thread.
+
+        Args:
+            symbols: List of trading symbols
+            quiet: Periodic background query; skip INFO logs and audit records
 
         Returns:
             List of position dictionaries
@@ -218,6 +281,21 @@ class PositionProvider(ABC):
         """
         ...
 
+    async def get_fresh_async(self, symbol: str) -> Optional["Position"]:
+        """Awaitable get_fresh() for callers on the event loop.
+
+        The default suits providers whose get_fresh() never blocks (e.g.
+        MockExchange). PositionCacheManager overrides it so the REST query
+        does not block the loop.
+
+        Args:
+            symbol: Trading pair
+
+        Returns:
+            Position if exists, None otherwise
+        """
+        return self.get_fresh(symbol)
+
     @abstractmethod
     def invalidate(self, symbol: str) -> None:
         """Invalidate cached position for symbol.
@@ -232,3 +310,14 @@ class PositionProvider(ABC):
     def cache(self) -> dict:
         """Access internal cache dict."""
         ...
+
+    def is_uncertain(self, symbol: str) -> bool:
+        """Whether a None from get() may mean "unknown" rather than "flat".
+
+        Providers that always hold authoritative state (e.g. MockExchange)
+        keep this default.
+
+        Args:
+            symbol: Trading pair
+        """
+        return False
@@ -17,11 +17,14 @@ Security Architecture:
 import asyncio
 import logging
 import time
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from src.core.audit_logger import AuditLogger, AuditEventType
+from src.core.binance_service import RequestWeightTracker
+from src.execution.base import AsyncExecutionGateway
 from src.utils.config_manager import LiquidationConfig
 
 
@@ -117,8 +120,16 @@ class LiquidationManager:
         - Liquidation errors are logged but do NOT raise exceptions
         - Shutdown ALWAYS continues regardless of liquidation outcome
         - Partial success is acceptable (logged for manual cleanup)
+
+    Concurrency:
+        Symbols are cancelled/closed in parallel, at most
+        config.max_concurrency requests in flight, and one at a time while
+        the request weight is near the limit. Retries back off per symbol.
     """
 
+    # Serialize requests above this share of the per-minute weight limit
+    WEIGHT_THROTTLE_RATIO = 0.8
+
     def __init__(
         self,
         order_gateway,  # OrderGateway instance
@@ -142,6 +153,7 @@ class LiquidationManager:
         # State machine
         self._state = LiquidationState.IDLE
         self._state_lock = asyncio.Lock()  # Protect state transitions
+        self._throttle_lock = asyncio.Lock()  # Serializes requests near the weight limit
 
         # Metrics
         self._last_execution_time: Optional[float] = None
@@ -354,6 +366,9 @@ class LiquidationManager:
         """
         Cancel all pending orders for symbols with retry logic.
 
+        Symbols are processed in parallel (at most config.max_concurrency in
+        flight), each with its own retry/backoff loop.
+
         Args:
             symbols: List of symbols
             correlation_id: Correlation ID for audit trail
@@ -365,73 +380,102 @@ class LiquidationManager:
             f"Cancelling orders for symbols={symbols} (correlation_id={correlation_id})"
         )
 
-        cancelled_total = 0
-        failed_total = 0
+        slots = asyncio.Semaphore(self.config.max_concurrency)
+        outcomes = await asyncio.gather(
+            *(self._cancel_symbol_orders(symbol, correlation_id, slots) for symbol in symbols)
+        )
 
-        # Cancel orders for each symbol with retry logic
-        for symbol in symbols:
-            for attempt in range(self.config.max_retries):
-                try:
-                    # Call OrderGateway.cancel_all_orders()
-                    cancelled_count = self.order_gateway.cancel_all_orders(symbol)
-                    cancelled_total += cancelled_count
+        cancelled_total = sum(cancelled for cancelled, _ in outcomes)
+        failed_total = sum(1 for _, ok in outcomes if not ok)
+        return {"cancelled": cancelled_total, "failed": failed_total}
 
-                    # Audit log success
-                    self.audit_logger.log_event(
-                        event_type=AuditEventType.ORDER_CANCELLED,
-                        operation="liquidation_cancel_orders",
-                        data={
-                            "correlation_id": correlation_id,
-                            "symbol": symbol,
-                            "cancelled": cancelled_count,
-                            "attempt": attempt + 1,
-                        },
-                    )
+    async def _cancel_symbol_orders(
+        self, symbol: str, correlation_id: str, slots: asyncio.Semaphore
+    ) -> Tuple[int, bool]:
+        """
+        Cancel orders for one symbol with retry logic.
 
-                    self.logger.info(
-                        f"Cancelled {cancelled_count} orders for {symbol} "
-                        f"(attempt {attempt + 1}/{self.config.max_retries}, "
-                        f"correlation_id={correlation_id})"
-                    )
+        Returns:
+            (cancelled count, success)
+        """
+        for attempt in range(self.config.max_retries):
+            try:
+                async with self._request_slot(slots):
+                    cancelled_count = await self._cancel_orders_call(symbol)
+
+                # Audit log success
+                self.audit_logger.log_event(
+                    event_type=AuditEventType.ORDER_CANCELLED,
+                    operation="liquidation_cancel_orders",
+                    data={
+                        "correlation_id": correlation_id,
+                        "symbol": symbol,
+                        "cancelled": cancelled_count,
+                        "attempt": attempt + 1,
+                    },
+                )
 
-                    # Success - break retry loop
-                    break
+                self.logger.info(
+                    f"Cancelled {cancelled_count} orders for {symbol} "
+                    f"(attempt {attempt + 1}/{self.config.max_retries}, "
+                    f"correlation_id={correlation_id})"
+                )
+                return cancelled_count, True
+
+            except Exception as e:
+                # Log error
+                self.logger.error(
+                    f"Failed to cancel orders for {symbol} (attempt {attempt + 1}/"
+                    f"{self.config.max_retries}): {e}"
+                )
+
+                # Audit log retry attempt
+                self.audit_logger.log_event(
+                    event_type=AuditEventType.API_ERROR,
+                    operation="liquidation_cancel_orders_retry",
+                    data={
+                        "correlation_id": correlation_id,
+                        "symbol": symbol,
+                        "attempt": attempt + 1,
+                        "max_retries": self.config.max_retries,
+                        "error": str(e),
+                    },
+                )
 
-                except Exception as e:
-                    # Log error
+                # Check if this was the last attempt
+                if attempt + 1 >= self.config.max_retries:
                     self.logger.error(
-                        f"Failed to cancel orders for {symbol} (attempt {attempt + 1}/"
-                        f"{self.config.max_retries}): {e}"
+                        f"Max retries reached for cancelling orders {symbol} "
+                        f"(correlation_id={correlation_id})"
                     )
+                    return 0, False
 
-                    # Audit log retry attempt
-                    self.audit_logger.log_event(
-                        event_type=AuditEventType.API_ERROR,
-                        operation="liquidation_cancel_orders_retry",
-                        data={
-                            "correlation_id": correlation_id,
-                            "symbol": symbol,
-                            "attempt": attempt + 1,
-                            "max_retries": self.config.max_retries,
-                            "error": str(e),
-                        },
-                    )
+                # Exponential backoff: delay * (2 ^ attempt), slot released meanwhile
+                delay = self.config.retry_delay_seconds * (2 ** attempt)
+                self.logger.info(f"Retrying in {delay}s...")
+                await asyncio.sleep(delay)
 
-                    # Check if this was the last attempt
-                    if attempt + 1 >= self.config.max_retries:
-                        failed_total += 1
-                        self.logger.error(
-                            f"Max retries reached for cancelling orders {symbol} "
-                            f"(correlation_id={correlation_id})"
-                        )
-                        break
+        return 0, True  # max_retries=0: nothing attempted
 
-                    # Exponential backoff: delay * (2 ^ attempt)
-                    delay = self.config.retry_delay_seconds * (2 ** attempt)
-                    self.logger.info(f"Retrying in {delay}s...")
-                    await asyncio.sleep(delay)
+    async def _cancel_orders_call(self, symbol: str) -> int:
+        """Cancel a symbol's orders without blocking the other symbols' tasks."""
+        if isinstance(self.order_gateway, AsyncExecutionGateway):
+            return await self.order_gateway.cancel_all_orders_async(symbol)
+        return await asyncio.to_thread(self.order_gateway.cancel_all_orders, symbol)
 
-        return {"cancelled": cancelled_total, "failed": failed_total}
+    async def _market_close_call(self, **params: Any) -> Dict[str, Any]:
+        """
+        Submit a market close without blocking the other symbols' tasks.
+
+        The blocking OrderGateway's execute_market_close calls its sync
+        client from inside the coroutine, so it runs on a private event
+        loop in a worker thread.
+        """
+        if isinstance(self.order_gateway, AsyncExecutionGateway):
+            return await self.order_gateway.execute_market_close(**params)
+        return await asyncio.to_thread(
+            asyncio.run, self.order_gateway.execute_market_close(**params)
+        )
 
     async def _close_all_positions(
         self, symbols: List[str], correlation_id: str
@@ -439,6 +483,9 @@ class LiquidationManager:
         """
         Close all open positions for symbols using market orders with retry logic.
 
+        Positions are closed in parallel (at most config.max_concurrency in
+        flight), each with its own retry/backoff loop.
+
         Args:
             symbols: List of symbols
             correlation_id: Correlation ID for audit trail
@@ -450,9 +497,6 @@ class LiquidationManager:
             f"Closing positions for symbols={symbols} (correlation_id={correlation_id})"
         )
 
-        closed_total = 0
-        failed_total = 0
-
         # Step 1: Query all open positions for symbols
         try:
             positions = await self.order_gateway.get_all_positions(symbols)
@@ -476,161 +520,174 @@ class LiquidationManager:
             # Cannot proceed without position data
             return {"closed": 0, "failed": len(symbols)}
 
-        # Step 2: Close each position with retry logic
-        for position in positions:
-            symbol = position["symbol"]
-            position_amt = float(position["positionAmt"])
-
-            # Determine close side (opposite of position side)
-            # positionAmt > 0 = LONG → close with SELL
-            # positionAmt < 0 = SHORT → close with BUY
-            close_side = "SELL" if position_amt > 0 else "BUY"
-            abs_position_amt = abs(position_amt)
-
-            # Validate position amount
-            if abs_position_amt <= 0:
-                self.logger.warning(
-                    f"Invalid position amount for {symbol}: {position_amt}. Skipping."
-                )
-                failed_total += 1
-                continue
+        # Step 2: Close positions in parallel, each with retry logic
+        slots = asyncio.Semaphore(self.config.max_concurrency)
+        outcomes = await asyncio.gather(
+            *(self._close_position(position, correlation_id, slots) for position in positions)
+        )
 
-            self.logger.info(
-                f"Closing position: {symbol} {close_side} {abs_position_amt} "
-                f"(entry={position['entryPrice']}, PnL={position['unrealizedProfit']}, "
-                f"correlation_id={correlation_id})"
+        closed_total = sum(1 for closed in outcomes if closed)
+        return {"closed": closed_total, "failed": len(outcomes) - closed_total}
+
+    async def _close_position(
+        self, position: Dict, correlation_id: str, slots: asyncio.Semaphore
+    ) -> bool:
+        """
+        Close one position with a reduceOnly market order and retry logic.
+
+        Returns:
+            True if the position was closed
+        """
+        symbol = position["symbol"]
+        position_amt = float(position["positionAmt"])
+
+        # Determine close side (opposite of position side)
+        # positionAmt > 0 = LONG → close with SELL
+        # positionAmt < 0 = SHORT → close with BUY
+        close_side = "SELL" if position_amt > 0 else "BUY"
+        abs_position_amt = abs(position_amt)
+
+        # Validate position amount
+        if abs_position_amt <= 0:
+            self.logger.warning(
+                f"Invalid position amount for {symbol}: {position_amt}. Skipping."
             )
+            return False
 
-            # Retry loop with exponential backoff
-            position_closed = False
-            for attempt in range(self.config.max_retries):
-                try:
-                    # Execute market close order with reduceOnly=True (enforced in execute_market_close)
-                    result = await self.order_gateway.execute_market_close(
+        self.logger.info(
+            f"Closing position: {symbol} {close_side} {abs_position_amt} "
+            f"(entry={position['entryPrice']}, PnL={position['unrealizedProfit']}, "
+            f"correlation_id={correlation_id})"
+        )
+
+        # Retry loop with exponential backoff
+        for attempt in range(self.config.max_retries):
+            try:
+                # Execute market close order with reduceOnly=True (enforced in execute_market_close)
+                async with self._request_slot(slots):
+                    result = await self._market_close_call(
                         symbol=symbol,
                         position_amt=abs_position_amt,
                         side=close_side,
                         reduce_only=True,  # SECURITY: Always True
                     )
 
-                    if result["success"]:
-                        closed_total += 1
-                        position_closed = True
-
-                        # Extract exit details for realized PnL calculation
-                        exit_price = result.get("avg_price", 0.0)
-                        executed_qty = result.get("executed_qty", abs_position_amt)
-                        entry_price = float(position.get("entryPrice", 0))
-                        position_side = "LONG" if position_amt > 0 else "SHORT"
-
-                        # Calculate realized PnL
-                        if position_side == "LONG":
-                            realized_pnl = (exit_price - entry_price) * executed_qty
-                        else:
-                            realized_pnl = (entry_price - exit_price) * executed_qty
-
-                        # Audit log: trade_closed event with full exit details
-                        self.audit_logger.log_event(
-                            event_type=AuditEventType.TRADE_CLOSED,
-                            operation="liquidation_close_position",
-                            symbol=symbol,
-                            data={
-                                "correlation_id": correlation_id,
-                                "exit_price": exit_price,
-                                "realized_pnl": realized_pnl,
-                                "exit_reason": "emergency_liquidation",
-                                "entry_price": entry_price,
-                                "quantity": executed_qty,
-                                "position_side": position_side,
-                                "order_id": result.get("order_id"),
-                                "attempt": attempt + 1,
-                            },
-                        )
-
-                        self.logger.info(
-                            f"Position closed: {symbol} order_id={result.get('order_id')} "
-                            f"exit_price={exit_price} realized_pnl={realized_pnl:.4f} "
-                            f"(attempt {attempt + 1}/{self.config.max_retries}, "
-                            f"correlation_id={correlation_id})"
-                        )
-
-                        # Success - break retry loop
-                        break
+                if result["success"]:
+                    # Extract exit details for realized PnL calculation
+                    exit_price = result.get("avg_price", 0.0)
+                    executed_qty = result.get("executed_qty", abs_position_amt)
+                    entry_price = float(position.get("entryPrice", 0))
+                    position_side = "LONG" if position_amt > 0 else "SHORT"
 
+                    # Calculate realized PnL
+                    if position_side == "LONG":
+                        realized_pnl = (exit_price - entry_price) * executed_qty
                     else:
-                        # Order rejected but not an exception
-                        self.logger.error(
-                            f"Position close rejected for {symbol}: {result.get('error')} "
-                            f"(attempt {attempt + 1}/{self.config.max_retries})"
-                        )
-
-                        # Audit log rejection
-                        self.audit_logger.log_event(
-                            event_type=AuditEventType.ORDER_REJECTED,
-                            operation="liquidation_close_position",
-                            data={
-                                "correlation_id": correlation_id,
-                                "symbol": symbol,
-                                "error": result.get("error"),
-                                "attempt": attempt + 1,
-                            },
-                        )
-
-                        # Check if this was the last attempt
-                        if attempt + 1 >= self.config.max_retries:
-                            failed_total += 1
-                            self.logger.error(
-                                f"Max retries reached for closing position {symbol} "
-                                f"(correlation_id={correlation_id})"
-                            )
-                            break
-
-                        # Exponential backoff
-                        delay = self.config.retry_delay_seconds * (2 ** attempt)
-                        self.logger.info(f"Retrying in {delay}s...")
-                        await asyncio.sleep(delay)
-
-                except Exception as e:
-                    # Unexpected exception
-                    self.logger.error(
-                        f"Failed to close position {symbol} (attempt {attempt + 1}/"
-                        f"{self.config.max_retries}): {e}",
-                        exc_info=True,
-                    )
+                        realized_pnl = (entry_price - exit_price) * executed_qty
 
-                    # Audit log retry attempt
+                    # Audit log: trade_closed event with full exit details
                     self.audit_logger.log_event(
-                        event_type=AuditEventType.API_ERROR,
-                        operation="liquidation_close_position_retry",
+                        event_type=AuditEventType.TRADE_CLOSED,
+                        operation="liquidation_close_position",
+                        symbol=symbol,
                         data={
                             "correlation_id": correlation_id,
-                            "symbol": symbol,
+                            "exit_price": exit_price,
+                            "realized_pnl": realized_pnl,
+                            "exit_reason": "emergency_liquidation",
+                            "entry_price": entry_price,
+                            "quantity": executed_qty,
+                            "position_side": position_side,
+                            "order_id": result.get("order_id"),
                             "attempt": attempt + 1,
-                            "max_retries": self.config.max_retries,
-                            "error": str(e),
                         },
                     )
 
-                    # Check if this was the last attempt
-                    if attempt + 1 >= self.config.max_retries:
-                        failed_total += 1
-                        self.logger.error(
-                            f"Max retries reached for closing position {symbol} "
-                            f"(correlation_id={correlation_id})"
-                        )
-                        break
-
-                    # Exponential backoff
-                    delay = self.config.retry_delay_seconds * (2 ** attempt)
-                    self.logger.info(f"Retrying in {delay}s...")
-                    await asyncio.sleep(delay)
-
-            # Log final status for this position
-            if not position_closed and failed_total == 0:
-                # This should not happen, but handle edge case
-                failed_total += 1
-
-        return {"closed": closed_total, "failed": failed_total}
+                    self.logger.info(
+                        f"Position closed: {symbol} order_id={result.get('order_id')} "
+                        f"exit_price={exit_price} realized_pnl={realized_pnl:.4f} "
+                        f"(attempt {attempt + 1}/{self.config.max_retries}, "
+                        f"correlation_id={correlation_id})"
+                    )
+                    return True
+
+                # Order rejected but not an exception
+                self.logger.error(
+                    f"Position close rejected for {symbol}: {result.get('error')} "
+                    f"(attempt {attempt + 1}/{self.config.max_retries})"
+                )
+
+                # Audit log rejection
+                self.audit_logger.log_event(
+                    event_type=AuditEventType.ORDER_REJECTED,
+                    operation="liquidation_close_position",
+                    data={
+                        "correlation_id": correlation_id,
+                        "symbol": symbol,
+                        "error": result.get("error"),
+                        "attempt": attempt + 1,
+                    },
+                )
+
+            except Exception as e:
+                # Unexpected exception
+                self.logger.error(
+                    f"Failed to close position {symbol} (attempt {attempt + 1}/"
+                    f"{self.config.max_retries}): {e}",
+                    exc_info=True,
+                )
+
+                # Audit log retry attempt
+                self.audit_logger.log_event(
+                    event_type=AuditEventType.API_ERROR,
+                    operation="liquidation_close_position_retry",
+                    data={
+                        "correlation_id": correlation_id,
+                        "symbol": symbol,
+                        "attempt": attempt + 1,
+                        "max_retries": self.config.max_retries,
+                        "error": str(e),
+                    },
+                )
+
+            # Check if this was the last attempt
+            if attempt + 1 >= self.config.max_retries:
+                self.logger.error(
+                    f"Max retries reached for closing position {symbol} "
+                    f"(correlation_id={correlation_id})"
+                )
+                return False
+
+            # Exponential backoff, slot released meanwhile
+            delay = self.config.retry_delay_seconds * (2 ** attempt)
+            self.logger.info(f"Retrying in {delay}s...")
+            await asyncio.sleep(delay)
+
+        return False
+
+    @asynccontextmanager
+    async def _request_slot(self, slots: asyncio.Semaphore):
+        """
+        Admit one exchange request.
+
+        At most config.max_concurrency requests are in flight. While the
+        request weight used in the current minute is above
+        WEIGHT_THROTTLE_RATIO of the limit, requests are additionally
+        serialized so liquidation does not trip the rate limiter (HTTP 429/418).
+        """
+        async with slots:
+            if self._weight_constrained():
+                async with self._throttle_lock:
+                    yield
+            else:
+                yield
+
+    def _weight_constrained(self) -> bool:
+        """Whether the gateway's reported weight usage is near the limit."""
+        tracker = getattr(self.order_gateway, "weight_tracker", None)
+        if not isinstance(tracker, RequestWeightTracker):
+            return False
+        return tracker.used_weight() >= tracker.weight_limit * self.WEIGHT_THROTTLE_RATIO
 
     async def _audit_log_result(
         self, result: LiquidationResult, symbols: List[str], correlation_id: str
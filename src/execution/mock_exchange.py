@@ -282,8 +282,16 @@ class MockExchange(ExecutionGateway, ExchangeProvider, PositionProvider):
         """Get position for symbol."""
         return self._positions.get(symbol)
 
-    async def get_all_positions(self, symbols: List[str]) -> List[Dict[str, Any]]:
+    async def get_all_positions(
+        self, symbols: List[str], quiet: bool = False
+    ) -> List[Dict[str, Any]]:
         """Get all positions for given symbols."""
+        return self.get_all_positions_sync(symbols, quiet)
+
+    def get_all_positions_sync(
+        self, symbols: List[str], quiet: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Get all positions for given symbols (sync)."""
         result = []
         for symbol in symbols:
             pos = self._positions.get(symbol)
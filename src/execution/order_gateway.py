@@ -2,10 +2,14 @@
 Order execution and management with Binance Futures API integration.
 """
 
+import asyncio
 import logging
+import threading
 import time
-from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Set
 
 from binance.error import ClientError, ServerError
 
@@ -13,6 +17,7 @@ from src.core.audit_logger import AuditEventType, AuditLogger
 from src.core.binance_service import BinanceServiceClient
 from src.core.circuit_breaker import CircuitBreaker
 from src.core.exceptions import OrderExecutionError, OrderRejectedError, ValidationError
+from src.core.exchange_info_cache import ExchangeInfoCache, SymbolQuantizer, precision_of
 from src.core.retry import retry_with_backoff
 from src.models.order import Order, OrderSide, OrderStatus, OrderType
 from src.models.position import Position
@@ -22,6 +27,22 @@ from src.execution.base import ExecutionGateway, ExchangeProvider
 
 # RequestWeightTracker moved to src.core.binance_service
 
+# Rounding for symbols missing from exchange info (standard USDT pair)
+DEFAULT_QUANTIZER = SymbolQuantizer("DEFAULT", tick_size=0.01, step_size=0.001)
+
+CLIENT_ALGO_ID_PREFIX = "tpsl-"
+
+# ALGO_UPDATE statuses meaning the conditional order exists (or existed) on the exchange
+_PLACED_ALGO_STATUSES = frozenset({"NEW", "TRIGGERING", "TRIGGERED", "FINISHED"})
+
+_EXIT_ORDER_TYPES = (OrderType.TAKE_PROFIT_MARKET, OrderType.STOP_MARKET)
+
+# Algo order types cancelled when a -4130 duplicate blocks one of ours
+_SAME_KIND = {
+    OrderType.TAKE_PROFIT_MARKET: ["TAKE_PROFIT_MARKET", "TAKE_PROFIT"],
+    OrderType.STOP_MARKET: ["STOP_MARKET", "STOP"],
+}
+
 
 class OrderGateway(ExecutionGateway, ExchangeProvider):
     """
@@ -59,6 +80,8 @@ class OrderGateway(ExecutionGateway, ExchangeProvider):
         self,
         audit_logger: Optional[AuditLogger] = None,
         binance_service: Optional[BinanceServiceClient] = None,
+        exchange_info: Optional[ExchangeInfoCache] = None,
+        confirm_timeout: float = 1.0,
     ) -> None:
         """
         Initialize OrderGateway.
@@ -67,6 +90,11 @@ class OrderGateway(ExecutionGateway, ExchangeProvider):
             audit_logger: Optional AuditLogger instance for structured logging.
                          If None, uses singleton instance from AuditLogger.get_instance()
             binance_service: Centralized BinanceServiceClient instance
+            exchange_info: Shared ExchangeInfoCache (e.g. warm-started from
+                disk and also used by RiskGuard). If None, an in-memory cache
+                is created.
+            confirm_timeout: Seconds to wait for the ALGO_UPDATE of a TP/SL
+                whose submission failed ambiguously before retrying it
         """
         # Store injected service and components
         self.client = binance_service
@@ -91,9 +119,19 @@ class OrderGateway(ExecutionGateway, ExchangeProvider):
             recovery_timeout=60,  # Increased from 3 to 5, 30s to 60s
         )
 
-        # Exchange info cache with 24h TTL
-        self._exchange_info_cache: Dict[str, Dict[str, float]] = {}
-        self._cache_timestamp: Optional[datetime] = None
+        # Exchange info (symbol filters + compiled quantizers) with 24h TTL
+        self.exchange_info = exchange_info if exchange_info is not None else ExchangeInfoCache()
+
+        # TP and SL are submitted side by side, one worker thread each
+        self._exit_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="tpsl")
+
+        # TP/SL placement confirmation (ALGO_UPDATE), keyed by clientAlgoId.
+        # Written from the WebSocket thread, read by the placing thread.
+        self._confirm_timeout = confirm_timeout
+        self._tracked_client_ids: Set[str] = set()
+        self._unconfirmed_exits: Set[str] = set()
+        self._algo_confirmations: Dict[str, Dict[str, Any]] = {}
+        self._confirmation_events: Dict[str, threading.Event] = {}
 
     @retry_with_backoff(max_retries=3, initial_delay=1.0)
     def set_leverage(self, symbol: str, leverage: int) -> bool:
@@ -285,8 +323,9 @@ class OrderGateway(ExecutionGateway, ExchangeProvider):
         """
         Format price according to symbol's tick size specification.
 
-        Fetches tick size from Binance exchange info (cached), calculates
-        precision, and formats price to exact decimal places required.
+        Uses the symbol's SymbolQuantizer compiled from exchange info
+        (cached): the price is rounded to the nearest tick and formatted to
+        the exact decimal places required.
 
         Args:
             price: Raw price value
@@ -305,19 +344,16 @@ class OrderGateway(ExecutionGateway, ExchangeProvider):
             >>> manager._format_price(492.1234, 'BNBUSDT')
             '492.123'  # 3 decimals for BNBUSDT
         """
-        # 1. Get symbol-specific tick size (with caching)
-        tick_size = self._get_tick_size(symbol)
+        # 1. Get symbol's compiled quantizer (with caching)
+        quantizer = self._get_quantizer(symbol, "tickSize=0.01 (2 decimals)")
 
-        # 2. Calculate decimal precision from tick size
-        decimal_places = self._calculate_precision(tick_size)
+        # 2. Round to the nearest tick and format with the precompiled precision
+        formatted = quantizer.format_price(price)
 
-        # 3. Format price with calculated precision
-        formatted = f"{price:.{decimal_places}f}"
-
-        # 4. Log formatting (debug level)
+        # 3. Log formatting (debug level)
         self.logger.debug(
             f"Formatted price for {symbol}: {price} → {formatted} "
-            f"(tick_size={tick_size}, precision={decimal_places})"
+            f"(tick_size={quantizer.tick_size}, precision={quantizer.price_precision})"
         )
 
         return formatted
@@ -340,25 +376,11 @@ class OrderGateway(ExecutionGateway, ExchangeProvider):
             >>> self._calculate_precision(1.0)
             0
         """
-        # Convert to string to count decimal places
-        tick_str = f"{tick_size:.10f}".rstrip("0")  # Remove trailing zeros
-
-        if "." not in tick_str:
-            return 0  # Integer tick size
-
-        # Count digits after decimal point
-        decimal_part = tick_str.split(".")[1]
-        precision = len(decimal_part)
-
-        return precision
+        return precision_of(tick_size)
 
     def _is_cache_expired(self) -> bool:
         """Check if exchange info cache has expired (24h TTL)."""
-        if self._cache_timestamp is None:
-            return True  # Never cached
-
-        age = datetime.now() - self._cache_timestamp
-        return age > timedelta(hours=24)
+        return self.exchange_info.is_expired()
 
     @retry_with_backoff(max_retries=3, initial_delay=1.0)
     def _refresh_exchange_info(self) -> None:
@@ -377,48 +399,7 @@ class OrderGateway(ExecutionGateway, ExchangeProvider):
                     f"Unexpected exchange info response type: {type(exchange_data).__name__}"
                 )
 
-            # Validate symbols field exists
-            if "symbols" not in exchange_data:
-                self.logger.error(f"Exchange info keys: {list(exchange_data.keys())}")
-                raise OrderExecutionError(
-                    "Exchange info response missing 'symbols' field"
-                )
-
-            # Parse symbols and extract tick sizes
-            symbols_parsed = 0
-            for symbol_data in exchange_data["symbols"]:
-                symbol = symbol_data["symbol"]
-
-                # Find PRICE_FILTER and LOT_SIZE in symbol filters
-                price_filter = None
-                lot_filter = None
-                for filter_item in symbol_data["filters"]:
-                    if filter_item["filterType"] == "PRICE_FILTER":
-                        price_filter = filter_item
-                    elif filter_item["filterType"] == "LOT_SIZE":
-                        lot_filter = filter_item
-
-                if price_filter or lot_filter:
-                    self._exchange_info_cache[symbol] = {
-                        "tickSize": float(price_filter["tickSize"])
-                        if price_filter
-                        else 0.01,
-                        "minPrice": float(price_filter["minPrice"])
-                        if price_filter
-                        else 0.0,
-                        "maxPrice": float(price_filter["maxPrice"])
-                        if price_filter
-                        else 0.0,
-                        "stepSize": float(lot_filter["stepSize"])
-                        if lot_filter
-                        else 0.001,
-                        "minQty": float(lot_filter["minQty"]) if lot_filter else 0.0,
-                        "maxQty": float(lot_filter["maxQty"]) if lot_filter else 0.0,
-                    }
-                    symbols_parsed += 1
-
-            # Update cache timestamp
-            self._cache_timestamp = datetime.now()
+            symbols_parsed = self._cache_exchange_info(exchange_data)
 
             self.logger.info(f"Exchange info cached: {symbols_parsed} symbols loaded")
 
@@ -454,6 +435,45 @@ class OrderGateway(ExecutionGateway, ExchangeProvider):
             self.logger.error(f"Failed to fetch exchange info: {e}")
             raise OrderExecutionError(f"Exchange info fetch failed: {e}")
 
+    async def _ensure_exchange_info(self) -> None:
+        """
+        Refresh the exchange info cache off the event loop, if expired.
+
+        Used by the background refresh so the blocking fetch never runs on
+        the order path.
+
+        Raises:
+            OrderExecutionError: Exchange info fetch fails
+        """
+        if not self._is_cache_expired():
+            return
+        await asyncio.to_thread(self._refresh_exchange_info)
+
+    def _cache_exchange_info(self, exchange_data: Dict[str, Any]) -> int:
+        """
+        Parse an exchangeInfo payload into the shared ExchangeInfoCache.
+
+        Filters are compiled into per-symbol quantizers and persisted when
+        the cache has a file.
+
+        Args:
+            exchange_data: Unwrapped GET /fapi/v1/exchangeInfo response
+
+        Returns:
+            Number of symbols cached
+
+        Raises:
+            OrderExecutionError: Response missing 'symbols' field
+        """
+        # Validate symbols field exists
+        if "symbols" not in exchange_data:
+            self.logger.error(f"Exchange info keys: {list(exchange_data.keys())}")
+            raise OrderExecutionError(
+                "Exchange info response missing 'symbols' field"
+            )
+
+        return self.exchange_info.update_from_exchange_info(exchange_data)
+
     def _get_tick_size(self, symbol: str) -> float:
         """
         Get tick size for symbol from exchange info (cached).
@@ -475,10 +495,10 @@ class OrderGateway(ExecutionGateway, ExchangeProvider):
             self._refresh_exchange_info()
 
         # 2. Look up symbol in cache
-        if symbol in self._exchange_info_cache:
-            tick_size = self._exchange_info_cache[symbol]["tickSize"]
-            self.logger.debug(f"Cache hit for {symbol}: tickSize={tick_size}")
-            return tick_size
+        quantizer = self.exchange_info.get(symbol)
+        if quantizer is not None:
+            self.logger.debug(f"Cache hit for {symbol}: tickSize={quantizer.tick_size}")
+            return quantizer.tick_size
 
         # 3. Symbol not found - graceful fallback
         self.logger.warning(
@@ -506,10 +526,10 @@ class OrderGateway(ExecutionGateway, ExchangeProvider):
             self._refresh_exchange_info()
 
         # 2. Look up symbol in cache
-        if symbol in self._exchange_info_cache:
-            step_size = self._exchange_info_cache[symbol].get("stepSize", 0.001)
-            self.logger.debug(f"Cache hit for {symbol}: stepSize={step_size}")
-            return step_size
+        quantizer = self.exchange_info.get(symbol)
+        if quantizer is not None:
+            self.logger.debug(f"Cache hit for {symbol}: stepSize={quantizer.step_size}")
+            return quantizer.step_size
 
         # 3. Symbol not found - graceful fallback
         self.logger.warning(
@@ -519,10 +539,39 @@ class OrderGateway(ExecutionGateway, ExchangeProvider):
         )
         return 0.001  # Default
 
+    def _get_quantizer(self, symbol: str, fallback_note: str) -> SymbolQuantizer:
+        """
+        Get the compiled quantizer for symbol (refreshing expired exchange info).
+
+        Args:
+            symbol: Trading symbol (e.g., 'BTCUSDT')
+            fallback_note: Default being applied, for the not-found warning
+
+        Returns:
+            Symbol's SymbolQuantizer, or DEFAULT_QUANTIZER (tick 0.01, step
+            0.001) if the symbol is not in exchange info
+        """
+        if self._is_cache_expired():
+            self._refresh_exchange_info()
+
+        quantizer = self.exchange_info.get(symbol)
+        if quantizer is not None:
+            return quantizer
+
+        self.logger.warning(
+            f"Symbol {symbol} not found in exchange info. "
+            f"Using default {fallback_note}. "
+            f"This may cause order rejection for non-standard pairs."
+        )
+        return DEFAULT_QUANTIZER
+
     def _format_quantity(self, quantity: float, symbol: str) -> str:
         """
         Format quantity according to symbol's step size specification.
 
+        The quantity is floored to a step multiple (the same rounding
+        RiskGuard applies when sizing), never rounded up.
+
         Args:
             quantity: Raw quantity value
             symbol: Trading symbol (e.g., 'BTCUSDT')
@@ -534,19 +583,16 @@ class OrderGateway(ExecutionGateway, ExchangeProvider):
             >>> manager._format_quantity(10.123456, 'XRPUSDT')
             '10.1'  # 1 decimal for XRPUSDT
         """
-        # 1. Get symbol-specific step size (with caching)
-        step_size = self._get_step_size(symbol)
+        # 1. Get symbol's compiled quantizer (with caching)
+        quantizer = self._get_quantizer(symbol, "stepSize=0.001 (3 decimals)")
 
-        # 2. Calculate decimal precision from step size
-        decimal_places = self._calculate_precision(step_size)
+        # 2. Floor to the step and format with the precompiled precision
+        formatted = quantizer.format_quantity(quantity)
 
-        # 3. Format quantity with calculated precision
-        formatted = f"{quantity:.{decimal_places}f}"
-
-        # 4. Log formatting (debug level)
+        # 3. Log formatting (debug level)
         self.logger.debug(
             f"Formatted quantity for {symbol}: {quantity} → {formatted} "
-            f"(stepSize={step_size}, precision={decimal_places})"
+            f"(stepSize={quantizer.step_size}, precision={quantizer.quantity_precision})"
         )
 
         return formatted
@@ -718,12 +764,303 @@ class OrderGateway(ExecutionGateway, ExchangeProvider):
         except (ValueError, TypeError) as e:
             raise OrderExecutionError(f"Invalid data type in API response: {e}")
 
+    def _adjust_sl_trigger(
+        self, adjusted_stop_loss: float, mark_price: float, side: OrderSide
+    ) -> float:
+        """
+        Move a STOP_MARKET trigger to the valid side of the mark price.
+
+        Prevents immediate-trigger rejections (code -2021) by keeping the
+        trigger at least 0.2% away from the mark price.
+
+        Args:
+            adjusted_stop_loss: Requested trigger price
+            mark_price: Current mark price
+            side: Order side closing the position
+
+        Returns:
+            Trigger price to submit
+        """
+        min_buffer = mark_price * 0.002  # 0.2% minimum distance from mark price
+        original_stop_loss = adjusted_stop_loss
+
+        # STOP_MARKET trigger logic:
+        # - SELL side (closing LONG): triggers when mark price <= stopPrice
+        #   → SL must be BELOW mark price
+        # - BUY side (closing SHORT): triggers when mark price >= stopPrice
+        #   → SL must be ABOVE mark price
+        if side == OrderSide.SELL:
+            # Closing LONG - SL must be below mark price
+            if adjusted_stop_loss >= mark_price:
+                adjusted_stop_loss = mark_price - min_buffer
+                self.logger.warning(
+                    f"SL (SELL) adjusted: {original_stop_loss:.4f} >= mark {mark_price:.4f}, "
+                    f"new SL: {adjusted_stop_loss:.4f}"
+                )
+            elif mark_price - adjusted_stop_loss < min_buffer:
+                adjusted_stop_loss = mark_price - min_buffer
+                self.logger.warning(
+                    f"SL (SELL) too close to mark price, adjusted: "
+                    f"{original_stop_loss:.4f} → {adjusted_stop_loss:.4f}"
+                )
+        else:  # OrderSide.BUY
+            # Closing SHORT - SL must be above mark price
+            if adjusted_stop_loss <= mark_price:
+                adjusted_stop_loss = mark_price + min_buffer
+                self.logger.warning(
+                    f"SL (BUY) adjusted: {original_stop_loss:.4f} <= mark {mark_price:.4f}, "
+                    f"new SL: {adjusted_stop_loss:.4f}"
+                )
+            elif adjusted_stop_loss - mark_price < min_buffer:
+                adjusted_stop_loss = mark_price + min_buffer
+                self.logger.warning(
+                    f"SL (BUY) too close to mark price, adjusted: "
+                    f"{original_stop_loss:.4f} → {adjusted_stop_loss:.4f}"
+                )
+
+        return adjusted_stop_loss
+
+    def _adjust_tp_trigger(
+        self, adjusted_take_profit: float, mark_price: float, side: OrderSide
+    ) -> float:
+        """
+        Move a TAKE_PROFIT_MARKET trigger to the valid side of the mark price.
+
+        Prevents immediate-trigger rejections (code -2021) by keeping the
+        trigger at least 0.2% away from the mark price.
+
+        Args:
+            adjusted_take_profit: Requested trigger price
+            mark_price: Current mark price
+            side: Order side closing the position
+
+        Returns:
+            Trigger price to submit
+        """
+        original_take_profit = adjusted_take_profit
+        min_buffer = mark_price * 0.002  # 0.2% minimum distance from mark price
+
+        # TAKE_PROFIT_MARKET trigger logic:
+        # - SELL side (closing LONG): triggers when mark price >= stopPrice
+        #   → TP must be ABOVE mark price
+        # - BUY side (closing SHORT): triggers when mark price <= stopPrice
+        #   → TP must be BELOW mark price
+        if side == OrderSide.SELL:
+            # Closing LONG - TP must be above mark price
+            if adjusted_take_profit <= mark_price:
+                adjusted_take_profit = mark_price + min_buffer
+                self.logger.warning(
+                    f"TP (SELL) adjusted: {original_take_profit:.4f} <= mark {mark_price:.4f}, "
+                    f"new TP: {adjusted_take_profit:.4f}"
+                )
+            elif adjusted_take_profit - mark_price < min_buffer:
+                adjusted_take_profit = mark_price + min_buffer
+                self.logger.warning(
+                    f"TP (SELL) too close to mark price, adjusted: "
+                    f"{original_take_profit:.4f} → {adjusted_take_profit:.4f}"
+                )
+        else:  # OrderSide.BUY
+            # Closing SHORT - TP must be below mark price
+            if adjusted_take_profit >= mark_price:
+                adjusted_take_profit = mark_price - min_buffer
+                self.logger.warning(
+                    f"TP (BUY) adjusted: {original_take_profit:.4f} >= mark {mark_price:.4f}, "
+                    f"new TP: {adjusted_take_profit:.4f}"
+                )
+            elif mark_price - adjusted_take_profit < min_buffer:
+                adjusted_take_profit = mark_price - min_buffer
+                self.logger.warning(
+                    f"TP (BUY) too close to mark price, adjusted: "
+                    f"{original_take_profit:.4f} → {adjusted_take_profit:.4f}"
+                )
+
+        return adjusted_take_profit
+
+    # TP/SL placement confirmation
+
+    def on_algo_update(self, order_data: Dict[str, Any]) -> None:
+        """
+        Record an ALGO_UPDATE payload for an in-flight TP/SL placement.
+
+        Safe to call from the WebSocket thread. Updates for IDs this gateway
+        is not tracking are ignored.
+
+        Args:
+            order_data: The event's 'o' object (caid, aid, o, s, X, tp, ...)
+        """
+        client_algo_id = order_data.get("caid")
+        if client_algo_id not in self._tracked_client_ids:
+            return
+
+        self._algo_confirmations[client_algo_id] = order_data
+        self._notify_confirmation(client_algo_id, order_data)
+
+    def _notify_confirmation(self, client_algo_id: str, order_data: Dict[str, Any]) -> None:
+        """Wake a thread blocked in _wait_for_confirmation for this ID."""
+        event = self._confirmation_events.get(client_algo_id)
+        if event is not None:
+            event.set()
+
+    def _wait_for_confirmation(
+        self, client_algo_id: str, timeout: float
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Block until the ALGO_UPDATE of a placement arrives.
+
+        Returns:
+            The payload if the order exists on the exchange, None if it was
+            rejected/expired or nothing arrived within ``timeout``
+        """
+        data = self._algo_confirmations.get(client_algo_id)
+        if data is None:
+            event = threading.Event()
+            self._confirmation_events[client_algo_id] = event
+            try:
+                # Re-check: the update may have landed before the event existed
+                data = self._algo_confirmations.get(client_algo_id)
+                if data is None and event.wait(timeout):
+                    data = self._algo_confirmations.get(client_algo_id)
+            finally:
+                self._confirmation_events.pop(client_algo_id, None)
+
+        if data is None or data.get("X") not in _PLACED_ALGO_STATUSES:
+            return None
+        return data
+
+    def _order_from_confirmation(
+        self, data: Dict[str, Any], signal: Signal, side: OrderSide, order_type: OrderType
+    ) -> Order:
+        """Order for a TP/SL whose placement was confirmed over the stream only."""
+        trigger = float(data["tp"]) if data.get("tp") else None
+        is_tp = order_type == OrderType.TAKE_PROFIT_MARKET
+        return Order(
+            symbol=signal.symbol,
+            side=side,
+            order_type=order_type,
+            quantity=0.0,
+            stop_price=signal.take_profit if is_tp else trigger,
+            order_id=str(data.get("aid")),
+            client_order_id=data.get("caid"),
+            status=OrderStatus.NEW,
+            timestamp=datetime.now(timezone.utc),
+        )
+
+    def _release_client_ids(self, client_algo_ids: Dict[OrderType, str]) -> None:
+        for client_algo_id in client_algo_ids.values():
+            self._tracked_client_ids.discard(client_algo_id)
+            self._unconfirmed_exits.discard(client_algo_id)
+            self._algo_confirmations.pop(client_algo_id, None)
+
+    def _adopt_confirmed_exits_sync(
+        self,
+        signal: Signal,
+        side: OrderSide,
+        missing: List[OrderType],
+        tpsl_orders: list[Order],
+        client_algo_ids: Dict[OrderType, str],
+    ) -> bool:
+        """
+        Resolve ambiguous submissions of missing exit orders from ALGO_UPDATE.
+
+        Confirmed orders are moved from ``missing`` to ``tpsl_orders``. All
+        pending confirmations share one ``confirm_timeout`` window.
+
+        Returns:
+            True if any submission was ambiguous (the wait already spaced the
+            next retry)
+        """
+        pending = [
+            order_type
+            for order_type in missing
+            if client_algo_ids.get(order_type) in self._unconfirmed_exits
+        ]
+        if not pending:
+            return False
+
+        deadline = time.monotonic() + self._confirm_timeout
+        for order_type in pending:
+            client_algo_id = client_algo_ids[order_type]
+            data = self._wait_for_confirmation(
+                client_algo_id, max(0.0, deadline - time.monotonic())
+            )
+            self._unconfirmed_exits.discard(client_algo_id)
+            if data is not None:
+                order = self._order_from_confirmation(data, signal, side, order_type)
+                self._log_adopted_exit(order, signal, side, "ALGO_UPDATE")
+            else:
+                # ALGO_UPDATE may just be late: a resubmission under the same
+                # clientAlgoId would hit -4130 on the order that did land
+                order = self._find_open_exit_sync(signal, side, order_type, client_algo_id)
+                if order is None:
+                    self.logger.warning(
+                        f"{order_type.value} {client_algo_id} not confirmed by ALGO_UPDATE "
+                        f"or open algo orders, resubmitting"
+                    )
+                    continue
+                self._log_adopted_exit(order, signal, side, "openAlgoOrders")
+
+            tpsl_orders.append(order)
+            missing.remove(order_type)
+        return True
+
+    def _find_open_exit_sync(
+        self, signal: Signal, side: OrderSide, order_type: OrderType, client_algo_id: str
+    ) -> Optional[Order]:
+        """Open algo order placed under ``client_algo_id``, if any (None on lookup failure)."""
+        try:
+            open_orders = self.client.query_open_algo_orders(signal.symbol)
+        except Exception as e:
+            self.logger.warning(f"Open algo order lookup failed for {signal.symbol}: {e}")
+            return None
+        return self._match_open_exit(open_orders, signal, side, order_type, client_algo_id)
+
+    def _match_open_exit(
+        self,
+        open_orders: Any,
+        signal: Signal,
+        side: OrderSide,
+        order_type: OrderType,
+        client_algo_id: str,
+    ) -> Optional[Order]:
+        """Order for the openAlgoOrders entry carrying ``client_algo_id``."""
+        for data in open_orders or []:
+            if data.get("clientAlgoId") == client_algo_id:
+                confirmation = {
+                    "caid": client_algo_id,
+                    "aid": data.get("algoId"),
+                    "tp": data.get("triggerPrice"),
+                }
+                return self._order_from_confirmation(confirmation, signal, side, order_type)
+        return None
+
+    def _log_adopted_exit(self, order: Order, signal: Signal, side: OrderSide, source: str) -> None:
+        """Audit a TP/SL found on the exchange after an ambiguous failure."""
+        try:
+            self.audit_logger.log_order_placed(
+                symbol=signal.symbol,
+                order_data={
+                    "order_type": order.order_type.value,
+                    "side": side.value,
+                    "stop_price": order.stop_price,
+                    "close_position": True,
+                },
+                response={"order_id": order.order_id, "status": order.status.value},
+            )
+        except Exception as e:
+            self.logger.warning(f"Audit logging failed: {e}")
+        self.logger.info(
+            f"{order.order_type.value} confirmed by {source} after ambiguous failure: "
+            f"algoId={order.order_id}"
+        )
+
     @retry_with_backoff(max_retries=3)
     def _place_sl_order(
         self,
         signal: Signal,
         side: OrderSide,
         adjusted_stop_loss: Optional[float] = None,
+        mark_price: Optional[float] = None,
+        client_algo_id: Optional[str] = None,
     ) -> Optional[Order]:
         """
         Place STOP_MARKET order for position exit.
@@ -732,6 +1069,11 @@ class OrderGateway(ExecutionGateway, ExchangeProvider):
             signal: Trading signal with stop_loss price
             side: Order side to close position (opposite of entry)
             adjusted_stop_loss: Optional pre-adjusted stop loss price
+            mark_price: Mark price already fetched by the caller (fetched
+                here when None)
+            client_algo_id: clientAlgoId to send. If the request fails
+                without a definite rejection, the ID is recorded as
+                unconfirmed so the caller can wait for its ALGO_UPDATE.
 
         Returns:
             Order object if successful, None if placement fails
@@ -754,48 +1096,12 @@ class OrderGateway(ExecutionGateway, ExchangeProvider):
             # Validate and adjust SL to prevent immediate trigger (code -2021)
             # CRITICAL: Order uses workingType=MARK_PRICE, so validate against mark price
             if adjusted_stop_loss:
-                try:
-                    mark_price = self.client.get_mark_price(signal.symbol)
-                except Exception as e:
-                    self.logger.warning(f"Failed to get mark price, using entry: {e}")
-                    mark_price = signal.entry_price if hasattr(signal, "entry_price") else 0.0
-
-                min_buffer = mark_price * 0.002  # 0.2% minimum distance from mark price
-                original_stop_loss = adjusted_stop_loss
-
-                # STOP_MARKET trigger logic:
-                # - SELL side (closing LONG): triggers when mark price <= stopPrice
-                #   → SL must be BELOW mark price
-                # - BUY side (closing SHORT): triggers when mark price >= stopPrice
-                #   → SL must be ABOVE mark price
-                if side == OrderSide.SELL:
-                    # Closing LONG - SL must be below mark price
-                    if adjusted_stop_loss >= mark_price:
-                        adjusted_stop_loss = mark_price - min_buffer
-                        self.logger.warning(
-                            f"SL (SELL) adjusted: {original_stop_loss:.4f} >= mark {mark_price:.4f}, "
-                            f"new SL: {adjusted_stop_loss:.4f}"
-                        )
-                    elif mark_price - adjusted_stop_loss < min_buffer:
-                        adjusted_stop_loss = mark_price - min_buffer
-                        self.logger.warning(
-                            f"SL (SELL) too close to mark price, adjusted: "
-                            f"{original_stop_loss:.4f} → {adjusted_stop_loss:.4f}"
-                        )
-                else:  # OrderSide.BUY
-                    # Closing SHORT - SL must be above mark price
-                    if adjusted_stop_loss <= mark_price:
-                        adjusted_stop_loss = mark_price + min_buffer
-                        self.logger.warning(
-                            f"SL (BUY) adjusted: {original_stop_loss:.4f} <= mark {mark_price:.4f}, "
-                            f"new SL: {adjusted_stop_loss:.4f}"
-                        )
-                    elif adjusted_stop_loss - mark_price < min_buffer:
-                        adjusted_stop_loss = mark_price + min_buffer
-                        self.logger.warning(
-                            f"SL (BUY) too close to mark price, adjusted: "
-                            f"{original_stop_loss:.4f} → {adjusted_stop_loss:.4f}"
-                        )
+                if mark_price is None:
+                    mark_price = self._mark_price_or_entry_sync(signal)
+
+                adjusted_stop_loss = self._adjust_sl_trigger(
+                    adjusted_stop_loss, mark_price, side
+                )
 
             # Format stop price for API
             stop_price_str = self._format_price(adjusted_stop_loss, signal.symbol)
@@ -809,6 +1115,7 @@ class OrderGateway(ExecutionGateway, ExchangeProvider):
                 triggerPrice=stop_price_str,  # Algo API uses triggerPrice, not stopPrice
                 closePosition="true",  # Close entire position
                 workingType="MARK_PRICE",  # Use mark price for trigger
+                **_client_algo_id_param(client_algo_id),
             )
 
             # Parse API response into Order object
@@ -847,14 +1154,27 @@ class OrderGateway(ExecutionGateway, ExchangeProvider):
 
         except ClientError as e:
             # Handle -4130: Duplicate TP/SL order with closePosition exists
+            if e.error_code == -4130 and client_algo_id is not None:
+                # Our own earlier (ambiguous) submission may be the duplicate
+                existing = self._find_open_exit_sync(
+                    signal, side, OrderType.STOP_MARKET, client_algo_id
+                )
+                if existing is not None:
+                    self._log_adopted_exit(existing, signal, side, "openAlgoOrders")
+                    return existing
+
             if e.error_code == -4130:
+                # Only this type is cancelled, the TP may have just been placed
                 self.logger.warning(
                     f"SL order rejected (-4130): existing algo order with closePosition "
-                    f"detected for {signal.symbol}. Attempting to cancel existing algo orders..."
+                    f"detected for {signal.symbol}. Attempting to cancel existing SL "
+                    f"algo orders..."
                 )
                 try:
-                    # Cancel existing algo orders (TP/SL) for future attempts
-                    algo_results = self.client.cancel_all_algo_orders(signal.symbol)
+                    # Cancel existing SL algo orders for future attempts
+                    algo_results = self.client.cancel_algo_orders_by_type(
+                        signal.symbol, _SAME_KIND[OrderType.STOP_MARKET]
+                    )
                     algo_cancelled = len(algo_results) if algo_results else 0
                     if algo_cancelled > 0:
                         self.logger.info(
@@ -891,6 +1211,9 @@ class OrderGateway(ExecutionGateway, ExchangeProvider):
             return None
 
         except Exception as e:
+            if client_algo_id is not None:
+                # 5xx/timeout: the exchange may still have accepted it
+                self._unconfirmed_exits.add(client_algo_id)
             # Unexpected error - log but don't raise
             self.logger.error(f"SL order placement failed: {type(e).__name__}: {e}")
 
@@ -1026,6 +1349,8 @@ class OrderGateway(ExecutionGateway, ExchangeProvider):
         signal: Signal,
         side: OrderSide,
         adjusted_take_profit: Optional[float] = None,
+        mark_price: Optional[float] = None,
+        client_algo_id: Optional[str] = None,
     ) -> Optional[Order]:
         """
         Place TAKE_PROFIT_MARKET order for position exit.
@@ -1036,6 +1361,8 @@ class OrderGateway(ExecutionGateway, ExchangeProvider):
         - Comprehensive audit logging
         - Retry logic with exponential backoff
         - Error handling without raising exceptions
+
+        ``mark_price`` and ``client_algo_id`` work as in _place_sl_order.
         """
         try:
             # Validate take_profit exists
@@ -1047,50 +1374,12 @@ class OrderGateway(ExecutionGateway, ExchangeProvider):
 
             # Validate and adjust TP to prevent immediate trigger (code -2021)
             # CRITICAL: Order uses workingType=MARK_PRICE, so validate against mark price
-            original_take_profit = signal.take_profit
-            adjusted_take_profit = original_take_profit
-
-            try:
-                mark_price = self.client.get_mark_price(signal.symbol)
-            except Exception as e:
-                self.logger.warning(f"Failed to get mark price, using entry: {e}")
-                mark_price = signal.entry_price if hasattr(signal, "entry_price") else 0.0
-
-            min_buffer = mark_price * 0.002  # 0.2% minimum distance from mark price
+            if mark_price is None:
+                mark_price = self._mark_price_or_entry_sync(signal)
 
-            # TAKE_PROFIT_MARKET trigger logic:
-            # - SELL side (closing LONG): triggers when mark price >= stopPrice
-            #   → TP must be ABOVE mark price
-            # - BUY side (closing SHORT): triggers when mark price <= stopPrice
-            #   → TP must be BELOW mark price
-            if side == OrderSide.SELL:
-                # Closing LONG - TP must be above mark price
-                if adjusted_take_profit <= mark_price:
-                    adjusted_take_profit = mark_price + min_buffer
-                    self.logger.warning(
-                        f"TP (SELL) adjusted: {original_take_profit:.4f} <= mark {mark_price:.4f}, "
-                        f"new TP: {adjusted_take_profit:.4f}"
-                    )
-                elif adjusted_take_profit - mark_price < min_buffer:
-                    adjusted_take_profit = mark_price + min_buffer
-                    self.logger.warning(
-                        f"TP (SELL) too close to mark price, adjusted: "
-                        f"{original_take_profit:.4f} → {adjusted_take_profit:.4f}"
-                    )
-            else:  # OrderSide.BUY
-                # Closing SHORT - TP must be below mark price
-                if adjusted_take_profit >= mark_price:
-                    adjusted_take_profit = mark_price - min_buffer
-                    self.logger.warning(
-                        f"TP (BUY) adjusted: {original_take_profit:.4f} >= mark {mark_price:.4f}, "
-                        f"new TP: {adjusted_take_profit:.4f}"
-                    )
-                elif mark_price - adjusted_take_profit < min_buffer:
-                    adjusted_take_profit = mark_price - min_buffer
-                    self.logger.warning(
-                        f"TP (BUY) too close to mark price, adjusted: "
-                        f"{original_take_profit:.4f} → {adjusted_take_profit:.4f}"
-                    )
+            adjusted_take_profit = self._adjust_tp_trigger(
+                signal.take_profit, mark_price, side
+            )
 
             # Format stop price for API
             stop_price_str = self._format_price(adjusted_take_profit, signal.symbol)
@@ -1104,6 +1393,7 @@ class OrderGateway(ExecutionGateway, ExchangeProvider):
                 triggerPrice=stop_price_str,  # Algo API uses triggerPrice, not stopPrice
                 closePosition="true",  # Close entire position
                 workingType="MARK_PRICE",  # Use mark price for trigger
+                **_client_algo_id_param(client_algo_id),
             )
 
             # Parse API response into Order object
@@ -1142,14 +1432,27 @@ class OrderGateway(ExecutionGateway, ExchangeProvider):
 
         except ClientError as e:
             # Handle -4130: Duplicate TP/SL order with closePosition exists
+            if e.error_code == -4130 and client_algo_id is not None:
+                # Our own earlier (ambiguous) submission may be the duplicate
+                existing = self._find_open_exit_sync(
+                    signal, side, OrderType.TAKE_PROFIT_MARKET, client_algo_id
+                )
+                if existing is not None:
+                    self._log_adopted_exit(existing, signal, side, "openAlgoOrders")
+                    return existing
+
             if e.error_code == -4130:
+                # Only this type is cancelled, the SL may have just been placed
                 self.logger.warning(
                     f"TP order rejected (-4130): existing algo order with closePosition "
-                    f"detected for {signal.symbol}. Attempting to cancel existing algo orders..."
+                    f"detected for {signal.symbol}. Attempting to cancel existing TP "
+                    f"algo orders..."
                 )
                 try:
-                    # Cancel existing algo orders (TP/SL) for future attempts
-                    algo_results = self.client.cancel_all_algo_orders(signal.symbol)
+                    # Cancel existing TP algo orders for future attempts
+                    algo_results = self.client.cancel_algo_orders_by_type(
+                        signal.symbol, _SAME_KIND[OrderType.TAKE_PROFIT_MARKET]
+                    )
                     algo_cancelled = len(algo_results) if algo_results else 0
                     if algo_cancelled > 0:
                         self.logger.info(
@@ -1186,6 +1489,9 @@ class OrderGateway(ExecutionGateway, ExchangeProvider):
             return None
 
         except Exception as e:
+            if client_algo_id is not None:
+                # 5xx/timeout: the exchange may still have accepted it
+                self._unconfirmed_exits.add(client_algo_id)
             # Unexpected error - log but don't raise
             self.logger.error(f"TP order placement failed: {type(e).__name__}: {e}")
 
@@ -1204,6 +1510,50 @@ class OrderGateway(ExecutionGateway, ExchangeProvider):
 
             return None
 
+    def _mark_price_or_entry_sync(self, signal: Signal) -> float:
+        """Mark price for trigger validation, falling back to the entry price."""
+        try:
+            return self.client.get_mark_price(signal.symbol)
+        except Exception as e:
+            self.logger.warning(f"Failed to get mark price, using entry: {e}")
+            return signal.entry_price if hasattr(signal, "entry_price") else 0.0
+
+    def _place_exit_orders(
+        self,
+        signal: Signal,
+        side: OrderSide,
+        order_types: List[OrderType],
+        client_algo_ids: Dict[OrderType, str],
+    ) -> list[Order]:
+        """
+        Submit exit orders concurrently, sharing one mark price lookup.
+
+        Each order goes out from its own worker thread, so TP and SL cost
+        one round-trip instead of two.
+
+        Returns:
+            Orders that were placed, in ``order_types`` order
+        """
+        mark_price = self._mark_price_or_entry_sync(signal)
+        placers = {
+            OrderType.TAKE_PROFIT_MARKET: self._place_tp_order,
+            OrderType.STOP_MARKET: self._place_sl_order,
+        }
+
+        def place(order_type: OrderType) -> Optional[Order]:
+            return placers[order_type](
+                signal,
+                side,
+                mark_price=mark_price,
+                client_algo_id=client_algo_ids.get(order_type),
+            )
+
+        if len(order_types) == 1:
+            results = [place(order_types[0])]
+        else:
+            results = list(self._exit_executor.map(place, order_types))
+        return [order for order in results if order]
+
     @retry_with_backoff(max_retries=3, initial_delay=1.0)
     def execute_signal(
         self, signal: Signal, quantity: float, reduce_only: bool = False
@@ -1355,7 +1705,8 @@ class OrderGateway(ExecutionGateway, ExchangeProvider):
         tpsl_side = OrderSide.SELL if side == OrderSide.BUY else OrderSide.BUY
 
         # Handle different signal types
-        if signal.signal_type in (SignalType.LONG_ENTRY, SignalType.SHORT_ENTRY):
+        is_entry = signal.signal_type in (SignalType.LONG_ENTRY, SignalType.SHORT_ENTRY)
+        if is_entry:
             # Entry signals: Cancel existing orders before placing new TP/SL orders
             # This prevents orphaned TP/SL orders from previous positions
             try:
@@ -1372,15 +1723,25 @@ class OrderGateway(ExecutionGateway, ExchangeProvider):
                     f"Proceeding with TP/SL placement anyway."
                 )
 
-        # Place TP order
-        tp_order = self._place_tp_order(signal, tpsl_side)
-        if tp_order:
-            tpsl_orders.append(tp_order)
-
-        # Place SL order
-        sl_order = self._place_sl_order(signal, tpsl_side)
-        if sl_order:
-            tpsl_orders.append(sl_order)
+        # Place TP and SL concurrently; each carries a clientAlgoId so an
+        # ambiguous failure can be confirmed over ALGO_UPDATE before a retry
+        client_algo_ids = {order_type: _new_client_algo_id() for order_type in _EXIT_ORDER_TYPES}
+        self._tracked_client_ids.update(client_algo_ids.values())
+        try:
+            tpsl_orders = self._place_exit_orders(
+                signal, tpsl_side, list(_EXIT_ORDER_TYPES), client_algo_ids
+            )
+            if is_entry:
+                # Entry signals: TP/SL completeness check with retry + escalation
+                tpsl_orders = self._ensure_tpsl_completeness(
+                    signal=signal,
+                    tpsl_orders=tpsl_orders,
+                    tpsl_side=tpsl_side,
+                    entry_order=entry_order,
+                    client_algo_ids=client_algo_ids,
+                )
+        finally:
+            self._release_client_ids(client_algo_ids)
 
         # Handle different post-entry processing based on signal type
         if signal.signal_type in (SignalType.CLOSE_LONG, SignalType.CLOSE_SHORT):
@@ -1403,14 +1764,6 @@ class OrderGateway(ExecutionGateway, ExchangeProvider):
                     f"Failed to cancel remaining orders after position closure: {e}. "
                     f"Manual cleanup may be required."
                 )
-        else:
-            # Entry signals: TP/SL completeness check with retry + escalation
-            tpsl_orders = self._ensure_tpsl_completeness(
-                signal=signal,
-                tpsl_orders=tpsl_orders,
-                tpsl_side=tpsl_side,
-                entry_order=entry_order,
-            )
 
         # Return entry order and TP/SL orders
         return (entry_order, tpsl_orders)
@@ -1457,67 +1810,11 @@ class OrderGateway(ExecutionGateway, ExchangeProvider):
                 f"get_position_risk response for {symbol}: {type(response)} - {response}"
             )
 
-            # 4. Parse response
-            if response is None:
-                self.logger.error(f"Position API failed for {symbol} - no response")
+            # 4-9. Parse response into Position (None when flat)
+            position = self._parse_position_risk(symbol, response)
+            if position is None:
                 return None
 
-            # Handler Binance API response structure (now already unwrapped by BinanceServiceClient)
-            unwrapped = response
-
-            if isinstance(unwrapped, list):
-                # Direct list response or unwrapped data list
-                if len(unwrapped) == 0:
-                    self.logger.info(f"No active position for {symbol} (empty data)")
-                    return None
-                position_data = unwrapped[0]
-            else:
-                raise OrderExecutionError(
-                    f"Unexpected response type: {type(unwrapped).__name__}"
-                )
-
-            # Extract position amount
-            position_amt = float(position_data.get("positionAmt", 0))
-
-            # 5. Check if position exists
-            if position_amt == 0:
-                self.logger.info(f"No active position for {symbol}")
-                return None
-
-            # 6. Determine position side
-            side = "LONG" if position_amt > 0 else "SHORT"
-            quantity = abs(position_amt)
-
-            # 7. Extract required fields
-            entry_price = float(position_data["entryPrice"])
-            leverage = int(
-                position_data.get("leverage", 1)
-            )  # Default to 1x if not provided
-            unrealized_pnl = float(position_data.get("unRealizedProfit", 0))
-
-            # 8. Extract optional liquidation price
-            liquidation_price = None
-            if "liquidationPrice" in position_data:
-                liq_price_str = position_data["liquidationPrice"]
-                if liq_price_str and liq_price_str != "0":
-                    liquidation_price = float(liq_price_str)
-
-            # 9. Create Position object
-            position = Position(
-                symbol=symbol,
-                side=side,
-                entry_price=entry_price,
-                quantity=quantity,
-                leverage=leverage,
-                unrealized_pnl=unrealized_pnl,
-                liquidation_price=liquidation_price,
-            )
-
-            self.logger.info(
-                f"Position retrieved: {side} {quantity} {symbol} @ {entry_price}, "
-                f"PnL: {unrealized_pnl}"
-            )
-
             # Audit log: position query successful
             try:
                 from src.core.audit_logger import AuditEventType
@@ -1528,10 +1825,10 @@ class OrderGateway(ExecutionGateway, ExchangeProvider):
                     symbol=symbol,
                     response={
                         "has_position": True,
-                        "position_amt": quantity,
-                        "entry_price": entry_price,
-                        "side": side,
-                        "unrealized_pnl": unrealized_pnl,
+                        "position_amt": position.quantity,
+                        "entry_price": position.entry_price,
+                        "side": position.side,
+                        "unrealized_pnl": position.unrealized_pnl,
                     },
                 )
             except Exception as e:
@@ -1597,6 +1894,83 @@ class OrderGateway(ExecutionGateway, ExchangeProvider):
 
             raise OrderExecutionError(f"Failed to parse position data: {e}")
 
+    def _parse_position_risk(self, symbol: str, response: Any) -> Optional[Position]:
+        """
+        Parse a positionRisk response for one symbol.
+
+        Args:
+            symbol: Trading pair queried
+            response: Unwrapped GET /fapi/v3/positionRisk response
+
+        Returns:
+            Position if one is open, None if flat or no response
+
+        Raises:
+            OrderExecutionError: Unexpected response type
+            KeyError/ValueError/TypeError: Malformed position data
+        """
+        if response is None:
+            self.logger.error(f"Position API failed for {symbol} - no response")
+            return None
+
+        # Handler Binance API response structure (now already unwrapped by BinanceServiceClient)
+        unwrapped = response
+
+        if isinstance(unwrapped, list):
+            # Direct list response or unwrapped data list
+            if len(unwrapped) == 0:
+                self.logger.info(f"No active position for {symbol} (empty data)")
+                return None
+            position_data = unwrapped[0]
+        else:
+            raise OrderExecutionError(
+                f"Unexpected response type: {type(unwrapped).__name__}"
+            )
+
+        # Extract position amount
+        position_amt = float(position_data.get("positionAmt", 0))
+
+        # Check if position exists
+        if position_amt == 0:
+            self.logger.info(f"No active position for {symbol}")
+            return None
+
+        # Determine position side
+        side = "LONG" if position_amt > 0 else "SHORT"
+        quantity = abs(position_amt)
+
+        # Extract required fields
+        entry_price = float(position_data["entryPrice"])
+        leverage = int(
+            position_data.get("leverage", 1)
+        )  # Default to 1x if not provided
+        unrealized_pnl = float(position_data.get("unRealizedProfit", 0))
+
+        # Extract optional liquidation price
+        liquidation_price = None
+        if "liquidationPrice" in position_data:
+            liq_price_str = position_data["liquidationPrice"]
+            if liq_price_str and liq_price_str != "0":
+                liquidation_price = float(liq_price_str)
+
+        # Create Position object
+        position = Position(
+            symbol=symbol,
+            side=side,
+            entry_price=entry_price,
+            quantity=quantity,
+            leverage=leverage,
+            unrealized_pnl=unrealized_pnl,
+            liquidation_price=liquidation_price,
+        )
+
+        self.logger.info(
+            f"Position retrieved: {side} {quantity} {symbol} @ {entry_price}, "
+            f"PnL: {unrealized_pnl}"
+        )
+
+        return position
+
     def get_account_balance(self) -> float:
         """
         Query USDT wallet balance.
@@ -1621,33 +1995,9 @@ class OrderGateway(ExecutionGateway, ExchangeProvider):
             # 2. Call Binance API
             response = self.client.account()
 
-            # 3. Extract account data
-            # Handle Binance API response structure (now already unwrapped by BinanceServiceClient)
-            account_data = response
-
-            if not isinstance(account_data, dict):
-                raise OrderExecutionError(
-                    f"Unexpected account response type: {type(account_data).__name__}"
-                )
-
-            # 4. Extract assets array
-            if "assets" not in account_data:
-                self.logger.error(f"Account data keys: {list(account_data.keys())}")
-                raise OrderExecutionError("Account response missing 'assets' field")
-
-            assets = account_data["assets"]
-
-            # 5. Find USDT balance
-            usdt_balance = None
-
-            for asset in assets:
-                if asset.get("asset") == "USDT":
-                    usdt_balance = float(asset["walletBalance"])
-                    break
-
+            # 3-5. Extract USDT wallet balance
+            usdt_balance = self._extract_usdt_balance(response)
             if usdt_balance is None:
-                # USDT not found in assets array
-                self.logger.warning("USDT not found in account assets, returning 0.0")
                 return 0.0
 
             # 6. Log and return
@@ -1680,6 +2030,48 @@ class OrderGateway(ExecutionGateway, ExchangeProvider):
         except (KeyError, ValueError, TypeError) as e:
             raise OrderExecutionError(f"Failed to parse account data: {e}")
 
+    def _extract_usdt_balance(self, response: Any) -> Optional[float]:
+        """
+        Extract the USDT wallet balance from an account response.
+
+        Args:
+            response: Unwrapped GET /fapi/v3/account response
+
+        Returns:
+            USDT wallet balance, None if USDT is not among the assets
+
+        Raises:
+            OrderExecutionError: Unexpected response shape
+        """
+        # Handle Binance API response structure (now already unwrapped by BinanceServiceClient)
+        account_data = response
+
+        if not isinstance(account_data, dict):
+            raise OrderExecutionError(
+                f"Unexpected account response type: {type(account_data).__name__}"
+            )
+
+        # Extract assets array
+        if "assets" not in account_data:
+            self.logger.error(f"Account data keys: {list(account_data.keys())}")
+            raise OrderExecutionError("Account response missing 'assets' field")
+
+        assets = account_data["assets"]
+
+        # Find USDT balance
+        usdt_balance = None
+
+        for asset in assets:
+            if asset.get("asset") == "USDT":
+                usdt_balance = float(asset["walletBalance"])
+                break
+
+        if usdt_balance is None:
+            # USDT not found in assets array
+            self.logger.warning("USDT not found in account assets, returning 0.0")
+
+        return usdt_balance
+
     def get_open_orders(self, symbol: str) -> List[Dict[str, Any]]:
         """
         Query all open orders for a symbol.
@@ -1902,6 +2294,37 @@ class OrderGateway(ExecutionGateway, ExchangeProvider):
             self.logger.warning(f"Unexpected error cancelling order {order_id}: {e}")
             return False
 
+    def _count_cancelled(self, response: Any, symbol: str) -> int:
+        """
+        Count orders cancelled by a DELETE /fapi/v1/allOpenOrders response.
+
+        Args:
+            response: Unwrapped bulk-cancel response
+            symbol: Trading pair (for logging)
+
+        Returns:
+            Number of regular orders cancelled
+        """
+        # Response is already unwrapped by BinanceServiceClient
+        unwrapped = response
+
+        if isinstance(unwrapped, list):
+            # Response is a list of cancelled order objects
+            cancelled_count = len(unwrapped)
+            self.logger.info(f"Cancelled {cancelled_count} orders for {symbol}")
+        elif isinstance(unwrapped, dict) and unwrapped.get("code") == 200:
+            # Response is a success message (no orders to cancel or success msg)
+            cancelled_count = 0
+            self.logger.info(
+                f"Success: {unwrapped.get('msg', 'Orders cancelled')} for {symbol}"
+            )
+        else:
+            # Unexpected response format
+            self.logger.warning(f"Unexpected response format: {response}")
+            cancelled_count = 0
+
+        return cancelled_count
+
     def cancel_all_orders(
         self,
         symbol: str,
@@ -1964,23 +2387,8 @@ class OrderGateway(ExecutionGateway, ExchangeProvider):
             # 4. Call Binance API (bulk cancel)
             response = self.client.cancel_open_orders(symbol=symbol)
 
-            # 5. Parse response (now already unwrapped by BinanceServiceClient)
-            unwrapped = response
-
-            if isinstance(unwrapped, list):
-                # Response is a list of cancelled order objects
-                cancelled_count = len(unwrapped)
-                self.logger.info(f"Cancelled {cancelled_count} orders for {symbol}")
-            elif isinstance(unwrapped, dict) and unwrapped.get("code") == 200:
-                # Response is a success message (no orders to cancel or success msg)
-                cancelled_count = 0
-                self.logger.info(
-                    f"Success: {unwrapped.get('msg', 'Orders cancelled')} for {symbol}"
-                )
-            else:
-                # Unexpected response format
-                self.logger.warning(f"Unexpected response format: {response}")
-                cancelled_count = 0
+            # 5. Parse response
+            cancelled_count = self._count_cancelled(response, symbol)
 
             # 5.5 Cancel Algo Orders (TP/SL placed via Algo Order API)
             # Standard cancel_open_orders does NOT cancel algo orders - they use separate API
@@ -2090,12 +2498,80 @@ class OrderGateway(ExecutionGateway, ExchangeProvider):
                 f"Unexpected error during order cancellation: {e}"
             )
 
-    async def get_all_positions(self, symbols: List[str]) -> List[Dict[str, Any]]:
+    def _filter_open_positions(
+        self, response: Any, symbols: List[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Reduce an all-symbols positionRisk response to open positions.
+
+        Args:
+            response: Unwrapped GET /fapi/v3/positionRisk response
+            symbols: Symbols to keep
+
+        Returns:
+            Position dictionaries (see get_all_positions)
+
+        Raises:
+            OrderExecutionError: Unexpected response type
+        """
+        # Handle Binance API response structure
+        if isinstance(response, dict) and "data" in response:
+            position_list = response["data"]
+        elif isinstance(response, list):
+            position_list = response
+        else:
+            raise OrderExecutionError(
+                f"Unexpected response type: {type(response).__name__}"
+            )
+
+        # Filter to requested symbols with non-zero positions
+        filtered_positions = []
+        for pos_data in position_list:
+            symbol = pos_data.get("symbol")
+            position_amt = float(pos_data.get("positionAmt", 0))
+
+            # Only include positions for requested symbols with non-zero quantity
+            if symbol in symbols and position_amt != 0:
+                filtered_positions.append(
+                    {
+                        "symbol": symbol,
+                        "positionAmt": pos_data.get("positionAmt"),
+                        "entryPrice": pos_data.get("entryPrice"),
+                        "unrealizedProfit": pos_data.get("unRealizedProfit"),
+                        "leverage": pos_data.get("leverage"),
+                        "liquidationPrice": pos_data.get("liquidationPrice"),
+                    }
+                )
+
+        return filtered_positions
+
+    async def _request_async(self, method: str, **params: Any) -> Any:
+        """
+        Issue an API call from one of the async methods.
+
+        Calls the blocking client directly; AsyncOrderGateway overrides this
+        to use its non-blocking client instead.
+
+        Args:
+            method: Client method name (e.g. 'new_order')
+            **params: Method parameters
+
+        Returns:
+            Unwrapped API response
+        """
+        return getattr(self.client, method)(**params)
+
+    async def get_all_positions(
+        self, symbols: List[str], quiet: bool = False
+    ) -> List[Dict[str, Any]]:
         """
         Query all open positions for given symbols.
 
         Args:
             symbols: List of trading symbols (e.g., ['BTCUSDT', 'ETHUSDT'])
+            quiet: Periodic background query (position reconciliation): log
+                at debug level and skip the POSITION_QUERY audit record.
+                API errors are still audited.
 
         Returns:
             List of position dictionaries with keys:
@@ -2113,83 +2589,102 @@ class OrderGateway(ExecutionGateway, ExchangeProvider):
             >>> for pos in positions:
             ...     print(f"{pos['symbol']}: {pos['positionAmt']} @ {pos['entryPrice']}")
         """
-        self.logger.info(f"Querying positions for symbols: {symbols}")
+        log = self.logger.debug if quiet else self.logger.info
+        log(f"Querying positions for symbols: {symbols}")
 
         try:
             # Call Binance API without symbol parameter to get all positions
-            response = self.client.get_position_risk()
+            response = await self._request_async("get_position_risk")
+        except ClientError as e:
+            raise self._position_query_error(e)
+        except Exception as e:
+            raise OrderExecutionError(f"Unexpected error querying positions: {e}")
 
-            # Handle Binance API response structure
-            if isinstance(response, dict) and "data" in response:
-                position_list = response["data"]
-            elif isinstance(response, list):
-                position_list = response
-            else:
-                raise OrderExecutionError(
-                    f"Unexpected response type: {type(response).__name__}"
-                )
+        return self._open_positions_result(response, symbols, quiet)
 
-            # Filter to requested symbols with non-zero positions
-            filtered_positions = []
-            for pos_data in position_list:
-                symbol = pos_data.get("symbol")
-                position_amt = float(pos_data.get("positionAmt", 0))
-
-                # Only include positions for requested symbols with non-zero quantity
-                if symbol in symbols and position_amt != 0:
-                    filtered_positions.append(
-                        {
-                            "symbol": symbol,
-                            "positionAmt": pos_data.get("positionAmt"),
-                            "entryPrice": pos_data.get("entryPrice"),
-                            "unrealizedProfit": pos_data.get("unRealizedProfit"),
-                            "leverage": pos_data.get("leverage"),
-                            "liquidationPrice": pos_data.get("liquidationPrice"),
-                        }
-                    )
+    def get_all_positions_sync(
+        self, symbols: List[str], quiet: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Blocking get_all_positions() for callers running in a worker thread.
 
-            self.logger.info(f"Found {len(filtered_positions)} open positions")
+        Issues the same single positionRisk query through the sync client,
+        so it must not be called on the event loop.
 
-            # Audit log
-            try:
-                from src.core.audit_logger import AuditEventType
+        Args:
+            symbols: List of trading symbols
+            quiet: See get_all_positions
 
-                self.audit_logger.log_event(
-                    event_type=AuditEventType.POSITION_QUERY,
-                    operation="get_all_positions",
-                    data={
-                        "symbols": symbols,
-                        "positions_count": len(filtered_positions),
-                    },
-                )
-            except Exception as e:
-                self.logger.warning(f"Audit logging failed: {e}")
+        Returns:
+            List of position dictionaries (see get_all_positions)
 
-            return filtered_positions
+        Raises:
+            OrderExecutionError: API call fails
+        """
+        log = self.logger.debug if quiet else self.logger.info
+        log(f"Querying positions for symbols: {symbols}")
 
+        try:
+            response = self.client.get_position_risk()
         except ClientError as e:
-            # Audit log API error
-            try:
-                from src.core.audit_logger import AuditEventType
+            raise self._position_query_error(e)
+        except Exception as e:
+            raise OrderExecutionError(f"Unexpected error querying positions: {e}")
 
-                self.audit_logger.log_event(
-                    event_type=AuditEventType.API_ERROR,
-                    operation="get_all_positions",
-                    error={
-                        "status_code": e.status_code,
-                        "error_code": e.error_code,
-                        "error_message": e.error_message,
-                    },
-                )
-            except Exception:
-                pass
+        return self._open_positions_result(response, symbols, quiet)
 
-            raise OrderExecutionError(
-                f"Position query failed: code={e.error_code}, msg={e.error_message}"
-            )
+    def _open_positions_result(
+        self, response: Any, symbols: List[str], quiet: bool
+    ) -> List[Dict[str, Any]]:
+        """Filter a positionRisk response and audit the query unless quiet."""
+        log = self.logger.debug if quiet else self.logger.info
+        try:
+            filtered_positions = self._filter_open_positions(response, symbols)
         except Exception as e:
             raise OrderExecutionError(f"Unexpected error querying positions: {e}")
 
+        log(f"Found {len(filtered_positions)} open positions")
+        if quiet:
+            return filtered_positions
+
+        # Audit log
+        try:
+            from src.core.audit_logger import AuditEventType
+
+            self.audit_logger.log_event(
+                event_type=AuditEventType.POSITION_QUERY,
+                operation="get_all_positions",
+                data={
+                    "symbols": symbols,
+                    "positions_count": len(filtered_positions),
+                },
+            )
+        except Exception as e:
+            self.logger.warning(f"Audit logging failed: {e}")
+
+        return filtered_positions
+
+    def _position_query_error(self, e: ClientError) -> OrderExecutionError:
+        """Audit a failed positionRisk query and build the error to raise."""
+        try:
+            from src.core.audit_logger import AuditEventType
+
+            self.audit_logger.log_event(
+                event_type=AuditEventType.API_ERROR,
+                operation="get_all_positions",
+                error={
+                    "status_code": e.status_code,
+                    "error_code": e.error_code,
+                    "error_message": e.error_message,
+                },
+            )
+        except Exception:
+            pass
+
+        return OrderExecutionError(
+            f"Position query failed: code={e.error_code}, msg={e.error_message}"
+        )
+
     def _ensure_tpsl_completeness(
         self,
         signal: Signal,
@@ -2197,20 +2692,29 @@ class OrderGateway(ExecutionGateway, ExchangeProvider):
         tpsl_side: OrderSide,
         entry_order: Order,
         max_retries: int = 2,
-        retry_delay: float = 1.0,
+        retry_delay: float = 0.2,
+        client_algo_ids: Optional[Dict[OrderType, str]] = None,
     ) -> list[Order]:
         """Ensure both TP and SL orders are placed after entry.
 
         Retries missing orders up to max_retries times. If still incomplete,
         escalates to emergency market close (reduce_only=True).
 
+        A missing order whose submission failed ambiguously is first looked
+        up on the user data stream (ALGO_UPDATE by clientAlgoId, up to
+        ``confirm_timeout``) and only resubmitted, under the same
+        clientAlgoId, if it did not land. Definite rejections are retried
+        after ``retry_delay`` with a fresh mark price.
+
         Args:
             signal: Original trading signal
             tpsl_orders: Currently placed TP/SL orders
             tpsl_side: Side for TP/SL orders (opposite of entry)
             entry_order: The filled entry order
             max_retries: Maximum retry attempts (default 2)
-            retry_delay: Seconds between retries (default 1.0)
+            retry_delay: Seconds before a retry that did not wait for a
+                confirmation (default 0.2)
+            client_algo_ids: clientAlgoId per exit order type
 
         Returns:
             Updated list of TP/SL orders (may be empty if emergency close triggered)
@@ -2224,42 +2728,34 @@ class OrderGateway(ExecutionGateway, ExchangeProvider):
             f"Retrying missing orders (max {max_retries} attempts)."
         )
 
-        # Identify what's missing
-        has_tp = any(
-            o.order_type in (OrderType.TAKE_PROFIT_MARKET, OrderType.TAKE_PROFIT)
-            for o in tpsl_orders
-        )
-        has_sl = any(
-            o.order_type in (OrderType.STOP_MARKET, OrderType.STOP)
-            for o in tpsl_orders
-        )
+        client_algo_ids = client_algo_ids or {}
+        missing = _missing_exit_types(tpsl_orders)
 
-        for attempt in range(1, max_retries + 1):
-            time.sleep(retry_delay)
-            self.logger.info(
-                f"TP/SL retry attempt {attempt}/{max_retries} for {signal.symbol}"
+        attempt = 0
+        while True:
+            waited = self._adopt_confirmed_exits_sync(
+                signal, tpsl_side, missing, tpsl_orders, client_algo_ids
             )
-
-            if not has_tp:
-                tp_order = self._place_tp_order(signal, tpsl_side)
-                if tp_order:
-                    tpsl_orders.append(tp_order)
-                    has_tp = True
-                    self.logger.info("TP order placed on retry")
-
-            if not has_sl:
-                sl_order = self._place_sl_order(signal, tpsl_side)
-                if sl_order:
-                    tpsl_orders.append(sl_order)
-                    has_sl = True
-                    self.logger.info("SL order placed on retry")
-
-            if len(tpsl_orders) >= 2:
+            if not missing:
                 self.logger.info(
-                    f"TP/SL placement complete after {attempt} retry: "
-                    f"2/2 orders placed"
+                    f"TP/SL placement complete after {attempt} retries: 2/2 orders placed"
                 )
                 return tpsl_orders
+            if attempt == max_retries:
+                break
+
+            attempt += 1
+            if not waited:
+                time.sleep(retry_delay)
+            self.logger.info(
+                f"TP/SL retry attempt {attempt}/{max_retries} for {signal.symbol}"
+            )
+            placed = self._place_exit_orders(
+                signal, tpsl_side, list(missing), client_algo_ids
+            )
+            tpsl_orders.extend(placed)
+            placed_types = {o.order_type for o in placed}
+            missing = [order_type for order_type in missing if order_type not in placed_types]
 
         # All retries exhausted — escalate to emergency close
         self.logger.error(
@@ -2457,7 +2953,8 @@ class OrderGateway(ExecutionGateway, ExchangeProvider):
 
         try:
             # Place market order with reduceOnly
-            response = self.client.new_order(
+            response = await self._request_async(
+                "new_order",
                 symbol=symbol,
                 side=side,
                 type=OrderType.MARKET.value,
@@ -2547,3 +3044,26 @@ class OrderGateway(ExecutionGateway, ExchangeProvider):
                 "success": False,
                 "error": f"Unexpected error: {str(e)}",
             }
+
+
+def _new_client_algo_id() -> str:
+    """Unique clientAlgoId (Binance allows up to 36 characters)."""
+    return f"{CLIENT_ALGO_ID_PREFIX}{uuid.uuid4().hex[:24]}"
+
+
+def _client_algo_id_param(client_algo_id: Optional[str]) -> Dict[str, str]:
+    """new_algo_order kwargs for an optional clientAlgoId."""
+    return {"clientAlgoId": client_algo_id} if client_algo_id is not None else {}
+
+
+def _missing_exit_types(tpsl_orders: list[Order]) -> List[OrderType]:
+    """Exit order types (TP, SL) not yet covered by ``tpsl_orders``."""
+    placed_types = {o.order_type for o in tpsl_orders}
+    return [
+        order_type
+        for order_type, variants in (
+            (OrderType.TAKE_PROFIT_MARKET, {OrderType.TAKE_PROFIT_MARKET, OrderType.TAKE_PROFIT}),
+            (OrderType.STOP_MARKET, {OrderType.STOP_MARKET, OrderType.STOP}),
+        )
+        if not placed_types & variants
+    ]
@@ -18,10 +18,12 @@ from typing import TYPE_CHECKING, Callable, Optional, Dict, Any, List
 
 if TYPE_CHECKING:
     from src.core.audit_logger import AuditLogger
+    from src.core.balance_cache import BalanceCache
     from src.models.position import Position
     from src.core.position_cache_manager import PositionCacheManager
     from src.execution.base import ExecutionGateway, PositionProvider
 
+from src.execution.base import AsyncExecutionGateway
 from src.models.order import Order
 from src.models.position import PositionEntryData
 from src.models.signal import Signal
@@ -43,6 +45,7 @@ class TradeCoordinator:
     - ConfigManager: For trading parameters (leverage)
     - PositionCacheManager: For cache invalidation after execution
     - AuditLogger: For compliance logging
+    - BalanceCache (optional): WebSocket-fed balance used for sizing
     """
 
     def __init__(
@@ -52,12 +55,14 @@ class TradeCoordinator:
         config_manager,
         audit_logger: "AuditLogger",
         position_cache_manager: "PositionProvider",
+        balance_cache: Optional["BalanceCache"] = None,
     ):
         self._order_gateway = order_gateway
         self._risk_guard = risk_guard
         self._config_manager = config_manager
         self._audit_logger = audit_logger
         self._position_cache_manager = position_cache_manager
+        self._balance_cache = balance_cache
         self._position_entry_data: Dict[str, PositionEntryData] = {}
         self._entry_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
         self._get_wallet_balance: Optional[Callable[[], Optional[float]]] = None
@@ -84,82 +89,129 @@ class TradeCoordinator:
         try:
             open_orders = self._order_gateway.get_open_orders(symbol)
         except Exception as e:
-            # Conditional Fail-Open: API failure → proceed with warning
-            self.logger.warning(
-                f"Pre-flight check API failed for {symbol}: {e}. "
-                f"Proceeding with entry (fail-open policy)."
-            )
-            try:
-                from src.core.audit_logger import AuditEventType
+            return self._pre_flight_fail_open(symbol, e)
 
-                self._audit_logger.log_event(
-                    event_type=AuditEventType.RISK_REJECTION,
-                    operation="pre_flight_check",
-                    symbol=symbol,
-                    error={
-                        "reason": "pre_flight_api_failure_fallthrough",
-                        "error": str(e),
-                    },
-                )
-            except Exception:
-                pass
+        if not open_orders:
             return True
 
+        self._log_orphaned_orders(symbol, open_orders)
+        try:
+            cancelled_count = self._order_gateway.cancel_all_orders(symbol)
+        except Exception as e:
+            return self._pre_flight_cancel_failed(symbol, e, open_orders)
+        return self._pre_flight_cleaned(symbol, cancelled_count, open_orders)
+
+    async def _pre_flight_check_async(self, symbol: str) -> bool:
+        """_pre_flight_check for an AsyncExecutionGateway (same policy, non-blocking)."""
+        gateway: "AsyncExecutionGateway" = self._order_gateway
+        try:
+            open_orders = await gateway.get_open_orders_async(symbol)
+        except Exception as e:
+            return self._pre_flight_fail_open(symbol, e)
+
         if not open_orders:
             return True
 
-        # Orphaned orders detected — attempt pre-flight cleanup
+        self._log_orphaned_orders(symbol, open_orders)
+        try:
+            cancelled_count = await gateway.cancel_all_orders_async(symbol)
+        except Exception as e:
+            return self._pre_flight_cancel_failed(symbol, e, open_orders)
+        return self._pre_flight_cleaned(symbol, cancelled_count, open_orders)
+
+    def _pre_flight_fail_open(self, symbol: str, error: Exception) -> bool:
+        """Conditional Fail-Open: API failure → proceed with warning."""
         self.logger.warning(
-            f"Pre-flight: {len(open_orders)} orphaned orders detected for {symbol}, "
-            f"cancelling before entry"
+            f"Pre-flight check API failed for {symbol}: {error}. "
+            f"Proceeding with entry (fail-open policy)."
         )
-
         try:
-            cancelled_count = self._order_gateway.cancel_all_orders(symbol)
-            self.logger.info(
-                f"Pre-flight cleanup: cancelled {cancelled_count} orders for {symbol}"
+            from src.core.audit_logger import AuditEventType
+
+            self._audit_logger.log_event(
+                event_type=AuditEventType.RISK_REJECTION,
+                operation="pre_flight_check",
+                symbol=symbol,
+                error={
+                    "reason": "pre_flight_api_failure_fallthrough",
+                    "error": str(error),
+                },
             )
+        except Exception:
+            pass
+        return True
 
-            try:
-                from src.core.audit_logger import AuditEventType
+    def _log_orphaned_orders(self, symbol: str, open_orders: List[Dict[str, Any]]) -> None:
+        """Orphaned orders detected — cleanup is attempted next."""
+        self.logger.warning(
+            f"Pre-flight: {len(open_orders)} orphaned orders detected for {symbol}, "
+            f"cancelling before entry"
+        )
 
-                self._audit_logger.log_event(
-                    event_type=AuditEventType.ORDER_CANCELLED,
-                    operation="pre_flight_cleanup",
-                    symbol=symbol,
-                    data={
-                        "reason": "pre_flight_cleanup",
-                        "cancelled_count": cancelled_count,
-                        "detected_orders": len(open_orders),
-                    },
-                )
-            except Exception:
-                pass
-            return True
+    def _pre_flight_cleaned(
+        self, symbol: str, cancelled_count: int, open_orders: List[Dict[str, Any]]
+    ) -> bool:
+        """Orphans cancelled — entry may proceed."""
+        self.logger.info(
+            f"Pre-flight cleanup: cancelled {cancelled_count} orders for {symbol}"
+        )
 
-        except Exception as e:
-            # Cancel failed — reject entry to prevent orphan interference
-            self.logger.error(
-                f"Pre-flight cancel failed for {symbol}: {e}. "
-                f"Rejecting entry to prevent orphan order interference."
+        try:
+            from src.core.audit_logger import AuditEventType
+
+            self._audit_logger.log_event(
+                event_type=AuditEventType.ORDER_CANCELLED,
+                operation="pre_flight_cleanup",
+                symbol=symbol,
+                data={
+                    "reason": "pre_flight_cleanup",
+                    "cancelled_count": cancelled_count,
+                    "detected_orders": len(open_orders),
+                },
             )
+        except Exception:
+            pass
+        return True
+
+    def _pre_flight_cancel_failed(
+        self, symbol: str, error: Exception, open_orders: List[Dict[str, Any]]
+    ) -> bool:
+        """Cancel failed — reject entry to prevent orphan interference."""
+        self.logger.error(
+            f"Pre-flight cancel failed for {symbol}: {error}. "
+            f"Rejecting entry to prevent orphan order interference."
+        )
 
-            try:
-                from src.core.audit_logger import AuditEventType
+        try:
+            from src.core.audit_logger import AuditEventType
 
-                self._audit_logger.log_event(
-                    event_type=AuditEventType.RISK_REJECTION,
-                    operation="pre_flight_check",
-                    symbol=symbol,
-                    error={
-                        "reason": "orphaned_orders_cancel_failed",
-                        "error": str(e),
-                        "detected_orders": len(open_orders),
-                    },
-                )
-            except Exception:
-                pass
-            return False
+            self._audit_logger.log_event(
+                event_type=AuditEventType.RISK_REJECTION,
+                operation="pre_flight_check",
+                symbol=symbol,
+                error={
+                    "reason": "orphaned_orders_cancel_failed",
+                    "error": str(error),
+                    "detected_orders": len(open_orders),
+                },
+            )
+        except Exception:
+            pass
+        return False
+
+    @property
+    def _async_gateway(self) -> Optional["AsyncExecutionGateway"]:
+        """The gateway if it offers the non-blocking API, else None."""
+        if isinstance(self._order_gateway, AsyncExecutionGateway):
+            return self._order_gateway
+        return None
+
+    async def _cancel_all_orders(self, symbol: str) -> int:
+        """cancel_all_orders, awaited when the gateway is non-blocking."""
+        gateway = self._async_gateway
+        if gateway is not None:
+            return await gateway.cancel_all_orders_async(symbol)
+        return self._order_gateway.cancel_all_orders(symbol)
 
     async def on_signal_generated(self, event: Event) -> None:
         """
@@ -184,7 +236,9 @@ class TradeCoordinator:
         async with self._entry_locks[signal.symbol]:
             try:
                 # Step 2: Get current position via PositionCacheManager (fresh query)
-                current_position = self._position_cache_manager.get_fresh(signal.symbol)
+                current_position = await self._position_cache_manager.get_fresh_async(
+                    signal.symbol
+                )
 
                 # Step 3: Validate signal with RiskGuard
                 is_valid = self._risk_guard.validate_risk(signal, current_position)
@@ -220,7 +274,12 @@ class TradeCoordinator:
                     return
 
                 # Step 4.5: Pre-flight open order check before entry
-                if not self._pre_flight_check(signal.symbol):
+                async_gateway = self._async_gateway
+                if async_gateway is not None:
+                    pre_flight_ok = await self._pre_flight_check_async(signal.symbol)
+                else:
+                    pre_flight_ok = self._pre_flight_check(signal.symbol)
+                if not pre_flight_ok:
                     self.logger.warning(
                         f"Signal rejected by pre-flight check: "
                         f"{signal.signal_type.value} for {signal.symbol}"
@@ -228,8 +287,15 @@ class TradeCoordinator:
                     return
 
                 # Entry signal: calculate position size and execute with TP/SL
-                # Step 5: Get account balance
-                account_balance = self._order_gateway.get_account_balance()
+                # Step 5: Get account balance (WebSocket cache, REST if stale)
+                account_balance = (
+                    self._balance_cache.get() if self._balance_cache is not None else None
+                )
+                if account_balance is None:
+                    if async_gateway is not None:
+                        account_balance = await async_gateway.get_account_balance_async()
+                    else:
+                        account_balance = self._order_gateway.get_account_balance()
 
                 if account_balance <= 0:
                     self.logger.error(
@@ -243,14 +309,19 @@ class TradeCoordinator:
                     entry_price=signal.entry_price,
                     stop_loss_price=signal.stop_loss,
                     leverage=self._config_manager.trading_config.leverage,
-                    symbol_info=None,  # OrderGateway will handle rounding internally
+                    symbol_info={"symbol": signal.symbol},  # Shared exchange info quantizer
                 )
 
                 # Step 7: Execute signal via OrderGateway
                 # Returns (entry_order, [tp_order, sl_order])
-                entry_order, tpsl_orders = self._order_gateway.execute_signal(
-                    signal=signal, quantity=quantity
-                )
+                if async_gateway is not None:
+                    entry_order, tpsl_orders = await async_gateway.execute_signal_async(
+                        signal=signal, quantity=quantity
+                    )
+                else:
+                    entry_order, tpsl_orders = self._order_gateway.execute_signal(
+                        signal=signal, quantity=quantity
+                    )
 
                 # Invalidate position cache after order execution
                 self._position_cache_manager.invalidate(signal.symbol)
@@ -351,7 +422,7 @@ class TradeCoordinator:
 
             # Step 1: Cancel any existing TP/SL orders first
             try:
-                cancelled_count = self._order_gateway.cancel_all_orders(signal.symbol)
+                cancelled_count = await self._cancel_all_orders(signal.symbol)
                 if cancelled_count > 0:
                     self.logger.info(
                         f"Cancelled {cancelled_count} existing orders before exit"
@@ -599,7 +670,7 @@ class TradeCoordinator:
             )
 
             try:
-                cancelled_count = self._order_gateway.cancel_all_orders(order.symbol)
+                cancelled_count = await self._cancel_all_orders(order.symbol)
                 if cancelled_count > 0:
                     self.logger.info(
                         f"TP/SL hit: cancelled {cancelled_count} remaining orders "
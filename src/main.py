@@ -28,6 +28,7 @@ from src.core.trading_engine import TradingEngine
 from src.execution.liquidation_manager import LiquidationManager
 from src.utils.config_manager import ConfigManager, LiquidationConfig
 from src.execution.order_gateway import OrderGateway
+from src.monitoring.metrics_collector import MetricsCollector
 from src.risk.risk_guard import RiskGuard
 from src.utils.logger import TradingLogger
 
@@ -156,8 +157,9 @@ class TradingBot:
         self.logger.info("Initializing AuditLogger...")
         self.audit_logger = AuditLogger.get_instance(log_dir="logs/audit")
 
-        # Step 6: Initialize EventBus
+        # Step 6: Initialize EventBus (records queue/handler latency metrics)
         self.logger.info("Initializing EventBus...")
+        MetricsCollector().start()
         self.event_bus = EventBus()
 
         # Step 7: Initialize TradingEngine and delegate component creation
@@ -199,6 +201,7 @@ class TradingBot:
             timeout_seconds=5.0,         # 5 second timeout for liquidation
             max_retries=3,               # 3 retry attempts
             retry_delay_seconds=0.5,     # 0.5 second base delay for exponential backoff
+            max_concurrency=8,           # Up to 8 symbols cancelled/closed in parallel
         )
 
         self.liquidation_manager = LiquidationManager(
@@ -317,6 +320,7 @@ class TradingBot:
 
         # Step 2: Delegate to TradingEngine shutdown
         await self.trading_engine.shutdown()
+        MetricsCollector().stop()
 
         # Transition to STOPPED state
         self._lifecycle_state = LifecycleState.STOPPED
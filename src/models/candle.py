@@ -3,7 +3,13 @@ Candlestick data model
 """
 
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Optional, Tuple
+
+# Naive UTC epoch: epoch + timedelta(ms) matches
+# datetime.fromtimestamp(ms / 1000, tz=utc).replace(tzinfo=None) without the tz round-trip
+_EPOCH = datetime(1970, 1, 1)
+_UTC = timezone.utc
 
 
 @dataclass
@@ -25,6 +31,10 @@ class Candle:
         volume: Trading volume in base asset
         close_time: Candle closing timestamp (UTC)
         is_closed: Whether candle period has ended
+
+    open_time/close_time are also available as integer epoch milliseconds
+    (open_time_ms/close_time_ms). Candles built with from_exchange() keep
+    only the milliseconds and materialize the datetimes on first access.
     """
 
     symbol: str
@@ -38,6 +48,15 @@ class Candle:
     close_time: datetime
     is_closed: bool
 
+    if TYPE_CHECKING:
+        # Installed by _lazy_time below; declared here for type checkers
+
+        @property
+        def open_time_ms(self) -> int: ...
+
+        @property
+        def close_time_ms(self) -> int: ...
+
     def __post_init__(self) -> None:
         """Validate price coherence."""
         if self.high < max(self.open, self.close):
@@ -51,6 +70,44 @@ class Candle:
         if self.volume < 0:
             raise ValueError(f"Volume ({self.volume}) cannot be negative")
 
+    @classmethod
+    def from_exchange(
+        cls,
+        symbol: str,
+        interval: str,
+        open_time_ms: int,
+        close_time_ms: int,
+        open: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float,
+        is_closed: bool,
+    ) -> "Candle":
+        """
+        Build a candle from trusted exchange data.
+
+        Skips __post_init__ coherence validation and datetime conversion;
+        open_time/close_time are materialized lazily from the milliseconds.
+        Only use for data the exchange produced (WebSocket/REST klines).
+        """
+        candle = cls.__new__(cls)
+        candle.__dict__.update(
+            symbol=symbol,
+            interval=interval,
+            _open_time=None,
+            _open_time_ms=open_time_ms,
+            open=open,
+            high=high,
+            low=low,
+            close=close,
+            volume=volume,
+            _close_time=None,
+            _close_time_ms=close_time_ms,
+            is_closed=is_closed,
+        )
+        return candle
+
     @property
     def body_size(self) -> float:
         """Absolute size of candle body (close - open)."""
@@ -75,3 +132,46 @@ class Candle:
     def total_range(self) -> float:
         """Total price range (high - low)."""
         return self.high - self.low
+
+
+def _ms_to_datetime(ms: int) -> datetime:
+    return _EPOCH + timedelta(milliseconds=ms)
+
+
+def _datetime_to_ms(value: datetime) -> int:
+    if value.tzinfo is not None:
+        value = value.astimezone(_UTC).replace(tzinfo=None)
+    return (value - _EPOCH) // timedelta(milliseconds=1)
+
+
+def _lazy_time(name: str) -> Tuple[property, property]:
+    """datetime attribute backed by epoch ms, converted on first read."""
+    dt_attr, ms_attr = f"_{name}", f"_{name}_ms"
+
+    def get_datetime(self: Any) -> datetime:
+        value: Optional[datetime] = self.__dict__[dt_attr]
+        if value is None:
+            value = _ms_to_datetime(self.__dict__[ms_attr])
+            self.__dict__[dt_attr] = value
+        return value
+
+    def set_datetime(self: Any, value: datetime) -> None:
+        self.__dict__[dt_attr] = value
+        self.__dict__[ms_attr] = None
+
+    def get_ms(self: Any) -> int:
+        value: Optional[int] = self.__dict__[ms_attr]
+        if value is None:
+            value = _datetime_to_ms(self.__dict__[dt_attr])
+            self.__dict__[ms_attr] = value
+        return value
+
+    return property(get_datetime, set_datetime), property(get_ms)
+
+
+# Installed after @dataclass so the dataclass machinery (__init__, __eq__,
+# __repr__, asdict) goes through the lazy accessors. Type checkers see
+# open_time/close_time as the datetime fields and *_ms as the read-only
+# properties declared in the class body, so the runtime swap is ignored.
+Candle.open_time, Candle.open_time_ms = _lazy_time("open_time")  # type: ignore[assignment]
+Candle.close_time, Candle.close_time_ms = _lazy_time("close_time")  # type: ignore[assignment]
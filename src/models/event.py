@@ -25,7 +25,7 @@ class EventType(Enum):
 class QueueType(Enum):
     """Queue types for event distribution priority."""
 
-    CANDLE_UPDATE = "candle_update"  # High freq, can drop
+    CANDLE_UPDATE = "candle_update"  # High freq, conflated per stream
     CANDLE_CLOSED = "candle_closed"  # Low freq, critical
     SIGNAL = "signal"
     ORDER = "order"
@@ -45,9 +45,12 @@ class Event:
         data: Event payload (Candle, Signal, Order, etc.)
         timestamp: Event occurrence time (UTC)
         source: Component that generated event
+        enqueued_at_ns: time.perf_counter_ns() stamped by EventBus.publish
+            (0 until published); used for queue-wait metrics
     """
 
     event_type: EventType
     data: Any
     timestamp: datetime = field(default_factory=datetime.utcnow)
     source: Optional[str] = None
+    enqueued_at_ns: int = field(default=0, repr=False, compare=False)
@@ -8,7 +8,7 @@ import logging
 import threading
 import time
 from collections import defaultdict, deque
-from typing import Dict, Deque
+from typing import Dict, Deque, List, Optional, Tuple
 
 from .event_ids import EventID
 from .ring_buffer import LockFreeRingBuffer, MetricEntry, MetricType
@@ -24,7 +24,8 @@ class MetricsAggregator:
     Architecture:
     - Runs in separate daemon thread
     - Reads ring buffer every 100ms
-    - Maintains sliding windows (1s, 5s, 60s)
+    - Maintains sliding windows (1s, 5s, 60s) per (event, label)
+    - Uses SAMPLE entries as-is; matches START/END pairs otherwise
     - Calculates percentiles using simple sorting (O(n log n))
     - Updates MetricsStats with calculated statistics
 
@@ -39,24 +40,31 @@ class MetricsAggregator:
     BATCH_SIZE = 1000  # Max entries per read batch
     WINDOW_SIZES = [1, 5, 60]  # Sliding window sizes in seconds
 
-    def __init__(self, ring_buffer: LockFreeRingBuffer, stats: MetricsStats):
+    def __init__(
+        self,
+        ring_buffer: LockFreeRingBuffer,
+        stats: MetricsStats,
+        label_names: Optional[Dict[int, str]] = None,
+    ):
         """
         Initialize metrics aggregator.
 
         Args:
             ring_buffer: Ring buffer to read from
             stats: MetricsStats to update with calculated statistics
+            label_names: Label id → name mapping (shared with the collector)
         """
         self._ring_buffer = ring_buffer
         self._stats = stats
+        self._label_names = label_names if label_names is not None else {}
 
-        # Sliding windows: {event_id: {window_seconds: deque of latencies}}
-        self._windows: Dict[EventID, Dict[int, Deque[float]]] = defaultdict(
+        # Sliding windows: {(event_id, label): {window_seconds: deque of latencies}}
+        self._windows: Dict[Tuple[EventID, int], Dict[int, Deque[float]]] = defaultdict(
             lambda: {seconds: deque() for seconds in self.WINDOW_SIZES}
         )
 
-        # Pending start timestamps: {event_id: start_timestamp}
-        self._pending_starts: Dict[EventID, int] = {}
+        # Pending start timestamps: {(event_id, label): start_timestamp}
+        self._pending_starts: Dict[Tuple[EventID, int], int] = {}
 
         # Thread control
         self._thread: threading.Thread = None
@@ -123,54 +131,67 @@ class MetricsAggregator:
         """
         Process batch of metric entries.
 
-        Matches START/END pairs and calculates latencies.
+        Takes SAMPLE values directly and matches START/END pairs to
+        calculate latencies.
 
         Args:
             entries: List of metric entries from ring buffer
         """
         for entry in entries:
-            event_id = EventID(entry.event_id)
+            key = (EventID(entry.event_id), entry.label)
 
-            if entry.metric_type == MetricType.START:
+            if entry.metric_type == MetricType.SAMPLE:
+                self._add_value(key, entry.value)
+
+            elif entry.metric_type == MetricType.START:
                 # Store start timestamp
-                self._pending_starts[event_id] = entry.timestamp
+                self._pending_starts[key] = entry.timestamp
 
             elif entry.metric_type == MetricType.END:
                 # Match with start timestamp
-                start_ts = self._pending_starts.pop(event_id, None)
+                start_ts = self._pending_starts.pop(key, None)
                 if start_ts is None:
                     continue  # Orphaned END (start not captured)
 
                 # Calculate latency (nanoseconds)
-                latency_ns = entry.timestamp - start_ts
+                self._add_value(key, entry.timestamp - start_ts)
 
-                # Add to sliding windows
-                current_time = time.time()
-                for window_seconds in self.WINDOW_SIZES:
-                    window = self._windows[event_id][window_seconds]
+    def _add_value(self, key: Tuple[EventID, int], value: float) -> None:
+        """Append a value to every sliding window of a series."""
+        current_time = time.time()
+        for window_seconds in self.WINDOW_SIZES:
+            window = self._windows[key][window_seconds]
 
-                    # Add latency with timestamp
-                    window.append((current_time, latency_ns))
+            # Add value with timestamp
+            window.append((current_time, value))
 
-                    # Remove entries outside window
-                    cutoff_time = current_time - window_seconds
-                    while window and window[0][0] < cutoff_time:
-                        window.popleft()
+            # Remove entries outside window
+            cutoff_time = current_time - window_seconds
+            while window and window[0][0] < cutoff_time:
+                window.popleft()
 
     def _update_statistics(self) -> None:
         """Calculate percentiles and update MetricsStats."""
-        for event_id, windows in self._windows.items():
-            for window_seconds, window in windows.items():
-                if not window:
-                    continue
-
-                # Extract latencies (discard timestamps)
-                latencies = [latency for _, latency in window]
-
-                # Calculate percentiles
-                stats = self._calculate_percentiles(
-                    event_id, window_seconds, latencies
-                )
+        for window_seconds in self.WINDOW_SIZES:
+            # Group series by event: {event_id: [(label, latencies), ...]}
+            by_event: Dict[EventID, List[Tuple[int, List[float]]]] = defaultdict(list)
+            for (event_id, label), windows in self._windows.items():
+                window = windows[window_seconds]
+                if window:
+                    # Extract latencies (discard timestamps)
+                    by_event[event_id].append((label, [latency for _, latency in window]))
+
+            for event_id, series in by_event.items():
+                # Calculate percentiles over all labels combined
+                combined = [latency for _, latencies in series for latency in latencies]
+                stats = self._calculate_percentiles(event_id, window_seconds, combined)
+
+                for label, latencies in series:
+                    if label:
+                        name = self._label_names.get(label, str(label))
+                        stats.labels[name] = self._calculate_percentiles(
+                            event_id, window_seconds, latencies
+                        )
 
                 # Update global stats
                 self._stats.update_stats(event_id, window_seconds, stats)
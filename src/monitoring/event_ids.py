@@ -24,10 +24,14 @@ class EventID(IntEnum):
     ORDER_PLACEMENT = 3
     ORDER_FILL = 4
 
-    # Event bus operations
-    EVENT_BUS_PUBLISH = 5
-    EVENT_BUS_HANDLE = 6
+    # Event bus operations (labeled per queue / per handler)
+    EVENT_BUS_PUBLISH = 5  # Queue wait: publish() until dispatch starts
+    EVENT_BUS_HANDLE = 6  # Execution time of one handler
 
     # System health metrics
-    QUEUE_BACKLOG = 7
+    QUEUE_BACKLOG = 7  # Sampled queue depth (count, not a latency)
     GC_PAUSE = 8
+
+
+# Events whose values are counts rather than nanosecond latencies
+COUNT_EVENT_IDS = frozenset({EventID.QUEUE_BACKLOG})
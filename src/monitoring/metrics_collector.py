@@ -64,9 +64,13 @@ class MetricsCollector:
         # Sampling RNG (faster than random.random())
         self._rng = random.Random()
 
+        # Label registry for sub-series (e.g. per queue / per handler)
+        self._label_ids: Dict[str, int] = {}
+        self._label_names: Dict[int, str] = {}
+
         # Statistics and aggregation
         self._stats = MetricsStats()
-        self._aggregator = MetricsAggregator(self._buffer, self._stats)
+        self._aggregator = MetricsAggregator(self._buffer, self._stats, self._label_names)
 
         self._initialized = True
 
@@ -115,6 +119,54 @@ class MetricsCollector:
         ts = time.perf_counter_ns()
         self._buffer.record(ts, event_id, MetricType.END)
 
+    def record_value(self, event_id: EventID, value: int, label: int = 0) -> None:
+        """
+        Record a pre-measured value (duration in ns, or a count).
+
+        Use when start and end are not observed by the same code path,
+        e.g. queue wait measured from a timestamp stamped at publish time.
+
+        Args:
+            event_id: EventID enum identifying the metric
+            value: Duration in nanoseconds (or a count for QUEUE_BACKLOG)
+            label: Label id from label_id(), 0 for unlabeled
+
+        Performance:
+            - Enabled + sampled: ~100ns
+            - Disabled or not sampled: ~20ns
+        """
+        if not self._enabled:
+            return
+
+        if self._sampling_rate < 1.0 and self._rng.random() > self._sampling_rate:
+            return
+
+        self._buffer.record(time.perf_counter_ns(), event_id, MetricType.SAMPLE, value, label)
+
+    def label_id(self, name: str) -> int:
+        """
+        Get the id for a label name, registering it on first use.
+
+        Resolve ids once (e.g. at subscription time), not in the hot path.
+
+        Args:
+            name: Human-readable label (e.g. "signal" or "on_candle_closed")
+
+        Returns:
+            Positive label id for record_value()
+        """
+        label = self._label_ids.get(name)
+        if label is None:
+            label = len(self._label_ids) + 1  # 0 is reserved for unlabeled
+            self._label_ids[name] = label
+            self._label_names[label] = name
+        return label
+
+    @property
+    def enabled(self) -> bool:
+        """Whether metrics are currently being recorded."""
+        return self._enabled
+
     def set_enabled(self, enabled: bool) -> None:
         """
         Enable or disable metrics collection.
@@ -205,12 +257,16 @@ class MetricsCollector:
             window_seconds: Time window size (1, 5, or 60 seconds)
 
         Returns:
-            Dictionary mapping EventID to PercentileStats
+            Dictionary mapping EventID to PercentileStats. Labeled events
+            (EVENT_BUS_PUBLISH / QUEUE_BACKLOG per queue, EVENT_BUS_HANDLE per
+            handler) include a per-label breakdown in ``stats.labels``.
 
         Example:
             all_stats = collector.get_all_stats(window_seconds=60)
             for event_id, stats in all_stats.items():
                 print(f"{event_id.name}: P95={stats.p95 / 1_000_000:.2f}ms")
+                for name, label_stats in stats.labels.items():
+                    print(f"  {name}: P99={label_stats.p99 / 1_000_000:.2f}ms")
         """
         return self._stats.get_all_stats(window_seconds)
 
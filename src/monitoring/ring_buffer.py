@@ -16,6 +16,7 @@ class MetricType(IntEnum):
 
     START = 0  # Event start timestamp
     END = 1  # Event end timestamp
+    SAMPLE = 2  # Pre-measured value (duration in ns, or a count)
 
 
 class MetricEntry(NamedTuple):
@@ -24,14 +25,18 @@ class MetricEntry(NamedTuple):
 
     Layout optimized for cache efficiency (32 bytes total):
     - timestamp: 8 bytes (int64 nanoseconds)
-    - event_id: 8 bytes (int64 for alignment)
-    - metric_type: 8 bytes (int64 for alignment)
-    - padding: 8 bytes (reserved for future use)
+    - value: 8 bytes (int64, SAMPLE entries only)
+    - event_id: 4 bytes (int32)
+    - metric_type: 4 bytes (int32)
+    - label: 4 bytes (int32 label id, 0 = unlabeled)
+    - padding: 4 bytes (reserved for future use)
     """
 
     timestamp: int  # nanoseconds since epoch (time.perf_counter_ns)
     event_id: int  # EventID enum value
     metric_type: int  # MetricType enum value
+    value: int = 0  # Measured value for MetricType.SAMPLE
+    label: int = 0  # Label id (e.g. queue or handler), 0 = unlabeled
 
 
 class LockFreeRingBuffer:
@@ -59,9 +64,11 @@ class LockFreeRingBuffer:
     DTYPE = np.dtype(
         [
             ("timestamp", np.int64),
-            ("event_id", np.int64),
-            ("metric_type", np.int64),
-            ("padding", np.int64),  # Reserved for future use
+            ("value", np.int64),
+            ("event_id", np.int32),
+            ("metric_type", np.int32),
+            ("label", np.int32),
+            ("padding", np.int32),  # Reserved for future use
         ]
     )
 
@@ -79,14 +86,23 @@ class LockFreeRingBuffer:
         # Track overflow for diagnostics
         self._overflow_count = 0
 
-    def record(self, timestamp: int, event_id: int, metric_type: MetricType) -> None:
+    def record(
+        self,
+        timestamp: int,
+        event_id: int,
+        metric_type: MetricType,
+        value: int = 0,
+        label: int = 0,
+    ) -> None:
         """
         Record metric entry (producer side).
 
         Args:
             timestamp: Nanosecond timestamp from time.perf_counter_ns()
             event_id: EventID enum value
-            metric_type: MetricType.START or MetricType.END
+            metric_type: MetricType.START, MetricType.END or MetricType.SAMPLE
+            value: Measured value (MetricType.SAMPLE only)
+            label: Label id distinguishing sub-series of one EventID
 
         Performance:
             - Average: ~50ns (array write + index increment)
@@ -95,7 +111,7 @@ class LockFreeRingBuffer:
         """
         # Write to current position
         idx = self._write_idx % self.BUFFER_SIZE
-        self._buffer[idx] = (timestamp, event_id, metric_type, 0)
+        self._buffer[idx] = (timestamp, value, event_id, metric_type, label, 0)
 
         # Advance write index (atomic for SPSC)
         self._write_idx += 1
@@ -142,6 +158,8 @@ class LockFreeRingBuffer:
                     timestamp=int(entry["timestamp"]),
                     event_id=int(entry["event_id"]),
                     metric_type=int(entry["metric_type"]),
+                    value=int(entry["value"]),
+                    label=int(entry["label"]),
                 )
             )
             self._read_idx += 1
@@ -8,7 +8,7 @@ import time
 from dataclasses import dataclass, field
 from typing import Dict, Optional
 
-from .event_ids import EventID
+from .event_ids import COUNT_EVENT_IDS, EventID
 
 
 @dataclass(slots=True)
@@ -16,7 +16,10 @@ class PercentileStats:
     """
     Percentile statistics for a single event type.
 
-    All latency values in nanoseconds for precision.
+    All latency values in nanoseconds for precision (plain counts for
+    COUNT_EVENT_IDS such as QUEUE_BACKLOG). Events recorded with labels
+    carry a per-label breakdown in ``labels``; the top-level values cover
+    all labels combined.
     """
 
     event_id: EventID
@@ -34,24 +37,35 @@ class PercentileStats:
     max: float = 0.0
     mean: float = 0.0
 
+    # Per-label breakdown: {label name: PercentileStats}
+    labels: Dict[str, "PercentileStats"] = field(default_factory=dict)
+
     # Metadata
     last_updated: float = field(default_factory=time.time)
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
-        return {
+        if self.event_id in COUNT_EVENT_IDS:
+            scale, suffix = 1, ""
+        else:
+            scale, suffix = 1_000_000, "_ms"
+
+        result = {
             "event_id": self.event_id.name,
             "window_seconds": self.window_seconds,
-            "p50_ms": self.p50 / 1_000_000,
-            "p95_ms": self.p95 / 1_000_000,
-            "p99_ms": self.p99 / 1_000_000,
-            "p99_9_ms": self.p99_9 / 1_000_000,
+            f"p50{suffix}": self.p50 / scale,
+            f"p95{suffix}": self.p95 / scale,
+            f"p99{suffix}": self.p99 / scale,
+            f"p99_9{suffix}": self.p99_9 / scale,
             "count": self.count,
-            "min_ms": self.min / 1_000_000,
-            "max_ms": self.max / 1_000_000,
-            "mean_ms": self.mean / 1_000_000,
+            f"min{suffix}": self.min / scale,
+            f"max{suffix}": self.max / scale,
+            f"mean{suffix}": self.mean / scale,
             "last_updated": self.last_updated,
         }
+        if self.labels:
+            result["labels"] = {name: stats.to_dict() for name, stats in self.labels.items()}
+        return result
 
 
 @dataclass(slots=True)
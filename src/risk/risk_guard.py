@@ -11,6 +11,7 @@ from src.models.signal import Signal
 # Only imported during static analysis (e.g., mypy, IDE)
 if TYPE_CHECKING:
     from src.core.audit_logger import AuditLogger
+    from src.core.exchange_info_cache import ExchangeInfoCache
 
 
 class RiskGuard:
@@ -18,7 +19,12 @@ class RiskGuard:
     Manages risk and calculates position sizes
     """
 
-    def __init__(self, config: dict, audit_logger: Optional["AuditLogger"] = None):
+    def __init__(
+        self,
+        config: dict,
+        audit_logger: Optional["AuditLogger"] = None,
+        exchange_info: Optional["ExchangeInfoCache"] = None,
+    ):
         """
         Initialize RiskGuard with configuration.
 
@@ -30,6 +36,9 @@ class RiskGuard:
                 - max_position_size_percent: float (e.g., 0.1 for 10%)
             audit_logger: Optional AuditLogger instance for structured logging.
                          If None, uses singleton instance from AuditLogger.get_instance()
+            exchange_info: Optional ExchangeInfoCache shared with OrderGateway.
+                         When set, quantities for a symbol_info with only a
+                         'symbol' are floored by the symbol's compiled quantizer.
         """
         self.max_risk_per_trade = config.get("max_risk_per_trade", 0.01)
         self.max_leverage = config.get("max_leverage", 20)
@@ -48,6 +57,8 @@ class RiskGuard:
         else:
             self.audit_logger = audit_logger
 
+        self.exchange_info = exchange_info
+
     def calculate_position_size(
         self,
         account_balance: float,
@@ -484,9 +495,14 @@ class RiskGuard:
         1. Floor to nearest lot size (stepSize) multiple
         2. Round to required decimal precision
 
+        If symbol_info carries only a 'symbol' and the shared exchange info
+        knows it, the symbol's quantizer is used instead, so the size matches
+        what OrderGateway sends.
+
         Args:
             quantity: Raw calculated position size
-            symbol_info: Optional dict with 'lot_size' and 'quantity_precision'
+            symbol_info: Optional dict with 'lot_size' and 'quantity_precision',
+                or 'symbol' for exchange info lookup
 
         Returns:
             Binance-compliant rounded quantity
@@ -506,6 +522,17 @@ class RiskGuard:
         if symbol_info is None:
             symbol_info = {}
 
+        quantizer = None
+        if self.exchange_info is not None and "lot_size" not in symbol_info:
+            quantizer = self.exchange_info.get(symbol_info.get("symbol"))
+        if quantizer is not None:
+            rounded = quantizer.floor_quantity(quantity)
+            self.logger.debug(
+                f"Quantity rounding: {quantity:.6f} → {rounded} "
+                f"(lot_size={quantizer.step_size}, precision={quantizer.quantity_precision})"
+            )
+            return rounded
+
         lot_size = symbol_info.get("lot_size", 0.001)
         quantity_precision = symbol_info.get("quantity_precision", 3)
 
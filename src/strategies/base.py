@@ -8,7 +8,6 @@ are thin wrappers that forward to the internal BufferManager instance.
 
 import logging
 from abc import ABC, abstractmethod
-from collections import deque
 from typing import TYPE_CHECKING, Dict, List, Optional
 
 from src.models.candle import Candle
@@ -16,6 +15,7 @@ from src.models.module_requirements import ModuleRequirements
 from src.models.position import Position
 from src.models.signal import Signal
 from src.strategies.buffer_manager import BufferManager
+from src.strategies.candle_store import CandleStore
 
 if TYPE_CHECKING:
     from src.strategies.indicator_cache import IndicatorStateCache
@@ -62,7 +62,7 @@ class BaseStrategy(ABC):
     # ------------------------------------------------------------------
 
     @property
-    def buffers(self) -> Dict[str, deque]:
+    def buffers(self) -> Dict[str, CandleStore]:
         return self._buffer.buffers
 
     @property
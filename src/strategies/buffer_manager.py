@@ -5,14 +5,18 @@ Extracted from BaseStrategy to separate buffer lifecycle (init, update, query)
 from strategy logic (analyze, exit). Uses composition pattern — BaseStrategy
 delegates buffer operations to BufferManager via thin wrappers.
 
-Performance: All operations are O(1) for append/evict (deque with maxlen).
+Storage: Each interval is backed by a CandleStore — a preallocated,
+ring-indexed columnar buffer (float64 OHLCV + int64 open/close ms) that
+keeps the deque-style API and exposes zero-copy NumPy views via get_arrays().
+
+Performance: All operations are O(1) for append/evict and array views.
 """
 
 import logging
-from collections import deque
 from typing import Callable, Dict, List, Optional
 
 from src.models.candle import Candle
+from src.strategies.candle_store import CandleColumns, CandleStore
 
 
 class BufferManager:
@@ -21,8 +25,8 @@ class BufferManager:
     def __init__(self, buffer_size: int, intervals: List[str]) -> None:
         self.buffer_size: int = buffer_size
         self.intervals: List[str] = list(intervals)
-        self.buffers: Dict[str, deque] = {
-            iv: deque(maxlen=buffer_size) for iv in self.intervals
+        self.buffers: Dict[str, CandleStore] = {
+            iv: CandleStore(maxlen=buffer_size) for iv in self.intervals
         }
         self._initialized: Dict[str, bool] = {
             iv: False for iv in self.intervals
@@ -63,7 +67,7 @@ class BufferManager:
                 target_interval, self.intervals,
             )
             self.intervals.append(target_interval)
-            self.buffers[target_interval] = deque(maxlen=self.buffer_size)
+            self.buffers[target_interval] = CandleStore(maxlen=self.buffer_size)
             self._initialized[target_interval] = False
 
         if not candles:
@@ -84,8 +88,7 @@ class BufferManager:
         self.buffers[target_interval].clear()
 
         # Add candles respecting maxlen (keeps most recent)
-        for candle in candles[-self.buffer_size:]:
-            self.buffers[target_interval].append(candle)
+        self.buffers[target_interval].extend(candles[-self.buffer_size:])
 
         # Mark interval as initialized
         self._initialized[target_interval] = True
@@ -112,7 +115,7 @@ class BufferManager:
                 "Auto-registering interval '%s'", interval,
             )
             self.intervals.append(interval)
-            self.buffers[interval] = deque(maxlen=self.buffer_size)
+            self.buffers[interval] = CandleStore(maxlen=self.buffer_size)
             self._initialized[interval] = True
 
         self.buffers[interval].append(candle)
@@ -126,7 +129,30 @@ class BufferManager:
         buffer = self.buffers[target_interval]
         if len(buffer) < count:
             return []
-        return list(buffer)[-count:]
+        return buffer.latest(count)
+
+    def get_arrays(
+        self, count: Optional[int] = None, interval: Optional[str] = None
+    ) -> Optional[CandleColumns]:
+        """
+        Get zero-copy NumPy views of the most recent N bars (oldest first).
+
+        Args:
+            count: Number of bars. None returns the whole buffer.
+            interval: Target interval. Defaults to the first registered interval.
+
+        Returns:
+            CandleColumns of read-only views, or None if interval unknown or
+            the buffer holds fewer than ``count`` bars.
+        """
+        target_interval = interval or (self.intervals[0] if self.intervals else None)
+        if not target_interval or target_interval not in self.buffers:
+            return None
+
+        buffer = self.buffers[target_interval]
+        if count is not None and len(buffer) < count:
+            return None
+        return buffer.columns(count)
 
     def get_current_size(self, interval: Optional[str] = None) -> int:
         """Get current number of candles in buffer."""
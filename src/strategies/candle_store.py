@@ -0,0 +1,220 @@
+"""
+Columnar ring-indexed candle store.
+
+Drop-in replacement for the ``deque(maxlen=N)`` of Candle objects held per
+interval by BufferManager. Besides the Candle references (still needed by
+object-based detectors), OHLCV values and open/close timestamps are written
+into preallocated NumPy columns so vectorized consumers can read the last N
+bars as zero-copy views.
+
+Layout:
+- float64 columns: open, high, low, close, volume
+- int64 columns: open_time, close_time (Unix milliseconds)
+- Each column has 2 * maxlen slots; every value is written twice (slot and
+  slot + maxlen) so the most recent N bars are always one contiguous slice.
+
+Performance:
+- append: O(1), no per-candle allocation beyond the caller's Candle
+- columns(n): O(1), returns read-only views (no copy)
+- Memory: the columns add 2 * maxlen * 7 * 8 bytes per interval (~56KB for
+  maxlen=500) on top of the Candle references; the store trades that extra
+  memory for O(1) vectorized reads, it does not reduce memory use
+"""
+
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Union, overload
+
+import numpy as np
+
+from src.models.candle import Candle
+
+
+class CandleColumns(NamedTuple):
+    """Read-only NumPy views over the most recent bars (oldest first)."""
+
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    open_time: np.ndarray  # int64 Unix ms
+    close_time: np.ndarray  # int64 Unix ms
+
+    def __len__(self) -> int:  # type: ignore[override]
+        return len(self.close)
+
+
+class CandleStore:
+    """
+    Fixed-capacity FIFO candle buffer with columnar NumPy storage.
+
+    Sequence API mirrors the subset of ``collections.deque`` used across the
+    codebase (append, extend, clear, len, iteration, integer indexing,
+    ``maxlen``) so existing consumers keep working unchanged.
+
+    Example:
+        >>> store = CandleStore(maxlen=500)
+        >>> store.append(candle)
+        >>> cols = store.columns(50)
+        >>> cols.high.max(), cols.low.min()
+    """
+
+    __slots__ = (
+        "_maxlen",
+        "_size",
+        "_head",
+        "_objects",
+        "_open",
+        "_high",
+        "_low",
+        "_close",
+        "_volume",
+        "_open_time",
+        "_close_time",
+    )
+
+    def __init__(self, maxlen: int, candles: Optional[Iterable[Candle]] = None) -> None:
+        if maxlen <= 0:
+            raise ValueError(f"maxlen must be positive, got {maxlen}")
+
+        self._maxlen = maxlen
+        self._size = 0
+        self._head = 0  # Next physical slot to write (0..maxlen-1)
+        self._objects: List[Optional[Candle]] = [None] * maxlen
+
+        double = 2 * maxlen
+        self._open = np.zeros(double, dtype=np.float64)
+        self._high = np.zeros(double, dtype=np.float64)
+        self._low = np.zeros(double, dtype=np.float64)
+        self._close = np.zeros(double, dtype=np.float64)
+        self._volume = np.zeros(double, dtype=np.float64)
+        self._open_time = np.zeros(double, dtype=np.int64)
+        self._close_time = np.zeros(double, dtype=np.int64)
+
+        if candles is not None:
+            self.extend(candles)
+
+    # ------------------------------------------------------------------
+    # Mutation
+    # ------------------------------------------------------------------
+
+    def append(self, candle: Candle) -> None:
+        """Append candle, evicting the oldest one when full. O(1)."""
+        slot = self._head
+        mirror = slot + self._maxlen
+
+        self._objects[slot] = candle
+
+        self._open[slot] = self._open[mirror] = candle.open
+        self._high[slot] = self._high[mirror] = candle.high
+        self._low[slot] = self._low[mirror] = candle.low
+        self._close[slot] = self._close[mirror] = candle.close
+        self._volume[slot] = self._volume[mirror] = candle.volume
+
+        # Epoch ms straight from the candle: exchange-built candles never
+        # materialize their lazy datetimes just to be buffered
+        open_ms = candle.open_time_ms
+        close_ms = candle.close_time_ms
+        self._open_time[slot] = self._open_time[mirror] = open_ms
+        self._close_time[slot] = self._close_time[mirror] = close_ms
+
+        self._head = slot + 1 if slot + 1 < self._maxlen else 0
+        if self._size < self._maxlen:
+            self._size += 1
+
+    def extend(self, candles: Iterable[Candle]) -> None:
+        """Append candles in order (oldest first)."""
+        for candle in candles:
+            self.append(candle)
+
+    def clear(self) -> None:
+        """Remove all candles. Preallocated columns are reused."""
+        self._objects = [None] * self._maxlen
+        self._size = 0
+        self._head = 0
+
+    # ------------------------------------------------------------------
+    # Sequence protocol (deque-compatible)
+    # ------------------------------------------------------------------
+
+    @property
+    def maxlen(self) -> int:
+        """Maximum number of candles retained."""
+        return self._maxlen
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    def _physical_index(self, index: int) -> int:
+        """Map logical index (0 = oldest) to physical slot."""
+        return (self._head - self._size + index) % self._maxlen
+
+    @overload
+    def __getitem__(self, index: int) -> Candle: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Candle]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Candle, List[Candle]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._size))]
+
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("CandleStore index out of range")
+        return self._objects[self._physical_index(index)]  # type: ignore[return-value]
+
+    def __iter__(self) -> Iterator[Candle]:
+        start = self._head - self._size
+        maxlen = self._maxlen
+        objects = self._objects
+        for offset in range(self._size):
+            yield objects[(start + offset) % maxlen]  # type: ignore[misc]
+
+    def __reversed__(self) -> Iterator[Candle]:
+        for index in range(self._size - 1, -1, -1):
+            yield self[index]
+
+    def __repr__(self) -> str:
+        return f"CandleStore(size={self._size}, maxlen={self._maxlen})"
+
+    # ------------------------------------------------------------------
+    # Columnar access
+    # ------------------------------------------------------------------
+
+    def latest(self, count: int) -> List[Candle]:
+        """Most recent ``count`` Candle objects (oldest first)."""
+        count = min(max(count, 0), self._size)
+        return self[self._size - count :]
+
+    def columns(self, count: Optional[int] = None) -> CandleColumns:
+        """
+        Zero-copy views over the most recent ``count`` bars (oldest first).
+
+        Views are read-only and remain valid until the next ``append``
+        overwrites their slots; copy them if they must outlive that.
+
+        Args:
+            count: Number of bars. None (default) returns the whole buffer.
+        """
+        size = self._size if count is None else min(max(count, 0), self._size)
+        end = self._head + self._maxlen
+        start = end - size
+
+        def _view(column: np.ndarray) -> np.ndarray:
+            view = column[start:end]
+            view.flags.writeable = False
+            return view
+
+        return CandleColumns(
+            open=_view(self._open),
+            high=_view(self._high),
+            low=_view(self._low),
+            close=_view(self._close),
+            volume=_view(self._volume),
+            open_time=_view(self._open_time),
+            close_time=_view(self._close_time),
+        )
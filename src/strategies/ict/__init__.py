@@ -48,6 +48,7 @@ def _build_ict_config(
         displacement_ratio=strategy_config.get("displacement_ratio", 1.5),
         mtf_interval=strategy_config.get("mtf_interval", "1h"),
         htf_interval=strategy_config.get("htf_interval", "4h"),
+        incremental_analysis=strategy_config.get("incremental_analysis", False),
     )
 
     min_rr_ratio = strategy_config.get("rr_ratio", 2.0)
@@ -0,0 +1,651 @@
+"""
+Incremental ICT analysis engine.
+
+Keeps per-interval ICT state up to date one candle at a time so entry and
+exit determiners can query it instead of rescanning the whole buffer on
+every closed candle:
+
+- Swing structure / trend (IncrementalSwingDetector)
+- Premium/discount range (monotonic max/min deques)
+- Rolling average range and displacement list
+- Inducements (evaluated one bar late, once the confirming bar arrives)
+- Equal highs/lows clusters (BSL/SSL) and liquidity sweep state
+
+State is bounded by a sliding ``window`` that mirrors the candle buffer;
+events that fall out of the window are evicted. Indicator indices are
+stream positions (0 = first candle fed since the last reset).
+
+Performance Characteristics:
+- update: O(1) amortised per candle (constant-size neighbourhood checks,
+  monotonic deques, O(log L) heap operations for L active liquidity levels)
+- trend / premium_discount / average_range: O(1)
+- event lists: O(k) copy of the retained events
+"""
+
+import heapq
+import logging
+from collections import deque
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
+
+from src.models.candle import Candle
+from src.models.indicators import Displacement, Inducement, LiquidityLevel, LiquiditySweep
+from src.strategies.ict.detectors.market_structure import IncrementalSwingDetector
+
+# Bars after a sweep checked for a reversal back through the level
+# (matches detect_liquidity_sweep: candles i+1 .. i+4)
+SWEEP_REVERSAL_BARS = 4
+
+
+@dataclass
+class _LevelCluster:
+    """Equal highs/lows cluster anchored at its first peak."""
+
+    level_type: str  # 'bsl' or 'ssl'
+    anchor_index: int
+    anchor_price: float
+    timestamp: datetime
+    prices: List[float]
+    swept: bool = False
+    sweep_timestamp: Optional[datetime] = None
+    evicted: bool = False
+    version: int = 0  # Bumped when price changes; invalidates older heap entries
+
+    @property
+    def price(self) -> float:
+        return sum(self.prices) / len(self.prices)
+
+
+@dataclass
+class _PendingSweep:
+    """Sweep waiting for its reversal window to complete."""
+
+    sweep: LiquiditySweep
+    level_type: str
+    deadline: int  # Last stream index checked for a reversal
+    reversed: bool = False
+
+
+@dataclass
+class _HeapEntry:
+    key: float
+    seq: int
+    version: int
+    cluster: _LevelCluster = field(compare=False)
+
+    def __lt__(self, other: "_HeapEntry") -> bool:
+        return (self.key, self.seq) < (other.key, other.seq)
+
+
+class IntervalAnalysisState:
+    """
+    Incremental ICT state for a single symbol/interval stream.
+
+    Mirrors the batch detectors run over the last ``window`` candles:
+    trend, premium/discount, inducements and equal-level clusters match
+    get_current_trend, calculate_premium_discount, detect_inducement and
+    find_equal_highs/lows (see "Window edge" below for where the equal
+    levels differ).
+
+    Displacements are judged causally: each bar is compared against the
+    average range of the ``avg_range_period`` bars ending at that bar,
+    instead of re-judging the whole buffer against the latest average.
+    Sweeps are likewise evaluated against each level's price when the bar
+    arrives.
+
+    Window edge (equal highs/lows):
+        A cluster is evicted as a whole once its anchor (first touch) leaves
+        the window, together with any later touches still inside it.
+        find_equal_highs/lows run over the window alone would re-cluster
+        those later touches, possibly into a new level anchored inside the
+        window. Conversely, the window's first bar can still count as a
+        peak here, because its real predecessor was seen, while the batch
+        detectors cannot judge it. Level candle_index values are stream
+        indices, not window positions. The equal levels therefore match the
+        batch detectors only while the window covers every candle since
+        the last reset.
+
+    Usage:
+        state = IntervalAnalysisState("5m", window=500)
+        for candle in candles:
+            state.update(candle)
+        trend = state.trend
+        range_low, range_mid, range_high = state.premium_discount
+    """
+
+    def __init__(
+        self,
+        interval: str,
+        window: int = 500,
+        swing_lookback: int = 5,
+        displacement_ratio: float = 1.5,
+        avg_range_period: int = 20,
+        range_lookback: int = 50,
+        inducement_lookback: int = 10,
+        liquidity_tolerance: float = 0.001,
+        liquidity_lookback: int = 20,
+        min_touches: int = 2,
+    ) -> None:
+        if window <= 0:
+            raise ValueError(f"window must be positive, got {window}")
+
+        self.interval = interval
+        self.window = window
+        self.swing_lookback = swing_lookback
+        self.displacement_ratio = displacement_ratio
+        self.avg_range_period = avg_range_period
+        self.range_lookback = min(range_lookback, window)
+        self.inducement_lookback = inducement_lookback
+        self.liquidity_tolerance = liquidity_tolerance
+        self.liquidity_lookback = liquidity_lookback
+        self.min_touches = min_touches
+
+        self._swings = IncrementalSwingDetector(swing_lookback, swing_lookback)
+        # Recent candles for inducement/peak/sweep neighbourhood checks
+        self._recent: Deque[Candle] = deque(maxlen=max(inducement_lookback, liquidity_lookback) + 2)
+        self._ranges: Deque[float] = deque(maxlen=min(avg_range_period, window))
+        # Monotonic (index, value) deques for the premium/discount range
+        self._range_highs: Deque[Tuple[int, float]] = deque()
+        self._range_lows: Deque[Tuple[int, float]] = deque()
+
+        self._displacements: Deque[Displacement] = deque()
+        self._inducements: Deque[Inducement] = deque()
+        self._high_clusters: Deque[_LevelCluster] = deque()
+        self._low_clusters: Deque[_LevelCluster] = deque()
+        self._bsl_heap: List[_HeapEntry] = []  # min-heap on price
+        self._ssl_heap: List[_HeapEntry] = []  # min-heap on -price
+        self._heap_seq = 0
+        self._sweeps: Deque[LiquiditySweep] = deque()
+        self._pending_sweeps: List[_PendingSweep] = []
+
+        self._count = 0
+        self._last_open_time: Optional[datetime] = None
+
+    # ------------------------------------------------------------------
+    # Feeding
+    # ------------------------------------------------------------------
+
+    @property
+    def candle_count(self) -> int:
+        """Number of candles processed since the last reset."""
+        return self._count
+
+    @property
+    def last_open_time(self) -> Optional[datetime]:
+        """open_time of the most recently processed candle."""
+        return self._last_open_time
+
+    def reset(self) -> None:
+        """Drop all state."""
+        self._swings.reset()
+        self._recent.clear()
+        self._ranges.clear()
+        self._range_highs.clear()
+        self._range_lows.clear()
+        self._displacements.clear()
+        self._inducements.clear()
+        self._high_clusters.clear()
+        self._low_clusters.clear()
+        self._bsl_heap.clear()
+        self._ssl_heap.clear()
+        self._sweeps.clear()
+        self._pending_sweeps.clear()
+        self._count = 0
+        self._last_open_time = None
+
+    def initialize(self, candles: Sequence[Candle]) -> None:
+        """Reset and replay history."""
+        self.reset()
+        for candle in candles:
+            self.update(candle)
+
+    def update(self, candle: Candle) -> bool:
+        """
+        Process one appended candle.
+
+        Returns:
+            False if the candle is not newer than the last processed one
+            (duplicate or out of order) and was ignored, True otherwise.
+        """
+        if self._last_open_time is not None and candle.open_time <= self._last_open_time:
+            return False
+
+        index = self._count
+        self._count += 1
+        self._last_open_time = candle.open_time
+        self._recent.append(candle)
+
+        self._swings.update(candle)
+        self._update_range(index, candle)
+        self._update_displacement(index, candle)
+        self._update_pending_sweeps(index, candle)
+        self._update_level_sweeps(index, candle)
+        if index >= 1:
+            self._update_inducement(index - 1)
+        if index >= 2:
+            self._update_equal_levels(index - 1)
+        self._evict()
+        return True
+
+    def _bar(self, index: int) -> Candle:
+        """Candle at stream index (must still be in the recent window)."""
+        return self._recent[index - (self._count - len(self._recent))]
+
+    def _update_range(self, index: int, candle: Candle) -> None:
+        highs, lows = self._range_highs, self._range_lows
+        while highs and highs[-1][1] <= candle.high:
+            highs.pop()
+        highs.append((index, candle.high))
+        while lows and lows[-1][1] >= candle.low:
+            lows.pop()
+        lows.append((index, candle.low))
+
+        oldest = index - self.range_lookback
+        if highs[0][0] <= oldest:
+            highs.popleft()
+        if lows[0][0] <= oldest:
+            lows.popleft()
+
+    def _update_displacement(self, index: int, candle: Candle) -> None:
+        candle_range = candle.high - candle.low
+        self._ranges.append(candle_range)
+        if index < self.avg_range_period:
+            return
+
+        avg_range = sum(self._ranges) / len(self._ranges)
+        if avg_range == 0 or candle_range < self.displacement_ratio * avg_range:
+            return
+
+        self._displacements.append(
+            Displacement(
+                id=f"{candle.interval}_{index}_displacement",
+                interval=candle.interval,
+                index=index,
+                direction="bullish" if candle.close > candle.open else "bearish",
+                start_price=candle.open,
+                end_price=candle.close,
+                displacement_ratio=candle_range / avg_range,
+                timestamp=candle.open_time,
+            )
+        )
+
+    def _update_inducement(self, pivot: int) -> None:
+        """Evaluate bar ``pivot`` now that its confirming bar has arrived."""
+        lookback = self.inducement_lookback
+        if pivot < lookback:
+            return
+
+        recent = [self._bar(i) for i in range(pivot - lookback, pivot)]
+        recent_high = max(c.high for c in recent)
+        recent_low = min(c.low for c in recent)
+        current = self._bar(pivot)
+        confirm = self._bar(pivot + 1)
+
+        if current.low < recent_low and confirm.close > recent_low:
+            direction, price = "bearish", recent_low
+        elif current.high > recent_high and confirm.close < recent_high:
+            direction, price = "bullish", recent_high
+        else:
+            return
+
+        self._inducements.append(
+            Inducement(
+                id=f"{current.interval}_{pivot}_inducement_{direction}",
+                interval=current.interval,
+                index=pivot,
+                type="liquidity_grab",
+                direction=direction,
+                price=price,
+                timestamp=current.open_time,
+            )
+        )
+
+    # ------------------------------------------------------------------
+    # Equal highs/lows and sweeps
+    # ------------------------------------------------------------------
+
+    def _update_equal_levels(self, peak: int) -> None:
+        """Cluster bar ``peak`` if it is a 1-bar local high/low."""
+        prev, current, nxt = self._bar(peak - 1), self._bar(peak), self._bar(peak + 1)
+        if current.high > prev.high and current.high > nxt.high:
+            self._add_touch(self._high_clusters, "bsl", peak, current.high, current.open_time)
+        if current.low < prev.low and current.low < nxt.low:
+            self._add_touch(self._low_clusters, "ssl", peak, current.low, current.open_time)
+
+    def _add_touch(
+        self,
+        clusters: Deque[_LevelCluster],
+        level_type: str,
+        index: int,
+        price: float,
+        timestamp: datetime,
+    ) -> None:
+        """
+        Attach a peak to the earliest anchor that accepts it, else start a
+        new cluster. Same greedy grouping as find_equal_highs/lows.
+        """
+        earliest = index - self.liquidity_lookback
+        match: Optional[_LevelCluster] = None
+        for cluster in reversed(clusters):
+            if cluster.anchor_index < earliest:
+                break
+            tolerance = cluster.anchor_price * self.liquidity_tolerance
+            if abs(price - cluster.anchor_price) <= tolerance:
+                match = cluster
+
+        if match is None:
+            match = _LevelCluster(level_type, index, price, timestamp, [price])
+            clusters.append(match)
+        else:
+            match.prices.append(price)
+
+        touches = len(match.prices)
+        if match.swept or touches < self.min_touches:
+            return
+        if touches == self.min_touches:
+            self._activate_level(match)
+        else:
+            match.version += 1
+            self._push_level(match)
+
+    def _activate_level(self, cluster: _LevelCluster) -> None:
+        """Look back for a crossing since the anchor, else start watching the level."""
+        price = cluster.price
+        for index in range(cluster.anchor_index + 1, self._count):
+            candle = self._bar(index)
+            if self._crosses(cluster.level_type, candle, price):
+                self._record_sweep(cluster, index, candle, price)
+                for later in range(index + 1, self._count):
+                    self._check_reversal(self._pending_sweeps[-1], later, self._bar(later))
+                return
+        self._push_level(cluster)
+
+    def _push_level(self, cluster: _LevelCluster) -> None:
+        self._heap_seq += 1
+        if cluster.level_type == "bsl":
+            heapq.heappush(
+                self._bsl_heap,
+                _HeapEntry(cluster.price, self._heap_seq, cluster.version, cluster),
+            )
+        else:
+            heapq.heappush(
+                self._ssl_heap,
+                _HeapEntry(-cluster.price, self._heap_seq, cluster.version, cluster),
+            )
+
+    @staticmethod
+    def _crosses(level_type: str, candle: Candle, price: float) -> bool:
+        if level_type == "bsl":
+            return candle.high > price
+        return candle.low < price
+
+    def _update_level_sweeps(self, index: int, candle: Candle) -> None:
+        """Pop every watched level the new bar trades through."""
+        for heap, threshold in ((self._bsl_heap, candle.high), (self._ssl_heap, -candle.low)):
+            while heap and heap[0].key < threshold:
+                entry = heapq.heappop(heap)
+                cluster = entry.cluster
+                if cluster.swept or cluster.evicted or entry.version != cluster.version:
+                    continue  # Stale entry
+                self._record_sweep(cluster, index, candle, cluster.price)
+
+    def _record_sweep(
+        self, cluster: _LevelCluster, index: int, candle: Candle, price: float
+    ) -> None:
+        cluster.swept = True
+        cluster.sweep_timestamp = candle.open_time
+        sweep = LiquiditySweep(
+            id=f"{candle.interval}_{index}_sweep_{cluster.level_type}",
+            interval=candle.interval,
+            index=index,
+            direction="bearish" if cluster.level_type == "bsl" else "bullish",
+            swept_level=price,
+            reversal_started=False,
+            timestamp=candle.open_time,
+        )
+        self._pending_sweeps.append(
+            _PendingSweep(sweep, cluster.level_type, index + SWEEP_REVERSAL_BARS)
+        )
+
+    def _check_reversal(self, pending: _PendingSweep, index: int, candle: Candle) -> None:
+        if pending.reversed or index > pending.deadline:
+            return
+        level = pending.sweep.swept_level
+        if pending.level_type == "bsl":
+            pending.reversed = candle.low < level
+        else:
+            pending.reversed = candle.high > level
+
+    def _update_pending_sweeps(self, index: int, candle: Candle) -> None:
+        if not self._pending_sweeps:
+            return
+        still_pending: List[_PendingSweep] = []
+        for pending in self._pending_sweeps:
+            self._check_reversal(pending, index, candle)
+            if pending.reversed or index >= pending.deadline:
+                self._sweeps.append(replace(pending.sweep, reversal_started=pending.reversed))
+            else:
+                still_pending.append(pending)
+        self._pending_sweeps = still_pending
+
+    def _evict(self) -> None:
+        """Drop events that fell out of the window."""
+        floor = self._count - self.window
+        if floor <= 0:
+            return
+
+        swing_floor = floor + self.swing_lookback
+        for swings in (self._swings.swing_highs, self._swings.swing_lows):
+            while swings and swings[0].index < swing_floor:
+                swings.popleft()
+        while self._inducements and self._inducements[0].index < floor + self.inducement_lookback:
+            self._inducements.popleft()
+        while self._displacements and self._displacements[0].index < floor:
+            self._displacements.popleft()
+        while self._sweeps and self._sweeps[0].index < floor:
+            self._sweeps.popleft()
+        for clusters in (self._high_clusters, self._low_clusters):
+            while clusters and clusters[0].anchor_index < floor:
+                clusters.popleft().evicted = True
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    @property
+    def trend(self) -> Optional[str]:
+        """Same rule as get_current_trend(min_swings=2) over the window."""
+        if min(self._count, self.window) < self.swing_lookback * 2 + 2:
+            return None
+
+        highs, lows = self._swings.swing_highs, self._swings.swing_lows
+        if len(highs) < 2 or len(lows) < 2:
+            return None
+
+        prev_high, last_high = highs[-2].price, highs[-1].price
+        prev_low, last_low = lows[-2].price, lows[-1].price
+        if last_high > prev_high and last_low > prev_low:
+            return "bullish"
+        if last_high < prev_high and last_low < prev_low:
+            return "bearish"
+        return None
+
+    @property
+    def premium_discount(self) -> Tuple[float, float, float]:
+        """(range_low, range_mid, range_high) over the last range_lookback bars."""
+        if not self._count:
+            return (0.0, 0.0, 0.0)
+        range_high = self._range_highs[0][1]
+        range_low = self._range_lows[0][1]
+        return (range_low, (range_high + range_low) / 2.0, range_high)
+
+    @property
+    def average_range(self) -> float:
+        """Average high-low range over the last avg_range_period bars."""
+        if not self._ranges:
+            return 0.0
+        return sum(self._ranges) / len(self._ranges)
+
+    @property
+    def displacements(self) -> List[Displacement]:
+        return list(self._displacements)
+
+    @property
+    def inducements(self) -> List[Inducement]:
+        return list(self._inducements)
+
+    @property
+    def sweeps(self) -> List[LiquiditySweep]:
+        """Resolved and still-pending sweeps, oldest first."""
+        floor = self._count - self.window
+        sweeps = [s for s in self._sweeps if s.index >= floor]
+        sweeps.extend(p.sweep for p in self._pending_sweeps)
+        sweeps.sort(key=lambda s: s.index)
+        return sweeps
+
+    @property
+    def equal_highs(self) -> List[LiquidityLevel]:
+        return self._levels(self._high_clusters)
+
+    @property
+    def equal_lows(self) -> List[LiquidityLevel]:
+        return self._levels(self._low_clusters)
+
+    def _levels(self, clusters: Deque[_LevelCluster]) -> List[LiquidityLevel]:
+        levels: List[LiquidityLevel] = []
+        for cluster in clusters:
+            if len(cluster.prices) < self.min_touches:
+                continue
+            price = cluster.price
+            levels.append(
+                LiquidityLevel(
+                    id=f"{self.interval}_{price}_{cluster.level_type}",
+                    interval=self.interval,
+                    level_type=cluster.level_type,
+                    price=price,
+                    strength=len(cluster.prices),
+                    timestamp=cluster.timestamp,
+                    candle_index=cluster.anchor_index,
+                    swept=cluster.swept,
+                    sweep_timestamp=cluster.sweep_timestamp,
+                )
+            )
+        return levels
+
+
+class ICTAnalysisEngine:
+    """
+    Per-symbol container of IntervalAnalysisState, keyed by interval.
+
+    Determiners are instantiated per symbol, so each determiner owns one
+    engine and calls ``sync`` with the interval buffer on every candle; only
+    candles newer than the last processed one are fed.
+
+    Usage:
+        engine = ICTAnalysisEngine(swing_lookback=5, displacement_ratio=1.5)
+        state = engine.sync("5m", buffers["5m"])
+        if state.trend == "bullish" and state.displacements: ...
+    """
+
+    def __init__(
+        self,
+        swing_lookback: int = 5,
+        displacement_ratio: float = 1.5,
+        liquidity_tolerance: float = 0.001,
+        avg_range_period: int = 20,
+        range_lookback: int = 50,
+        inducement_lookback: int = 10,
+        liquidity_lookback: int = 20,
+    ) -> None:
+        self.swing_lookback = swing_lookback
+        self.displacement_ratio = displacement_ratio
+        self.liquidity_tolerance = liquidity_tolerance
+        self.avg_range_period = avg_range_period
+        self.range_lookback = range_lookback
+        self.inducement_lookback = inducement_lookback
+        self.liquidity_lookback = liquidity_lookback
+        self.logger = logging.getLogger(__name__)
+
+        self._states: Dict[str, IntervalAnalysisState] = {}
+
+    def get_state(self, interval: str) -> Optional[IntervalAnalysisState]:
+        return self._states.get(interval)
+
+    def reset(self, interval: Optional[str] = None) -> None:
+        """Drop state for one interval (or all intervals)."""
+        if interval is None:
+            self._states.clear()
+        else:
+            self._states.pop(interval, None)
+
+    def _create_state(self, interval: str, window: int) -> IntervalAnalysisState:
+        state = IntervalAnalysisState(
+            interval,
+            window=window,
+            swing_lookback=self.swing_lookback,
+            displacement_ratio=self.displacement_ratio,
+            avg_range_period=self.avg_range_period,
+            range_lookback=self.range_lookback,
+            inducement_lookback=self.inducement_lookback,
+            liquidity_tolerance=self.liquidity_tolerance,
+            liquidity_lookback=self.liquidity_lookback,
+        )
+        self._states[interval] = state
+        return state
+
+    def update(self, interval: str, candle: Candle, window: int = 500) -> IntervalAnalysisState:
+        """Push a single closed candle (creates the interval state on first use)."""
+        state = self._states.get(interval) or self._create_state(interval, window)
+        state.update(candle)
+        return state
+
+    def sync(self, interval: str, candles: Sequence[Candle]) -> Optional[IntervalAnalysisState]:
+        """
+        Bring the interval state up to date with a candle buffer.
+
+        Feeds only the tail candles newer than the last processed one
+        (O(new candles)). Rebuilds from the buffer when there is no state
+        yet, the buffer went backwards, or it no longer overlaps the
+        processed history (gap larger than the buffer).
+
+        Args:
+            interval: Buffer interval
+            candles: Buffer (deque/CandleStore/list), oldest first
+
+        Returns:
+            Updated state, or None if the buffer is empty and no state exists
+        """
+        state = self._states.get(interval)
+        if not candles:
+            return state
+
+        window = getattr(candles, "maxlen", None) or len(candles)
+        last_time = candles[-1].open_time
+
+        if state is None or state.last_open_time is None:
+            state = self._create_state(interval, window)
+            state.initialize(candles)
+            return state
+
+        if last_time == state.last_open_time:
+            return state
+
+        new_candles: List[Candle] = []
+        rebuild = last_time < state.last_open_time
+        if not rebuild:
+            for candle in reversed(candles):
+                if candle.open_time <= state.last_open_time:
+                    break
+                new_candles.append(candle)
+            else:
+                rebuild = True
+
+        if rebuild:
+            self.logger.debug(f"[ICTAnalysisEngine] Rebuilding {interval} state from buffer")
+            state.initialize(candles)
+            return state
+
+        for candle in reversed(new_candles):
+            state.update(candle)
+        return state
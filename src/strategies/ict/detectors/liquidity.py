@@ -3,13 +3,105 @@ ICT Liquidity Analysis
 Identifies equal highs/lows, premium/discount zones, and liquidity sweeps
 """
 
+import bisect
+import heapq
 from collections import deque
-from typing import List, Literal, Optional, Tuple, Union
+from datetime import datetime
+from typing import Dict, List, Literal, Optional, Tuple, Union
 
 from src.models.candle import Candle
 from src.models import LiquidityLevel, LiquiditySweep
 
 
+def _cluster_equal_levels(
+    peaks: List[Tuple[int, float, datetime]],
+    interval: str,
+    level_type: str,
+    tolerance_percent: float,
+    min_touches: int,
+    lookback: int,
+) -> List["LiquidityLevel"]:
+    """
+    Group peaks into equal-price levels.
+
+    Greedy rule: each peak joins the earliest anchor before it that is
+    within ``anchor_price * tolerance_percent`` and ``lookback`` bars,
+    otherwise it becomes an anchor itself.
+
+    Anchors still inside the lookback window are kept sorted by price, so a
+    peak only inspects the anchors in its tolerance band (bisect) instead
+    of every other peak: O(k log k) for k peaks.
+
+    Args:
+        peaks: (candle_index, price, open_time) tuples in index order
+        interval: Timeframe used for level ids
+        level_type: 'bsl' or 'ssl'
+        tolerance_percent: Price tolerance for "equal"
+        min_touches: Minimum number of touches required
+        lookback: Maximum bars between anchor and touch
+
+    Returns:
+        LiquidityLevel objects in anchor order
+    """
+    clusters: List[List[Tuple[int, float, datetime]]] = []  # anchor first
+    active: deque[int] = deque()  # cluster positions still within lookback
+    by_price: List[Tuple[float, int]] = []  # (anchor price, cluster position), sorted
+
+    # |p - a| <= a * tol implies |p - a| <= |p| * tol / (1 - tol): bisect on that
+    # band (slightly widened for rounding), then apply the exact test.
+    tolerance = abs(tolerance_percent)
+    band_scale = tolerance / (1 - tolerance) * (1 + 1e-9) if tolerance < 1 else None
+
+    for peak in peaks:
+        index, price, _ = peak
+
+        while active and clusters[active[0]][0][0] < index - lookback:
+            position = active.popleft()
+            del by_price[bisect.bisect_left(by_price, (clusters[position][0][1], position))]
+
+        if band_scale is None:
+            candidates = by_price
+        else:
+            radius = abs(price) * band_scale
+            lo = bisect.bisect_left(by_price, (price - radius, -1))
+            hi = bisect.bisect_right(by_price, (price + radius, len(clusters)))
+            candidates = by_price[lo:hi]
+
+        match: Optional[int] = None
+        for anchor_price, position in candidates:
+            if abs(price - anchor_price) <= anchor_price * tolerance_percent and (
+                match is None or position < match
+            ):
+                match = position
+
+        if match is None:
+            clusters.append([peak])
+            active.append(len(clusters) - 1)
+            bisect.insort(by_price, (price, len(clusters) - 1))
+        else:
+            clusters[match].append(peak)
+
+    levels: List[LiquidityLevel] = []
+    for touches in clusters:
+        if len(touches) < min_touches:
+            continue
+        anchor_idx, _, anchor_time = touches[0]
+        avg_price = sum(p for _, p, _ in touches) / len(touches)
+        levels.append(
+            LiquidityLevel(
+                id=f"{interval}_{avg_price}_{level_type}",
+                interval=interval,
+                level_type=level_type,
+                price=avg_price,
+                strength=len(touches),
+                timestamp=anchor_time,
+                candle_index=anchor_idx,
+                swept=False,
+            )
+        )
+    return levels
+
+
 def find_equal_highs(
     candles: Union[List[Candle], deque[Candle]],
     interval: str = "1h",
@@ -33,12 +125,11 @@ def find_equal_highs(
     Returns:
         List of LiquidityLevel objects for equal highs (BSL)
     """
-    equal_highs: List[LiquidityLevel] = []
     candles_list = list(candles)
 
     # Need at least 3 candles for local peak detection (1 in middle, 1 on each side)
     if len(candles_list) < 3:
-        return equal_highs
+        return []
 
     # Collect significant highs (local peaks) - look 1 bar on each side
     swing_highs = []
@@ -52,51 +143,9 @@ def find_equal_highs(
         if candle.high > prev_candle.high and candle.high > next_candle.high:
             swing_highs.append((i, candle.high, candle.open_time))
 
-    # Group equal highs within tolerance
-    processed = set()
-
-    for i, (current_idx, current_high, current_time) in enumerate(swing_highs):
-        if i in processed:
-            continue
-
-        # Find all highs within tolerance of current high
-        touches = [(i, current_idx, current_high, current_time)]
-
-        for j in range(i + 1, len(swing_highs)):
-            if j in processed:
-                continue
-
-            other_idx, other_high, other_time = swing_highs[j]
-
-            # Check if within tolerance and within lookback window
-            price_diff = abs(other_high - current_high)
-            tolerance = current_high * tolerance_percent
-
-            if price_diff <= tolerance and (other_idx - current_idx) <= lookback:
-                touches.append((j, other_idx, other_high, other_time))
-                processed.add(j)
-
-        # If we have enough touches, create liquidity level
-        if len(touches) >= min_touches:
-            avg_price = sum(h for _, _, h, _ in touches) / len(touches)
-            level_id = f"{interval}_{avg_price}_bsl"
-
-            equal_highs.append(
-                LiquidityLevel(
-                    id=level_id,
-                    interval=interval,
-                    level_type="bsl",
-                    price=avg_price,
-                    strength=len(touches),
-                    timestamp=current_time,
-                    candle_index=current_idx,
-                    swept=False,
-                )
-            )
-
-            processed.add(i)
-
-    return equal_highs
+    return _cluster_equal_levels(
+        swing_highs, interval, "bsl", tolerance_percent, min_touches, lookback
+    )
 
 
 def find_equal_lows(
@@ -122,12 +171,11 @@ def find_equal_lows(
     Returns:
         List of LiquidityLevel objects for equal lows (SSL)
     """
-    equal_lows: List[LiquidityLevel] = []
     candles_list = list(candles)
 
     # Need at least 3 candles for local valley detection (1 in middle, 1 on each side)
     if len(candles_list) < 3:
-        return equal_lows
+        return []
 
     # Collect significant lows (local valleys) - look 1 bar on each side
     swing_lows = []
@@ -141,51 +189,9 @@ def find_equal_lows(
         if candle.low < prev_candle.low and candle.low < next_candle.low:
             swing_lows.append((i, candle.low, candle.open_time))
 
-    # Group equal lows within tolerance
-    processed = set()
-
-    for i, (current_idx, current_low, current_time) in enumerate(swing_lows):
-        if i in processed:
-            continue
-
-        # Find all lows within tolerance of current low
-        touches = [(i, current_idx, current_low, current_time)]
-
-        for j in range(i + 1, len(swing_lows)):
-            if j in processed:
-                continue
-
-            other_idx, other_low, other_time = swing_lows[j]
-
-            # Check if within tolerance and within lookback window
-            price_diff = abs(other_low - current_low)
-            tolerance = current_low * tolerance_percent
-
-            if price_diff <= tolerance and (other_idx - current_idx) <= lookback:
-                touches.append((j, other_idx, other_low, other_time))
-                processed.add(j)
-
-        # If we have enough touches, create liquidity level
-        if len(touches) >= min_touches:
-            avg_price = sum(l for _, _, l, _ in touches) / len(touches)
-            level_id = f"{interval}_{avg_price}_ssl"
-
-            equal_lows.append(
-                LiquidityLevel(
-                    id=level_id,
-                    interval=interval,
-                    level_type="ssl",
-                    price=avg_price,
-                    strength=len(touches),
-                    timestamp=current_time,
-                    candle_index=current_idx,
-                    swept=False,
-                )
-            )
-
-            processed.add(i)
-
-    return equal_lows
+    return _cluster_equal_levels(
+        swing_lows, interval, "ssl", tolerance_percent, min_touches, lookback
+    )
 
 
 def calculate_premium_discount(
@@ -253,6 +259,23 @@ def is_in_discount(current_price: float, range_low: float, range_high: float) ->
     return current_price < range_mid
 
 
+def _sweep_reversed(candles_list: List[Candle], index: int, level: "LiquidityLevel") -> bool:
+    """
+    Check the 4 candles after a sweep for a close-back through the level.
+
+    A true ICT reversal: after a BSL sweep price must come back below the
+    level; after an SSL sweep it must come back above it.
+    """
+    for j in range(index + 1, min(index + 5, len(candles_list))):
+        future_candle = candles_list[j]
+        if level.level_type == "bsl":
+            if future_candle.low < level.price:
+                return True
+        elif future_candle.high > level.price:
+            return True
+    return False
+
+
 def detect_liquidity_sweep(
     candles: Union[List[Candle], deque[Candle]],
     liquidity_levels: List["LiquidityLevel"],
@@ -264,74 +287,74 @@ def detect_liquidity_sweep(
     A liquidity sweep occurs when price breaks through a liquidity level
     (taking stops) and then reverses direction.
 
+    Sweep-line: candles are walked once. Each level becomes active on the
+    candle after its candle_index; active BSL levels sit in a min-heap by
+    price and SSL levels in a max-heap, so every level the current candle
+    trades through is popped off the top. Each level is pushed and popped
+    at most once: O((n + L) log L) instead of O(L * n).
+
     Args:
         candles: List or deque of Candle objects
         liquidity_levels: List of LiquidityLevel objects to check
         reversal_threshold: Minimum reversal as % of sweep distance
 
     Returns:
-        List of LiquiditySweep objects
+        List of LiquiditySweep objects (one per swept level, in level order)
     """
-    sweeps: List[LiquiditySweep] = []
     candles_list = list(candles)
+    n = len(candles_list)
 
-    for level in liquidity_levels:
+    # First candle checked for each level, grouped by candle index
+    activations: Dict[int, List[int]] = {}
+    for position, level in enumerate(liquidity_levels):
         if level.swept:
             continue  # Already swept
+        start = level.candle_index + 1
+        if start < n:
+            activations.setdefault(start, []).append(position)
+
+    if not activations:
+        return []
+
+    bsl_heap: List[Tuple[float, int]] = []  # (price, position)
+    ssl_heap: List[Tuple[float, int]] = []  # (-price, position)
+    found: Dict[int, LiquiditySweep] = {}
+
+    for i in range(min(activations), n):
+        for position in activations.get(i, ()):
+            level = liquidity_levels[position]
+            if level.level_type == "bsl":
+                heapq.heappush(bsl_heap, (level.price, position))
+            elif level.level_type == "ssl":
+                heapq.heappush(ssl_heap, (-level.price, position))
+
+        if not bsl_heap and not ssl_heap:
+            continue
+
+        candle = candles_list[i]
+        swept_positions: List[Tuple[int, Literal["bullish", "bearish"]]] = []
+
+        # BSL sweep: price goes above the level (then should reverse down)
+        while bsl_heap and bsl_heap[0][0] < candle.high:
+            swept_positions.append((heapq.heappop(bsl_heap)[1], "bearish"))
+
+        # SSL sweep: price goes below the level (then should reverse up)
+        while ssl_heap and -ssl_heap[0][0] > candle.low:
+            swept_positions.append((heapq.heappop(ssl_heap)[1], "bullish"))
+
+        for position, direction in swept_positions:
+            level = liquidity_levels[position]
+            found[position] = LiquiditySweep(
+                id=f"{level.interval}_{i}_sweep_{level.level_type}",
+                interval=level.interval,
+                index=i,
+                direction=direction,
+                swept_level=level.price,
+                reversal_started=_sweep_reversed(candles_list, i, level),
+                timestamp=candle.open_time,
+            )
 
-        # Check each candle after the liquidity level
-        for i in range(level.candle_index + 1, len(candles_list)):
-            candle = candles_list[i]
-
-            swept = False
-            reversal_started = False
-            direction: Optional[Literal["bullish", "bearish"]] = None
-
-            # Check for BSL sweep (price goes above, then reverses down)
-            if level.level_type == "bsl" and candle.high > level.price:
-                swept = True
-                direction = "bearish"
-
-                # Check if price reversed back through the level
-                # A true ICT reversal: price must come back below the swept level
-                for j in range(i + 1, min(i + 5, len(candles_list))):
-                    future_candle = candles_list[j]
-
-                    # True ICT reversal: price must come back below the level
-                    if future_candle.low < level.price:
-                        reversal_started = True
-                        break
-
-            # Check for SSL sweep (price goes below, then reverses up)
-            elif level.level_type == "ssl" and candle.low < level.price:
-                swept = True
-                direction = "bullish"
-
-                # Check if price reversed back through the level
-                # A true ICT reversal: price must come back above the swept level
-                for j in range(i + 1, min(i + 5, len(candles_list))):
-                    future_candle = candles_list[j]
-
-                    # True ICT reversal: price must come back above the level
-                    if future_candle.high > level.price:
-                        reversal_started = True
-                        break
-
-            if swept and direction is not None:
-                sweeps.append(
-                    LiquiditySweep(
-                        id=f"{level.interval}_{i}_sweep_{level.level_type}",
-                        interval=level.interval,
-                        index=i,
-                        direction=direction,
-                        swept_level=level.price,
-                        reversal_started=reversal_started,
-                        timestamp=candle.open_time,
-                    )
-                )
-                break  # Found the sweep for this level
-
-    return sweeps
+    return [found[position] for position in sorted(found)]
 
 
 def find_liquidity_voids(
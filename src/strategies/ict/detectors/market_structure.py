@@ -10,6 +10,64 @@ from src.models.candle import Candle
 from src.models import StructureBreak, SwingPoint
 
 
+def _sliding_extremes(values: List[float], window: int, find_max: bool) -> List[float]:
+    """
+    Sliding-window max (or min) via a monotonic deque.
+
+    out[k] = max(values[k:k+window]) for k in range(len(values) - window + 1).
+    Each index enters and leaves the deque at most once: amortised O(n).
+    """
+    if window <= 0:
+        fill = float("-inf") if find_max else float("inf")
+        return [fill] * (len(values) + 1)
+
+    out: List[float] = []
+    candidates: deque[int] = deque()  # indices with monotonic values
+
+    for i, value in enumerate(values):
+        if find_max:
+            while candidates and values[candidates[-1]] <= value:
+                candidates.pop()
+        else:
+            while candidates and values[candidates[-1]] >= value:
+                candidates.pop()
+        candidates.append(i)
+
+        if candidates[0] <= i - window:
+            candidates.popleft()
+        if i >= window - 1:
+            out.append(values[candidates[0]])
+
+    return out
+
+
+def _swing_indices(
+    values: List[float], left_bars: int, right_bars: int, find_high: bool
+) -> List[int]:
+    """
+    Indices i where values[i] strictly exceeds (or undercuts) every value in
+    the left_bars bars before it and the right_bars bars after it.
+    """
+    n = len(values)
+    if n < left_bars + 1 + right_bars:
+        return []
+
+    # left_ext[i - left_bars] covers values[i-left_bars:i]
+    # right_ext[i + 1] covers values[i+1:i+1+right_bars]
+    left_ext = _sliding_extremes(values, left_bars, find_high)
+    right_ext = _sliding_extremes(values, right_bars, find_high)
+
+    indices: List[int] = []
+    for i in range(left_bars, n - right_bars):
+        value = values[i]
+        if find_high:
+            if value > left_ext[i - left_bars] and value > right_ext[i + 1]:
+                indices.append(i)
+        elif value < left_ext[i - left_bars] and value < right_ext[i + 1]:
+            indices.append(i)
+    return indices
+
+
 def identify_swing_highs(
     candles: Union[List[Candle], deque[Candle]], left_bars: int = 5, right_bars: int = 5
 ) -> List[SwingPoint]:
@@ -17,6 +75,7 @@ def identify_swing_highs(
     Identify swing high points in price action.
 
     A swing high is a high that is higher than N bars to the left and N bars to the right.
+    Uses monotonic-deque sliding maxima: O(n) regardless of left_bars/right_bars.
 
     Args:
         candles: List or deque of Candle objects
@@ -26,42 +85,22 @@ def identify_swing_highs(
     Returns:
         List of SwingPoint objects representing swing highs
     """
-    swing_highs: List[SwingPoint] = []
     candles_list = list(candles)  # Convert deque to list if needed
-
-    # Need at least left_bars + 1 + right_bars candles
-    min_length = left_bars + 1 + right_bars
-    if len(candles_list) < min_length:
-        return swing_highs
-
-    # Start from left_bars, end at len - right_bars (exclusive)
-    for i in range(left_bars, len(candles_list) - right_bars):
-        current_high = candles_list[i].high
-
-        # Check if current high is higher than all left bars
-        is_higher_than_left = all(
-            current_high > candles_list[j].high for j in range(i - left_bars, i)
-        )
-
-        # Check if current high is higher than all right bars
-        is_higher_than_right = all(
-            current_high > candles_list[j].high for j in range(i + 1, i + 1 + right_bars)
+    highs = [candle.high for candle in candles_list]
+    strength = min(left_bars, right_bars)
+
+    return [
+        SwingPoint(
+            id=f"{candles_list[i].interval}_{i}_high",
+            interval=candles_list[i].interval,
+            index=i,
+            price=highs[i],
+            type="high",
+            timestamp=candles_list[i].open_time,
+            strength=strength,
         )
-
-        if is_higher_than_left and is_higher_than_right:
-            swing_highs.append(
-                SwingPoint(
-                    id=f"{candles_list[i].interval}_{i}_high",
-                    interval=candles_list[i].interval,
-                    index=i,
-                    price=current_high,
-                    type="high",
-                    timestamp=candles_list[i].open_time,
-                    strength=min(left_bars, right_bars),
-                )
-            )
-
-    return swing_highs
+        for i in _swing_indices(highs, left_bars, right_bars, find_high=True)
+    ]
 
 
 def identify_swing_lows(
@@ -71,6 +110,7 @@ def identify_swing_lows(
     Identify swing low points in price action.
 
     A swing low is a low that is lower than N bars to the left and N bars to the right.
+    Uses monotonic-deque sliding minima: O(n) regardless of left_bars/right_bars.
 
     Args:
         candles: List or deque of Candle objects
@@ -80,40 +120,122 @@ def identify_swing_lows(
     Returns:
         List of SwingPoint objects representing swing lows
     """
-    swing_lows: List[SwingPoint] = []
     candles_list = list(candles)
+    lows = [candle.low for candle in candles_list]
+    strength = min(left_bars, right_bars)
+
+    return [
+        SwingPoint(
+            id=f"{candles_list[i].interval}_{i}_low",
+            interval=candles_list[i].interval,
+            index=i,
+            price=lows[i],
+            type="low",
+            timestamp=candles_list[i].open_time,
+            strength=strength,
+        )
+        for i in _swing_indices(lows, left_bars, right_bars, find_high=False)
+    ]
 
-    # Need at least left_bars + 1 + right_bars candles
-    min_length = left_bars + 1 + right_bars
-    if len(candles_list) < min_length:
-        return swing_lows
 
-    # Start from left_bars, end at len - right_bars (exclusive)
-    for i in range(left_bars, len(candles_list) - right_bars):
-        current_low = candles_list[i].low
+class IncrementalSwingDetector:
+    """
+    Keeps swing high/low lists up to date as candles are appended.
 
-        # Check if current low is lower than all left bars
-        is_lower_than_left = all(current_low < candles_list[j].low for j in range(i - left_bars, i))
+    Each update only checks the single newly confirmable bar
+    (stream index len - right_bars - 1) against its left/right neighbours,
+    so per-candle cost is O(left_bars + right_bars) instead of a full rescan.
 
-        # Check if current low is lower than all right bars
-        is_lower_than_right = all(
-            current_low < candles_list[j].low for j in range(i + 1, i + 1 + right_bars)
-        )
+    Swing indices are positions in the appended stream (0 = first candle
+    seen), matching identify_swing_highs/lows when fed the same history.
 
-        if is_lower_than_left and is_lower_than_right:
-            swing_lows.append(
-                SwingPoint(
-                    id=f"{candles_list[i].interval}_{i}_low",
-                    interval=candles_list[i].interval,
-                    index=i,
-                    price=current_low,
-                    type="low",
-                    timestamp=candles_list[i].open_time,
-                    strength=min(left_bars, right_bars),
-                )
+    Usage:
+        detector = IncrementalSwingDetector(left_bars=5, right_bars=5)
+        detector.initialize(historical_candles)
+        new_swings = detector.update(candle)
+    """
+
+    def __init__(
+        self, left_bars: int = 5, right_bars: int = 5, max_swings: Optional[int] = None
+    ) -> None:
+        self.left_bars = left_bars
+        self.right_bars = right_bars
+        self._window_size = left_bars + 1 + right_bars
+        self._window: deque[Candle] = deque(maxlen=self._window_size)
+        self._count = 0
+        self.swing_highs: deque[SwingPoint] = deque(maxlen=max_swings)
+        self.swing_lows: deque[SwingPoint] = deque(maxlen=max_swings)
+
+    @property
+    def candle_count(self) -> int:
+        """Number of candles appended so far."""
+        return self._count
+
+    def reset(self) -> None:
+        """Drop all state."""
+        self._window.clear()
+        self._count = 0
+        self.swing_highs.clear()
+        self.swing_lows.clear()
+
+    def initialize(self, candles: Union[List[Candle], deque[Candle]]) -> None:
+        """Seed from history with the batch O(n) detectors."""
+        self.reset()
+        candles_list = list(candles)
+        self.swing_highs.extend(
+            identify_swing_highs(candles_list, self.left_bars, self.right_bars)
+        )
+        self.swing_lows.extend(identify_swing_lows(candles_list, self.left_bars, self.right_bars))
+        self._window.extend(candles_list[-self._window_size:])
+        self._count = len(candles_list)
+
+    def update(self, candle: Candle) -> List[SwingPoint]:
+        """
+        Append a candle and confirm the bar right_bars positions back.
+
+        Returns:
+            Newly confirmed SwingPoints (0, 1 or 2 entries)
+        """
+        self._window.append(candle)
+        self._count += 1
+
+        if len(self._window) < self._window_size:
+            return []
+
+        window = self._window
+        pivot = window[self.left_bars]
+        index = self._count - self.right_bars - 1
+        neighbours = [c for k, c in enumerate(window) if k != self.left_bars]
+        strength = min(self.left_bars, self.right_bars)
+        confirmed: List[SwingPoint] = []
+
+        if all(pivot.high > c.high for c in neighbours):
+            swing = SwingPoint(
+                id=f"{pivot.interval}_{index}_high",
+                interval=pivot.interval,
+                index=index,
+                price=pivot.high,
+                type="high",
+                timestamp=pivot.open_time,
+                strength=strength,
+            )
+            self.swing_highs.append(swing)
+            confirmed.append(swing)
+
+        if all(pivot.low < c.low for c in neighbours):
+            swing = SwingPoint(
+                id=f"{pivot.interval}_{index}_low",
+                interval=pivot.interval,
+                index=index,
+                price=pivot.low,
+                type="low",
+                timestamp=pivot.open_time,
+                strength=strength,
             )
+            self.swing_lows.append(swing)
+            confirmed.append(swing)
 
-    return swing_lows
+        return confirmed
 
 
 def detect_bos(
@@ -0,0 +1,863 @@
+"""
+ICT Detectors - NumPy array backend
+
+Vectorized counterparts of the Candle-based detectors in fvg.py, order_block.py,
+market_structure.py, liquidity.py and smc.py. Each ``*_np`` function consumes an
+OHLCArrays bundle and returns the same model objects (FairValueGap, OrderBlock,
+SwingPoint, StructureBreak, LiquidityLevel, LiquiditySweep, Inducement,
+Displacement, Mitigation) as its Candle-based twin.
+
+Techniques:
+- Swing points / inducement: rolling-window max/min (sliding_window_view)
+- FVG / liquidity voids: shifted array comparisons
+- Average range: sequential cumulative sum (bit-identical to Python ``sum``)
+- First-crossing scans (sweeps, mitigation, BOS/CHoCH): masked argmax
+
+Datetimes are only materialized for detected indices, so OHLCArrays accepts any
+indexable ``open_time`` sequence (e.g. a lazy view over a CandleStore).
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, List, Literal, Optional, Sequence, Tuple, Union, overload
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from src.models import (
+    Displacement,
+    FairValueGap,
+    Inducement,
+    LiquidityLevel,
+    LiquiditySweep,
+    Mitigation,
+    OrderBlock,
+    StructureBreak,
+    SwingPoint,
+)
+from src.models.candle import Candle
+from src.models.indicators import IndicatorStatus
+from src.strategies.ict.detectors.liquidity import _cluster_equal_levels
+
+if TYPE_CHECKING:
+    from src.strategies.candle_store import CandleStore
+
+
+class _StoreOpenTimes(Sequence[datetime]):
+    """Lazy ``open_time`` sequence over a CandleStore window."""
+
+    __slots__ = ("_store", "_offset", "_size")
+
+    def __init__(self, store: "CandleStore", offset: int, size: int) -> None:
+        self._store = store
+        self._offset = offset
+        self._size = size
+
+    def __len__(self) -> int:
+        return self._size
+
+    @overload
+    def __getitem__(self, index: int) -> datetime: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[datetime]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[datetime, List[datetime]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("open_time index out of range")
+        return self._store[self._offset + index].open_time
+
+
+@dataclass(frozen=True)
+class OHLCArrays:
+    """
+    OHLC price columns plus the metadata detectors need for their results.
+
+    Attributes:
+        open, high, low, close: float64 arrays of equal length (oldest first)
+        open_time: Indexable sequence of candle open datetimes (read lazily)
+        interval: Candle interval (used where detectors read candle.interval)
+    """
+
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    open_time: Sequence[datetime]
+    interval: str = ""
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+    @classmethod
+    def from_candles(cls, candles: Sequence[Candle]) -> "OHLCArrays":
+        """Build arrays from a list/deque of Candle objects."""
+        candles_list = list(candles)
+        return cls(
+            open=np.fromiter((c.open for c in candles_list), np.float64, len(candles_list)),
+            high=np.fromiter((c.high for c in candles_list), np.float64, len(candles_list)),
+            low=np.fromiter((c.low for c in candles_list), np.float64, len(candles_list)),
+            close=np.fromiter((c.close for c in candles_list), np.float64, len(candles_list)),
+            open_time=[c.open_time for c in candles_list],
+            interval=candles_list[0].interval if candles_list else "",
+        )
+
+    @classmethod
+    def from_store(cls, store: "CandleStore", count: Optional[int] = None) -> "OHLCArrays":
+        """Build zero-copy arrays over the most recent ``count`` bars of a CandleStore."""
+        cols = store.columns(count)
+        size = len(cols)
+        return cls(
+            open=cols.open,
+            high=cols.high,
+            low=cols.low,
+            close=cols.close,
+            open_time=_StoreOpenTimes(store, len(store) - size, size),
+            interval=store[-1].interval if size else "",
+        )
+
+
+ArrayInput = Union[OHLCArrays, Sequence[Candle]]
+
+
+def _as_arrays(data: ArrayInput) -> OHLCArrays:
+    if isinstance(data, OHLCArrays):
+        return data
+    return OHLCArrays.from_candles(data)
+
+
+def _rolling_max(values: np.ndarray, window: int) -> np.ndarray:
+    """out[k] = max(values[k:k+window]); -inf everywhere for an empty window."""
+    if window <= 0:
+        return np.full(len(values) + 1, -np.inf)
+    return sliding_window_view(values, window).max(axis=1)
+
+
+def _rolling_min(values: np.ndarray, window: int) -> np.ndarray:
+    """out[k] = min(values[k:k+window]); +inf everywhere for an empty window."""
+    if window <= 0:
+        return np.full(len(values) + 1, np.inf)
+    return sliding_window_view(values, window).min(axis=1)
+
+
+def _first_true(mask: np.ndarray) -> int:
+    """Index of first True in mask, or -1."""
+    if mask.size == 0:
+        return -1
+    idx = int(np.argmax(mask))
+    return idx if mask[idx] else -1
+
+
+# ---------------------------------------------------------------------------
+# Average range (shared by order_block.py / smc.py)
+# ---------------------------------------------------------------------------
+
+
+def calculate_average_range_np(data: ArrayInput, period: int = 20) -> float:
+    """
+    Average candle range over the last ``period`` bars.
+
+    Uses a sequential cumulative sum so the result is bit-identical to
+    the Python ``sum`` in calculate_average_range.
+    """
+    arrays = _as_arrays(data)
+    n = len(arrays)
+    if n < period:
+        period = n
+    if period == 0:
+        return 0.0
+
+    ranges = arrays.high[n - period :] - arrays.low[n - period :]
+    return float(np.cumsum(ranges)[-1]) / period
+
+
+# ---------------------------------------------------------------------------
+# Market structure
+# ---------------------------------------------------------------------------
+
+
+def _swing_indices(
+    values: np.ndarray, left_bars: int, right_bars: int, find_high: bool
+) -> np.ndarray:
+    n = len(values)
+    if n < left_bars + 1 + right_bars:
+        return np.empty(0, dtype=np.intp)
+
+    centers = values[left_bars : n - right_bars]
+    if find_high:
+        left = _rolling_max(values, left_bars)[: len(centers)]
+        right = _rolling_max(values[left_bars + 1 :], right_bars)[: len(centers)]
+        mask = (centers > left) & (centers > right)
+    else:
+        left = _rolling_min(values, left_bars)[: len(centers)]
+        right = _rolling_min(values[left_bars + 1 :], right_bars)[: len(centers)]
+        mask = (centers < left) & (centers < right)
+    return np.flatnonzero(mask) + left_bars
+
+
+def identify_swing_highs_np(
+    data: ArrayInput, left_bars: int = 5, right_bars: int = 5
+) -> List[SwingPoint]:
+    """Vectorized identify_swing_highs (rolling-window max)."""
+    arrays = _as_arrays(data)
+    strength = min(left_bars, right_bars)
+    return [
+        SwingPoint(
+            id=f"{arrays.interval}_{i}_high",
+            interval=arrays.interval,
+            index=i,
+            price=float(arrays.high[i]),
+            type="high",
+            timestamp=arrays.open_time[i],
+            strength=strength,
+        )
+        for i in _swing_indices(arrays.high, left_bars, right_bars, find_high=True).tolist()
+    ]
+
+
+def identify_swing_lows_np(
+    data: ArrayInput, left_bars: int = 5, right_bars: int = 5
+) -> List[SwingPoint]:
+    """Vectorized identify_swing_lows (rolling-window min)."""
+    arrays = _as_arrays(data)
+    strength = min(left_bars, right_bars)
+    return [
+        SwingPoint(
+            id=f"{arrays.interval}_{i}_low",
+            interval=arrays.interval,
+            index=i,
+            price=float(arrays.low[i]),
+            type="low",
+            timestamp=arrays.open_time[i],
+            strength=strength,
+        )
+        for i in _swing_indices(arrays.low, left_bars, right_bars, find_high=False).tolist()
+    ]
+
+
+def detect_bos_np(data: ArrayInput, swing_lookback: int = 5) -> List[StructureBreak]:
+    """Vectorized detect_bos."""
+    arrays = _as_arrays(data)
+    bos_events: List[StructureBreak] = []
+
+    if len(arrays) < swing_lookback * 2 + 2:
+        return bos_events
+
+    swing_highs = identify_swing_highs_np(arrays, swing_lookback, swing_lookback)
+    swing_lows = identify_swing_lows_np(arrays, swing_lookback, swing_lookback)
+
+    for prev, current in zip(swing_highs, swing_highs[1:]):
+        if current.price > prev.price:
+            window = arrays.high[prev.index + 1 : current.index + 1]
+            hit = _first_true(window > prev.price)
+            break_index = prev.index + 1 + hit if hit >= 0 else current.index
+            bos_events.append(
+                StructureBreak(
+                    id=f"{arrays.interval}_{break_index}_bos_bullish",
+                    interval=arrays.interval,
+                    index=break_index,
+                    type="BOS",
+                    direction="bullish",
+                    broken_level=prev.price,
+                    timestamp=arrays.open_time[break_index],
+                )
+            )
+
+    for prev, current in zip(swing_lows, swing_lows[1:]):
+        if current.price < prev.price:
+            window = arrays.low[prev.index + 1 : current.index + 1]
+            hit = _first_true(window < prev.price)
+            break_index = prev.index + 1 + hit if hit >= 0 else current.index
+            bos_events.append(
+                StructureBreak(
+                    id=f"{arrays.interval}_{break_index}_bos_bearish",
+                    interval=arrays.interval,
+                    index=break_index,
+                    type="BOS",
+                    direction="bearish",
+                    broken_level=prev.price,
+                    timestamp=arrays.open_time[break_index],
+                )
+            )
+
+    bos_events.sort(key=lambda x: x.index)
+    return bos_events
+
+
+def detect_choch_np(data: ArrayInput, swing_lookback: int = 5) -> List[StructureBreak]:
+    """
+    Vectorized detect_choch.
+
+    The break candle is the first bar after the earliest confirming
+    opposite swing (a swing low below / swing high above the broken level),
+    which is exactly where the Candle-based scan first succeeds.
+    """
+    arrays = _as_arrays(data)
+    choch_events: List[StructureBreak] = []
+
+    if len(arrays) < swing_lookback * 2 + 2:
+        return choch_events
+
+    swing_highs = identify_swing_highs_np(arrays, swing_lookback, swing_lookback)
+    swing_lows = identify_swing_lows_np(arrays, swing_lookback, swing_lookback)
+
+    if not swing_highs or not swing_lows:
+        return choch_events
+
+    for prev in swing_highs[:-1]:
+        confirm = next(
+            (sl.index for sl in swing_lows if sl.index > prev.index and sl.price < prev.price),
+            None,
+        )
+        if confirm is None:
+            continue
+        hit = _first_true(arrays.high[confirm + 1 :] > prev.price)
+        if hit < 0:
+            continue
+        j = confirm + 1 + hit
+        choch_events.append(
+            StructureBreak(
+                id=f"{arrays.interval}_{j}_choch_bullish",
+                interval=arrays.interval,
+                index=j,
+                type="CHoCH",
+                direction="bullish",
+                broken_level=prev.price,
+                timestamp=arrays.open_time[j],
+            )
+        )
+
+    for prev in swing_lows[:-1]:
+        confirm = next(
+            (sh.index for sh in swing_highs if sh.index > prev.index and sh.price > prev.price),
+            None,
+        )
+        if confirm is None:
+            continue
+        hit = _first_true(arrays.low[confirm + 1 :] < prev.price)
+        if hit < 0:
+            continue
+        j = confirm + 1 + hit
+        choch_events.append(
+            StructureBreak(
+                id=f"{arrays.interval}_{j}_choch_bearish",
+                interval=arrays.interval,
+                index=j,
+                type="CHoCH",
+                direction="bearish",
+                broken_level=prev.price,
+                timestamp=arrays.open_time[j],
+            )
+        )
+
+    choch_events.sort(key=lambda x: x.index)
+    return choch_events
+
+
+def get_current_trend_np(
+    data: ArrayInput, swing_lookback: int = 5, min_swings: int = 2
+) -> Optional[str]:
+    """Vectorized get_current_trend."""
+    arrays = _as_arrays(data)
+    n = len(arrays)
+    if n < swing_lookback * 2 + 2:
+        return None
+
+    high_idx = _swing_indices(arrays.high, swing_lookback, swing_lookback, find_high=True)
+    low_idx = _swing_indices(arrays.low, swing_lookback, swing_lookback, find_high=False)
+
+    if len(high_idx) < min_swings or len(low_idx) < min_swings:
+        return None
+
+    highs = arrays.high[high_idx[-min_swings:]]
+    lows = arrays.low[low_idx[-min_swings:]]
+
+    if np.all(highs[1:] > highs[:-1]) and np.all(lows[1:] > lows[:-1]):
+        return "bullish"
+    if np.all(highs[1:] < highs[:-1]) and np.all(lows[1:] < lows[:-1]):
+        return "bearish"
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Fair Value Gaps
+# ---------------------------------------------------------------------------
+
+
+def _fvg_indices(
+    arrays: OHLCArrays, min_gap_percent: float, bullish: bool
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return (i, gap_low, gap_high) arrays for FVG patterns starting at bar i."""
+    if bullish:
+        lower, upper = arrays.high[:-2], arrays.low[2:]
+    else:
+        lower, upper = arrays.high[2:], arrays.low[:-2]
+
+    gap = upper - lower
+    avg_price = (lower + upper) / 2.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mask = (lower < upper) & (gap / avg_price >= min_gap_percent)
+    idx = np.flatnonzero(mask)
+    return idx, lower[idx], upper[idx]
+
+
+def _detect_fvg_np(
+    data: ArrayInput, interval: str, min_gap_percent: float, direction: str
+) -> List[FairValueGap]:
+    arrays = _as_arrays(data)
+    if len(arrays) < 3:
+        return []
+
+    idx, gap_lows, gap_highs = _fvg_indices(arrays, min_gap_percent, direction == "bullish")
+    fvgs: List[FairValueGap] = []
+    for i, gap_low, gap_high in zip(idx.tolist(), gap_lows.tolist(), gap_highs.tolist()):
+        middle_time = arrays.open_time[i + 1]
+        fvgs.append(
+            FairValueGap(
+                id=f"{interval}_{middle_time.timestamp()}_{direction}",
+                interval=interval,
+                direction=direction,
+                gap_high=gap_high,
+                gap_low=gap_low,
+                timestamp=middle_time,
+                candle_index=i + 1,
+                gap_size=gap_high - gap_low,
+            )
+        )
+    return fvgs
+
+
+def detect_bullish_fvg_np(
+    data: ArrayInput, interval: str = "1h", min_gap_percent: float = 0.001
+) -> List[FairValueGap]:
+    """Vectorized detect_bullish_fvg (high[i] < low[i+2])."""
+    return _detect_fvg_np(data, interval, min_gap_percent, "bullish")
+
+
+def detect_bearish_fvg_np(
+    data: ArrayInput, interval: str = "1h", min_gap_percent: float = 0.001
+) -> List[FairValueGap]:
+    """Vectorized detect_bearish_fvg (high[i+2] < low[i])."""
+    return _detect_fvg_np(data, interval, min_gap_percent, "bearish")
+
+
+def update_fvg_status_np(
+    fvgs: List[FairValueGap], data: ArrayInput, start_index: int = 0
+) -> List[FairValueGap]:
+    """Vectorized update_fvg_status."""
+    arrays = _as_arrays(data)
+    updated: List[FairValueGap] = []
+
+    for fvg in fvgs:
+        if fvg.status in (
+            IndicatorStatus.MITIGATED,
+            IndicatorStatus.FILLED,
+            IndicatorStatus.INVALIDATED,
+        ):
+            updated.append(fvg)
+            continue
+
+        start = max(start_index, fvg.index + 2)
+        overlap = (arrays.low[start:] <= fvg.gap_high) & (arrays.high[start:] >= fvg.gap_low)
+        if overlap.any():
+            updated.append(fvg.with_status(IndicatorStatus.FILLED, fill_percent=1.0))
+        else:
+            updated.append(fvg)
+
+    return updated
+
+
+def detect_all_fvg_np(
+    data: ArrayInput,
+    interval: str = "1h",
+    min_gap_percent: float = 0.001,
+    auto_update_status: bool = True,
+) -> Tuple[List[FairValueGap], List[FairValueGap]]:
+    """Vectorized detect_all_fvg."""
+    arrays = _as_arrays(data)
+    bullish = detect_bullish_fvg_np(arrays, interval, min_gap_percent)
+    bearish = detect_bearish_fvg_np(arrays, interval, min_gap_percent)
+    if auto_update_status:
+        bullish = update_fvg_status_np(bullish, arrays)
+        bearish = update_fvg_status_np(bearish, arrays)
+    return (bullish, bearish)
+
+
+# ---------------------------------------------------------------------------
+# Order Blocks
+# ---------------------------------------------------------------------------
+
+
+def _identify_ob_np(
+    data: ArrayInput,
+    interval: str,
+    displacement_ratio: float,
+    avg_range_period: int,
+    direction: str,
+) -> List[OrderBlock]:
+    arrays = _as_arrays(data)
+    n = len(arrays)
+    if n < avg_range_period + 2:
+        return []
+
+    avg_range = calculate_average_range_np(arrays, avg_range_period)
+    if avg_range == 0:
+        return []
+
+    ranges = arrays.high - arrays.low
+    if direction == "bullish":
+        impulse = arrays.close > arrays.open
+        opposing = arrays.close < arrays.open
+    else:
+        impulse = arrays.close < arrays.open
+        opposing = arrays.close > arrays.open
+
+    candidates = impulse & (ranges >= displacement_ratio * avg_range)
+    candidates[:avg_range_period] = False
+
+    obs: List[OrderBlock] = []
+    for i in np.flatnonzero(candidates).tolist():
+        # Same window as the Candle version: j in (max(0, i - 5), i - 1]
+        for j in range(i - 1, max(0, i - 5), -1):
+            if opposing[j]:
+                displacement_size = float(ranges[i])
+                ob_time = arrays.open_time[j]
+                obs.append(
+                    OrderBlock(
+                        id=f"{interval}_{ob_time.timestamp()}_{i}_{direction}",
+                        interval=interval,
+                        direction=direction,
+                        high=float(arrays.high[j]),
+                        low=float(arrays.low[j]),
+                        timestamp=ob_time,
+                        candle_index=j,
+                        displacement_size=displacement_size,
+                        strength=displacement_size / avg_range,
+                    )
+                )
+                break
+    return obs
+
+
+def identify_bullish_ob_np(
+    data: ArrayInput,
+    interval: str = "1h",
+    displacement_ratio: float = 1.5,
+    avg_range_period: int = 20,
+) -> List[OrderBlock]:
+    """Vectorized identify_bullish_ob."""
+    return _identify_ob_np(data, interval, displacement_ratio, avg_range_period, "bullish")
+
+
+def identify_bearish_ob_np(
+    data: ArrayInput,
+    interval: str = "1h",
+    displacement_ratio: float = 1.5,
+    avg_range_period: int = 20,
+) -> List[OrderBlock]:
+    """Vectorized identify_bearish_ob."""
+    return _identify_ob_np(data, interval, displacement_ratio, avg_range_period, "bearish")
+
+
+def detect_all_ob_np(
+    data: ArrayInput,
+    interval: str = "1h",
+    displacement_ratio: float = 1.5,
+    avg_range_period: int = 20,
+    min_strength: Optional[float] = None,
+) -> Tuple[List[OrderBlock], List[OrderBlock]]:
+    """Vectorized detect_all_ob."""
+    arrays = _as_arrays(data)
+    bullish = identify_bullish_ob_np(arrays, interval, displacement_ratio, avg_range_period)
+    bearish = identify_bearish_ob_np(arrays, interval, displacement_ratio, avg_range_period)
+    if min_strength is not None:
+        bullish = [ob for ob in bullish if ob.strength >= min_strength]
+        bearish = [ob for ob in bearish if ob.strength >= min_strength]
+    return (bullish, bearish)
+
+
+# ---------------------------------------------------------------------------
+# Liquidity
+# ---------------------------------------------------------------------------
+
+
+def find_equal_highs_np(
+    data: ArrayInput,
+    interval: str = "1h",
+    tolerance_percent: float = 0.001,
+    min_touches: int = 2,
+    lookback: int = 20,
+) -> List[LiquidityLevel]:
+    """Vectorized find_equal_highs (local peaks via shifted comparison)."""
+    arrays = _as_arrays(data)
+    if len(arrays) < 3:
+        return []
+
+    high = arrays.high
+    idx = np.flatnonzero((high[1:-1] > high[:-2]) & (high[1:-1] > high[2:])) + 1
+    peaks = [(i, float(high[i]), arrays.open_time[i]) for i in idx.tolist()]
+    return _cluster_equal_levels(peaks, interval, "bsl", tolerance_percent, min_touches, lookback)
+
+
+def find_equal_lows_np(
+    data: ArrayInput,
+    interval: str = "1h",
+    tolerance_percent: float = 0.001,
+    min_touches: int = 2,
+    lookback: int = 20,
+) -> List[LiquidityLevel]:
+    """Vectorized find_equal_lows (local valleys via shifted comparison)."""
+    arrays = _as_arrays(data)
+    if len(arrays) < 3:
+        return []
+
+    low = arrays.low
+    idx = np.flatnonzero((low[1:-1] < low[:-2]) & (low[1:-1] < low[2:])) + 1
+    peaks = [(i, float(low[i]), arrays.open_time[i]) for i in idx.tolist()]
+    return _cluster_equal_levels(peaks, interval, "ssl", tolerance_percent, min_touches, lookback)
+
+
+def calculate_premium_discount_np(
+    data: ArrayInput, lookback: int = 50
+) -> Tuple[float, float, float]:
+    """Vectorized calculate_premium_discount."""
+    arrays = _as_arrays(data)
+    n = len(arrays)
+    if n < lookback:
+        lookback = n
+    if lookback == 0:
+        return (0.0, 0.0, 0.0)
+
+    range_high = float(arrays.high[n - lookback :].max())
+    range_low = float(arrays.low[n - lookback :].min())
+    return (range_low, (range_high + range_low) / 2.0, range_high)
+
+
+def detect_liquidity_sweep_np(
+    data: ArrayInput,
+    liquidity_levels: List[LiquidityLevel],
+    reversal_threshold: float = 0.5,
+) -> List[LiquiditySweep]:
+    """Vectorized detect_liquidity_sweep (first crossing via masked argmax)."""
+    arrays = _as_arrays(data)
+    n = len(arrays)
+    sweeps: List[LiquiditySweep] = []
+
+    for level in liquidity_levels:
+        if level.swept:
+            continue
+
+        start = level.candle_index + 1
+        direction: Optional[Literal["bullish", "bearish"]] = None
+        if level.level_type == "bsl":
+            hit = _first_true(arrays.high[start:] > level.price)
+            direction = "bearish"
+        elif level.level_type == "ssl":
+            hit = _first_true(arrays.low[start:] < level.price)
+            direction = "bullish"
+        else:
+            continue
+
+        if hit < 0:
+            continue
+
+        i = start + hit
+        follow = slice(i + 1, min(i + 5, n))
+        if direction == "bearish":
+            reversal_started = bool((arrays.low[follow] < level.price).any())
+        else:
+            reversal_started = bool((arrays.high[follow] > level.price).any())
+
+        sweeps.append(
+            LiquiditySweep(
+                id=f"{level.interval}_{i}_sweep_{level.level_type}",
+                interval=level.interval,
+                index=i,
+                direction=direction,
+                swept_level=level.price,
+                reversal_started=reversal_started,
+                timestamp=arrays.open_time[i],
+            )
+        )
+
+    return sweeps
+
+
+def find_liquidity_voids_np(
+    data: ArrayInput, min_gap_percent: float = 0.005
+) -> List[Tuple[int, float, float]]:
+    """Vectorized find_liquidity_voids."""
+    arrays = _as_arrays(data)
+    if len(arrays) < 3:
+        return []
+
+    high0, low0 = arrays.high[:-2], arrays.low[:-2]
+    high2, low2 = arrays.high[2:], arrays.low[2:]
+
+    bullish = high0 < low2
+    bearish = ~bullish & (high2 < low0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        bullish &= (low2 - high0) / ((high0 + low2) / 2.0) >= min_gap_percent
+        bearish &= (low0 - high2) / ((high2 + low0) / 2.0) >= min_gap_percent
+
+    voids: List[Tuple[int, float, float]] = []
+    for i in np.flatnonzero(bullish | bearish).tolist():
+        if bullish[i]:
+            voids.append((i, float(high0[i]), float(low2[i])))
+        else:
+            voids.append((i, float(high2[i]), float(low0[i])))
+    return voids
+
+
+# ---------------------------------------------------------------------------
+# Smart Money Concepts
+# ---------------------------------------------------------------------------
+
+
+def detect_inducement_np(data: ArrayInput, lookback: int = 10) -> List[Inducement]:
+    """Vectorized detect_inducement (rolling max/min over the lookback window)."""
+    arrays = _as_arrays(data)
+    n = len(arrays)
+    if n < lookback + 2:
+        return []
+
+    # Bars i in [lookback, n - 1): window is [i - lookback, i)
+    recent_high = _rolling_max(arrays.high, lookback)[: n - 1 - lookback]
+    recent_low = _rolling_min(arrays.low, lookback)[: n - 1 - lookback]
+    cur_high = arrays.high[lookback : n - 1]
+    cur_low = arrays.low[lookback : n - 1]
+    next_close = arrays.close[lookback + 1 :]
+
+    bearish = (cur_low < recent_low) & (next_close > recent_low)
+    bullish = ~bearish & (cur_high > recent_high) & (next_close < recent_high)
+
+    inducements: List[Inducement] = []
+    for k in np.flatnonzero(bearish | bullish).tolist():
+        i = k + lookback
+        if bearish[k]:
+            direction, price = "bearish", float(recent_low[k])
+        else:
+            direction, price = "bullish", float(recent_high[k])
+        inducements.append(
+            Inducement(
+                id=f"{arrays.interval}_{i}_inducement_{direction}",
+                interval=arrays.interval,
+                index=i,
+                type="liquidity_grab",
+                direction=direction,
+                price=price,
+                timestamp=arrays.open_time[i],
+            )
+        )
+    return inducements
+
+
+def detect_displacement_np(
+    data: ArrayInput,
+    displacement_ratio: float = 1.5,
+    avg_range_period: int = 20,
+) -> List[Displacement]:
+    """Vectorized detect_displacement."""
+    arrays = _as_arrays(data)
+    n = len(arrays)
+    if n < avg_range_period + 1:
+        return []
+
+    avg_range = calculate_average_range_np(arrays, avg_range_period)
+    if avg_range == 0:
+        return []
+
+    ranges = arrays.high[avg_range_period:] - arrays.low[avg_range_period:]
+    hits = np.flatnonzero(ranges >= displacement_ratio * avg_range)
+
+    displacements: List[Displacement] = []
+    for k in hits.tolist():
+        i = k + avg_range_period
+        open_price = float(arrays.open[i])
+        close_price = float(arrays.close[i])
+        displacements.append(
+            Displacement(
+                id=f"{arrays.interval}_{i}_displacement",
+                interval=arrays.interval,
+                index=i,
+                direction="bullish" if close_price > open_price else "bearish",
+                start_price=open_price,
+                end_price=close_price,
+                displacement_ratio=float(ranges[k]) / avg_range,
+                timestamp=arrays.open_time[i],
+            )
+        )
+    return displacements
+
+
+def find_mitigation_zone_np(
+    data: ArrayInput,
+    fvgs: Optional[List[FairValueGap]] = None,
+    obs: Optional[List[OrderBlock]] = None,
+) -> List[Mitigation]:
+    """Vectorized find_mitigation_zone."""
+    arrays = _as_arrays(data)
+    mitigation_zones: List[Mitigation] = []
+
+    if not fvgs and not obs:
+        return mitigation_zones
+
+    def _first_overlap(start: int, zone_high: float, zone_low: float) -> int:
+        hit = _first_true((arrays.low[start:] <= zone_high) & (arrays.high[start:] >= zone_low))
+        return start + hit if hit >= 0 else -1
+
+    for fvg in fvgs or []:
+        if fvg.filled:
+            continue
+        i = _first_overlap(fvg.candle_index + 3, fvg.gap_high, fvg.gap_low)
+        if i >= 0:
+            mitigation_zones.append(
+                Mitigation(
+                    id=f"{arrays.interval}_{i}_mitigation_fvg",
+                    interval=arrays.interval,
+                    index=i,
+                    type="FVG",
+                    high=fvg.gap_high,
+                    low=fvg.gap_low,
+                    timestamp=arrays.open_time[i],
+                    mitigated=True,
+                )
+            )
+
+    for ob in obs or []:
+        i = _first_overlap(ob.candle_index + 1, ob.high, ob.low)
+        if i >= 0:
+            mitigation_zones.append(
+                Mitigation(
+                    id=f"{arrays.interval}_{i}_mitigation_ob",
+                    interval=arrays.interval,
+                    index=i,
+                    type="OB",
+                    high=ob.high,
+                    low=ob.low,
+                    timestamp=arrays.open_time[i],
+                    mitigated=True,
+                )
+            )
+
+    return mitigation_zones
+
+
+def detect_all_smc_np(
+    data: ArrayInput,
+    displacement_ratio: float = 1.5,
+    inducement_lookback: int = 10,
+    fvgs: Optional[List[FairValueGap]] = None,
+    obs: Optional[List[OrderBlock]] = None,
+) -> Tuple[List[Inducement], List[Displacement], List[Mitigation]]:
+    """Vectorized detect_all_smc."""
+    arrays = _as_arrays(data)
+    return (
+        detect_inducement_np(arrays, lookback=inducement_lookback),
+        detect_displacement_np(arrays, displacement_ratio=displacement_ratio),
+        find_mitigation_zone_np(arrays, fvgs=fvgs, obs=obs),
+    )
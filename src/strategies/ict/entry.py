@@ -18,6 +18,7 @@ from typing import Any, Dict, Optional
 from pydantic import BaseModel, Field
 from src.strategies.decorators import register_module
 
+from src.strategies.ict.analysis_engine import ICTAnalysisEngine
 from src.strategies.ict.profiles import get_profile_parameters, load_profile_from_name
 from src.strategies.ict.detectors.fvg import (
     detect_bearish_fvg,
@@ -94,6 +95,7 @@ class ICTEntryDeterminer(EntryDeterminer):
         fvg_min_gap_percent: float = Field(0.1, ge=0.01, le=1.0, description="FVG 최소 갭 %")
         ob_min_strength: float = Field(0.5, ge=0.1, le=1.0, description="Order Block 최소 강도")
         use_killzones: bool = Field(True, description="킬존 시간대 필터 사용")
+        incremental_analysis: bool = Field(False, description="증분 ICT 분석 엔진 사용")
 
     @classmethod
     def from_validated_params(cls, params: "ICTEntryDeterminer.ParamSchema") -> "ICTEntryDeterminer":
@@ -109,6 +111,9 @@ class ICTEntryDeterminer(EntryDeterminer):
     use_killzones: bool = True
     min_periods: int = 50
 
+    # Query an incremental per-interval engine instead of rescanning the buffer
+    incremental_analysis: bool = False
+
     # MTF interval names (set from config)
     ltf_interval: str = "5m"
     mtf_interval: str = "1h"
@@ -130,6 +135,15 @@ class ICTEntryDeterminer(EntryDeterminer):
     def __post_init__(self):
         self.logger = logging.getLogger(__name__)
         self.min_periods = max(50, self.swing_lookback * 4)
+        self.analysis_engine: Optional[ICTAnalysisEngine] = (
+            ICTAnalysisEngine(
+                swing_lookback=self.swing_lookback,
+                displacement_ratio=self.displacement_ratio,
+                liquidity_tolerance=self.liquidity_tolerance,
+            )
+            if self.incremental_analysis
+            else None
+        )
 
     @property
     def requirements(self) -> ModuleRequirements:
@@ -179,6 +193,7 @@ class ICTEntryDeterminer(EntryDeterminer):
                 "liquidity_tolerance", profile_params.get("liquidity_tolerance", 0.001)
             ),
             use_killzones=config.get("use_killzones", True),
+            incremental_analysis=config.get("incremental_analysis", False),
             ltf_interval=config.get("ltf_interval", "5m"),
             mtf_interval=config.get("mtf_interval", "1h"),
             htf_interval=config.get("htf_interval", "4h"),
@@ -209,6 +224,11 @@ class ICTEntryDeterminer(EntryDeterminer):
         # Use MTF buffer for structure detection when available
         candle_buffer = ltf_buffer
 
+        # Incremental engine: feed only candles appended since the last call
+        state = None
+        if self.analysis_engine is not None:
+            state = self.analysis_engine.sync(self.ltf_interval, candle_buffer)
+
         # Kill Zone Filter
         if self.use_killzones:
             if not is_killzone_active(candle.open_time):
@@ -230,15 +250,21 @@ class ICTEntryDeterminer(EntryDeterminer):
 
         # Fallback to original calculation if cache unavailable
         if trend is None:
-            trend = get_current_trend(candle_buffer, swing_lookback=self.swing_lookback)
+            if state is not None:
+                trend = state.trend
+            else:
+                trend = get_current_trend(candle_buffer, swing_lookback=self.swing_lookback)
 
         if trend is None or trend == "sideways":
             return None
 
         # Step 3: Premium/Discount Zone
-        range_low, range_mid, range_high = calculate_premium_discount(
-            candle_buffer, lookback=50
-        )
+        if state is not None:
+            range_low, range_mid, range_high = state.premium_discount
+        else:
+            range_low, range_mid, range_high = calculate_premium_discount(
+                candle_buffer, lookback=50
+            )
         current_price = candle.close
 
         # Step 4: FVG/OB Detection
@@ -295,22 +321,28 @@ class ICTEntryDeterminer(EntryDeterminer):
                 ob for ob in bearish_obs if ob.strength >= self.ob_min_strength
             ]
 
-        # Step 5: Liquidity Analysis
-        equal_highs = find_equal_highs(
-            candle_buffer, tolerance_percent=self.liquidity_tolerance, lookback=20
-        )
-        equal_lows = find_equal_lows(
-            candle_buffer, tolerance_percent=self.liquidity_tolerance, lookback=20
-        )
-        detect_liquidity_sweep(candle_buffer, equal_highs + equal_lows)
+        # Steps 5-7: Liquidity, Inducement, Displacement
+        if state is not None:
+            # Equal levels and sweep state are maintained by the engine
+            inducements = state.inducements
+            displacements = state.displacements
+        else:
+            # Step 5: Liquidity Analysis
+            equal_highs = find_equal_highs(
+                candle_buffer, tolerance_percent=self.liquidity_tolerance, lookback=20
+            )
+            equal_lows = find_equal_lows(
+                candle_buffer, tolerance_percent=self.liquidity_tolerance, lookback=20
+            )
+            detect_liquidity_sweep(candle_buffer, equal_highs + equal_lows)
 
-        # Step 6: Inducement Check
-        inducements = detect_inducement(candle_buffer, lookback=10)
+            # Step 6: Inducement Check
+            inducements = detect_inducement(candle_buffer, lookback=10)
 
-        # Step 7: Displacement Confirmation
-        displacements = detect_displacement(
-            candle_buffer, displacement_ratio=self.displacement_ratio
-        )
+            # Step 7: Displacement Confirmation
+            displacements = detect_displacement(
+                candle_buffer, displacement_ratio=self.displacement_ratio
+            )
 
         # Step 8: Entry Timing - mitigation zone detection
         if context.indicator_cache is None:
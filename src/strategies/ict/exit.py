@@ -16,6 +16,7 @@ from typing import Optional
 from pydantic import BaseModel, Field
 from src.strategies.decorators import register_module
 
+from src.strategies.ict.analysis_engine import ICTAnalysisEngine
 from src.strategies.ict.detectors.market_structure import get_current_trend
 from src.strategies.ict.detectors.smc import detect_displacement, detect_inducement
 from src.exit.base import ExitContext, ExitDeterminer
@@ -58,6 +59,7 @@ class ICTExitDeterminer(ExitDeterminer):
         displacement_ratio: float = Field(1.5, ge=1.0, le=5.0, description="디스플레이스먼트 비율")
         mtf_interval: str = Field("1h", description="Mid Timeframe 인터벌")
         htf_interval: str = Field("4h", description="High Timeframe 인터벌")
+        incremental_analysis: bool = Field(False, description="증분 ICT 분석 엔진 사용")
 
     @classmethod
     def from_validated_params(cls, params: "ICTExitDeterminer.ParamSchema") -> "ICTExitDeterminer":
@@ -76,6 +78,7 @@ class ICTExitDeterminer(ExitDeterminer):
             displacement_ratio=params.displacement_ratio,
             mtf_interval=params.mtf_interval,
             htf_interval=params.htf_interval,
+            incremental_analysis=params.incremental_analysis,
         )
 
     def __init__(
@@ -85,6 +88,7 @@ class ICTExitDeterminer(ExitDeterminer):
         displacement_ratio: float = 1.5,
         mtf_interval: str = "1h",
         htf_interval: str = "4h",
+        incremental_analysis: bool = False,
     ):
         self.exit_config = exit_config or ExitConfig()
         self.swing_lookback = swing_lookback
@@ -93,6 +97,15 @@ class ICTExitDeterminer(ExitDeterminer):
         self.htf_interval = htf_interval
         self.logger = logging.getLogger(__name__)
 
+        # Incremental MTF analysis (queried instead of rescanning the buffer)
+        self.analysis_engine: Optional[ICTAnalysisEngine] = (
+            ICTAnalysisEngine(
+                swing_lookback=swing_lookback, displacement_ratio=displacement_ratio
+            )
+            if incremental_analysis
+            else None
+        )
+
         # Trailing stop level persistence across candles (Issue #99)
         self._trailing_levels: dict[str, float] = {}
         # Position metrics for MFE/MAE tracking (trailing-stop-logging-optimization)
@@ -483,6 +496,10 @@ class ICTExitDeterminer(ExitDeterminer):
             if not mtf_buffer or len(mtf_buffer) < 50:
                 return None
 
+            state = None
+            if self.analysis_engine is not None:
+                state = self.analysis_engine.sync(self.mtf_interval, mtf_buffer)
+
             # Get current trend from ICT analysis
             trend = None
             if context.indicator_cache is not None:
@@ -501,6 +518,8 @@ class ICTExitDeterminer(ExitDeterminer):
                         else None
                     )
                 )
+            elif state is not None:
+                trend = state.trend
             else:
                 trend = get_current_trend(
                     mtf_buffer, swing_lookback=self.swing_lookback
@@ -509,10 +528,14 @@ class ICTExitDeterminer(ExitDeterminer):
             if trend is None:
                 return None
 
-            displacements = detect_displacement(
-                mtf_buffer, displacement_ratio=self.displacement_ratio
-            )
-            inducements = detect_inducement(mtf_buffer, lookback=10)
+            if state is not None:
+                displacements = state.displacements
+                inducements = state.inducements
+            else:
+                displacements = detect_displacement(
+                    mtf_buffer, displacement_ratio=self.displacement_ratio
+                )
+                inducements = detect_inducement(mtf_buffer, lookback=10)
 
             should_exit_position = False
             exit_reason = None
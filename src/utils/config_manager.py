@@ -39,6 +39,13 @@ class BinanceConfig:
         ws_mainnet_url: Market data WebSocket URL for mainnet
         user_ws_testnet_url: User data WebSocket URL for testnet
         user_ws_mainnet_url: User data WebSocket URL for mainnet
+        ws_streams_per_connection: Kline streams multiplexed per combined-stream
+            market data connection (Binance allows up to 1024)
+        async_rest: Place orders through the non-blocking aiohttp gateway
+            (AsyncOrderGateway) instead of the blocking REST client
+        exchange_info_cache_path: JSON file persisting exchange info symbol
+            filters across restarts (relative to project root; None keeps
+            them in memory only)
     """
 
     # REST API endpoints
@@ -53,6 +60,15 @@ class BinanceConfig:
     user_ws_testnet_url: str = "wss://stream.binancefuture.com/ws"
     user_ws_mainnet_url: str = "wss://fstream.binance.com/ws"
 
+    # Market data connection packing (combined streams)
+    ws_streams_per_connection: int = 1024
+
+    # Order hot path over a pooled aiohttp session
+    async_rest: bool = False
+
+    # Persisted exchangeInfo filters (warm start without re-downloading)
+    exchange_info_cache_path: Optional[str] = None
+
     def get_rest_url(self, is_testnet: bool) -> str:
         """Get REST API URL based on environment."""
         return self.rest_testnet_url if is_testnet else self.rest_mainnet_url
@@ -206,6 +222,7 @@ class TradingConfig:
         10  # Maximum symbols allowed (Issue #69: configurable MAX_SYMBOLS)
     )
     strategy_type: str = "composable"  # "composable" | "monolithic"
+    candle_updates: Dict[str, Any] = field(default_factory=dict)  # Intra-candle update policy
 
     def __post_init__(self):
         # Validation
@@ -324,11 +341,13 @@ class LiquidationConfig:
         timeout_seconds: Maximum time allowed for liquidation operations (DEFAULT: 5.0)
         max_retries: Maximum retry attempts for failed operations (DEFAULT: 3)
         retry_delay_seconds: Delay between retry attempts (DEFAULT: 0.5)
+        max_concurrency: Maximum symbols cancelled/closed in parallel (DEFAULT: 8)
 
     Validation Rules:
         - timeout_seconds: 1.0 - 30.0 seconds (minimum 1s, maximum 30s)
         - max_retries: 0 - 10 (0 = no retries, 10 = maximum)
         - retry_delay_seconds: 0.1 - 5.0 seconds
+        - max_concurrency: 1 - 50 (1 = sequential)
         - close_positions=False requires explicit acknowledgment (not auto-allowed)
         - cancel_orders should always be True (orders without positions are orphans)
 
@@ -347,6 +366,7 @@ class LiquidationConfig:
     timeout_seconds: float = 5.0  # DEFAULT: 5 seconds (balance speed vs reliability)
     max_retries: int = 3  # DEFAULT: 3 retries (balance reliability vs time)
     retry_delay_seconds: float = 0.5  # DEFAULT: 0.5 seconds (exponential backoff base)
+    max_concurrency: int = 8  # DEFAULT: 8 symbols in flight (liquidation wall time vs weight)
 
     def __post_init__(self) -> None:
         """
@@ -405,6 +425,11 @@ class LiquidationConfig:
                 f"retry_delay_seconds must be numeric, got {type(self.retry_delay_seconds).__name__}"
             )
 
+        if not isinstance(self.max_concurrency, int) or isinstance(self.max_concurrency, bool):
+            raise ConfigurationError(
+                f"max_concurrency must be int, got {type(self.max_concurrency).__name__}"
+            )
+
     def _validate_ranges(self) -> None:
         """Validate field value ranges."""
         # Timeout validation: 1-30 seconds
@@ -425,6 +450,12 @@ class LiquidationConfig:
                 f"retry_delay_seconds must be 0.1-5.0 seconds, got {self.retry_delay_seconds}"
             )
 
+        # Concurrency validation: 1-50 symbols in flight
+        if self.max_concurrency < 1 or self.max_concurrency > 50:
+            raise ConfigurationError(
+                f"max_concurrency must be 1-50, got {self.max_concurrency}"
+            )
+
     def _validate_consistency(self) -> None:
         """Validate cross-field consistency."""
         # If emergency_liquidation is disabled, both close_positions and cancel_orders must be False
@@ -511,6 +542,7 @@ class LiquidationConfig:
             "timeout_seconds": self.timeout_seconds,
             "max_retries": self.max_retries,
             "retry_delay_seconds": self.retry_delay_seconds,
+            "max_concurrency": self.max_concurrency,
         }
 
     @classmethod
@@ -534,6 +566,7 @@ class LiquidationConfig:
             timeout_seconds=config_dict.get("timeout_seconds", 5.0),
             max_retries=config_dict.get("max_retries", 3),
             retry_delay_seconds=config_dict.get("retry_delay_seconds", 0.5),
+            max_concurrency=config_dict.get("max_concurrency", 8),
         )
 
     def __repr__(self) -> str:
@@ -545,7 +578,8 @@ class LiquidationConfig:
             f"cancel_orders={self.cancel_orders}, "
             f"timeout={self.timeout_seconds}s, "
             f"retries={self.max_retries}, "
-            f"retry_delay={self.retry_delay_seconds}s)"
+            f"retry_delay={self.retry_delay_seconds}s, "
+            f"max_concurrency={self.max_concurrency})"
         )
 
 
@@ -781,6 +815,9 @@ class ConfigManager:
             ws_mainnet_url=binance.get("ws_mainnet_url", "wss://fstream.binance.com"),
             user_ws_testnet_url=binance.get("user_ws_testnet_url", "wss://stream.binancefuture.com/ws"),
             user_ws_mainnet_url=binance.get("user_ws_mainnet_url", "wss://fstream.binance.com/ws"),
+            ws_streams_per_connection=int(binance.get("ws_streams_per_connection", 1024)),
+            async_rest=bool(binance.get("async_rest", False)),
+            exchange_info_cache_path=binance.get("exchange_info_cache_path"),
         )
 
     def _parse_logging_config(self, data: Dict[str, Any]) -> LoggingConfig:
@@ -806,6 +843,7 @@ class ConfigManager:
             timeout_seconds=float(liq.get("timeout_seconds", 5.0)),
             max_retries=int(liq.get("max_retries", 3)),
             retry_delay_seconds=float(liq.get("retry_delay_seconds", 0.5)),
+            max_concurrency=int(liq.get("max_concurrency", 8)),
         )
 
     def _parse_trading_config(self, data: Dict[str, Any]) -> TradingConfig:
@@ -873,6 +911,7 @@ class ConfigManager:
             exit_config=exit_config,
             max_symbols=max_symbols,
             strategy_type=defaults.get("strategy_type", "composable"),
+            candle_updates=defaults.get("candle_updates") or {},
         )
 
     def _parse_hierarchical_config(self, data: Dict[str, Any]) -> "TradingConfigHierarchical":
@@ -321,6 +321,34 @@ class TestTpSlTrigger:
         sl_trades = [t for t in result.trades if t.exit_reason == "stop_loss"]
         assert len(sl_trades) >= 1
 
+    @pytest.mark.asyncio
+    async def test_leftover_leg_cancelled_after_fill(self, default_config):
+        """After TP fills, the SL leg is cancelled and cannot hit the next position."""
+        backfill = make_candle_series(5, base_price=100.0)
+        entry_candle = make_candle(
+            open_=103.0, high=108.0, low=98.0, close=106.0, minute_offset=5
+        )
+        tp_candle = make_candle(
+            open_=106.0, high=115.0, low=105.0, close=112.0, minute_offset=6
+        )
+        # Re-entry at 112, then a bar whose low (100) is below the stale SL
+        # of the first trade (102.82) and the new SL (108.64)
+        crash_candle = make_candle(
+            open_=112.0, high=113.0, low=100.0, close=101.0, minute_offset=7
+        )
+
+        provider = make_data_provider(backfill + [entry_candle, tp_candle, crash_candle])
+        default_config.backfill_limit = 5
+        engine = BacktestEngine(
+            strategies={"BTCUSDT": AlwaysLongStrategy("BTCUSDT")},
+            data_provider=provider,
+            config=default_config,
+        )
+
+        result = await engine.run()
+
+        assert [t.exit_reason for t in result.trades] == ["take_profit", "stop_loss"]
+
 
 class TestEquityCurve:
     """Verify equity curve tracking."""
@@ -0,0 +1,192 @@
+"""Tests for the parallel backtest sweep runner."""
+
+import csv
+import random
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+import pytest
+
+from src.backtest.engine import BacktestConfig
+from src.backtest.sweep import (
+    METRIC_COLUMNS,
+    BacktestSweepRunner,
+    SweepTask,
+    execute_task,
+    expand_grid,
+    split_params,
+)
+from src.models.candle import Candle
+
+
+def make_random_candles(n: int, seed: int = 1, symbol: str = "BTCUSDT") -> List[Candle]:
+    """Random-walk 1m candles."""
+    rng = random.Random(seed)
+    base_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    price = 100.0
+    candles = []
+    for i in range(n):
+        close = max(1.0, price + rng.gauss(0, 1.0))
+        open_time = base_time + timedelta(minutes=i)
+        candles.append(
+            Candle(
+                symbol=symbol,
+                interval="1m",
+                open_time=open_time,
+                open=price,
+                high=max(price, close) + 0.5,
+                low=min(price, close) - 0.5,
+                close=close,
+                volume=1.0,
+                close_time=open_time + timedelta(minutes=1),
+                is_closed=True,
+            )
+        )
+        price = close
+    return candles
+
+
+@pytest.fixture
+def candle_data():
+    return {"BTCUSDT": {"1m": make_random_candles(300)}}
+
+
+def _runner(candle_data=None, csv_paths=None, max_workers=1):
+    return BacktestSweepRunner(
+        candle_data=candle_data,
+        csv_paths=csv_paths,
+        strategy_name="always_signal",
+        base_strategy_config={"buffer_size": 20},
+        backtest_config=BacktestConfig(backfill_limit=50),
+        max_workers=max_workers,
+    )
+
+
+class TestGrid:
+    def test_expand_grid_is_cartesian_product(self):
+        runs = expand_grid(
+            {"active_profile": ["strict", "relaxed"], "displacement_ratio": [1.2, 1.5, 2.0]}
+        )
+        assert len(runs) == 6
+        assert runs[0] == {"active_profile": "strict", "displacement_ratio": 1.2}
+        assert runs[-1] == {"active_profile": "relaxed", "displacement_ratio": 2.0}
+
+    def test_empty_grid_is_single_base_run(self):
+        assert expand_grid({}) == [{}]
+
+    def test_split_params_routes_by_config_fields(self):
+        strategy, exit_, backtest = split_params(
+            {
+                "active_profile": "balanced",
+                "fvg_min_gap_percent": 0.002,
+                "exit_strategy": "breakeven",
+                "trailing_distance": 0.01,
+                "leverage": 5,
+            }
+        )
+        assert strategy == {"active_profile": "balanced", "fvg_min_gap_percent": 0.002}
+        assert exit_ == {"exit_strategy": "breakeven", "trailing_distance": 0.01}
+        assert backtest == {"leverage": 5}
+
+
+class TestExecuteTask:
+    def test_row_contains_params_and_metrics(self, candle_data):
+        task = SweepTask(
+            run_id=3,
+            params={"risk_per_trade": 0.01},
+            strategy_name="always_signal",
+            base_strategy_config={"buffer_size": 20},
+            base_exit_config={},
+            base_backtest_config={"backfill_limit": 50},
+        )
+        row = execute_task(task, candle_data)
+
+        assert row["run_id"] == 3
+        assert row["risk_per_trade"] == 0.01
+        assert set(METRIC_COLUMNS) <= set(row)
+        assert row["candles_processed"] == 250
+        assert row["total_trades"] > 0
+
+    def test_runs_do_not_share_data_cursor(self, candle_data):
+        task = SweepTask(0, {}, "always_signal", {"buffer_size": 20}, {}, {"backfill_limit": 50})
+        first = execute_task(task, candle_data)
+        second = execute_task(task, candle_data)
+        assert first["candles_processed"] == second["candles_processed"] == 250
+        assert first["total_pnl"] == second["total_pnl"]
+
+
+class TestSweepRunner:
+    def test_requires_exactly_one_data_source(self, candle_data):
+        with pytest.raises(ValueError):
+            BacktestSweepRunner()
+        with pytest.raises(ValueError):
+            BacktestSweepRunner(candle_data=candle_data, csv_paths={"X": {"1m": "x.csv"}})
+
+    def test_serial_sweep(self, candle_data):
+        sweep = _runner(candle_data).run({"risk_per_trade": [0.01, 0.02]})
+
+        assert [row["run_id"] for row in sweep.rows] == [0, 1]
+        assert [row["risk_per_trade"] for row in sweep.rows] == [0.01, 0.02]
+        assert sweep.errors == []
+
+    def test_process_pool_matches_serial(self, candle_data):
+        grid = {"risk_per_trade": [0.01, 0.02], "leverage": [1, 5]}
+        serial = _runner(candle_data).run(grid)
+        parallel = _runner(candle_data, max_workers=2).run(grid)
+
+        def strip_timing(rows):
+            return [{k: v for k, v in row.items() if k != "elapsed_seconds"} for row in rows]
+
+        assert strip_timing(parallel.rows) == strip_timing(serial.rows)
+
+    def test_failed_runs_are_reported_not_raised(self, candle_data):
+        sweep = _runner(candle_data, max_workers=2).run(
+            {"exit_strategy": ["trailing_stop", "not_a_strategy"]}
+        )
+
+        assert [row["exit_strategy"] for row in sweep.rows] == ["trailing_stop"]
+        assert len(sweep.errors) == 1
+        assert sweep.errors[0]["exit_strategy"] == "not_a_strategy"
+        assert "not_a_strategy" in sweep.errors[0]["error"]
+
+    def test_csv_source_loaded_by_workers(self, tmp_path, candle_data):
+        path = tmp_path / "btc_1m.csv"
+        with open(path, "w", newline="") as fh:
+            writer = csv.writer(fh)
+            writer.writerow(["open_time", "open", "high", "low", "close", "volume", "close_time"])
+            for c in candle_data["BTCUSDT"]["1m"]:
+                writer.writerow(
+                    [
+                        c.open_time.strftime("%Y-%m-%d %H:%M:%S"),
+                        c.open,
+                        c.high,
+                        c.low,
+                        c.close,
+                        c.volume,
+                        c.close_time.strftime("%Y-%m-%d %H:%M:%S"),
+                    ]
+                )
+
+        sweep = _runner(csv_paths={"BTCUSDT": {"1m": str(path)}}, max_workers=2).run(
+            {"risk_per_trade": [0.01, 0.02]}
+        )
+        assert len(sweep.rows) == 2
+        assert all(row["candles_processed"] == 250 for row in sweep.rows)
+
+    def test_table_helpers(self, candle_data, tmp_path):
+        sweep = _runner(candle_data).run({"risk_per_trade": [0.01, 0.02, 0.03]})
+
+        ordered = sweep.sorted_by("total_pnl")
+        assert ordered[0]["total_pnl"] >= ordered[-1]["total_pnl"]
+        assert sweep.best("total_pnl") == ordered[0]
+
+        frame = sweep.to_dataframe()
+        assert len(frame) == 3
+        assert {"run_id", "risk_per_trade", "win_rate"} <= set(frame.columns)
+
+        out = tmp_path / "sweep.csv"
+        sweep.to_csv(str(out))
+        with open(out, newline="") as fh:
+            rows = list(csv.DictReader(fh))
+        assert len(rows) == 3
+        assert list(rows[0])[:2] == ["run_id", "risk_per_trade"]
@@ -0,0 +1,218 @@
+"""Tests for the concurrent startup backfill scheduler."""
+
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.core.backfill_scheduler import BackfillJob, BackfillScheduler, kline_request_weight
+from src.core.binance_service import BinanceServiceClient, RequestWeightTracker
+
+
+def _jobs(symbols, intervals=("5m", "1h"), limit=100):
+    return [BackfillJob(s, i, limit) for s in symbols for i in intervals]
+
+
+class SlowFetch:
+    """Blocking fetch that records peak concurrency and calling threads."""
+
+    def __init__(self, delay=0.05, fail=()):
+        self.delay = delay
+        self.fail = set(fail)
+        self.active = 0
+        self.peak = 0
+        self.threads = set()
+        self.lock = threading.Lock()
+
+    def __call__(self, symbol, interval, limit):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.threads.add(threading.get_ident())
+        try:
+            time.sleep(self.delay)
+            if (symbol, interval) in self.fail:
+                raise ConnectionError("REST API request failed")
+            return [f"{symbol}-{interval}-{n}" for n in range(3)]
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+class TestKlineWeight:
+    @pytest.mark.parametrize(
+        "limit,weight", [(1, 1), (99, 1), (100, 2), (499, 2), (500, 5), (1000, 5), (1500, 10)]
+    )
+    def test_weight_table(self, limit, weight):
+        assert kline_request_weight(limit) == weight
+
+
+class TestWeightTrackerWindow:
+    def test_used_weight_expires_at_minute_boundary(self):
+        tracker = RequestWeightTracker()
+        tracker.update_from_headers({"X-MBX-USED-WEIGHT-1M": "1500"})
+        tracker.updated_at = 120.5
+
+        assert tracker.used_weight(now=179.9) == 1500
+        assert tracker.used_weight(now=180.0) == 0
+        assert tracker.seconds_until_reset(now=179.5) == pytest.approx(0.5)
+        assert RequestWeightTracker.seconds_until_reset(now=179.5) == pytest.approx(0.5)
+
+
+class TestBackfillScheduler:
+    @pytest.mark.asyncio
+    async def test_runs_concurrently_off_loop(self):
+        fetch = SlowFetch(delay=0.05)
+        scheduler = BackfillScheduler(fetch, max_workers=4)
+        results = {}
+
+        start = time.monotonic()
+        report = await scheduler.run(
+            _jobs(["A", "B", "C", "D"]), lambda job, candles: results.update({job: candles})
+        )
+        elapsed = time.monotonic() - start
+
+        assert len(report.succeeded) == len(results) == 8
+        assert fetch.peak == 4
+        assert threading.get_ident() not in fetch.threads
+        assert elapsed < 8 * 0.05
+
+    @pytest.mark.asyncio
+    async def test_results_stream_on_loop_thread(self):
+        fetch = SlowFetch(delay=0.01)
+        scheduler = BackfillScheduler(fetch, max_workers=1)
+        loop_thread = threading.get_ident()
+        order = []
+
+        def on_result(job, candles):
+            assert threading.get_ident() == loop_thread
+            order.append((job.symbol, fetch.active))
+
+        await scheduler.run(_jobs(["A", "B"], intervals=("5m",)), on_result)
+
+        # With one worker each result is applied before the next fetch runs
+        assert order == [("A", 0), ("B", 0)]
+
+    @pytest.mark.asyncio
+    async def test_failures_are_reported_not_raised(self):
+        fetch = SlowFetch(delay=0.0, fail={("B", "1h")})
+        scheduler = BackfillScheduler(fetch, max_workers=2)
+
+        def on_result(job, candles):
+            if job.symbol == "C":
+                raise ValueError("bad buffer")
+
+        report = await scheduler.run(_jobs(["A", "B", "C"]), on_result)
+
+        assert len(report.succeeded) == 3
+        assert set(report.failed) == {
+            BackfillJob("B", "1h", 100),
+            BackfillJob("C", "5m", 100),
+            BackfillJob("C", "1h", 100),
+        }
+
+    @pytest.mark.asyncio
+    async def test_waits_for_window_reset_when_budget_exhausted(self):
+        t0 = time.monotonic()
+        tracker = RequestWeightTracker()
+        tracker.current_weight = 1918
+        tracker.updated_at = 59.9
+
+        # Wall clock starts 0.1s before the minute boundary
+        def clock():
+            return 59.9 + (time.monotonic() - t0)
+
+        fetch = SlowFetch(delay=0.0)
+        scheduler = BackfillScheduler(fetch, weight_tracker=tracker, max_workers=4, clock=clock)
+        assert scheduler.budget == 1920
+
+        report = await scheduler.run(_jobs(["A"], intervals=("5m",), limit=500), lambda *_: None)
+
+        assert report.succeeded == [BackfillJob("A", "5m", 500)]
+        assert report.throttled_seconds == pytest.approx(0.1, abs=0.02)
+        assert time.monotonic() - t0 >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_counts_in_flight_weight(self):
+        tracker = RequestWeightTracker()
+        fetch = SlowFetch(delay=0.0)
+        scheduler = BackfillScheduler(fetch, weight_tracker=tracker, budget_ratio=0.5)
+
+        await scheduler.run(_jobs(["A", "B"], limit=1000), lambda *_: None)
+
+        # Responses without headers: all reserved weight is released again
+        assert scheduler._in_flight_weight == 0
+
+    @pytest.mark.asyncio
+    async def test_completed_requests_count_when_tracker_not_fed(self):
+        t0 = time.monotonic()
+        tracker = RequestWeightTracker()  # Responses carry no weight headers
+
+        def clock():
+            return 59.8 + (time.monotonic() - t0)
+
+        scheduler = BackfillScheduler(
+            SlowFetch(delay=0.0),
+            weight_tracker=tracker,
+            max_workers=1,
+            budget_ratio=0.005,
+            clock=clock,
+        )
+        assert scheduler.budget == 12
+
+        report = await scheduler.run(_jobs(["A", "B", "C"], ("5m",), limit=1000), lambda *_: None)
+
+        # 5 + 5 fit the budget of 12; the third request waits for the next window
+        assert len(report.succeeded) == 3
+        assert report.throttled_seconds == pytest.approx(0.2, abs=0.05)
+
+    @pytest.mark.asyncio
+    async def test_budget_follows_connector_limit_usage(self, monkeypatch):
+        t0 = time.monotonic()
+
+        def clock():
+            return 59.8 + (time.monotonic() - t0)
+
+        # Shape returned by UMFutures(show_limit_usage=True)
+        server_weight = 0
+
+        def klines(**kwargs):
+            nonlocal server_weight
+            server_weight += kline_request_weight(kwargs["limit"])
+            return {
+                "limit_usage": {"x-mbx-used-weight-1m": str(server_weight + 1191)},
+                "data": [kwargs["symbol"]],
+            }
+
+        with patch("src.core.binance_service.UMFutures", return_value=MagicMock()):
+            service = BinanceServiceClient(api_key="k", api_secret="s", is_testnet=True)
+        service.client.klines.side_effect = klines
+        monkeypatch.setattr("src.core.binance_service.time", SimpleNamespace(time=clock))
+
+        scheduler = BackfillScheduler(
+            lambda symbol, interval, limit: service.klines(
+                symbol=symbol, interval=interval, limit=limit
+            ),
+            weight_tracker=service.weight_tracker,
+            max_workers=1,
+            budget_ratio=0.5,
+            clock=clock,
+        )
+        results = []
+
+        report = await scheduler.run(
+            _jobs(["A", "B"], ("5m",), limit=1000), lambda job, data: results.extend(data)
+        )
+
+        # Other traffic already used 1191; after A (1196) B no longer fits 1200
+        assert results == ["A", "B"]
+        assert service.weight_tracker.current_weight == 1201
+        assert report.throttled_seconds == pytest.approx(0.2, abs=0.05)
+
+    def test_rejects_invalid_settings(self):
+        with pytest.raises(ValueError):
+            BackfillScheduler(SlowFetch(), max_workers=0)
+        with pytest.raises(ValueError):
+            BackfillScheduler(SlowFetch(), budget_ratio=0)
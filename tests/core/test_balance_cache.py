@@ -0,0 +1,223 @@
+"""Tests for the WebSocket-authoritative BalanceCache."""
+
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.core.balance_cache import SOURCE_REST, SOURCE_WEBSOCKET, BalanceCache
+from src.execution.base import AsyncExecutionGateway
+from src.execution.trade_coordinator import TradeCoordinator
+from src.models.event import Event, EventType
+from src.models.signal import Signal, SignalType
+
+
+class Clock:
+    """Controllable replacement for time.monotonic."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    clock = Clock()
+    with patch("src.core.balance_cache.time.monotonic", clock):
+        yield clock
+
+
+def _sync_gateway(balance=500.0):
+    gateway = MagicMock()
+    gateway.get_account_balance.return_value = balance
+    return gateway
+
+
+def _async_gateway(balance=500.0):
+    gateway = MagicMock(spec=AsyncExecutionGateway)
+    gateway.get_account_balance_async = AsyncMock(return_value=balance)
+    return gateway
+
+
+class TestBalanceCacheReads:
+    def test_empty_cache_returns_none(self, clock):
+        cache = BalanceCache(_sync_gateway())
+        assert cache.get() is None
+        assert cache.age is None
+
+    def test_websocket_update_served_until_max_age(self, clock):
+        cache = BalanceCache(_sync_gateway(), max_age=120.0, reconcile_after=60.0)
+        cache.update_from_websocket(1000.0)
+
+        clock.now += 119.0
+        assert cache.get() == 1000.0
+        assert cache.source == SOURCE_WEBSOCKET
+
+        clock.now += 1.0
+        assert cache.get() is None
+        assert cache.latest == 1000.0  # Still available for logging
+
+    def test_invalidate(self, clock):
+        cache = BalanceCache(_sync_gateway())
+        cache.update_from_websocket(1000.0)
+        cache.invalidate()
+        assert cache.get() is None
+
+    def test_reconcile_after_must_be_below_max_age(self):
+        with pytest.raises(ValueError):
+            BalanceCache(_sync_gateway(), max_age=60.0, reconcile_after=60.0)
+
+
+class TestBalanceCacheReconcile:
+    @pytest.mark.asyncio
+    async def test_reconcile_with_blocking_gateway(self, clock):
+        gateway = _sync_gateway(750.0)
+        cache = BalanceCache(gateway)
+
+        assert await cache.reconcile() is True
+        assert cache.get() == 750.0
+        assert cache.source == SOURCE_REST
+        gateway.get_account_balance.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_reconcile_with_async_gateway(self, clock):
+        gateway = _async_gateway(640.0)
+        cache = BalanceCache(gateway)
+
+        assert await cache.reconcile() is True
+        assert cache.get() == 640.0
+        gateway.get_account_balance_async.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_websocket_update_during_request_wins(self, clock):
+        cache = BalanceCache(MagicMock(spec=AsyncExecutionGateway))
+
+        async def slow_balance():
+            cache.update_from_websocket(999.0)  # Pushed while REST is in flight
+            return 500.0
+
+        cache._order_gateway.get_account_balance_async = slow_balance
+
+        assert await cache.reconcile() is False
+        assert cache.get() == 999.0
+        assert cache.source == SOURCE_WEBSOCKET
+
+    @pytest.mark.asyncio
+    async def test_failed_reconcile_keeps_previous_value(self, clock):
+        gateway = _sync_gateway()
+        gateway.get_account_balance.side_effect = RuntimeError("timeout")
+        cache = BalanceCache(gateway)
+        cache.update_from_websocket(1000.0)
+
+        assert await cache.reconcile() is False
+        assert cache.get() == 1000.0
+
+
+class TestBalanceCacheBackgroundLoop:
+    @pytest.mark.asyncio
+    async def test_loop_only_queries_rest_when_stream_is_silent(self):
+        gateway = _async_gateway(500.0)
+        cache = BalanceCache(gateway, max_age=0.2, reconcile_after=0.1)
+        cache.update_from_websocket(1000.0)
+
+        await cache.start()
+        try:
+            # Stream keeps pushing faster than reconcile_after: no REST calls
+            for _ in range(6):
+                await asyncio.sleep(0.03)
+                cache.update_from_websocket(1000.0)
+            assert gateway.get_account_balance_async.await_count == 0
+
+            # Stream goes silent: background reconciliation takes over
+            await asyncio.sleep(0.25)
+            assert gateway.get_account_balance_async.await_count >= 1
+            assert cache.get() == 500.0
+        finally:
+            await cache.stop()
+
+        assert cache._reconcile_task is None
+
+    @pytest.mark.asyncio
+    async def test_start_reconciles_empty_cache_immediately(self):
+        gateway = _async_gateway(321.0)
+        cache = BalanceCache(gateway)
+
+        await cache.start()
+        try:
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            assert cache.get() == 321.0
+        finally:
+            await cache.stop()
+        await cache.stop()  # Idempotent
+
+
+class TestTradeCoordinatorBalanceCache:
+    @staticmethod
+    def _coordinator(gateway, balance_cache):
+        risk_guard = MagicMock()
+        risk_guard.validate_risk.return_value = True
+        risk_guard.calculate_position_size.return_value = 0.01
+        position_cache = MagicMock()
+        position_cache.get_fresh_async = AsyncMock(return_value=None)
+        config_manager = MagicMock()
+        config_manager.trading_config.leverage = 10
+        return TradeCoordinator(
+            order_gateway=gateway,
+            risk_guard=risk_guard,
+            config_manager=config_manager,
+            audit_logger=MagicMock(),
+            position_cache_manager=position_cache,
+            balance_cache=balance_cache,
+        )
+
+    @staticmethod
+    def _entry_event():
+        signal = Signal(
+            signal_type=SignalType.LONG_ENTRY,
+            symbol="BTCUSDT",
+            entry_price=50000.0,
+            take_profit=52000.0,
+            stop_loss=49000.0,
+            strategy_name="test",
+            timestamp=datetime.now(timezone.utc),
+        )
+        return Event(EventType.SIGNAL_GENERATED, signal)
+
+    @staticmethod
+    def _gateway():
+        gateway = MagicMock()
+        gateway.get_open_orders.return_value = []
+        gateway.get_account_balance.return_value = 100.0
+        gateway.execute_signal.return_value = (MagicMock(), [])
+        return gateway
+
+    @pytest.mark.asyncio
+    async def test_fresh_cache_skips_rest_balance_query(self, clock):
+        gateway = self._gateway()
+        cache = BalanceCache(gateway)
+        cache.update_from_websocket(2500.0)
+        coordinator = self._coordinator(gateway, cache)
+
+        await coordinator.on_signal_generated(self._entry_event())
+
+        gateway.get_account_balance.assert_not_called()
+        kwargs = coordinator._risk_guard.calculate_position_size.call_args.kwargs
+        assert kwargs["account_balance"] == 2500.0
+
+    @pytest.mark.asyncio
+    async def test_stale_cache_falls_back_to_rest(self, clock):
+        gateway = self._gateway()
+        cache = BalanceCache(gateway, max_age=120.0, reconcile_after=60.0)
+        cache.update_from_websocket(2500.0)
+        clock.now += 121.0
+        coordinator = self._coordinator(gateway, cache)
+
+        await coordinator.on_signal_generated(self._entry_event())
+
+        gateway.get_account_balance.assert_called_once()
+        kwargs = coordinator._risk_guard.calculate_position_size.call_args.kwargs
+        assert kwargs["account_balance"] == 100.0
@@ -0,0 +1,128 @@
+"""Tests for per-stream intra-candle update throttling."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from src.core import public_market_streamer
+from src.core.candle_update_filter import CandleUpdateFilter, CandleUpdatePolicy, UpdateMode
+from src.core.public_market_streamer import PublicMarketStreamer
+
+
+def _kline(close, closed=False, symbol="BTCUSDT", interval="1m"):
+    return {
+        "s": symbol,
+        "i": interval,
+        "t": 1638747600000,
+        "T": 1638747659999,
+        "o": "100.0",
+        "h": "200.0",
+        "l": "50.0",
+        "c": str(close),
+        "v": "1.0",
+        "x": closed,
+    }
+
+
+class TestCandleUpdatePolicy:
+    def test_from_dict(self):
+        policy = CandleUpdatePolicy.from_dict({"mode": "throttle", "min_interval_ms": 500})
+        assert policy == CandleUpdatePolicy(UpdateMode.THROTTLE, min_interval_ms=500)
+
+    @pytest.mark.parametrize(
+        "data", [{"mode": "throttle"}, {"mode": "price_change"}, {"mode": "sometimes"}]
+    )
+    def test_rejects_incomplete_policies(self, data):
+        with pytest.raises(ValueError):
+            CandleUpdatePolicy.from_dict(data)
+
+
+class TestCandleUpdateFilter:
+    def test_closed_only(self):
+        gate = CandleUpdateFilter(CandleUpdatePolicy(UpdateMode.CLOSED_ONLY))
+
+        assert gate.admit(_kline(100)) is False
+        assert gate.admit(_kline(101)) is False
+        assert gate.admit(_kline(102, closed=True)) is True
+        assert gate.suppressed == 2
+
+    def test_throttle_uses_event_time(self):
+        gate = CandleUpdateFilter(CandleUpdatePolicy(UpdateMode.THROTTLE, min_interval_ms=1000))
+
+        emitted = [gate.admit(_kline(100), event_time_ms=t) for t in (0, 250, 999, 1000, 1500)]
+
+        assert emitted == [True, False, False, True, False]
+
+    def test_price_change_in_bps(self):
+        gate = CandleUpdateFilter(CandleUpdatePolicy(UpdateMode.PRICE_CHANGE, min_change_bps=10))
+
+        # 10 bps of 100.0 is 0.1
+        closes = [100.0, 100.05, 100.2, 100.25, 100.0]
+        assert [gate.admit(_kline(c)) for c in closes] == [True, False, True, False, True]
+
+    def test_closed_candle_resets_reference(self):
+        gate = CandleUpdateFilter(CandleUpdatePolicy(UpdateMode.PRICE_CHANGE, min_change_bps=10))
+
+        gate.admit(_kline(100.0))
+        assert gate.admit(_kline(100.5, closed=True)) is True
+        assert gate.admit(_kline(100.52)) is False  # Measured from the closed candle
+
+    def test_overrides_per_symbol_and_interval(self):
+        gate = CandleUpdateFilter.from_config(
+            {
+                "mode": "closed_only",
+                "overrides": {
+                    "btcusdt": {"mode": "all"},
+                    "BTCUSDT@5m": {"mode": "throttle", "min_interval_ms": 100},
+                },
+            }
+        )
+
+        assert gate.policy_for("ETHUSDT", "1m").mode == UpdateMode.CLOSED_ONLY
+        assert gate.policy_for("BTCUSDT", "1m").mode == UpdateMode.ALL
+        assert gate.policy_for("BTCUSDT", "5m").mode == UpdateMode.THROTTLE
+        assert gate.passes_everything is False
+        assert CandleUpdateFilter.from_config({}).passes_everything is True
+
+
+class TestStreamerEdgeFiltering:
+    def test_suppressed_updates_never_become_candles(self, monkeypatch):
+        callback = Mock()
+        streamer = PublicMarketStreamer(
+            symbols=["BTCUSDT", "ETHUSDT"],
+            intervals=["1m"],
+            on_candle_callback=callback,
+            update_filter=CandleUpdateFilter(
+                CandleUpdatePolicy(UpdateMode.CLOSED_ONLY),
+                {"ETHUSDT": CandleUpdatePolicy()},
+            ),
+        )
+        built = []
+        original = public_market_streamer.kline_to_candle
+
+        def recording_kline_to_candle(kline):
+            built.append(kline["s"])
+            return original(kline)
+
+        monkeypatch.setattr(public_market_streamer, "kline_to_candle", recording_kline_to_candle)
+
+        for symbol in ("BTCUSDT", "ETHUSDT"):
+            streamer._handle_kline_message(
+                None,
+                {
+                    "stream": f"{symbol.lower()}@kline_1m",
+                    "data": {"e": "kline", "E": 1, "k": _kline(100, symbol=symbol)},
+                },
+            )
+        streamer._handle_kline_message(None, {"e": "kline", "k": _kline(100, closed=True)})
+
+        assert built == ["ETHUSDT", "BTCUSDT"]
+        assert callback.call_count == 2
+        assert streamer.suppressed_updates == 1
+
+    def test_pass_through_filter_is_skipped(self):
+        streamer = PublicMarketStreamer(
+            symbols=["BTCUSDT"], intervals=["1m"], update_filter=CandleUpdateFilter()
+        )
+        assert streamer._update_filter is None
+        assert streamer.suppressed_updates == 0
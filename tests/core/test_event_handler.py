@@ -10,8 +10,13 @@ import threading
 
 import pytest
 
-from src.core.event_bus import EventBus
+from src.core.event_bus import ConflatingQueue, EventBus, order_independent
 from src.models.event import Event, EventType, QueueType
+from src.monitoring.aggregator import MetricsAggregator
+from src.monitoring.event_ids import EventID
+from src.monitoring.metrics_collector import MetricsCollector
+from src.monitoring.ring_buffer import MetricType
+from src.monitoring.stats import MetricsStats
 
 
 @pytest.fixture
@@ -21,7 +26,7 @@ async def event_bus_with_queues():
     # Initialize queues directly (mimics what start() does)
     # Must be async to create queues in the test's event loop
     bus._queues = {
-        QueueType.CANDLE_UPDATE: asyncio.Queue(maxsize=1000),
+        QueueType.CANDLE_UPDATE: ConflatingQueue(maxsize=1000),
         QueueType.CANDLE_CLOSED: asyncio.Queue(maxsize=100),
         QueueType.SIGNAL: asyncio.Queue(maxsize=100),
         QueueType.ORDER: asyncio.Queue(maxsize=50),
@@ -263,15 +268,13 @@ class TestEventBusQueues:
         assert stats[QueueType.SIGNAL]["size"] == 0
         assert stats[QueueType.ORDER]["size"] == 0
 
-        # No drops initially
-        assert stats[QueueType.CANDLE_UPDATE]["drops"] == 0
-        assert stats[QueueType.CANDLE_CLOSED]["drops"] == 0
-        assert stats[QueueType.SIGNAL]["drops"] == 0
-        assert stats[QueueType.ORDER]["drops"] == 0
+        # Nothing conflated initially; only CANDLE_UPDATE conflates
+        assert stats[QueueType.CANDLE_UPDATE]["conflated"] == 0
+        assert "conflated" not in stats[QueueType.SIGNAL]
 
     @pytest.mark.asyncio
-    async def test_candle_update_queue_drops_events_when_full(self, event_bus_with_queues):
-        """Verify candle update queue drops events after timeout when full."""
+    async def test_candle_update_queue_evicts_oldest_when_full(self, event_bus_with_queues):
+        """Verify a full candle update queue evicts the oldest event without waiting."""
         bus = event_bus_with_queues
 
         # Fill candle update queue to capacity (1000 events)
@@ -283,19 +286,20 @@ class TestEventBusQueues:
         stats = bus.get_queue_stats()
         assert stats[QueueType.CANDLE_UPDATE]["size"] == 1000
 
-        # Attempt to publish one more (should drop due to timeout)
+        # Publish one more: must not wait for the put timeout
         overflow_event = Event(EventType.CANDLE_UPDATE, {"id": 1000}, source="test")
+        await asyncio.wait_for(
+            bus.publish(overflow_event, queue_type=QueueType.CANDLE_UPDATE), timeout=0.1
+        )
 
-        # Should not raise exception (drops gracefully)
-        await bus.publish(overflow_event, queue_type=QueueType.CANDLE_UPDATE)
-
-        # Verify drop was counted
+        # Oldest event evicted and counted once
         stats_after = bus.get_queue_stats()
-        assert stats_after[QueueType.CANDLE_UPDATE]["drops"] == 1
-
-        # Queue still at capacity (event was dropped, not added)
+        assert stats_after[QueueType.CANDLE_UPDATE]["conflated"] == 1
         assert stats_after[QueueType.CANDLE_UPDATE]["size"] == 1000
 
+        queue = bus._queues[QueueType.CANDLE_UPDATE]
+        assert queue.get_nowait().data == {"id": 1}
+
     @pytest.mark.asyncio
     async def test_signal_queue_raises_timeout_when_full(self, event_bus_with_queues):
         """Verify signal queue raises TimeoutError when full (no drops)."""
@@ -318,9 +322,9 @@ class TestEventBusQueues:
         with pytest.raises(asyncio.TimeoutError):
             await bus.publish(overflow_event, queue_type=QueueType.SIGNAL)
 
-        # Verify no drops (signal queue never drops)
+        # Verify nothing was discarded (signal queue never drops)
         stats_after = bus.get_queue_stats()
-        assert stats_after[QueueType.SIGNAL]["drops"] == 0
+        assert stats_after[QueueType.SIGNAL]["size"] == 100
 
     @pytest.mark.asyncio
     async def test_order_queue_blocks_indefinitely_when_full(self, event_bus_with_queues):
@@ -348,9 +352,9 @@ class TestEventBusQueues:
                 timeout=0.5,  # Short timeout to verify blocking
             )
 
-        # Verify no drops (order queue NEVER drops)
+        # Verify nothing was discarded (order queue NEVER drops)
         stats_after = bus.get_queue_stats()
-        assert stats_after[QueueType.ORDER]["drops"] == 0
+        assert stats_after[QueueType.ORDER]["size"] == 50
 
     @pytest.mark.asyncio
     async def test_publish_raises_valueerror_for_invalid_queue(self, event_bus_with_queues):
@@ -383,7 +387,7 @@ class TestEventBusQueues:
         # Verify stats updated
         stats_after = bus.get_queue_stats()
         assert stats_after[QueueType.CANDLE_UPDATE]["size"] == 10
-        assert stats_after[QueueType.CANDLE_UPDATE]["drops"] == 0
+        assert stats_after[QueueType.CANDLE_UPDATE]["conflated"] == 0
 
         # Publish 5 to signal, 2 to order
         for i in range(5):
@@ -591,6 +595,63 @@ class TestEventBusProcessors:
         # Verify sequential execution (1 completes before 2 starts)
         assert execution_order == ["start_1", "end_1", "start_2", "end_2"]
 
+    @pytest.mark.asyncio
+    async def test_idle_processor_parks_and_wakes_on_stop(self, event_bus_with_queues):
+        """Idle processor blocks on the queue and exits as soon as _running clears."""
+        bus = event_bus_with_queues
+        bus._running = True
+        queue = bus._queues[QueueType.CANDLE_UPDATE]
+
+        processor_task = asyncio.create_task(bus._process_queue(QueueType.CANDLE_UPDATE))
+        await asyncio.sleep(0.01)
+        assert QueueType.CANDLE_UPDATE in bus._idle_queues
+
+        bus._running = False
+        await asyncio.wait_for(processor_task, timeout=0.05)
+
+        # Wake sentinel consumed and accounted for
+        assert queue.qsize() == 0
+        await asyncio.wait_for(queue.join(), timeout=0.05)
+
+    @pytest.mark.asyncio
+    async def test_stop_without_processors_leaves_queues_untouched(self, event_bus_with_queues):
+        """Clearing _running only wakes processors that are actually parked."""
+        bus = event_bus_with_queues
+        bus._running = True
+        bus.stop()
+
+        assert all(queue.qsize() == 0 for queue in bus._queues.values())
+
+    @pytest.mark.asyncio
+    async def test_burst_drained_in_micro_batches(self, event_bus_with_queues):
+        """Bursts are drained back-to-back, yielding between full batches."""
+        bus = event_bus_with_queues
+        bus._shard_lanes = 1  # Sequential processors only
+        bus._running = True
+        order = []
+
+        bus.subscribe(EventType.CANDLE_UPDATE, lambda e: order.append("update"))
+        bus.subscribe(EventType.CANDLE_CLOSED, lambda e: order.append("closed"))
+
+        burst = bus._MAX_BATCH + 10  # fits CANDLE_CLOSED maxsize
+        for i in range(burst):
+            await bus.publish(Event(EventType.CANDLE_UPDATE, i), QueueType.CANDLE_UPDATE)
+            await bus.publish(Event(EventType.CANDLE_CLOSED, i), QueueType.CANDLE_CLOSED)
+
+        tasks = [
+            asyncio.create_task(bus._process_queue(QueueType.CANDLE_UPDATE)),
+            asyncio.create_task(bus._process_queue(QueueType.CANDLE_CLOSED)),
+        ]
+        await asyncio.wait_for(bus._queues[QueueType.CANDLE_UPDATE].join(), timeout=1.0)
+        await asyncio.wait_for(bus._queues[QueueType.CANDLE_CLOSED].join(), timeout=1.0)
+        bus._running = False
+        await asyncio.gather(*tasks)
+
+        assert order.count("update") == order.count("closed") == burst
+        # First processor handled exactly one batch before the second got a turn
+        assert order[: bus._MAX_BATCH] == ["update"] * bus._MAX_BATCH
+        assert order[bus._MAX_BATCH] == "closed"
+
 
 class TestEventBusLifecycle:
     """Test suite for Subtask 4.4: Lifecycle management with start/stop/shutdown."""
@@ -779,3 +840,471 @@ class TestEventBusLifecycle:
         stats = bus.get_queue_stats()
         assert stats[QueueType.CANDLE_UPDATE]["size"] == 0
         assert stats[QueueType.SIGNAL]["size"] == 0
+
+
+class TestEventBusShardedLanes:
+    """Per-symbol lanes for CANDLE_CLOSED and SIGNAL."""
+
+    @staticmethod
+    def _symbols_on_distinct_lanes(bus, count):
+        symbols, lanes = [], set()
+        for i in range(100):
+            symbol = f"SYM{i}USDT"
+            lane = bus._lane_for(Event(EventType.CANDLE_CLOSED, {"symbol": symbol}))
+            if lane not in lanes:
+                lanes.add(lane)
+                symbols.append(symbol)
+            if len(symbols) == count:
+                return symbols
+        raise AssertionError("could not find symbols on distinct lanes")
+
+    @pytest.mark.asyncio
+    async def test_symbols_run_concurrently_in_order(self, event_bus_with_queues):
+        bus = event_bus_with_queues
+        bus._running = True
+        symbols = self._symbols_on_distinct_lanes(bus, 4)
+        seen = {symbol: [] for symbol in symbols}
+        active = [0, 0]  # current, peak
+
+        async def handler(event):
+            active[0] += 1
+            active[1] = max(active[1], active[0])
+            await asyncio.sleep(0.01)
+            seen[event.data["symbol"]].append(event.data["seq"])
+            active[0] -= 1
+
+        bus.subscribe(EventType.CANDLE_CLOSED, handler)
+        for seq in range(3):
+            for symbol in symbols:
+                await bus.publish(
+                    Event(EventType.CANDLE_CLOSED, {"symbol": symbol, "seq": seq}),
+                    QueueType.CANDLE_CLOSED,
+                )
+
+        processor = asyncio.create_task(bus._process_queue(QueueType.CANDLE_CLOSED))
+        await asyncio.wait_for(bus._queues[QueueType.CANDLE_CLOSED].join(), timeout=0.2)
+        bus._running = False
+        await processor
+
+        assert all(order == [0, 1, 2] for order in seen.values())
+        assert active[1] == 4
+
+    @pytest.mark.asyncio
+    async def test_same_symbol_never_overlaps(self, event_bus_with_queues):
+        bus = event_bus_with_queues
+        bus._running = True
+        log = []
+
+        async def handler(event):
+            log.append(("start", event.data.symbol))
+            await asyncio.sleep(0.005)
+            log.append(("end", event.data.symbol))
+
+        class _Signal:
+            def __init__(self, symbol):
+                self.symbol = symbol
+
+        bus.subscribe(EventType.SIGNAL_GENERATED, handler)
+        for _ in range(3):
+            await bus.publish(
+                Event(EventType.SIGNAL_GENERATED, _Signal("BTCUSDT")), QueueType.SIGNAL
+            )
+
+        processor = asyncio.create_task(bus._process_queue(QueueType.SIGNAL))
+        await asyncio.wait_for(bus._queues[QueueType.SIGNAL].join(), timeout=0.2)
+        bus._running = False
+        await processor
+
+        assert log == [("start", "BTCUSDT"), ("end", "BTCUSDT")] * 3
+
+    @pytest.mark.asyncio
+    async def test_stats_report_lane_depth_and_lag(self, event_bus_with_queues):
+        bus = event_bus_with_queues
+        bus._running = True
+        release = asyncio.Event()
+
+        async def blocking_handler(event):
+            await release.wait()
+
+        bus.subscribe(EventType.CANDLE_CLOSED, blocking_handler)
+        for _ in range(3):
+            await bus.publish(
+                Event(EventType.CANDLE_CLOSED, {"symbol": "BTCUSDT"}), QueueType.CANDLE_CLOSED
+            )
+
+        processor = asyncio.create_task(bus._process_queue(QueueType.CANDLE_CLOSED))
+        await asyncio.sleep(0.02)
+
+        lanes = bus.get_queue_stats()[QueueType.CANDLE_CLOSED]["lanes"]
+        busy = lanes[bus._lane_for(Event(EventType.CANDLE_CLOSED, {"symbol": "BTCUSDT"}))]
+        assert len(lanes) == 4
+        assert busy["depth"] == 2  # one in the handler, two waiting
+        assert busy["lag"] >= 0.01
+        assert "lanes" not in bus.get_queue_stats()[QueueType.CANDLE_UPDATE]
+
+        release.set()
+        await asyncio.wait_for(bus._queues[QueueType.CANDLE_CLOSED].join(), timeout=0.2)
+        bus._running = False
+        await processor
+        assert "lanes" not in bus.get_queue_stats()[QueueType.CANDLE_CLOSED]
+
+    @pytest.mark.asyncio
+    async def test_shutdown_drains_lanes(self):
+        bus = EventBus(shard_lanes=3)
+        handled = []
+
+        async def handler(event):
+            await asyncio.sleep(0.001)
+            handled.append(event.data["symbol"])
+
+        bus.subscribe(EventType.SIGNAL_GENERATED, handler)
+        start_task = asyncio.create_task(bus.start())
+        await asyncio.sleep(0.01)
+
+        for symbol in ["BTCUSDT", "ETHUSDT", "SOLUSDT", "XRPUSDT"] * 5:
+            await bus.publish(
+                Event(EventType.SIGNAL_GENERATED, {"symbol": symbol}), QueueType.SIGNAL
+            )
+
+        await bus.shutdown(timeout=2.0)
+        await start_task
+
+        assert len(handled) == 20
+
+    def test_single_lane_disables_sharding(self):
+        assert EventBus(shard_lanes=1)._shard_lanes == 1
+        with pytest.raises(ValueError):
+            EventBus(shard_lanes=0)
+
+
+class _Tick:
+    """Minimal candle-like payload with a stream key."""
+
+    def __init__(self, symbol, interval, price):
+        self.symbol = symbol
+        self.interval = interval
+        self.price = price
+
+
+class TestConflatingQueue:
+    """CANDLE_UPDATE keeps only the newest pending tick per (symbol, interval)."""
+
+    @pytest.mark.asyncio
+    async def test_latest_tick_per_stream_in_arrival_order(self):
+        queue = ConflatingQueue(maxsize=1000)
+        for price in range(5):
+            queue.put_nowait(Event(EventType.CANDLE_UPDATE, _Tick("BTCUSDT", "1m", price)))
+            queue.put_nowait(Event(EventType.CANDLE_UPDATE, _Tick("ETHUSDT", "1m", price)))
+        queue.put_nowait(Event(EventType.CANDLE_UPDATE, _Tick("BTCUSDT", "5m", 99)))
+
+        assert queue.qsize() == 3
+        assert queue.conflated_count == 8
+
+        drained = [queue.get_nowait().data for _ in range(3)]
+        assert [(t.symbol, t.interval, t.price) for t in drained] == [
+            ("BTCUSDT", "1m", 4),
+            ("ETHUSDT", "1m", 4),
+            ("BTCUSDT", "5m", 99),
+        ]
+
+        # join() counts each pending stream once
+        for _ in range(3):
+            queue.task_done()
+        await asyncio.wait_for(queue.join(), timeout=0.1)
+
+    @pytest.mark.asyncio
+    async def test_unkeyed_events_and_event_types_not_conflated(self):
+        queue = ConflatingQueue(maxsize=1000)
+        queue.put_nowait(Event(EventType.CANDLE_UPDATE, {"id": 1}))
+        queue.put_nowait(Event(EventType.CANDLE_UPDATE, {"id": 2}))
+        queue.put_nowait(Event(EventType.CANDLE_UPDATE, _Tick("BTCUSDT", "1m", 1)))
+        queue.put_nowait(Event(EventType.CANDLE_CLOSED, _Tick("BTCUSDT", "1m", 2)))
+
+        assert queue.qsize() == 4
+        assert queue.conflated_count == 0
+        assert [queue.get_nowait().data for _ in range(2)] == [{"id": 1}, {"id": 2}]
+
+    @pytest.mark.asyncio
+    async def test_put_never_blocks_when_full(self):
+        queue = ConflatingQueue(maxsize=2)
+        await queue.put(Event(EventType.CANDLE_UPDATE, _Tick("BTCUSDT", "1m", 1)))
+        await queue.put(Event(EventType.CANDLE_UPDATE, _Tick("ETHUSDT", "1m", 1)))
+
+        # Pending stream: replaced in place
+        await asyncio.wait_for(
+            queue.put(Event(EventType.CANDLE_UPDATE, _Tick("BTCUSDT", "1m", 2))), timeout=0.1
+        )
+        # New stream: evicts the oldest pending stream
+        await asyncio.wait_for(
+            queue.put(Event(EventType.CANDLE_UPDATE, _Tick("SOLUSDT", "1m", 1))), timeout=0.1
+        )
+
+        assert queue.qsize() == 2
+        assert queue.conflated_count == 2
+        drained = [queue.get_nowait().data for _ in range(2)]
+        assert [(t.symbol, t.price) for t in drained] == [("ETHUSDT", 1), ("SOLUSDT", 1)]
+
+        # join() still balances after replace and evict
+        for _ in range(2):
+            queue.task_done()
+        await asyncio.wait_for(queue.join(), timeout=0.1)
+
+    @pytest.mark.asyncio
+    async def test_bus_reports_conflated_count(self):
+        bus = EventBus()
+        handled = []
+        bus.subscribe(EventType.CANDLE_UPDATE, lambda e: handled.append(e.data.price))
+
+        start_task = asyncio.create_task(bus.start())
+        await asyncio.sleep(0)  # Queues created; processors not yet running
+
+        for price in range(10):
+            await bus.publish(
+                Event(EventType.CANDLE_UPDATE, _Tick("BTCUSDT", "1m", price)),
+                QueueType.CANDLE_UPDATE,
+            )
+        stats = bus.get_queue_stats()[QueueType.CANDLE_UPDATE]
+
+        await bus.shutdown(timeout=1.0)
+        await start_task
+
+        assert stats["size"] == 1
+        assert stats["conflated"] == 9
+        assert "drops" not in stats
+        assert handled == [9]
+
+
+class TestEventBusDispatchTables:
+    """Tests for precompiled per-EventType handler tables."""
+
+    def test_table_rebuilt_on_subscribe_and_unsubscribe(self):
+        bus = EventBus()
+
+        async def async_handler(event):
+            pass
+
+        def sync_handler(event):
+            pass
+
+        bus.subscribe(EventType.CANDLE_CLOSED, async_handler)
+        bus.subscribe(EventType.CANDLE_CLOSED, sync_handler)
+        table = bus._dispatch_tables[EventType.CANDLE_CLOSED]
+
+        assert [(r.callable, r.is_async, r.name) for r in table.ordered] == [
+            (async_handler, True, "async_handler"),
+            (sync_handler, False, "sync_handler"),
+        ]
+        assert table.concurrent == ()
+
+        assert bus.unsubscribe(EventType.CANDLE_CLOSED, async_handler) is True
+        assert bus.unsubscribe(EventType.CANDLE_CLOSED, async_handler) is False
+        assert bus.unsubscribe(EventType.SIGNAL_GENERATED, sync_handler) is False
+        assert [r.callable for r in bus._dispatch_tables[EventType.CANDLE_CLOSED].ordered] == [
+            sync_handler
+        ]
+        assert bus._get_handlers(EventType.CANDLE_CLOSED) == [sync_handler]
+
+    def test_order_independent_requires_async(self):
+        bus = EventBus()
+
+        @order_independent
+        def sync_marked(event):
+            pass
+
+        @order_independent
+        async def async_marked(event):
+            pass
+
+        bus.subscribe(EventType.CANDLE_CLOSED, sync_marked)
+        bus.subscribe(EventType.CANDLE_CLOSED, async_marked)
+        table = bus._dispatch_tables[EventType.CANDLE_CLOSED]
+
+        # Sync handlers cannot overlap; they stay in the ordered chain
+        assert [r.callable for r in table.ordered] == [sync_marked]
+        assert [r.callable for r in table.concurrent] == [async_marked]
+
+    @pytest.mark.asyncio
+    async def test_ordered_handlers_keep_subscription_order(self):
+        bus = EventBus()
+        calls = []
+
+        async def first(event):
+            await asyncio.sleep(0.01)
+            calls.append("first")
+
+        def second(event):
+            calls.append("second")
+
+        async def third(event):
+            calls.append("third")
+
+        for handler in (first, second, third):
+            bus.subscribe(EventType.CANDLE_CLOSED, handler)
+
+        await bus._dispatch(Event(EventType.CANDLE_CLOSED, {}), QueueType.CANDLE_CLOSED)
+
+        assert calls == ["first", "second", "third"]
+
+    @pytest.mark.asyncio
+    async def test_order_independent_handlers_overlap(self):
+        bus = EventBus()
+        calls = []
+
+        async def ordered(event):
+            calls.append("ordered:start")
+            await asyncio.sleep(0.02)
+            calls.append("ordered:end")
+
+        @order_independent
+        async def audit(event):
+            calls.append("audit:start")
+            await asyncio.sleep(0.02)
+            calls.append("audit:end")
+
+        bus.subscribe(EventType.CANDLE_CLOSED, ordered)
+        bus.subscribe(EventType.CANDLE_CLOSED, audit)
+
+        await bus._dispatch(Event(EventType.CANDLE_CLOSED, {}), QueueType.CANDLE_CLOSED)
+
+        # Both started before either finished
+        assert calls[:2] == ["ordered:start", "audit:start"]
+        assert set(calls[2:]) == {"ordered:end", "audit:end"}
+
+    @pytest.mark.asyncio
+    async def test_order_independent_errors_are_isolated(self, caplog):
+        bus = EventBus()
+        handled = []
+
+        @order_independent
+        async def broken(event):
+            raise RuntimeError("audit down")
+
+        async def ordered(event):
+            handled.append(event.data)
+
+        bus.subscribe(EventType.CANDLE_CLOSED, broken)
+        bus.subscribe(EventType.CANDLE_CLOSED, ordered)
+
+        await bus._dispatch(Event(EventType.CANDLE_CLOSED, "x"), QueueType.CANDLE_CLOSED)
+
+        assert handled == ["x"]
+        assert "Handler 'broken' failed" in caplog.text
+
+
+class TestEventBusMetrics:
+    """Tests for queue-wait, handler-latency and backlog instrumentation."""
+
+    @pytest.fixture
+    def collector(self):
+        collector = MetricsCollector()
+        collector.set_enabled(True)
+        collector.set_sampling_rate(1.0)
+        buffer = collector.get_buffer()
+        buffer.read_batch(buffer.BUFFER_SIZE)  # Discard entries from other tests
+        return collector
+
+    @staticmethod
+    def _aggregate(collector):
+        """Run the recorded entries through a fresh aggregator."""
+        buffer = collector.get_buffer()
+        entries = buffer.read_batch(buffer.BUFFER_SIZE)
+        stats = MetricsStats()
+        aggregator = MetricsAggregator(buffer, stats, collector._label_names)
+        aggregator._process_batch(entries)
+        aggregator._update_statistics()
+        return entries, stats.get_all_stats(window_seconds=60)
+
+    @pytest.mark.asyncio
+    async def test_queue_wait_and_handler_latency_per_label(self, collector):
+        bus = EventBus(metrics=collector, backlog_sample_interval=0)
+
+        async def slow_strategy(event):
+            await asyncio.sleep(0.02)
+
+        def fast_audit(event):
+            pass
+
+        bus.subscribe(EventType.SIGNAL_GENERATED, slow_strategy)
+        bus.subscribe(EventType.SIGNAL_GENERATED, fast_audit)
+
+        start_task = asyncio.create_task(bus.start())
+        await asyncio.sleep(0)
+        for _ in range(3):
+            await bus.publish(
+                Event(EventType.SIGNAL_GENERATED, {"symbol": "BTCUSDT"}), QueueType.SIGNAL
+            )
+        await bus.shutdown(timeout=1.0)
+        await start_task
+
+        entries, all_stats = self._aggregate(collector)
+        assert {e.metric_type for e in entries} == {MetricType.SAMPLE}
+
+        # Same-symbol events queue behind the slow handler: the last waits ~2 runs
+        wait = all_stats[EventID.EVENT_BUS_PUBLISH]
+        assert set(wait.labels) == {"queue:signal"}
+        assert wait.count == 3
+        assert wait.max >= 30_000_000
+
+        # Handler labels use the qualified name
+        handle = {
+            name.rsplit(".", 1)[-1]: stats
+            for name, stats in all_stats[EventID.EVENT_BUS_HANDLE].labels.items()
+        }
+        strategy, audit = handle["slow_strategy"], handle["fast_audit"]
+        assert strategy.count == audit.count == 3
+        assert strategy.p50 >= 20_000_000
+        assert audit.p99 < strategy.p50
+
+    @pytest.mark.asyncio
+    async def test_publish_stamps_enqueue_time(self, event_bus_with_queues):
+        event = Event(EventType.CANDLE_CLOSED, {})
+        assert event.enqueued_at_ns == 0
+
+        await event_bus_with_queues.publish(event, QueueType.CANDLE_CLOSED)
+
+        assert event.enqueued_at_ns > 0
+        assert event == Event(EventType.CANDLE_CLOSED, {}, timestamp=event.timestamp)
+
+    @pytest.mark.asyncio
+    async def test_backlog_sampled_per_queue(self, collector, event_bus_with_queues):
+        bus = event_bus_with_queues
+        for _ in range(5):
+            await bus.publish(Event(EventType.CANDLE_CLOSED, {}), QueueType.CANDLE_CLOSED)
+
+        bus._record_backlog()
+        _, all_stats = self._aggregate(collector)
+
+        backlog = all_stats[EventID.QUEUE_BACKLOG]
+        assert backlog.labels["queue:candle_closed"].max == 5
+        assert backlog.labels["queue:order"].max == 0
+        assert backlog.to_dict()["labels"]["queue:candle_closed"]["p50"] == 5
+
+    @pytest.mark.asyncio
+    async def test_sampler_runs_only_while_started(self, collector):
+        bus = EventBus(metrics=collector, backlog_sample_interval=0.01)
+
+        start_task = asyncio.create_task(bus.start())
+        await asyncio.sleep(0.05)
+        bus.stop()
+        await start_task
+
+        entries, _ = self._aggregate(collector)
+        samples = [e for e in entries if e.event_id == EventID.QUEUE_BACKLOG]
+        assert len(samples) >= 4 * 2  # Four queues, several rounds
+        assert len(samples) % 4 == 0
+        assert all(task.get_name() != "backlog_sampler" for task in asyncio.all_tasks())
+
+    @pytest.mark.asyncio
+    async def test_disabled_collector_records_nothing(self, collector, event_bus_with_queues):
+        bus = event_bus_with_queues
+        bus.subscribe(EventType.CANDLE_CLOSED, lambda e: None)
+        collector.set_enabled(False)
+        try:
+            await bus._dispatch(
+                Event(EventType.CANDLE_CLOSED, {}, enqueued_at_ns=1), QueueType.CANDLE_CLOSED
+            )
+            bus._record_backlog()
+        finally:
+            collector.set_enabled(True)
+
+        assert collector.get_buffer().get_available_count() == 0
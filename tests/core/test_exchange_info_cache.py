@@ -0,0 +1,218 @@
+"""Tests for the persistent, precompiled ExchangeInfoCache."""
+
+import asyncio
+import json
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.core.exchange_info_cache import ExchangeInfoCache, SymbolQuantizer, precision_of
+from src.execution.order_gateway import OrderGateway
+from src.risk.risk_guard import RiskGuard
+
+MAINNET = "https://fapi.binance.com"
+
+
+def _exchange_info(*symbols):
+    return {
+        "symbols": [
+            {
+                "symbol": symbol,
+                "filters": [
+                    {
+                        "filterType": "PRICE_FILTER",
+                        "tickSize": tick,
+                        "minPrice": "0.1",
+                        "maxPrice": "1000000",
+                    },
+                    {
+                        "filterType": "LOT_SIZE",
+                        "stepSize": step,
+                        "minQty": step,
+                        "maxQty": "1000",
+                    },
+                ],
+            }
+            for symbol, tick, step in symbols
+        ]
+    }
+
+
+class TestSymbolQuantizer:
+    def test_precision_of(self):
+        assert precision_of(0.01) == 2
+        assert precision_of(0.00001) == 5
+        assert precision_of(1.0) == 0
+        assert precision_of(0.5) == 1
+
+    def test_price_rounds_to_nearest_tick(self):
+        quantizer = SymbolQuantizer("BTCUSDT", tick_size=0.1, step_size=0.001)
+        assert quantizer.format_price(50123.46) == "50123.5"
+        assert quantizer.format_price(50123.44) == "50123.4"
+        assert quantizer.price_units(50123.44) == 501234
+
+    def test_non_power_of_ten_tick(self):
+        quantizer = SymbolQuantizer("XYZUSDT", tick_size=0.5, step_size=1.0)
+        assert quantizer.format_price(100.26) == "100.5"
+        assert quantizer.format_price(100.24) == "100.0"
+        assert quantizer.quantize_price(7.8) == 8.0
+
+    def test_quantity_floors_to_step(self):
+        quantizer = SymbolQuantizer("BTCUSDT", tick_size=0.1, step_size=0.001)
+        assert quantizer.format_quantity(1.2349) == "1.234"
+        assert quantizer.floor_quantity(0.0019) == 0.001
+        assert quantizer.format_quantity(0.0009) == "0.000"
+
+    def test_quantity_exact_step_survives_float_error(self):
+        quantizer = SymbolQuantizer("ETHUSDT", tick_size=0.01, step_size=0.001)
+        # 0.1 + 0.2 = 0.30000000000000004; 0.3 * 1000 = 299.99999999999994
+        assert quantizer.format_quantity(0.3) == "0.300"
+        assert quantizer.format_quantity(0.1 + 0.2) == "0.300"
+
+    def test_from_filters_defaults(self):
+        quantizer = SymbolQuantizer.from_filters("NEWUSDT", {})
+        assert quantizer.tick_size == 0.01
+        assert quantizer.step_size == 0.001
+
+
+class TestExchangeInfoCache:
+    def test_update_compiles_quantizers(self):
+        cache = ExchangeInfoCache()
+        count = cache.update_from_exchange_info(
+            _exchange_info(("BTCUSDT", "0.10", "0.001"), ("DOGEUSDT", "0.00001", "1"))
+        )
+
+        assert count == 2
+        assert len(cache) == 2
+        assert "DOGEUSDT" in cache
+        assert cache.get("DOGEUSDT").format_quantity(123.9) == "123"
+        assert cache.get("UNKNOWN") is None
+        assert not cache.is_expired()
+
+    def test_expiry(self):
+        cache = ExchangeInfoCache(ttl=60.0)
+        assert cache.is_expired()
+        assert cache.seconds_until_expiry() == 0.0
+
+        cache.update_from_exchange_info(_exchange_info(("BTCUSDT", "0.10", "0.001")))
+        now = cache.updated_at
+        assert not cache.is_expired(now=now + 60.0)
+        assert cache.is_expired(now=now + 61.0)
+        assert cache.seconds_until_expiry(now=now + 20.0) == pytest.approx(40.0)
+
+    def test_persistence_round_trip(self, tmp_path):
+        path = tmp_path / "cache" / "exchange_info.json"
+        cache = ExchangeInfoCache(path=path, source=MAINNET)
+        cache.update_from_exchange_info(_exchange_info(("BTCUSDT", "0.10", "0.001")))
+        assert path.exists()
+
+        restarted = ExchangeInfoCache(path=path, source=MAINNET)
+        assert restarted.load() is True
+        assert restarted.updated_at == cache.updated_at
+        assert restarted.get("BTCUSDT").format_price(50123.46) == "50123.5"
+
+    def test_stale_file_still_loaded(self, tmp_path):
+        path = tmp_path / "exchange_info.json"
+        cache = ExchangeInfoCache(path=path, source=MAINNET, ttl=60.0)
+        cache.update_from_exchange_info(_exchange_info(("BTCUSDT", "0.10", "0.001")))
+        data = json.loads(path.read_text())
+        data["updated_at"] = time.time() - 3600
+        path.write_text(json.dumps(data))
+
+        restarted = ExchangeInfoCache(path=path, source=MAINNET, ttl=60.0)
+        assert restarted.load() is True
+        assert "BTCUSDT" in restarted
+        assert restarted.is_expired()
+
+    def test_file_from_other_source_ignored(self, tmp_path):
+        path = tmp_path / "exchange_info.json"
+        ExchangeInfoCache(
+            path=path, source="https://testnet.binancefuture.com"
+        ).update_from_exchange_info(_exchange_info(("BTCUSDT", "0.10", "0.001")))
+
+        cache = ExchangeInfoCache(path=path, source=MAINNET)
+        assert cache.load() is False
+        assert len(cache) == 0
+
+    def test_corrupt_file_ignored(self, tmp_path):
+        path = tmp_path / "exchange_info.json"
+        path.write_text("{not json")
+
+        cache = ExchangeInfoCache(path=path)
+        assert cache.load() is False
+        assert cache.is_expired()
+
+    def test_missing_file(self, tmp_path):
+        assert ExchangeInfoCache(path=tmp_path / "missing.json").load() is False
+        assert ExchangeInfoCache().load() is False
+
+    @pytest.mark.asyncio
+    async def test_background_refresh_when_expired(self):
+        cache = ExchangeInfoCache(ttl=3600.0, retry_interval=0.01)
+        refresh_calls = 0
+
+        async def refresh():
+            nonlocal refresh_calls
+            refresh_calls += 1
+            cache.update_from_exchange_info(_exchange_info(("BTCUSDT", "0.10", "0.001")))
+
+        await cache.start(refresh)
+        try:
+            for _ in range(5):
+                await asyncio.sleep(0)
+            assert refresh_calls == 1
+            assert "BTCUSDT" in cache
+        finally:
+            await cache.stop()
+        await cache.stop()  # Idempotent
+        assert cache._refresh_task is None
+
+    @pytest.mark.asyncio
+    async def test_background_refresh_failure_keeps_data(self):
+        cache = ExchangeInfoCache(ttl=3600.0)
+        cache.update_from_exchange_info(_exchange_info(("BTCUSDT", "0.10", "0.001")))
+        cache.updated_at -= 7200
+        refresh = MagicMock(side_effect=RuntimeError("418 I'm a teapot"))
+
+        async def failing_refresh():
+            refresh()
+
+        await cache.start(failing_refresh)
+        try:
+            for _ in range(5):
+                await asyncio.sleep(0)
+        finally:
+            await cache.stop()
+
+        refresh.assert_called_once()
+        assert "BTCUSDT" in cache
+
+
+class TestSharedQuantizers:
+    def test_gateway_and_risk_guard_round_identically(self):
+        cache = ExchangeInfoCache()
+        cache.update_from_exchange_info(
+            _exchange_info(("BTCUSDT", "0.10", "0.001"), ("DOGEUSDT", "0.00001", "1"))
+        )
+        gateway = OrderGateway(
+            audit_logger=MagicMock(), binance_service=MagicMock(), exchange_info=cache
+        )
+        risk_guard = RiskGuard({}, audit_logger=MagicMock(), exchange_info=cache)
+
+        for symbol, quantity in (("BTCUSDT", 0.0129), ("DOGEUSDT", 1523.7)):
+            sized = risk_guard._round_to_lot_size(quantity, {"symbol": symbol})
+            assert gateway._format_quantity(sized, symbol) == gateway._format_quantity(
+                quantity, symbol
+            )
+
+        assert risk_guard._round_to_lot_size(1523.7, {"symbol": "DOGEUSDT"}) == 1523.0
+        gateway.client.exchange_info.assert_not_called()
+
+    def test_explicit_lot_size_takes_precedence(self):
+        cache = ExchangeInfoCache()
+        cache.update_from_exchange_info(_exchange_info(("DOGEUSDT", "0.00001", "1")))
+        risk_guard = RiskGuard({}, audit_logger=MagicMock(), exchange_info=cache)
+
+        symbol_info = {"symbol": "DOGEUSDT", "lot_size": 0.1, "quantity_precision": 1}
+        assert risk_guard._round_to_lot_size(1523.77, symbol_info) == 1523.7
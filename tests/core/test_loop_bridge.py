@@ -0,0 +1,164 @@
+"""Tests for the batching WebSocket-thread → event-loop bridge."""
+
+import asyncio
+import threading
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.event_dispatcher import EventDispatcher
+from src.core.exceptions import EngineState
+from src.core.loop_bridge import BatchingLoopBridge
+from src.models.candle import Candle
+from src.models.event import Event, EventType, QueueType
+
+
+def _candle(close: float, is_closed: bool = False, symbol: str = "BTCUSDT") -> Candle:
+    return Candle(
+        symbol=symbol,
+        interval="1m",
+        open_time=datetime(2025, 1, 1),
+        open=close,
+        high=close,
+        low=close,
+        close=close,
+        volume=1.0,
+        close_time=datetime(2025, 1, 1, 0, 1),
+        is_closed=is_closed,
+    )
+
+
+class Recorder:
+    def __init__(self, fail_on=None):
+        self.published = []
+        self.fail_on = fail_on
+
+    async def __call__(self, event, queue_type):
+        if event.data == self.fail_on:
+            raise RuntimeError("publish failed")
+        self.published.append((event.data, queue_type))
+
+
+async def _settle(bridge):
+    for _ in range(100):
+        await asyncio.sleep(0)
+        if bridge.pending == 0 and (bridge._drain_task is None or bridge._drain_task.done()):
+            return
+
+
+class TestBatchingLoopBridge:
+    @pytest.mark.asyncio
+    async def test_burst_from_thread_wakes_loop_once(self):
+        loop = asyncio.get_running_loop()
+        recorder = Recorder()
+        bridge = BatchingLoopBridge(recorder)
+
+        def ws_thread():
+            for i in range(1000):
+                bridge.submit(loop, Event(EventType.CANDLE_UPDATE, i), QueueType.CANDLE_UPDATE)
+
+        # The loop is blocked while the thread runs, like a busy loop under load
+        thread = threading.Thread(target=ws_thread)
+        thread.start()
+        thread.join()
+        await _settle(bridge)
+
+        assert bridge.wakeups == 1
+        assert [data for data, _ in recorder.published] == list(range(1000))
+
+    @pytest.mark.asyncio
+    async def test_concurrent_submission_loses_nothing(self):
+        loop = asyncio.get_running_loop()
+        recorder = Recorder()
+        bridge = BatchingLoopBridge(recorder)
+
+        def ws_thread(offset):
+            for i in range(500):
+                bridge.submit(
+                    loop, Event(EventType.CANDLE_UPDATE, offset + i), QueueType.CANDLE_UPDATE
+                )
+
+        threads = [threading.Thread(target=ws_thread, args=(n * 1000,)) for n in range(3)]
+        for thread in threads:
+            thread.start()
+        while any(thread.is_alive() for thread in threads):
+            await asyncio.sleep(0.001)
+        await _settle(bridge)
+
+        published = [data for data, _ in recorder.published]
+        assert sorted(published) == sorted(n * 1000 + i for n in range(3) for i in range(500))
+        for n in range(3):
+            own = [d for d in published if n * 1000 <= d < (n + 1) * 1000]
+            assert own == sorted(own)  # per-thread order preserved
+        assert bridge.wakeups < 1500
+
+    @pytest.mark.asyncio
+    async def test_backlog_bound_rejects_only_updates(self):
+        loop = asyncio.get_running_loop()
+        recorder = Recorder()
+        bridge = BatchingLoopBridge(recorder, max_pending=5)
+
+        accepted = [
+            bridge.submit(loop, Event(EventType.CANDLE_UPDATE, i), QueueType.CANDLE_UPDATE)
+            for i in range(8)
+        ]
+        closed = bridge.submit(loop, Event(EventType.CANDLE_CLOSED, "c"), QueueType.CANDLE_CLOSED)
+        await _settle(bridge)
+
+        assert accepted == [True] * 5 + [False] * 3
+        assert closed is True
+        assert bridge.rejected == 3
+        assert [data for data, _ in recorder.published] == [0, 1, 2, 3, 4, "c"]
+
+    @pytest.mark.asyncio
+    async def test_publish_error_does_not_stall_drain(self):
+        loop = asyncio.get_running_loop()
+        recorder = Recorder(fail_on=1)
+        bridge = BatchingLoopBridge(recorder)
+
+        for i in range(3):
+            bridge.submit(loop, Event(EventType.CANDLE_UPDATE, i), QueueType.CANDLE_UPDATE)
+        await _settle(bridge)
+
+        assert [data for data, _ in recorder.published] == [0, 2]
+
+
+class TestDispatcherBridge:
+    @pytest.mark.asyncio
+    async def test_on_candle_received_routes_through_bridge(self):
+        loop = asyncio.get_running_loop()
+        published = []
+
+        async def publish(event, queue_type):
+            published.append((event.event_type, event.data.close, queue_type))
+
+        event_bus = Mock()
+        event_bus.publish = publish
+        dispatcher = EventDispatcher(
+            strategies={},
+            position_cache_manager=Mock(),
+            event_bus=event_bus,
+            audit_logger=Mock(),
+            order_gateway=Mock(),
+            engine_state_getter=lambda: EngineState.RUNNING,
+            event_loop_getter=lambda: loop,
+            log_live_data=False,
+        )
+
+        def ws_thread():
+            dispatcher.on_candle_received(_candle(100.0))
+            dispatcher.on_candle_received(_candle(101.0))
+            dispatcher.on_candle_received(_candle(102.0, is_closed=True))
+
+        thread = threading.Thread(target=ws_thread)
+        thread.start()
+        thread.join()
+        await _settle(dispatcher._loop_bridge)
+
+        assert published == [
+            (EventType.CANDLE_UPDATE, 100.0, QueueType.CANDLE_UPDATE),
+            (EventType.CANDLE_UPDATE, 101.0, QueueType.CANDLE_UPDATE),
+            (EventType.CANDLE_CLOSED, 102.0, QueueType.CANDLE_CLOSED),
+        ]
+        assert dispatcher._event_drop_count == 0
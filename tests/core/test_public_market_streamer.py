@@ -2,15 +2,20 @@
 Tests for PublicMarketStreamer (Issue #57 Refactoring).
 
 PublicMarketStreamer handles:
-- WebSocket connection management (one per symbol)
+- WebSocket connection management (combined streams, chunked per connection)
 - Kline message parsing and Candle object creation
 - Heartbeat monitoring
 """
 
+import asyncio
+import json
 import logging
+import threading
 from datetime import datetime
 from unittest.mock import AsyncMock, Mock, patch
 import pytest
+from aiohttp import WSMsgType, web
+from binance.websocket.binance_socket_manager import BinanceSocketManager
 
 from src.core.public_market_streamer import PublicMarketStreamer
 from src.models.candle import Candle
@@ -172,12 +177,14 @@ class TestPublicMarketStreamerStreaming:
 
         await streamer.start()
 
-        assert len(streamer.ws_clients) == 2
-        assert mock_ws_client_class.call_count == 2
+        # All 4 streams fit on one combined-stream connection
+        assert len(streamer.ws_clients) == 1
+        assert mock_ws_client_class.call_count == 1
 
         first_call_args = mock_ws_client_class.call_args_list[0]
         assert first_call_args[1]["stream_url"] == "wss://stream.binancefuture.com"
         assert first_call_args[1]["on_message"] == streamer._handle_kline_message
+        assert first_call_args[1]["is_combined"] is True
         assert streamer._running is True
         assert streamer._is_connected is True
 
@@ -196,7 +203,7 @@ class TestPublicMarketStreamerStreaming:
 
         await streamer.start()
 
-        assert len(streamer.ws_clients) == 2
+        assert len(streamer.ws_clients) == 1
 
         first_call_args = mock_ws_client_class.call_args_list[0]
         assert first_call_args[1]["stream_url"] == "wss://fstream.binance.com"
@@ -216,9 +223,9 @@ class TestPublicMarketStreamerStreaming:
 
         await streamer.start()
 
-        kline_calls = mock_ws_instance.kline.call_args_list
-        called_symbols = [call[1]["symbol"] for call in kline_calls]
-        assert all(symbol.islower() for symbol in called_symbols)
+        (streams,) = mock_ws_instance.subscribe.call_args[0]
+        assert streams[:3] == ["btcusdt@kline_1m", "btcusdt@kline_5m", "btcusdt@kline_1h"]
+        assert all(stream.islower() for stream in streams)
 
     @patch("src.core.public_market_streamer.UMFuturesWebsocketClient")
     @pytest.mark.asyncio
@@ -235,8 +242,44 @@ class TestPublicMarketStreamerStreaming:
 
         await streamer.start()
 
-        # 2 symbols × 2 intervals = 4 subscriptions
-        assert mock_ws_instance.kline.call_count == 4
+        # 2 symbols × 2 intervals = 4 streams in a single SUBSCRIBE request
+        mock_ws_instance.subscribe.assert_called_once()
+        assert len(mock_ws_instance.subscribe.call_args[0][0]) == 4
+
+    @patch("src.core.public_market_streamer.UMFuturesWebsocketClient")
+    @pytest.mark.asyncio
+    async def test_streams_chunked_per_connection(self, mock_ws_client_class):
+        """Test streams are split across connections at streams_per_connection."""
+        clients = [Mock(), Mock(), Mock()]
+        mock_ws_client_class.side_effect = clients
+
+        streamer = PublicMarketStreamer(
+            symbols=["BTCUSDT", "ETHUSDT", "ADAUSDT"],
+            intervals=["1m", "5m"],
+            is_testnet=True,
+            streams_per_connection=4,
+        )
+
+        await streamer.start()
+
+        assert mock_ws_client_class.call_count == 2
+        assert list(streamer.ws_clients) == ["conn-0", "conn-1"]
+        assert clients[0].subscribe.call_args[0][0] == [
+            "btcusdt@kline_1m",
+            "btcusdt@kline_5m",
+            "ethusdt@kline_1m",
+            "ethusdt@kline_5m",
+        ]
+        assert clients[1].subscribe.call_args[0][0] == ["adausdt@kline_1m", "adausdt@kline_5m"]
+        assert streamer.is_connected is True
+
+    @pytest.mark.parametrize("value", [0, 1025])
+    def test_invalid_streams_per_connection(self, value):
+        """Test streams_per_connection is bounded by the Binance limit."""
+        with pytest.raises(ValueError, match="streams_per_connection"):
+            PublicMarketStreamer(
+                symbols=["BTCUSDT"], intervals=["1m"], streams_per_connection=value
+            )
 
     @patch("src.core.public_market_streamer.UMFuturesWebsocketClient")
     @pytest.mark.asyncio
@@ -254,8 +297,8 @@ class TestPublicMarketStreamerStreaming:
         await streamer.start()
         await streamer.start()
 
-        # Only called once per symbol
-        assert mock_ws_client_class.call_count == 2
+        # Only one connection opened
+        assert mock_ws_client_class.call_count == 1
 
     @patch("src.core.public_market_streamer.UMFuturesWebsocketClient")
     @pytest.mark.asyncio
@@ -576,6 +619,32 @@ class TestPublicMarketStreamerMessageParsing:
         assert captured_candle is not None
         assert captured_candle.symbol == "BTCUSDT"
 
+    def test_combined_stream_envelope_routed(self, streamer, valid_kline_message):
+        """Test combined-stream payloads are unwrapped by stream name."""
+        captured = []
+        streamer.on_candle_callback = captured.append
+
+        streamer._handle_kline_message(
+            None, {"stream": "btcusdt@kline_1m", "data": valid_kline_message}
+        )
+        streamer._handle_kline_message(
+            None, {"stream": "ethusdt@kline_1m", "data": valid_kline_message}
+        )
+
+        # Only the subscribed stream reaches the callback
+        assert len(captured) == 1
+        assert captured[0].symbol == "BTCUSDT"
+
+    def test_subscription_response_ignored(self, streamer):
+        """Test SUBSCRIBE acknowledgements are ignored silently."""
+        streamer.on_candle_callback = Mock()
+
+        with patch.object(streamer.logger, "error") as mock_error:
+            streamer._handle_kline_message(None, '{"result": null, "id": 1}')
+
+        streamer.on_candle_callback.assert_not_called()
+        mock_error.assert_not_called()
+
 
 # =============================================================================
 # Connection Status Tests
@@ -613,3 +682,106 @@ class TestPublicMarketStreamerConnectionStatus:
         await streamer.start()
 
         assert streamer.is_connected is True
+
+
+# =============================================================================
+# Local WebSocket Stand-in Tests
+# =============================================================================
+
+
+class CombinedStreamStandIn:
+    """Local stand-in for the Binance combined-stream endpoint (/stream)."""
+
+    def __init__(self):
+        self.subscriptions = []  # One list of stream names per SUBSCRIBE
+        self.url = None
+        self._runner = None
+
+    async def __aenter__(self):
+        app = web.Application()
+        app.router.add_get("/stream", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"ws://127.0.0.1:{port}"
+        return self
+
+    async def __aexit__(self, *exc):
+        await self._runner.cleanup()
+
+    async def _handle(self, request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        async for msg in ws:
+            if msg.type != WSMsgType.TEXT:
+                break
+            request_body = json.loads(msg.data)
+            if request_body.get("method") != "SUBSCRIBE":
+                continue
+            self.subscriptions.append(request_body["params"])
+            await ws.send_str(json.dumps({"result": None, "id": request_body["id"]}))
+            for stream in request_body["params"]:
+                await ws.send_str(json.dumps({"stream": stream, "data": self._kline(stream)}))
+        return ws
+
+    @staticmethod
+    def _kline(stream):
+        symbol, interval = stream.split("@kline_")
+        return {
+            "e": "kline",
+            "s": symbol.upper(),
+            "k": {
+                "s": symbol.upper(),
+                "i": interval,
+                "t": 1638747600000,
+                "T": 1638747659999,
+                "o": "1.0",
+                "h": "2.0",
+                "l": "0.5",
+                "c": "1.5",
+                "v": "10.0",
+                "x": False,
+            },
+        }
+
+
+class TestPublicMarketStreamerCombinedStreams:
+    """End-to-end tests against a local combined-stream WebSocket server."""
+
+    @pytest.mark.asyncio
+    async def test_streams_multiplexed_over_few_connections(self):
+        """Test 6 streams share 2 sockets/threads and every stream is routed."""
+        symbols = ["BTCUSDT", "ETHUSDT", "ADAUSDT"]
+        received = []
+        lock = threading.Lock()
+
+        def on_candle(candle):
+            with lock:
+                received.append((candle.symbol, candle.interval))
+
+        async with CombinedStreamStandIn() as server:
+            streamer = PublicMarketStreamer(
+                symbols=symbols,
+                intervals=["1m", "5m"],
+                on_candle_callback=on_candle,
+                ws_url=server.url,
+                streams_per_connection=4,
+            )
+            await streamer.start()
+            try:
+                socket_threads = [
+                    t for t in threading.enumerate() if isinstance(t, BinanceSocketManager)
+                ]
+                assert len(socket_threads) == 2
+
+                for _ in range(200):
+                    if len(received) == 6:
+                        break
+                    await asyncio.sleep(0.01)
+            finally:
+                await streamer.stop()
+
+        assert sorted(map(len, server.subscriptions)) == [2, 4]
+        assert sorted(received) == sorted((s, i) for s in symbols for i in ("1m", "5m"))
@@ -16,6 +16,7 @@ from src.core.exceptions import EngineState
 from src.models.candle import Candle
 from src.models.event import Event, EventType, QueueType
 from src.models.signal import Signal, SignalType
+from src.utils.config_manager import BinanceConfig
 
 
 @pytest.fixture
@@ -148,6 +149,8 @@ class TestTradingEngineInit:
         mock_config_manager.trading_config.strategy_config = {"use_killzones": True}
         mock_config_manager.trading_config.max_risk_per_trade = 0.02
         mock_config_manager.trading_config.exit_config = MagicMock()
+        mock_config_manager.binance_config = BinanceConfig()
+        mock_config_manager.trading_config.candle_updates = {}
 
         mock_event_bus = Mock()
         mock_event_bus.subscribe = Mock()
@@ -831,6 +834,8 @@ class TestInitializationOrder:
         # Mock components
         mock_config = MagicMock()
         mock_config.trading_config = MagicMock()
+        mock_config.binance_config = BinanceConfig()
+        mock_config.trading_config.candle_updates = {}
         mock_config.trading_config.symbols = ["BTCUSDT"]
         mock_config.trading_config.intervals = ["5m", "1h"]  # Missing 4h
         mock_config.trading_config.leverage = 10
@@ -911,6 +916,8 @@ class TestInitializationOrder:
         # Mock components
         mock_config = MagicMock()
         mock_config.trading_config = MagicMock()
+        mock_config.binance_config = BinanceConfig()
+        mock_config.trading_config.candle_updates = {}
         mock_config.trading_config.symbols = ["BTCUSDT"]
         mock_config.trading_config.intervals = ["5m", "1h"]  # Missing 4h
         mock_config.trading_config.leverage = 10
@@ -1232,6 +1239,7 @@ class TestBackfillIntervalFix:
     async def test_mtf_strategy_uses_own_intervals_not_datacollector(self):
         """Test MTF strategy only fetches intervals it actually needs (Issue #26)."""
         from src.strategies.base import BaseStrategy
+        from src.models.module_requirements import ModuleRequirements
 
         # Setup engine
         mock_audit_logger = MagicMock()
@@ -1253,6 +1261,7 @@ class TestBackfillIntervalFix:
         mock_strategy = Mock(spec=BaseStrategy)
         mock_strategy.intervals = ["5m", "1h", "4h"]  # Strategy only needs these 3
         mock_strategy.initialize_with_historical_data = Mock()
+        mock_strategy.data_requirements = ModuleRequirements.empty()
 
         engine.strategies = {"BTCUSDT": mock_strategy}
 
@@ -1267,7 +1276,8 @@ class TestBackfillIntervalFix:
             call[1]["interval"]
             for call in mock_data_collector.get_historical_candles.call_args_list
         ]
-        assert called_intervals == ["5m", "1h", "4h"]
+        # Requests run concurrently, so compare as a multiset
+        assert sorted(called_intervals) == sorted(["5m", "1h", "4h"])
         assert "1m" not in called_intervals
         assert "15m" not in called_intervals
 
@@ -1275,6 +1285,7 @@ class TestBackfillIntervalFix:
     async def test_backfill_prevents_unnecessary_api_calls(self):
         """Test backfill reduces API calls when strategy needs fewer intervals (Issue #26)."""
         from src.strategies.base import BaseStrategy
+        from src.models.module_requirements import ModuleRequirements
 
         # Setup engine
         mock_audit_logger = MagicMock()
@@ -1290,6 +1301,7 @@ class TestBackfillIntervalFix:
         mock_strategy = Mock(spec=BaseStrategy)
         mock_strategy.intervals = ["5m", "1h"]  # Only 2 out of 5
         mock_strategy.initialize_with_historical_data = Mock()
+        mock_strategy.data_requirements = ModuleRequirements.empty()
 
         engine.strategies = {"BTCUSDT": mock_strategy}
 
@@ -1306,6 +1318,7 @@ class TestBackfillIntervalFix:
     async def test_backfill_respects_strategy_compatibility_validation(self):
         """Test backfill assumes strategy intervals are subset of data_collector (Issue #26)."""
         from src.strategies.base import BaseStrategy
+        from src.models.module_requirements import ModuleRequirements
 
         # Setup engine
         mock_audit_logger = MagicMock()
@@ -1321,6 +1334,7 @@ class TestBackfillIntervalFix:
         mock_strategy = Mock(spec=BaseStrategy)
         mock_strategy.intervals = ["5m", "1h"]  # Subset of data_collector.intervals
         mock_strategy.initialize_with_historical_data = Mock()
+        mock_strategy.data_requirements = ModuleRequirements.empty()
 
         engine.strategies = {"BTCUSDT": mock_strategy}
 
@@ -0,0 +1,69 @@
+"""Tests for the WebSocket payload decoder."""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from src.core import ws_decoder
+from src.core.ws_decoder import decode_message, kline_to_candle
+
+KLINE = {
+    "s": "BTCUSDT",
+    "i": "1m",
+    "t": 1638747600000,
+    "T": 1638747659999,
+    "o": "57000.00",
+    "h": "57100.00",
+    "l": "56900.00",
+    "c": "57050.00",
+    "v": "10.5",
+    "x": True,
+}
+
+
+class TestDecodeMessage:
+    def test_text_and_bytes(self):
+        text = json.dumps({"e": "kline", "k": KLINE})
+        assert decode_message(text) == decode_message(text.encode()) == {"e": "kline", "k": KLINE}
+
+    def test_dict_passthrough(self):
+        message = {"e": "ACCOUNT_UPDATE"}
+        assert decode_message(message) is message
+
+    def test_invalid_json_raises_stdlib_error(self):
+        with pytest.raises(json.JSONDecodeError):
+            decode_message("{not json")
+
+    def test_backend_reported(self):
+        assert ws_decoder.JSON_BACKEND in ("orjson", "json")
+
+
+class TestKlineToCandle:
+    def test_fields_match_legacy_parsing(self):
+        candle = kline_to_candle(KLINE)
+
+        assert candle.symbol == "BTCUSDT"
+        assert candle.interval == "1m"
+        assert candle.open_time_ms == 1638747600000
+        assert candle.close_time_ms == 1638747659999
+        assert candle.open_time == datetime(2021, 12, 5, 23, 40)
+        assert candle.close_time == datetime(2021, 12, 5, 23, 40, 59, 999000)
+        assert (candle.open, candle.high, candle.low, candle.close, candle.volume) == (
+            57000.0,
+            57100.0,
+            56900.0,
+            57050.0,
+            10.5,
+        )
+        assert candle.is_closed is True
+
+    def test_missing_field_raises_key_error(self):
+        kline = dict(KLINE)
+        del kline["c"]
+        with pytest.raises(KeyError):
+            kline_to_candle(kline)
+
+    def test_non_numeric_price_raises_value_error(self):
+        with pytest.raises(ValueError):
+            kline_to_candle(dict(KLINE, o="invalid_price"))
@@ -0,0 +1,162 @@
+"""Tests for the binary columnar candle cache."""
+
+import csv
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from src.data.binary_cache import (
+    CANDLE_DTYPE,
+    CandleArray,
+    candles_to_array,
+    read_cache,
+    read_series,
+    series_path,
+    write_series,
+)
+from src.data.historical import HistoricalDataProvider
+from src.models.candle import Candle
+
+
+def _series(symbol, interval, minutes, count):
+    candles = []
+    for i in range(count):
+        open_time = datetime(2025, 1, 1) + timedelta(minutes=i * minutes)
+        price = 100.0 + i
+        candles.append(
+            Candle(
+                symbol=symbol,
+                interval=interval,
+                open_time=open_time,
+                open=price,
+                high=price + 1.5,
+                low=price - 0.5,
+                close=price + 0.25,
+                volume=10.0 + i,
+                close_time=open_time + timedelta(minutes=minutes),
+                is_closed=True,
+            )
+        )
+    return candles
+
+
+@pytest.fixture
+def candle_data():
+    return {
+        "BTCUSDT": {"1m": _series("BTCUSDT", "1m", 1, 40), "5m": _series("BTCUSDT", "5m", 5, 8)},
+        "ETHUSDT": {"1m": _series("ETHUSDT", "1m", 1, 40)},
+    }
+
+
+@pytest.fixture
+def cache_dir(tmp_path, candle_data):
+    root = str(tmp_path / "cache")
+    HistoricalDataProvider(candle_data).to_binary(root)
+    return root
+
+
+class TestCandleArray:
+    def test_round_trip(self, tmp_path, candle_data):
+        candles = candle_data["BTCUSDT"]["1m"]
+        path = write_series(str(tmp_path), "BTCUSDT", "1m", candles)
+        assert path == series_path(str(tmp_path), "BTCUSDT", "1m")
+
+        series = read_series(str(tmp_path), "BTCUSDT", "1m")
+        assert isinstance(series.data, np.memmap)
+        assert len(series) == 40
+        assert list(series) == candles
+        assert series[-1] == candles[-1]
+        assert series[5:8] == candles[5:8]
+
+    def test_iter_from_skips_without_reading(self, tmp_path, candle_data):
+        candles = candle_data["BTCUSDT"]["1m"]
+        write_series(str(tmp_path), "BTCUSDT", "1m", candles)
+        series = read_series(str(tmp_path), "BTCUSDT", "1m", mmap=False)
+
+        assert not isinstance(series.data, np.memmap)
+        assert list(series.iter_from(35)) == candles[35:]
+        assert list(series.iter_from(40)) == []
+
+    def test_columns_are_exposed(self, candle_data):
+        array = candles_to_array(candle_data["BTCUSDT"]["1m"])
+        assert array.dtype == CANDLE_DTYPE
+        assert array["close"][3] == 103.25
+        assert array["close_time"][0] - array["open_time"][0] == 60_000
+
+    def test_aware_datetimes_stored_as_utc(self):
+        open_time = datetime(2025, 1, 1, 9, tzinfo=timezone(timedelta(hours=9)))
+        candle = Candle(
+            symbol="BTCUSDT",
+            interval="1h",
+            open_time=open_time,
+            open=1.0,
+            high=2.0,
+            low=0.5,
+            close=1.5,
+            volume=1.0,
+            close_time=open_time + timedelta(hours=1),
+            is_closed=True,
+        )
+        series = CandleArray(candles_to_array([candle]), "BTCUSDT", "1h")
+        assert series[0].open_time == datetime(2025, 1, 1, 0)
+
+    def test_rejects_foreign_dtype(self):
+        with pytest.raises(ValueError):
+            CandleArray(np.zeros(3), "BTCUSDT", "1m")
+
+
+class TestProviderBinary:
+    def test_read_cache_layout(self, cache_dir):
+        data = read_cache(cache_dir)
+        assert list(data) == ["BTCUSDT", "ETHUSDT"]
+        assert list(data["BTCUSDT"]) == ["1m", "5m"]
+
+    def test_matches_in_memory_provider(self, cache_dir, candle_data):
+        memory = HistoricalDataProvider(candle_data)
+        binary = HistoricalDataProvider.from_binary(cache_dir)
+
+        assert binary.symbols == memory.symbols
+        assert binary.get_historical_candles("BTCUSDT", "1m", 10) == (
+            memory.get_historical_candles("BTCUSDT", "1m", 10)
+        )
+        assert binary.remaining_count() == memory.remaining_count() == 78
+        assert list(binary.iter_chronological()) == list(memory.iter_chronological())
+
+    @pytest.mark.asyncio
+    async def test_streaming_skips_init_candles(self, cache_dir):
+        received = []
+        provider = HistoricalDataProvider.from_binary(cache_dir, on_candle_callback=received.append)
+        provider.get_historical_candles("ETHUSDT", "1m", 30)
+
+        await provider.start_streaming()
+
+        assert len(received) == 40 + 8 + 10
+        assert received[-1].symbol == "ETHUSDT"
+        assert received[-1].open_time == datetime(2025, 1, 1, 0, 39)
+
+    def test_convert_csv_to_binary(self, tmp_path, candle_data):
+        path = tmp_path / "btc_1m.csv"
+        with open(path, "w", newline="") as fh:
+            writer = csv.writer(fh)
+            writer.writerow(["open_time", "open", "high", "low", "close", "volume", "close_time"])
+            for c in candle_data["BTCUSDT"]["1m"]:
+                writer.writerow(
+                    [
+                        c.open_time.strftime("%Y-%m-%d %H:%M:%S"),
+                        c.open,
+                        c.high,
+                        c.low,
+                        c.close,
+                        c.volume,
+                        c.close_time.strftime("%Y-%m-%d %H:%M:%S"),
+                    ]
+                )
+
+        root = str(tmp_path / "cache")
+        file_paths = {"BTCUSDT": {"1m": str(path)}}
+        HistoricalDataProvider.convert_csv_to_binary(file_paths, root)
+
+        from_csv = HistoricalDataProvider.from_csv(file_paths)
+        from_binary = HistoricalDataProvider.from_binary(root)
+        assert list(from_binary.iter_chronological()) == list(from_csv.iter_chronological())
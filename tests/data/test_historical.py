@@ -2,7 +2,7 @@
 
 import asyncio
 import csv
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 
 import pytest
@@ -171,6 +171,85 @@ class TestStartStreaming:
         assert prov.is_running is False
 
 
+# ---------------------------------------------------------------------------
+# TestIterChronological
+# ---------------------------------------------------------------------------
+
+
+def _series(symbol, interval, minutes, count, price=100.0):
+    """``count`` candles of ``minutes`` length starting at midnight."""
+    candles = []
+    for i in range(count):
+        open_time = datetime(2025, 1, 1) + timedelta(minutes=i * minutes)
+        candles.append(
+            Candle(
+                symbol=symbol,
+                interval=interval,
+                open_time=open_time,
+                open=price,
+                high=price + 1.0,
+                low=price - 1.0,
+                close=price,
+                volume=1.0,
+                close_time=open_time + timedelta(minutes=minutes),
+                is_closed=True,
+            )
+        )
+    return candles
+
+
+class TestIterChronological:
+    """Tests for the k-way merge replay iterator."""
+
+    @pytest.fixture
+    def multi_provider(self):
+        return HistoricalDataProvider(
+            {
+                "BTCUSDT": {
+                    "1m": _series("BTCUSDT", "1m", 1, 30),
+                    "5m": _series("BTCUSDT", "5m", 5, 6),
+                },
+                "ETHUSDT": {
+                    "1m": _series("ETHUSDT", "1m", 1, 30),
+                    "15m": _series("ETHUSDT", "15m", 15, 2),
+                },
+            }
+        )
+
+    def _stable_sorted(self, provider):
+        """Reference: concatenate remaining candles and stable-sort by close_time."""
+        queue = []
+        for symbol, intervals in provider._data.items():
+            for interval, candles in intervals.items():
+                queue.extend(candles[provider._init_counts[symbol][interval] :])
+        queue.sort(key=lambda c: c.close_time)
+        return queue
+
+    def test_matches_stable_sort(self, multi_provider):
+        merged = list(multi_provider.iter_chronological())
+        assert len(merged) == 68
+        assert [id(c) for c in merged] == [id(c) for c in self._stable_sorted(multi_provider)]
+
+    def test_skips_init_candles(self, multi_provider):
+        multi_provider.get_historical_candles("BTCUSDT", "1m", limit=10)
+        multi_provider.get_historical_candles("ETHUSDT", "15m", limit=2)
+
+        merged = list(multi_provider.iter_chronological())
+        assert multi_provider.remaining_count() == len(merged) == 56
+        assert [id(c) for c in merged] == [id(c) for c in self._stable_sorted(multi_provider)]
+
+    def test_is_lazy(self, multi_provider):
+        it = multi_provider.iter_chronological()
+        first = next(it)
+        assert first.close_time == datetime(2025, 1, 1, 0, 1)
+        assert first.symbol == "BTCUSDT"
+
+    def test_empty_series(self):
+        prov = HistoricalDataProvider({"BTCUSDT": {"1m": []}})
+        assert list(prov.iter_chronological()) == []
+        assert prov.remaining_count() == 0
+
+
 # ---------------------------------------------------------------------------
 # TestFromCsv
 # ---------------------------------------------------------------------------
@@ -2,6 +2,7 @@
 Unit tests for ICT Liquidity Analysis
 """
 
+import random
 from collections import deque
 from datetime import datetime, timedelta
 
@@ -18,7 +19,7 @@ from src.detectors.ict_liquidity import (
     is_in_premium,
 )
 from src.models.candle import Candle
-from src.models.indicators import LiquidityLevel
+from src.models.indicators import LiquidityLevel, LiquiditySweep
 
 
 def create_test_candle(
@@ -143,6 +144,78 @@ class TestFindEqualLows:
         assert len(equal_lows) >= 2
 
 
+class TestEqualLevelClustering:
+    """Sorted clustering matches the pairwise greedy grouping."""
+
+    @pytest.mark.parametrize("seed", [3, 11, 29])
+    @pytest.mark.parametrize(
+        "tolerance,lookback", [(0.0, 20), (0.001, 20), (0.005, 10), (0.02, 50), (0.01, -1)]
+    )
+    def test_matches_pairwise_grouping(self, seed, tolerance, lookback):
+        rng = random.Random(seed)
+        candles = []
+        price = 100.0
+        for i in range(500):
+            close = price + rng.gauss(0, 0.5)
+            high = max(price, close) + abs(rng.gauss(0, 0.2))
+            low = min(price, close) - abs(rng.gauss(0, 0.2))
+            if candles and rng.random() < 0.2:
+                ref = candles[rng.randrange(max(0, i - 30), i)]
+                high, low = max(high, ref.high), min(low, ref.low)
+            candles.append(create_test_candle(i, price, high, low, close))
+            price = close
+
+        highs = [
+            (i, candles[i].high, candles[i].open_time)
+            for i in range(1, len(candles) - 1)
+            if candles[i - 1].high < candles[i].high > candles[i + 1].high
+        ]
+        lows = [
+            (i, candles[i].low, candles[i].open_time)
+            for i in range(1, len(candles) - 1)
+            if candles[i - 1].low > candles[i].low < candles[i + 1].low
+        ]
+
+        assert find_equal_highs(
+            candles, "1m", tolerance, min_touches=2, lookback=lookback
+        ) == _pairwise_levels(highs, "bsl", tolerance, lookback)
+        assert find_equal_lows(
+            candles, "1m", tolerance, min_touches=2, lookback=lookback
+        ) == _pairwise_levels(lows, "ssl", tolerance, lookback)
+
+
+def _pairwise_levels(peaks, level_type, tolerance, lookback, min_touches=2):
+    """Reference O(k^2) greedy grouping."""
+    levels = []
+    processed = set()
+    for i, (idx, price, time) in enumerate(peaks):
+        if i in processed:
+            continue
+        touches = [price]
+        for j in range(i + 1, len(peaks)):
+            other_idx, other_price, _ = peaks[j]
+            if j not in processed and abs(other_price - price) <= price * tolerance and (
+                other_idx - idx <= lookback
+            ):
+                touches.append(other_price)
+                processed.add(j)
+        if len(touches) >= min_touches:
+            avg = sum(touches) / len(touches)
+            levels.append(
+                LiquidityLevel(
+                    id=f"1m_{avg}_{level_type}",
+                    interval="1m",
+                    level_type=level_type,
+                    price=avg,
+                    strength=len(touches),
+                    timestamp=time,
+                    candle_index=idx,
+                    swept=False,
+                )
+            )
+    return levels
+
+
 class TestCalculatePremiumDiscount:
     """Test premium/discount zone calculation"""
 
@@ -271,6 +344,69 @@ class TestDetectLiquiditySweep:
         # But price stayed above 110.5, so no significant reversal
         assert not sweeps[0].reversal_started  # No reversal
 
+    def test_matches_per_level_scan(self):
+        """Sweep-line result is identical to the per-level forward scan."""
+        rng = random.Random(7)
+        candles = []
+        price = 100.0
+        for i in range(300):
+            close = price + rng.gauss(0, 0.8)
+            high = max(price, close) + abs(rng.gauss(0, 0.4))
+            low = min(price, close) - abs(rng.gauss(0, 0.4))
+            candles.append(create_test_candle(i, price, high, low, close))
+            price = close
+
+        levels = []
+        for k in range(60):
+            index = rng.randrange(0, 300)
+            level_type = rng.choice(["bsl", "ssl"])
+            anchor = candles[index]
+            levels.append(
+                LiquidityLevel(
+                    id=f"lvl{k}",
+                    interval="1m",
+                    level_type=level_type,
+                    price=anchor.high if level_type == "bsl" else anchor.low,
+                    strength=2,
+                    timestamp=anchor.open_time,
+                    candle_index=index,
+                    swept=k % 10 == 0,
+                )
+            )
+
+        assert detect_liquidity_sweep(candles, levels) == _per_level_sweeps(candles, levels)
+
+
+def _per_level_sweeps(candles, levels):
+    """Reference O(levels * candles) scan."""
+    sweeps = []
+    for level in levels:
+        if level.swept:
+            continue
+        for i in range(level.candle_index + 1, len(candles)):
+            candle = candles[i]
+            if level.level_type == "bsl" and candle.high > level.price:
+                direction = "bearish"
+                reversed_ = any(c.low < level.price for c in candles[i + 1:i + 5])
+            elif level.level_type == "ssl" and candle.low < level.price:
+                direction = "bullish"
+                reversed_ = any(c.high > level.price for c in candles[i + 1:i + 5])
+            else:
+                continue
+            sweeps.append(
+                LiquiditySweep(
+                    id=f"{level.interval}_{i}_sweep_{level.level_type}",
+                    interval=level.interval,
+                    index=i,
+                    direction=direction,
+                    swept_level=level.price,
+                    reversal_started=reversed_,
+                    timestamp=candle.open_time,
+                )
+            )
+            break
+    return sweeps
+
 
 class TestFindLiquidityVoids:
     """Test liquidity void detection"""
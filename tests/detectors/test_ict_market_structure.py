@@ -2,10 +2,12 @@
 Unit tests for ICT Market Structure Analysis
 """
 
+import random
 from collections import deque
 from datetime import datetime, timedelta
 
 from src.detectors.ict_market_structure import (
+    IncrementalSwingDetector,
     detect_bos,
     detect_choch,
     get_current_trend,
@@ -321,3 +323,100 @@ class TestGetCurrentTrend:
         candles = [create_test_candle(i, 100, 101, 99, 100) for i in range(5)]
         trend = get_current_trend(candles, swing_lookback=5, min_swings=2)
         assert trend is None
+
+
+def _random_walk(n: int, seed: int) -> list:
+    """Random-walk candles with frequent ties on highs/lows."""
+    rng = random.Random(seed)
+    price = 100.0
+    candles = []
+    for i in range(n):
+        close = round(price + rng.choice([-1, -0.5, 0, 0.5, 1]), 1)
+        high = max(price, close) + rng.choice([0, 0.5, 1])
+        low = min(price, close) - rng.choice([0, 0.5, 1])
+        candles.append(create_test_candle(i, price, high, low, close))
+        price = close
+    return candles
+
+
+def _brute_force_swings(candles, left, right, find_high):
+    values = [c.high if find_high else c.low for c in candles]
+    result = []
+    for i in range(left, len(values) - right):
+        others = values[i - left : i] + values[i + 1 : i + 1 + right]
+        if find_high and all(values[i] > v for v in others):
+            result.append(i)
+        elif not find_high and all(values[i] < v for v in others):
+            result.append(i)
+    return result
+
+
+class TestSwingDetectionLinear:
+    """Monotonic-deque swing detection matches the definition exactly."""
+
+    def test_matches_brute_force(self):
+        for seed in range(5):
+            candles = _random_walk(300, seed)
+            for left, right in [(1, 1), (3, 2), (5, 5), (0, 3), (4, 0)]:
+                highs = identify_swing_highs(candles, left, right)
+                lows = identify_swing_lows(candles, left, right)
+                assert [s.index for s in highs] == _brute_force_swings(
+                    candles, left, right, True
+                )
+                assert [s.index for s in lows] == _brute_force_swings(
+                    candles, left, right, False
+                )
+
+    def test_ties_are_not_swings(self):
+        """Equal highs on either side disqualify a swing (strict comparison)."""
+        candles = [
+            create_test_candle(0, 100, 101, 99, 100),
+            create_test_candle(1, 100, 105, 99, 100),
+            create_test_candle(2, 100, 105, 99, 100),
+            create_test_candle(3, 100, 101, 99, 100),
+        ]
+        assert identify_swing_highs(candles, left_bars=1, right_bars=1) == []
+
+
+class TestIncrementalSwingDetector:
+    """Incremental swing detection matches batch detection."""
+
+    def test_streaming_matches_batch(self):
+        candles = _random_walk(250, seed=11)
+        detector = IncrementalSwingDetector(left_bars=3, right_bars=3)
+        for candle in candles:
+            detector.update(candle)
+
+        assert list(detector.swing_highs) == identify_swing_highs(candles, 3, 3)
+        assert list(detector.swing_lows) == identify_swing_lows(candles, 3, 3)
+        assert detector.candle_count == 250
+
+    def test_initialize_then_stream(self):
+        candles = _random_walk(200, seed=5)
+        detector = IncrementalSwingDetector(left_bars=2, right_bars=4)
+        detector.initialize(candles[:120])
+        for candle in candles[120:]:
+            detector.update(candle)
+
+        assert list(detector.swing_highs) == identify_swing_highs(candles, 2, 4)
+        assert list(detector.swing_lows) == identify_swing_lows(candles, 2, 4)
+
+    def test_update_returns_newly_confirmed_swing(self):
+        candles = [
+            create_test_candle(0, 100, 101, 99, 100),
+            create_test_candle(1, 100, 110, 99.5, 105),
+            create_test_candle(2, 105, 106, 100, 101),
+        ]
+        detector = IncrementalSwingDetector(left_bars=1, right_bars=1)
+        assert detector.update(candles[0]) == []
+        assert detector.update(candles[1]) == []
+        confirmed = detector.update(candles[2])
+        assert [(s.type, s.index, s.price) for s in confirmed] == [("high", 1, 110)]
+
+    def test_max_swings_bounds_history(self):
+        candles = _random_walk(300, seed=2)
+        detector = IncrementalSwingDetector(left_bars=1, right_bars=1, max_swings=5)
+        for candle in candles:
+            detector.update(candle)
+        assert len(detector.swing_highs) == 5
+        assert list(detector.swing_highs) == identify_swing_highs(candles, 1, 1)[-5:]
@@ -0,0 +1,229 @@
+"""
+Parity tests: NumPy array backend vs Candle-based ICT detectors.
+
+Every ``*_np`` detector must return exactly the same results as its
+Candle-based counterpart (ignoring wall-clock created_at/last_updated).
+"""
+
+import random
+from dataclasses import asdict, is_dataclass
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.models.candle import Candle
+from src.strategies.candle_store import CandleStore
+from src.strategies.ict.detectors import fvg, liquidity, market_structure, order_block, smc
+from src.strategies.ict.detectors import vectorized as vec
+
+_VOLATILE_FIELDS = {"created_at", "last_updated"}
+
+
+def _normalize(results):
+    """Convert detector output into comparable plain data."""
+    if isinstance(results, tuple):
+        return tuple(_normalize(r) for r in results)
+    if isinstance(results, list):
+        return [_normalize(r) for r in results]
+    if is_dataclass(results):
+        data = asdict(results)
+        for key in _VOLATILE_FIELDS:
+            data.pop(key, None)
+        return data
+    return results
+
+
+def generate_candles(n: int, seed: int, interval: str = "5m", jumpy: bool = False):
+    """Random-walk candles; ``jumpy`` adds gaps and big bars (FVG/OB/displacement)."""
+    rng = random.Random(seed)
+    base_time = datetime(2025, 1, 1, 0, 0)
+    price = 100.0
+    candles = []
+    for i in range(n):
+        step = rng.gauss(0, 0.6)
+        if jumpy and rng.random() < 0.1:
+            step *= 6
+        open_price = price
+        close_price = max(1.0, price + step)
+        high = max(open_price, close_price) + abs(rng.gauss(0, 0.3))
+        low = min(open_price, close_price) - abs(rng.gauss(0, 0.3))
+        # Occasionally repeat a previous extreme to create equal highs/lows
+        if candles and rng.random() < 0.15:
+            ref = candles[rng.randrange(max(0, i - 15), i)]
+            high = max(high, ref.high) if rng.random() < 0.5 else high
+            low = min(low, ref.low) if rng.random() < 0.5 else low
+        open_time = base_time + timedelta(minutes=5 * i)
+        candles.append(
+            Candle(
+                symbol="BTCUSDT",
+                interval=interval,
+                open_time=open_time,
+                open=open_price,
+                high=high,
+                low=low,
+                close=close_price,
+                volume=1.0,
+                close_time=open_time + timedelta(minutes=5),
+                is_closed=True,
+            )
+        )
+        price = close_price
+    return candles
+
+
+SEEDS = [1, 42, 1234]
+SIZES = [0, 2, 15, 120, 500]
+
+
+@pytest.fixture(params=[(s, n, j) for s in SEEDS for n in SIZES for j in (False, True)])
+def candles(request):
+    seed, size, jumpy = request.param
+    return generate_candles(size, seed, jumpy=jumpy)
+
+
+class TestMarketStructureParity:
+    @pytest.mark.parametrize("left,right", [(1, 1), (2, 3), (5, 5), (0, 2)])
+    def test_swing_points(self, candles, left, right):
+        assert _normalize(vec.identify_swing_highs_np(candles, left, right)) == _normalize(
+            market_structure.identify_swing_highs(candles, left, right)
+        )
+        assert _normalize(vec.identify_swing_lows_np(candles, left, right)) == _normalize(
+            market_structure.identify_swing_lows(candles, left, right)
+        )
+
+    @pytest.mark.parametrize("lookback", [2, 3, 5])
+    def test_bos_choch_trend(self, candles, lookback):
+        assert _normalize(vec.detect_bos_np(candles, lookback)) == _normalize(
+            market_structure.detect_bos(candles, lookback)
+        )
+        assert _normalize(vec.detect_choch_np(candles, lookback)) == _normalize(
+            market_structure.detect_choch(candles, lookback)
+        )
+        assert vec.get_current_trend_np(candles, lookback) == market_structure.get_current_trend(
+            candles, lookback
+        )
+
+
+class TestFVGParity:
+    @pytest.mark.parametrize("min_gap", [0.0, 0.001, 0.005])
+    def test_detect_fvg(self, candles, min_gap):
+        assert _normalize(vec.detect_bullish_fvg_np(candles, "1h", min_gap)) == _normalize(
+            fvg.detect_bullish_fvg(candles, "1h", min_gap)
+        )
+        assert _normalize(vec.detect_bearish_fvg_np(candles, "1h", min_gap)) == _normalize(
+            fvg.detect_bearish_fvg(candles, "1h", min_gap)
+        )
+
+    def test_detect_all_fvg(self, candles):
+        assert _normalize(vec.detect_all_fvg_np(candles, "5m", 0.0)) == _normalize(
+            fvg.detect_all_fvg(candles, "5m", 0.0)
+        )
+
+
+class TestOrderBlockParity:
+    @pytest.mark.parametrize("ratio", [1.0, 1.5, 2.5])
+    def test_identify_ob(self, candles, ratio):
+        assert _normalize(vec.identify_bullish_ob_np(candles, "1h", ratio)) == _normalize(
+            order_block.identify_bullish_ob(candles, "1h", ratio)
+        )
+        assert _normalize(vec.identify_bearish_ob_np(candles, "1h", ratio)) == _normalize(
+            order_block.identify_bearish_ob(candles, "1h", ratio)
+        )
+
+    def test_detect_all_ob_with_strength(self, candles):
+        assert _normalize(vec.detect_all_ob_np(candles, "1h", 1.2, min_strength=1.8)) == (
+            _normalize(order_block.detect_all_ob(candles, "1h", 1.2, min_strength=1.8))
+        )
+
+    def test_average_range(self, candles):
+        for period in (1, 5, 20):
+            assert vec.calculate_average_range_np(candles, period) == (
+                order_block.calculate_average_range(candles, period)
+            )
+
+
+class TestLiquidityParity:
+    @pytest.mark.parametrize("tolerance,lookback", [(0.001, 20), (0.005, 10), (0.01, 50)])
+    def test_equal_levels(self, candles, tolerance, lookback):
+        assert _normalize(
+            vec.find_equal_highs_np(candles, "5m", tolerance, lookback=lookback)
+        ) == _normalize(liquidity.find_equal_highs(candles, "5m", tolerance, lookback=lookback))
+        assert _normalize(
+            vec.find_equal_lows_np(candles, "5m", tolerance, lookback=lookback)
+        ) == _normalize(liquidity.find_equal_lows(candles, "5m", tolerance, lookback=lookback))
+
+    def test_premium_discount(self, candles):
+        for lookback in (10, 50, 1000):
+            assert vec.calculate_premium_discount_np(candles, lookback) == (
+                liquidity.calculate_premium_discount(candles, lookback)
+            )
+
+    def test_liquidity_sweep(self, candles):
+        levels = liquidity.find_equal_highs(candles, "5m", 0.005) + liquidity.find_equal_lows(
+            candles, "5m", 0.005
+        )
+        assert _normalize(vec.detect_liquidity_sweep_np(candles, levels)) == _normalize(
+            liquidity.detect_liquidity_sweep(candles, levels)
+        )
+
+    @pytest.mark.parametrize("min_gap", [0.0, 0.002])
+    def test_liquidity_voids(self, candles, min_gap):
+        assert vec.find_liquidity_voids_np(candles, min_gap) == liquidity.find_liquidity_voids(
+            candles, min_gap
+        )
+
+
+class TestSMCParity:
+    @pytest.mark.parametrize("lookback", [3, 10])
+    def test_inducement(self, candles, lookback):
+        assert _normalize(vec.detect_inducement_np(candles, lookback)) == _normalize(
+            smc.detect_inducement(candles, lookback)
+        )
+
+    @pytest.mark.parametrize("ratio", [1.2, 1.5, 2.0])
+    def test_displacement(self, candles, ratio):
+        assert _normalize(vec.detect_displacement_np(candles, ratio)) == _normalize(
+            smc.detect_displacement(candles, ratio)
+        )
+
+    def test_mitigation_and_all_smc(self, candles):
+        fvgs = fvg.detect_bullish_fvg(candles, "5m", 0.0) + fvg.detect_bearish_fvg(
+            candles, "5m", 0.0
+        )
+        obs = order_block.identify_bullish_ob(candles, "5m", 1.2)
+        assert _normalize(vec.detect_all_smc_np(candles, 1.5, 10, fvgs, obs)) == _normalize(
+            smc.detect_all_smc(candles, 1.5, 10, fvgs, obs)
+        )
+
+
+class TestCandleStoreInput:
+    """Array backend fed directly from a CandleStore (zero-copy)."""
+
+    def test_from_store_matches_candle_input(self):
+        candles = generate_candles(300, seed=3, jumpy=True)
+        store = CandleStore(maxlen=200, candles=candles)
+        arrays = vec.OHLCArrays.from_store(store)
+        window = candles[-200:]
+
+        assert arrays.interval == "5m"
+        assert _normalize(vec.identify_swing_highs_np(arrays, 3, 3)) == _normalize(
+            market_structure.identify_swing_highs(window, 3, 3)
+        )
+        assert _normalize(vec.detect_bullish_fvg_np(arrays, "5m", 0.0)) == _normalize(
+            fvg.detect_bullish_fvg(window, "5m", 0.0)
+        )
+        assert _normalize(vec.detect_displacement_np(arrays, 1.5)) == _normalize(
+            smc.detect_displacement(window, 1.5)
+        )
+
+    def test_from_store_partial_window(self):
+        candles = generate_candles(50, seed=9)
+        store = CandleStore(maxlen=100, candles=candles)
+        arrays = vec.OHLCArrays.from_store(store, count=30)
+        assert len(arrays) == 30
+        assert arrays.open_time[0] == candles[20].open_time
+        assert arrays.open_time[-1] == candles[-1].open_time
+        assert list(arrays.open_time) == [c.open_time for c in candles[20:]]
+        assert arrays.open_time[-2:] == [c.open_time for c in candles[-2:]]
+        with pytest.raises(IndexError):
+            arrays.open_time[30]
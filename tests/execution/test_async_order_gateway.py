@@ -0,0 +1,629 @@
+"""Tests for AsyncOrderGateway and AsyncBinanceClient against a local REST stand-in."""
+
+import asyncio
+import hashlib
+import hmac
+import threading
+import time
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aiohttp import web
+from binance.error import ClientError, ServerError
+
+from src.core.async_binance_client import AsyncBinanceClient
+from src.core.binance_service import RequestWeightTracker
+from src.execution.async_order_gateway import CLIENT_ALGO_ID_PREFIX, AsyncOrderGateway
+from src.execution.base import AsyncExecutionGateway
+from src.execution.trade_coordinator import TradeCoordinator
+from src.models.event import Event, EventType
+from src.models.order import OrderSide, OrderType
+from src.models.signal import Signal, SignalType
+
+API_KEY = "test-key"
+API_SECRET = "test-secret"
+
+EXCHANGE_INFO = {
+    "symbols": [
+        {
+            "symbol": "BTCUSDT",
+            "filters": [
+                {
+                    "filterType": "PRICE_FILTER",
+                    "tickSize": "0.10",
+                    "minPrice": "0.10",
+                    "maxPrice": "1000000",
+                },
+                {
+                    "filterType": "LOT_SIZE",
+                    "stepSize": "0.001",
+                    "minQty": "0.001",
+                    "maxQty": "1000",
+                },
+            ],
+        }
+    ]
+}
+
+
+def _order_response(order_id, status="FILLED", qty="0.010", avg_price="50000.0"):
+    return {
+        "orderId": order_id,
+        "symbol": "BTCUSDT",
+        "status": status,
+        "type": "MARKET",
+        "avgPrice": avg_price,
+        "origQty": qty,
+        "executedQty": qty,
+        "updateTime": 1700000000000,
+    }
+
+
+class FuturesRestStandIn:
+    """
+    Local stand-in for the Binance USD-M futures REST API.
+
+    Signed requests are verified (API key header and HMAC signature); each
+    route answers from ``responses[(method, path)]``, a callable taking the
+    query dict and returning ``(status, body)``.
+    """
+
+    def __init__(self, responses=None, delay=None):
+        self.responses = dict(responses or {})
+        self.delay = delay or {}  # (method, path) -> seconds
+        self.requests = []  # (method, path, params)
+        self.peers = set()  # Client (host, port) pairs seen
+        self.url = None
+        self._runner = None
+
+    async def __aenter__(self):
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}"
+        return self
+
+    async def __aexit__(self, *exc):
+        await self._runner.cleanup()
+
+    def calls(self, method, path):
+        return [params for m, p, params in self.requests if (m, p) == (method, path)]
+
+    async def _handle(self, request):
+        self.peers.add(request.transport.get_extra_info("peername"))
+        key = (request.method, request.path)
+        params = dict(request.query)
+        self.requests.append((request.method, request.path, params))
+
+        if "signature" in params:
+            if request.headers.get("X-MBX-APIKEY") != API_KEY:
+                return web.json_response({"code": -2015, "msg": "Invalid API-key"}, status=401)
+            signed, _, signature = request.query_string.rpartition("&signature=")
+            expected = hmac.new(API_SECRET.encode(), signed.encode(), hashlib.sha256).hexdigest()
+            if signature != expected:
+                return web.json_response({"code": -1022, "msg": "Signature invalid"}, status=400)
+
+        if key in self.delay:
+            await asyncio.sleep(self.delay[key])
+
+        handler = self.responses.get(key)
+        if handler is None:
+            return web.json_response({"code": -1000, "msg": f"no stub for {key}"}, status=404)
+        status, body = handler(params)
+        if isinstance(body, str):
+            return web.Response(status=status, text=body)
+        return web.json_response(body, status=status, headers={"x-mbx-used-weight-1m": "7"})
+
+
+def _trading_routes(open_orders=None):
+    """Routes for a full entry + TP/SL round trip."""
+    algo_ids = iter(range(900, 1000))
+    return {
+        ("GET", "/fapi/v1/exchangeInfo"): lambda q: (200, EXCHANGE_INFO),
+        ("GET", "/fapi/v1/premiumIndex"): lambda q: (200, {"markPrice": "50000.0"}),
+        ("POST", "/fapi/v1/order"): lambda q: (200, _order_response(1001)),
+        ("GET", "/fapi/v1/openOrders"): lambda q: (200, list(open_orders or [])),
+        ("DELETE", "/fapi/v1/allOpenOrders"): lambda q: (200, {"code": 200, "msg": "ok"}),
+        ("GET", "/fapi/v1/openAlgoOrders"): lambda q: (200, []),
+        ("POST", "/fapi/v1/algoOrder"): lambda q: (
+            200,
+            {
+                "algoId": next(algo_ids),
+                "status": "NEW",
+                "triggerPrice": q["triggerPrice"],
+                "updateTime": 1700000000000,
+            },
+        ),
+        ("GET", "/fapi/v3/account"): lambda q: (
+            200,
+            {"assets": [{"asset": "USDT", "walletBalance": "1234.5"}]},
+        ),
+    }
+
+
+def _signal(signal_type=SignalType.LONG_ENTRY):
+    return Signal(
+        signal_type=signal_type,
+        symbol="BTCUSDT",
+        entry_price=50000.0,
+        take_profit=52000.0,
+        stop_loss=49000.0,
+        strategy_name="test",
+        timestamp=datetime.now(timezone.utc),
+    )
+
+
+def _client(server, **kwargs):
+    return AsyncBinanceClient(API_KEY, API_SECRET, base_url=server.url, **kwargs)
+
+
+def _gateway(server, **kwargs):
+    return AsyncOrderGateway(audit_logger=MagicMock(), async_client=_client(server), **kwargs)
+
+
+class TestAsyncBinanceClient:
+    @pytest.mark.asyncio
+    async def test_signed_request_verified_by_server(self):
+        routes = {("GET", "/fapi/v3/account"): lambda q: (200, {"assets": []})}
+        async with FuturesRestStandIn(routes) as server:
+            client = _client(server, recv_window=6000)
+            try:
+                assert await client.account() == {"assets": []}
+            finally:
+                await client.close()
+
+        params = server.calls("GET", "/fapi/v3/account")[0]
+        assert params["recvWindow"] == "6000"
+        assert abs(int(params["timestamp"]) - time.time() * 1000) < 5000
+
+    @pytest.mark.asyncio
+    async def test_wrong_secret_maps_to_client_error(self):
+        routes = {("GET", "/fapi/v3/account"): lambda q: (200, {"assets": []})}
+        async with FuturesRestStandIn(routes) as server:
+            client = AsyncBinanceClient(API_KEY, "other-secret", base_url=server.url)
+            try:
+                with pytest.raises(ClientError) as exc_info:
+                    await client.account()
+            finally:
+                await client.close()
+
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.error_code == -1022
+
+    @pytest.mark.asyncio
+    async def test_server_error_mapping(self):
+        routes = {("GET", "/fapi/v1/exchangeInfo"): lambda q: (503, "Service Unavailable")}
+        async with FuturesRestStandIn(routes) as server:
+            client = _client(server)
+            try:
+                with pytest.raises(ServerError) as exc_info:
+                    await client.exchange_info()
+            finally:
+                await client.close()
+
+        assert exc_info.value.status_code == 503
+
+    @pytest.mark.asyncio
+    async def test_payload_encoding_matches_connector(self):
+        routes = {("POST", "/fapi/v1/order"): lambda q: (200, _order_response(1))}
+        async with FuturesRestStandIn(routes) as server:
+            client = _client(server)
+            try:
+                await client.new_order(
+                    symbol="BTCUSDT",
+                    side="BUY",
+                    type="MARKET",
+                    quantity="0.010",
+                    reduceOnly=False,
+                    newClientOrderId=None,
+                )
+            finally:
+                await client.close()
+
+        params = server.calls("POST", "/fapi/v1/order")[0]
+        assert params["reduceOnly"] == "false"
+        assert "newClientOrderId" not in params
+
+    @pytest.mark.asyncio
+    async def test_session_is_reused_across_requests(self):
+        routes = {("GET", "/fapi/v1/premiumIndex"): lambda q: (200, {"markPrice": "1.5"})}
+        async with FuturesRestStandIn(routes) as server:
+            client = _client(server)
+            try:
+                for _ in range(5):
+                    assert await client.get_mark_price("BTCUSDT") == 1.5
+                session = client._session
+                await client.get_mark_price("BTCUSDT")
+                assert client._session is session
+            finally:
+                await client.close()
+
+        # Keep-alive: every sequential request rode the same pooled connection
+        assert len(server.peers) == 1
+        assert client._session is None
+
+    @pytest.mark.asyncio
+    async def test_weight_tracker_fed_from_headers(self):
+        tracker = RequestWeightTracker()
+        routes = {("GET", "/fapi/v1/premiumIndex"): lambda q: (200, {"markPrice": "1.0"})}
+        async with FuturesRestStandIn(routes) as server:
+            client = _client(server, weight_tracker=tracker)
+            try:
+                await client.get_mark_price("BTCUSDT")
+            finally:
+                await client.close()
+
+        assert tracker.current_weight == 7
+
+
+class TestAsyncOrderGateway:
+    def test_is_async_execution_gateway(self):
+        gateway = AsyncOrderGateway(audit_logger=MagicMock(), async_client=MagicMock())
+        assert isinstance(gateway, AsyncExecutionGateway)
+
+    def test_requires_service_or_client(self):
+        with pytest.raises(ValueError):
+            AsyncOrderGateway(audit_logger=MagicMock())
+
+    @pytest.mark.asyncio
+    async def test_execute_signal_places_entry_tp_and_sl(self):
+        async with FuturesRestStandIn(_trading_routes()) as server:
+            gateway = _gateway(server)
+            try:
+                entry, tpsl = await gateway.execute_signal_async(_signal(), quantity=0.0104)
+            finally:
+                await gateway.close()
+
+        assert entry.order_id == "1001"
+        assert server.calls("POST", "/fapi/v1/order")[0]["quantity"] == "0.010"
+
+        assert [o.order_type for o in tpsl] == [OrderType.TAKE_PROFIT_MARKET, OrderType.STOP_MARKET]
+        assert all(o.side == OrderSide.SELL for o in tpsl)
+        assert tpsl[0].stop_price == 52000.0
+        assert tpsl[1].stop_price == 49000.0
+
+        algo_calls = server.calls("POST", "/fapi/v1/algoOrder")
+        assert sorted(c["type"] for c in algo_calls) == ["STOP_MARKET", "TAKE_PROFIT_MARKET"]
+        assert all(c["closePosition"] == "true" for c in algo_calls)
+        assert all(c["workingType"] == "MARK_PRICE" for c in algo_calls)
+        assert gateway.audit_logger.log_order_placed.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_entry_rejection_raises_order_rejected(self):
+        from src.core.exceptions import OrderRejectedError
+
+        routes = _trading_routes()
+        routes[("POST", "/fapi/v1/order")] = lambda q: (
+            400,
+            {"code": -2019, "msg": "Margin is insufficient."},
+        )
+        async with FuturesRestStandIn(routes) as server:
+            gateway = _gateway(server)
+            try:
+                with pytest.raises(OrderRejectedError):
+                    await gateway.execute_signal_async(_signal(), quantity=0.01)
+            finally:
+                await gateway.close()
+
+        gateway.audit_logger.log_order_rejected.assert_called_once()
+        assert server.calls("POST", "/fapi/v1/algoOrder") == []
+
+    @pytest.mark.asyncio
+    async def test_entry_server_error_is_not_retried(self):
+        from src.core.exceptions import OrderExecutionError
+
+        routes = _trading_routes()
+        routes[("POST", "/fapi/v1/order")] = lambda q: (503, "Service Unavailable")
+        async with FuturesRestStandIn(routes) as server:
+            gateway = _gateway(server)
+            try:
+                with pytest.raises(OrderExecutionError):
+                    await gateway.execute_signal_async(_signal(), quantity=0.01)
+            finally:
+                await gateway.close()
+
+        assert len(server.calls("POST", "/fapi/v1/order")) == 1
+
+    @pytest.mark.asyncio
+    async def test_read_retried_after_server_error(self):
+        responses = iter([(503, "Service Unavailable"), (200, {"assets": []})])
+        routes = {("GET", "/fapi/v3/account"): lambda q: next(responses)}
+        async with FuturesRestStandIn(routes) as server:
+            gateway = _gateway(server)
+            try:
+                assert await gateway.get_account_balance_async() == 0.0
+            finally:
+                await gateway.close()
+
+        assert len(server.calls("GET", "/fapi/v3/account")) == 2
+
+    @pytest.mark.asyncio
+    async def test_get_account_balance(self):
+        async with FuturesRestStandIn(_trading_routes()) as server:
+            gateway = _gateway(server)
+            try:
+                assert await gateway.get_account_balance_async() == 1234.5
+            finally:
+                await gateway.close()
+
+    @pytest.mark.asyncio
+    async def test_cancel_all_orders_skips_call_without_open_orders(self):
+        async with FuturesRestStandIn(_trading_routes()) as server:
+            gateway = _gateway(server)
+            try:
+                assert await gateway.cancel_all_orders_async("BTCUSDT") == 0
+            finally:
+                await gateway.close()
+
+        assert server.calls("DELETE", "/fapi/v1/allOpenOrders") == []
+
+    @pytest.mark.asyncio
+    async def test_slow_order_does_not_block_event_loop(self):
+        routes = _trading_routes()
+        async with FuturesRestStandIn(routes, delay={("POST", "/fapi/v1/order"): 0.3}) as server:
+            gateway = _gateway(server)
+            await gateway._ensure_exchange_info()
+            ticks = 0
+
+            async def heartbeat():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+
+            beat = asyncio.create_task(heartbeat())
+            try:
+                await gateway.execute_signal_async(_signal(), quantity=0.01)
+            finally:
+                beat.cancel()
+                await gateway.close()
+
+        # A blocking client would have starved the heartbeat for the whole 300ms
+        assert ticks >= 10
+
+
+class TestConcurrentTpSlPlacement:
+    @pytest.mark.asyncio
+    async def test_tp_and_sl_submitted_concurrently(self):
+        routes = _trading_routes()
+        delay = {("POST", "/fapi/v1/algoOrder"): 0.2}
+        async with FuturesRestStandIn(routes, delay=delay) as server:
+            gateway = _gateway(server)
+            await gateway._ensure_exchange_info()
+            try:
+                started = time.monotonic()
+                _, tpsl = await gateway.execute_signal_async(_signal(), quantity=0.01)
+                elapsed = time.monotonic() - started
+            finally:
+                await gateway.close()
+
+        assert [o.order_type for o in tpsl] == [OrderType.TAKE_PROFIT_MARKET, OrderType.STOP_MARKET]
+        # Sequential placement would take at least 2 x 200ms
+        assert elapsed < 0.4
+        # One mark price lookup shared by both triggers
+        assert len(server.calls("GET", "/fapi/v1/premiumIndex")) == 1
+
+    @pytest.mark.asyncio
+    async def test_client_algo_ids_sent_and_released(self):
+        async with FuturesRestStandIn(_trading_routes()) as server:
+            gateway = _gateway(server)
+            try:
+                await gateway.execute_signal_async(_signal(), quantity=0.01)
+            finally:
+                await gateway.close()
+
+        ids = [c["clientAlgoId"] for c in server.calls("POST", "/fapi/v1/algoOrder")]
+        assert len(set(ids)) == 2
+        assert all(i.startswith(CLIENT_ALGO_ID_PREFIX) and len(i) <= 36 for i in ids)
+        assert not gateway._tracked_client_ids
+        assert not gateway._algo_confirmations
+
+    @pytest.mark.asyncio
+    async def test_ambiguous_failure_confirmed_by_algo_update(self):
+        routes = _trading_routes()
+        placed = routes[("POST", "/fapi/v1/algoOrder")]
+        gateway = None
+
+        def algo_order(q):
+            if q["type"] == "STOP_MARKET":
+                # Applied by the exchange, but the response is lost
+                threading.Timer(
+                    0.05,
+                    gateway.on_algo_update,
+                    [{"caid": q["clientAlgoId"], "aid": 4242, "X": "NEW", "tp": "49000.0"}],
+                ).start()
+                return 503, "Service Unavailable"
+            return placed(q)
+
+        routes[("POST", "/fapi/v1/algoOrder")] = algo_order
+        async with FuturesRestStandIn(routes) as server:
+            gateway = _gateway(server)
+            try:
+                _, tpsl = await gateway.execute_signal_async(_signal(), quantity=0.01)
+            finally:
+                await gateway.close()
+
+        # No duplicate submission, no emergency close
+        assert len(server.calls("POST", "/fapi/v1/algoOrder")) == 2
+        assert len(server.calls("POST", "/fapi/v1/order")) == 1
+        sl = tpsl[1]
+        assert sl.order_type == OrderType.STOP_MARKET
+        assert sl.order_id == "4242"
+        assert sl.stop_price == 49000.0
+
+    @pytest.mark.asyncio
+    async def test_unconfirmed_failure_resubmitted_with_same_client_id(self):
+        routes = _trading_routes()
+        placed = routes[("POST", "/fapi/v1/algoOrder")]
+        failures = iter([True])
+
+        def algo_order(q):
+            if q["type"] == "STOP_MARKET" and next(failures, False):
+                return 503, "Service Unavailable"
+            return placed(q)
+
+        routes[("POST", "/fapi/v1/algoOrder")] = algo_order
+        async with FuturesRestStandIn(routes) as server:
+            gateway = _gateway(server, confirm_timeout=0.05)
+            try:
+                _, tpsl = await gateway.execute_signal_async(_signal(), quantity=0.01)
+            finally:
+                await gateway.close()
+
+        assert [o.order_type for o in tpsl] == [OrderType.TAKE_PROFIT_MARKET, OrderType.STOP_MARKET]
+        sl_calls = [
+            c for c in server.calls("POST", "/fapi/v1/algoOrder") if c["type"] == "STOP_MARKET"
+        ]
+        assert len(sl_calls) == 2
+        assert sl_calls[0]["clientAlgoId"] == sl_calls[1]["clientAlgoId"]
+
+    @pytest.mark.asyncio
+    async def test_late_order_found_by_client_id_not_resubmitted(self):
+        routes = _trading_routes()
+        placed = routes[("POST", "/fapi/v1/algoOrder")]
+        landed = []
+
+        def algo_order(q):
+            if q["type"] == "STOP_MARKET":
+                # Applied by the exchange, but neither response nor ALGO_UPDATE arrives
+                landed.append(
+                    {
+                        "algoId": 4343,
+                        "clientAlgoId": q["clientAlgoId"],
+                        "orderType": "STOP_MARKET",
+                        "triggerPrice": q["triggerPrice"],
+                    }
+                )
+                return 503, "Service Unavailable"
+            return placed(q)
+
+        routes[("POST", "/fapi/v1/algoOrder")] = algo_order
+        routes[("GET", "/fapi/v1/openAlgoOrders")] = lambda q: (200, landed)
+        routes[("DELETE", "/fapi/v1/algoOrder")] = lambda q: (200, {"algoId": q["algoId"]})
+        async with FuturesRestStandIn(routes) as server:
+            gateway = _gateway(server, confirm_timeout=0.05)
+            try:
+                _, tpsl = await gateway.execute_signal_async(_signal(), quantity=0.01)
+            finally:
+                await gateway.close()
+
+        sl_calls = [
+            c for c in server.calls("POST", "/fapi/v1/algoOrder") if c["type"] == "STOP_MARKET"
+        ]
+        assert len(sl_calls) == 1
+        assert server.calls("DELETE", "/fapi/v1/algoOrder") == []
+        sl = tpsl[1]
+        assert sl.order_type == OrderType.STOP_MARKET
+        assert sl.order_id == "4343"
+        assert sl.client_order_id == sl_calls[0]["clientAlgoId"]
+
+    @pytest.mark.asyncio
+    async def test_duplicate_rejection_of_own_client_id_keeps_order(self):
+        routes = _trading_routes()
+        routes[("POST", "/fapi/v1/algoOrder")] = lambda q: (
+            400,
+            {"code": -4130, "msg": "closePosition order exists"},
+        )
+        routes[("GET", "/fapi/v1/openAlgoOrders")] = lambda q: (
+            200,
+            [
+                {
+                    "algoId": 11,
+                    "clientAlgoId": "tpsl-resubmitted",
+                    "orderType": "TAKE_PROFIT_MARKET",
+                    "triggerPrice": "52000.0",
+                }
+            ],
+        )
+        routes[("DELETE", "/fapi/v1/algoOrder")] = lambda q: (200, {"algoId": q["algoId"]})
+        async with FuturesRestStandIn(routes) as server:
+            gateway = _gateway(server)
+            try:
+                order = await gateway._place_exit_order_async(
+                    _signal(),
+                    OrderSide.SELL,
+                    OrderType.TAKE_PROFIT_MARKET,
+                    client_algo_id="tpsl-resubmitted",
+                )
+            finally:
+                await gateway.close()
+
+        assert order.order_id == "11"
+        assert server.calls("DELETE", "/fapi/v1/algoOrder") == []
+
+    @pytest.mark.asyncio
+    async def test_duplicate_rejection_cancels_only_same_type(self):
+        routes = _trading_routes()
+        placed = routes[("POST", "/fapi/v1/algoOrder")]
+        duplicate = iter([True])
+
+        def algo_order(q):
+            if q["type"] == "TAKE_PROFIT_MARKET" and next(duplicate, False):
+                return 400, {"code": -4130, "msg": "closePosition order exists"}
+            return placed(q)
+
+        routes[("POST", "/fapi/v1/algoOrder")] = algo_order
+        routes[("GET", "/fapi/v1/openAlgoOrders")] = lambda q: (
+            200,
+            [
+                {"algoId": 11, "orderType": "TAKE_PROFIT_MARKET"},
+                {"algoId": 12, "orderType": "STOP_MARKET"},
+            ],
+        )
+        routes[("DELETE", "/fapi/v1/algoOrder")] = lambda q: (200, {"algoId": q["algoId"]})
+        async with FuturesRestStandIn(routes) as server:
+            gateway = _gateway(server)
+            try:
+                await gateway._place_exit_order_async(
+                    _signal(), OrderSide.SELL, OrderType.TAKE_PROFIT_MARKET
+                )
+            finally:
+                await gateway.close()
+
+        assert [c["algoId"] for c in server.calls("DELETE", "/fapi/v1/algoOrder")] == ["11"]
+
+    def test_untracked_algo_update_ignored(self):
+        gateway = AsyncOrderGateway(audit_logger=MagicMock(), async_client=MagicMock())
+        gateway.on_algo_update({"caid": "manual-order", "aid": 1, "X": "NEW"})
+        assert gateway._algo_confirmations == {}
+
+
+class TestTradeCoordinatorAsyncPath:
+    @pytest.mark.asyncio
+    async def test_entry_signal_uses_async_gateway(self):
+        risk_guard = MagicMock()
+        risk_guard.validate_risk.return_value = True
+        risk_guard.calculate_position_size.return_value = 0.01
+        position_cache = MagicMock()
+        position_cache.get_fresh_async = AsyncMock(return_value=None)
+        config_manager = MagicMock()
+        config_manager.trading_config.leverage = 10
+
+        async with FuturesRestStandIn(_trading_routes()) as server:
+            gateway = _gateway(server)
+            # The blocking API must not be used on this path
+            gateway.get_open_orders = MagicMock(side_effect=AssertionError("blocking call"))
+            gateway.get_account_balance = MagicMock(side_effect=AssertionError("blocking call"))
+            gateway.execute_signal = MagicMock(side_effect=AssertionError("blocking call"))
+
+            coordinator = TradeCoordinator(
+                order_gateway=gateway,
+                risk_guard=risk_guard,
+                config_manager=config_manager,
+                audit_logger=MagicMock(),
+                position_cache_manager=position_cache,
+            )
+            try:
+                await coordinator.on_signal_generated(Event(EventType.SIGNAL_GENERATED, _signal()))
+            finally:
+                await gateway.close()
+
+        assert len(server.calls("POST", "/fapi/v1/order")) == 1
+        assert len(server.calls("POST", "/fapi/v1/algoOrder")) == 2
+        risk_guard.calculate_position_size.assert_called_once()
+        assert risk_guard.calculate_position_size.call_args.kwargs["account_balance"] == 1234.5
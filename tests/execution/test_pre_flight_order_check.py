@@ -83,7 +83,7 @@ def mock_order_gateway():
 @pytest.fixture
 def mock_position_cache():
     cache = MagicMock()
-    cache.get_fresh.return_value = None  # No existing position
+    cache.get_fresh_async = AsyncMock(return_value=None)  # No existing position
     cache.invalidate.return_value = None
     return cache
 
@@ -377,7 +377,7 @@ class TestEntryGuard:
         event2 = Event(EventType.SIGNAL_GENERATED, signal2)
 
         # Second call sees position from first → risk_guard rejects
-        mock_position_cache.get_fresh.side_effect = [None, MagicMock()]
+        mock_position_cache.get_fresh_async.side_effect = [None, MagicMock()]
         mock_risk_guard.validate_risk.side_effect = [True, False]
 
         await asyncio.gather(
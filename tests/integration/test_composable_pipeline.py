@@ -73,6 +73,7 @@ def _make_position_cache_manager():
     pcm.cache = {"BTCUSDT": (None, time.time())}
     pcm._last_signal_time = {}
     pcm._ttl = 60.0
+    pcm.is_uncertain.return_value = False
     return pcm
 
 
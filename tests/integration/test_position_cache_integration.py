@@ -6,6 +6,8 @@ as the single source of truth for position data, eliminating the previous
 dual-cache inconsistency between PositionCacheManager and OrderGateway.
 """
 
+import asyncio
+import threading
 import time
 from unittest.mock import MagicMock, Mock, AsyncMock
 
@@ -111,3 +113,272 @@ class TestPositionCacheSingleSourceOfTruth:
 
         assert "BTCUSDT" not in position_cache_manager.cache
         assert "BTCUSDT" not in position_cache_manager._last_signal_time
+
+
+class TestPositionCachePushMode:
+    """Push mode: WebSocket-authoritative cache with background reconciliation."""
+
+    @pytest.fixture
+    def gateway(self):
+        from src.execution.base import AsyncExecutionGateway
+
+        gw = MagicMock(spec=AsyncExecutionGateway)
+        gw.get_position = Mock(side_effect=AssertionError("hot-path REST call"))
+        gw.get_all_positions = AsyncMock(
+            return_value=[
+                {
+                    "symbol": "BTCUSDT",
+                    "positionAmt": "-0.010",
+                    "entryPrice": "50000.0",
+                    "unrealizedProfit": "1.5",
+                    "leverage": "10",
+                }
+            ]
+        )
+        return gw
+
+    @pytest.fixture
+    def pcm(self, gateway):
+        cm = MagicMock()
+        cm.trading_config.leverage = 10
+        return PositionCacheManager(
+            order_gateway=gateway,
+            config_manager=cm,
+            ttl=60.0,
+            reconcile_interval=3600.0,
+        )
+
+    @staticmethod
+    def _ws_update(symbol, amt, entry_price=51000.0):
+        update = MagicMock()
+        update.symbol = symbol
+        update.position_amt = amt
+        update.entry_price = entry_price
+        update.unrealized_pnl = 0.0
+        return update
+
+    @pytest.mark.asyncio
+    async def test_start_loads_all_symbols_with_one_batched_call(self, pcm, gateway):
+        await pcm.start(["BTCUSDT", "ETHUSDT"])
+        try:
+            await asyncio.sleep(0)
+            btc = pcm.get("BTCUSDT")
+            assert btc.side == "SHORT"
+            assert btc.quantity == 0.010
+            assert pcm.get("ETHUSDT") is None
+            assert pcm.is_uncertain("ETHUSDT") is False  # Confirmed flat
+        finally:
+            await pcm.stop()
+
+        gateway.get_all_positions.assert_awaited_once_with(["BTCUSDT", "ETHUSDT"], quiet=True)
+        gateway.get_position.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_reads_never_block_on_rest(self, pcm, gateway):
+        gateway.get_all_positions = AsyncMock(side_effect=RuntimeError("down"))
+        await pcm.start(["BTCUSDT"])
+        try:
+            await asyncio.sleep(0)
+            # Never loaded and reconciliation failing: uncertain, no REST fallback
+            assert pcm.get("BTCUSDT") is None
+            assert pcm.is_uncertain("BTCUSDT") is True
+        finally:
+            await pcm.stop()
+
+        gateway.get_position.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_websocket_update_is_authoritative(self, pcm, gateway):
+        await pcm.start(["BTCUSDT"])
+        try:
+            await asyncio.sleep(0)
+            pcm.update_from_websocket([self._ws_update("BTCUSDT", 0.02)], {"BTCUSDT"})
+            position = pcm.get("BTCUSDT")
+            assert position.side == "LONG"
+            assert position.quantity == 0.02
+            assert pcm.get_fresh("BTCUSDT") is position  # Confirmed state, no REST
+        finally:
+            await pcm.stop()
+
+        gateway.get_position.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_snapshot_does_not_overwrite_newer_websocket_update(self, pcm, gateway):
+        async def slow_snapshot(symbols, quiet=False):
+            # Fill pushed over WebSocket while the REST query is in flight
+            pcm.update_from_websocket([self._ws_update("BTCUSDT", 0.0)], {"BTCUSDT"})
+            return [
+                {"symbol": "BTCUSDT", "positionAmt": "-0.010", "entryPrice": "50000.0"}
+            ]
+
+        gateway.get_all_positions = slow_snapshot
+        pcm._symbols = ["BTCUSDT"]
+
+        assert await pcm.reconcile() is True
+        assert pcm.get("BTCUSDT") is None
+        assert pcm.is_uncertain("BTCUSDT") is False
+
+    @pytest.mark.asyncio
+    async def test_invalidate_marks_uncertain_and_triggers_reconcile(self, pcm, gateway):
+        await pcm.start(["BTCUSDT"])
+        try:
+            await asyncio.sleep(0)
+            assert gateway.get_all_positions.await_count == 1
+
+            pcm.invalidate("BTCUSDT")
+            assert pcm.is_uncertain("BTCUSDT") is True
+            assert pcm.get("BTCUSDT") is None
+
+            for _ in range(10):
+                await asyncio.sleep(0)
+            # Woken up long before the one-hour interval
+            assert gateway.get_all_positions.await_count == 2
+            assert pcm.get("BTCUSDT").side == "SHORT"
+        finally:
+            await pcm.stop()
+
+    @pytest.mark.asyncio
+    async def test_unconfirmed_entry_becomes_uncertain_after_ttl(self, pcm):
+        pcm._running = True  # Push-mode reads without the background task
+        pcm.update_from_websocket([self._ws_update("BTCUSDT", 0.02)], {"BTCUSDT"})
+        assert pcm.get("BTCUSDT") is not None
+
+        position, _ = pcm.cache["BTCUSDT"]
+        pcm.cache["BTCUSDT"] = (position, time.time() - 61.0)
+        assert pcm.is_uncertain("BTCUSDT") is True
+        assert pcm.get("BTCUSDT") is None
+
+    @pytest.mark.asyncio
+    async def test_drift_is_corrected_from_exchange(self, pcm, gateway):
+        pcm._symbols = ["BTCUSDT"]
+        pcm.update_from_websocket([self._ws_update("BTCUSDT", 0.02)], {"BTCUSDT"})
+
+        await pcm.reconcile()
+
+        assert pcm.drift_corrections == 1
+        assert pcm.cache["BTCUSDT"][0].side == "SHORT"
+
+    @pytest.mark.asyncio
+    async def test_stop_returns_to_pull_mode(self, pcm, gateway):
+        await pcm.start(["BTCUSDT"])
+        await pcm.stop()
+        await pcm.stop()  # Idempotent
+
+        assert pcm.push_mode is False
+        assert pcm._reconcile_task is None
+
+    @pytest.mark.asyncio
+    async def test_push_mode_get_fresh_never_queries_rest(self, pcm, gateway):
+        pcm._running = True  # Push-mode reads without the background task
+
+        assert pcm.get_fresh("BTCUSDT") is None  # Uncertain: use get_fresh_async
+        gateway.get_position.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_blocking_gateway_reconciles_off_the_loop(self, pcm):
+        release = threading.Event()
+        query_threads = []
+
+        def get_all_positions_sync(symbols, quiet=False):
+            query_threads.append(threading.get_ident())
+            release.wait(timeout=5.0)
+            return []
+
+        gateway = MagicMock()
+        gateway.get_all_positions_sync = Mock(side_effect=get_all_positions_sync)
+        gateway.get_all_positions = AsyncMock(side_effect=AssertionError("ran on the loop"))
+        pcm._order_gateway = gateway
+
+        await pcm.start(["BTCUSDT"])
+        try:
+            for _ in range(100):
+                if query_threads:
+                    break
+                await asyncio.sleep(0.01)
+            # The loop keeps running while the positionRisk query is in flight
+            await asyncio.sleep(0.05)
+            assert pcm.reconciliations == 0
+            assert query_threads[0] != threading.get_ident()
+
+            release.set()
+            for _ in range(100):
+                if pcm.reconciliations:
+                    break
+                await asyncio.sleep(0.01)
+            assert pcm.reconciliations == 1
+            assert pcm.is_uncertain("BTCUSDT") is False  # Confirmed flat
+        finally:
+            release.set()
+            await pcm.stop()
+
+        gateway.get_all_positions_sync.assert_called_once_with(["BTCUSDT"], quiet=True)
+
+
+class TestPositionCacheFreshAsync:
+    """get_fresh_async: the signal hot path never blocks the event loop."""
+
+    @staticmethod
+    def _pcm(gateway):
+        cm = MagicMock()
+        cm.trading_config.leverage = 10
+        return PositionCacheManager(order_gateway=gateway, config_manager=cm, ttl=60.0)
+
+    @staticmethod
+    def _position():
+        return Position(
+            symbol="BTCUSDT", side="LONG", quantity=0.001, entry_price=50000.0, leverage=10
+        )
+
+    @pytest.mark.asyncio
+    async def test_async_gateway_is_awaited(self):
+        from src.execution.base import AsyncExecutionGateway
+
+        gateway = MagicMock(spec=AsyncExecutionGateway)
+        gateway.get_position_async = AsyncMock(return_value=self._position())
+        gateway.get_position = Mock(side_effect=AssertionError("blocking REST call"))
+        pcm = self._pcm(gateway)
+
+        position = await pcm.get_fresh_async("BTCUSDT")
+
+        assert position.side == "LONG"
+        gateway.get_position_async.assert_awaited_once_with("BTCUSDT")
+        assert pcm.is_uncertain("BTCUSDT") is False
+
+    @pytest.mark.asyncio
+    async def test_blocking_gateway_runs_off_the_loop(self):
+        loop_thread = threading.get_ident()
+        query_threads = []
+
+        def get_position(symbol):
+            query_threads.append(threading.get_ident())
+            return None
+
+        gateway = MagicMock()
+        gateway.get_position = Mock(side_effect=get_position)
+        pcm = self._pcm(gateway)
+
+        assert await pcm.get_fresh_async("BTCUSDT") is None
+        assert query_threads and query_threads[0] != loop_thread
+        assert pcm.is_uncertain("BTCUSDT") is False  # Confirmed flat
+
+    @pytest.mark.asyncio
+    async def test_failure_returns_none_and_stays_uncertain(self):
+        gateway = MagicMock()
+        gateway.get_position = Mock(side_effect=RuntimeError("timeout"))
+        pcm = self._pcm(gateway)
+
+        assert await pcm.get_fresh_async("BTCUSDT") is None
+        assert pcm.is_uncertain("BTCUSDT") is True
+
+    @pytest.mark.asyncio
+    async def test_push_mode_confirmed_entry_skips_rest(self):
+        gateway = MagicMock()
+        gateway.get_position = Mock(side_effect=AssertionError("hot-path REST call"))
+        pcm = self._pcm(gateway)
+        pcm._running = True  # Push-mode reads without the background task
+        pcm._store("BTCUSDT", self._position())
+
+        position = await pcm.get_fresh_async("BTCUSDT")
+
+        assert position.side == "LONG"
+        gateway.get_position.assert_not_called()
@@ -8,7 +8,6 @@ Tests verify:
 - Concrete implementation compliance with interface
 """
 
-from collections import deque
 from datetime import datetime, timezone
 from typing import Optional
 
@@ -17,6 +16,7 @@ import pytest
 from src.models.candle import Candle
 from src.models.signal import Signal, SignalType
 from src.strategies.base import BaseStrategy
+from src.strategies.candle_store import CandleStore
 
 # ============================================================================
 # Test Helper: Concrete Strategy Implementation
@@ -172,7 +172,7 @@ class TestBaseStrategyInitialization:
         assert strategy.buffer_size == 100  # Default value
         # Access buffer via unified buffers dict (Issue #27)
         default_buffer = strategy.buffers['1m']
-        assert isinstance(default_buffer, deque)
+        assert isinstance(default_buffer, CandleStore)
         assert default_buffer.maxlen == 100
         assert len(default_buffer) == 0
 
@@ -185,7 +185,7 @@ class TestBaseStrategyInitialization:
         assert strategy.buffer_size == 200  # Custom value
         # Access buffer via unified buffers dict (Issue #27)
         default_buffer = strategy.buffers['1m']
-        assert isinstance(default_buffer, deque)
+        assert isinstance(default_buffer, CandleStore)
         assert default_buffer.maxlen == 200
         assert len(default_buffer) == 0
 
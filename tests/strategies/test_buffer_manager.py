@@ -185,3 +185,32 @@ class TestBufferManagerQueries:
         assert bm.get_current_size(None) == 1
         assert bm.get_latest(1, None) == [bm.buffers["5m"][-1]]
         assert bm.is_buffer_ready(1, None) is True
+
+
+class TestBufferManagerArrays:
+    """Test columnar array access."""
+
+    def test_get_arrays_returns_latest_views(self):
+        bm = BufferManager(buffer_size=5, intervals=["5m"])
+        for i in range(8):
+            bm.update(_make_candle("5m", close=100 + i, index=i))
+        cols = bm.get_arrays(3, "5m")
+        assert cols is not None
+        assert cols.close.tolist() == [105.0, 106.0, 107.0]
+        assert cols.high.tolist() == [106.0, 107.0, 108.0]
+
+    def test_get_arrays_whole_buffer(self):
+        bm = BufferManager(buffer_size=10, intervals=["5m"])
+        for i in range(4):
+            bm.update(_make_candle("5m", close=100 + i, index=i))
+        cols = bm.get_arrays(interval="5m")
+        assert len(cols) == 4
+
+    def test_get_arrays_insufficient_data(self):
+        bm = BufferManager(buffer_size=10, intervals=["5m"])
+        bm.update(_make_candle("5m", close=100))
+        assert bm.get_arrays(5, "5m") is None
+
+    def test_get_arrays_unknown_interval(self):
+        bm = BufferManager(buffer_size=10, intervals=["5m"])
+        assert bm.get_arrays(1, "1h") is None
@@ -0,0 +1,160 @@
+"""Unit tests for the columnar CandleStore."""
+
+import time
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from src.models.candle import Candle
+from src.strategies.candle_store import CandleStore
+
+
+def _make_candle(index: int, close: float = 100.0) -> Candle:
+    """Helper to create sequential 5m test candles."""
+    open_time = datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(minutes=5 * index)
+    return Candle(
+        symbol="BTCUSDT",
+        interval="5m",
+        open_time=open_time,
+        close_time=open_time + timedelta(minutes=5),
+        open=close - 1,
+        high=close + 1,
+        low=close - 2,
+        close=close,
+        volume=10.0 + index,
+        is_closed=True,
+    )
+
+
+class TestCandleStoreSequence:
+    """Deque-compatible sequence behaviour."""
+
+    def test_invalid_maxlen(self):
+        with pytest.raises(ValueError):
+            CandleStore(maxlen=0)
+
+    def test_append_and_index(self):
+        store = CandleStore(maxlen=3)
+        candles = [_make_candle(i, 100 + i) for i in range(2)]
+        store.extend(candles)
+        assert len(store) == 2
+        assert store[0] is candles[0]
+        assert store[-1] is candles[1]
+        assert store.maxlen == 3
+
+    def test_fifo_eviction_keeps_order(self):
+        store = CandleStore(maxlen=3)
+        candles = [_make_candle(i, 100 + i) for i in range(7)]
+        store.extend(candles)
+        assert list(store) == candles[-3:]
+        assert list(reversed(store)) == candles[-3:][::-1]
+        assert store[1:] == candles[-2:]
+
+    def test_index_out_of_range(self):
+        store = CandleStore(maxlen=3)
+        store.append(_make_candle(0))
+        with pytest.raises(IndexError):
+            store[1]
+
+    def test_clear(self):
+        store = CandleStore(maxlen=3)
+        store.extend(_make_candle(i) for i in range(5))
+        store.clear()
+        assert len(store) == 0
+        assert not store
+        assert list(store) == []
+        assert len(store.columns()) == 0
+
+    def test_latest(self):
+        store = CandleStore(maxlen=4)
+        candles = [_make_candle(i, 100 + i) for i in range(6)]
+        store.extend(candles)
+        assert store.latest(2) == candles[-2:]
+        assert store.latest(10) == candles[-4:]
+
+
+class TestCandleStoreColumns:
+    """Columnar NumPy views."""
+
+    def test_columns_match_candles_after_wraparound(self):
+        store = CandleStore(maxlen=4)
+        candles = [_make_candle(i, 100 + i) for i in range(11)]
+        for n, candle in enumerate(candles, start=1):
+            store.append(candle)
+            expected = candles[max(0, n - 4) : n]
+            cols = store.columns()
+            assert cols.close.tolist() == [c.close for c in expected]
+            assert cols.high.tolist() == [c.high for c in expected]
+            assert cols.low.tolist() == [c.low for c in expected]
+            assert cols.open.tolist() == [c.open for c in expected]
+            assert cols.volume.tolist() == [c.volume for c in expected]
+
+    def test_timestamps_in_milliseconds(self):
+        store = CandleStore(maxlen=2)
+        candle = _make_candle(0)
+        store.append(candle)
+        cols = store.columns()
+        assert cols.open_time.dtype == np.int64
+        assert cols.open_time[0] == int(candle.open_time.timestamp() * 1000)
+        assert cols.close_time[0] == int(candle.close_time.timestamp() * 1000)
+
+    def test_naive_utc_timestamps_ignore_local_timezone(self, monkeypatch):
+        monkeypatch.setenv("TZ", "America/New_York")
+        time.tzset()
+        try:
+            open_time = datetime(2023, 11, 14, 22, 13, 20)  # Naive UTC, 1700000000000 ms
+            candle = Candle(
+                symbol="BTCUSDT",
+                interval="5m",
+                open_time=open_time,
+                close_time=open_time + timedelta(minutes=5),
+                open=100.0,
+                high=101.0,
+                low=99.0,
+                close=100.5,
+                volume=1.0,
+                is_closed=True,
+            )
+            store = CandleStore(maxlen=2, candles=[candle])
+            cols = store.columns()
+            assert cols.open_time[0] == 1700000000000
+            assert cols.close_time[0] == 1700000300000
+        finally:
+            monkeypatch.delenv("TZ")
+            time.tzset()
+
+    def test_append_keeps_exchange_candle_times_lazy(self):
+        candle = Candle.from_exchange(
+            symbol="BTCUSDT",
+            interval="1m",
+            open_time_ms=1700000000000,
+            close_time_ms=1700000059999,
+            open=100.0,
+            high=101.0,
+            low=99.0,
+            close=100.5,
+            volume=1.0,
+            is_closed=False,
+        )
+        store = CandleStore(maxlen=2, candles=[candle])
+
+        assert store.columns().open_time[0] == 1700000000000
+        assert store.columns().close_time[0] == 1700000059999
+        assert candle.__dict__["_open_time"] is None
+        assert candle.__dict__["_close_time"] is None
+
+    def test_columns_are_zero_copy_and_read_only(self):
+        store = CandleStore(maxlen=5)
+        store.extend(_make_candle(i, 100 + i) for i in range(7))
+        cols = store.columns(3)
+        assert cols.close.base is not None
+        assert not cols.close.flags.writeable
+        with pytest.raises(ValueError):
+            cols.close[0] = 0.0
+
+    def test_columns_count_clamped(self):
+        store = CandleStore(maxlen=5)
+        store.extend(_make_candle(i, 100 + i) for i in range(2))
+        assert len(store.columns(10)) == 2
+        assert len(store.columns(0)) == 0
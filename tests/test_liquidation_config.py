@@ -122,6 +122,19 @@ class TestLiquidationConfigRangeValidation:
         config = LiquidationConfig(retry_delay_seconds=1.0)
         assert config.retry_delay_seconds == 1.0
 
+    def test_max_concurrency_range(self):
+        """max_concurrency must be 1-50."""
+        with pytest.raises(ConfigurationError, match="must be 1-50"):
+            LiquidationConfig(max_concurrency=0)
+        with pytest.raises(ConfigurationError, match="must be 1-50"):
+            LiquidationConfig(max_concurrency=51)
+        assert LiquidationConfig(max_concurrency=1).max_concurrency == 1
+
+    def test_max_concurrency_must_be_int(self):
+        """max_concurrency must be int."""
+        with pytest.raises(ConfigurationError, match="max_concurrency must be int"):
+            LiquidationConfig(max_concurrency=4.0)
+
 
 class TestLiquidationConfigConsistencyValidation:
     """Test cross-field consistency validation."""
@@ -261,3 +274,4 @@ class TestLiquidationConfigSerialization:
         assert restored.timeout_seconds == original.timeout_seconds
         assert restored.max_retries == original.max_retries
         assert restored.retry_delay_seconds == original.retry_delay_seconds
+        assert restored.max_concurrency == original.max_concurrency
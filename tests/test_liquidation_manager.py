@@ -8,13 +8,18 @@ Test Coverage:
 - Audit logging (all operations logged with correlation IDs)
 - Configuration-driven behavior (emergency_liquidation flag)
 - Result states (COMPLETED, PARTIAL, FAILED, SKIPPED)
+- Bounded-concurrency parallel cancel/close (weight-aware)
 """
 
 import asyncio
+import threading
+import time
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from src.core.audit_logger import AuditLogger
+from src.core.binance_service import RequestWeightTracker
+from src.execution.base import AsyncExecutionGateway
 from src.execution.liquidation_manager import (
     LiquidationManager,
     LiquidationState,
@@ -375,3 +380,181 @@ class TestLiquidationResultHelpers:
         assert result_dict["orders_cancelled"] == 3
         assert result_dict["orders_failed"] == 1
         assert result_dict["total_duration_seconds"] == 2.345
+
+
+def _positions(count):
+    return [
+        {
+            "symbol": f"SYM{i}USDT",
+            "positionAmt": "1.0" if i % 2 == 0 else "-1.0",
+            "entryPrice": "100",
+            "unrealizedProfit": "0",
+        }
+        for i in range(count)
+    ]
+
+
+class InFlightCounter:
+    """Async execute_market_close stand-in recording peak concurrency."""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.in_flight = 0
+        self.peak = 0
+        self.calls = []
+        self._lock = threading.Lock()  # Blocking-gateway closes run in worker threads
+
+    async def __call__(self, symbol, position_amt, side, reduce_only):
+        with self._lock:
+            self.calls.append(symbol)
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+        return {"success": True, "order_id": f"close-{symbol}", "avg_price": 100.0}
+
+
+class TestParallelLiquidation:
+    """Test bounded-concurrency parallel cancel/close."""
+
+    @staticmethod
+    def _manager(gateway, audit_logger, **config):
+        return LiquidationManager(
+            order_gateway=gateway,
+            audit_logger=audit_logger,
+            config=LiquidationConfig(timeout_seconds=10.0, retry_delay_seconds=0.1, **config),
+        )
+
+    @pytest.mark.asyncio
+    async def test_positions_closed_in_parallel_within_bound(
+        self, mock_order_gateway, mock_audit_logger
+    ):
+        """Closes overlap, but never more than max_concurrency at once."""
+        closer = InFlightCounter(delay=0.05)
+        mock_order_gateway.get_all_positions = AsyncMock(return_value=_positions(12))
+        mock_order_gateway.execute_market_close = closer
+        manager = self._manager(mock_order_gateway, mock_audit_logger, max_concurrency=4)
+
+        started = time.perf_counter()
+        result = await manager.execute_liquidation([p["symbol"] for p in _positions(12)])
+        elapsed = time.perf_counter() - started
+
+        assert result.state == LiquidationState.COMPLETED
+        assert result.positions_closed == 12
+        assert closer.peak == 4
+        # Sequential closing would take 12 x 50ms
+        assert elapsed < 0.4
+
+    @pytest.mark.asyncio
+    async def test_blocking_gateway_closes_overlap(self, mock_order_gateway, mock_audit_logger):
+        """A blocking OrderGateway's closes run in worker threads, not one by one."""
+        loop_thread = threading.get_ident()
+        lock = threading.Lock()
+        close_threads = set()
+        in_flight = peak = 0
+
+        async def close(symbol, position_amt, side, reduce_only):
+            nonlocal in_flight, peak
+            with lock:
+                close_threads.add(threading.get_ident())
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.05)  # Sync client call inside the coroutine
+            with lock:
+                in_flight -= 1
+            return {"success": True, "order_id": f"close-{symbol}", "avg_price": 100.0}
+
+        mock_order_gateway.get_all_positions = AsyncMock(return_value=_positions(4))
+        mock_order_gateway.execute_market_close = close
+        manager = self._manager(mock_order_gateway, mock_audit_logger, max_concurrency=4)
+
+        started = time.perf_counter()
+        result = await manager.execute_liquidation([p["symbol"] for p in _positions(4)])
+        elapsed = time.perf_counter() - started
+
+        assert result.positions_closed == 4
+        assert loop_thread not in close_threads
+        assert peak > 1
+        # Sequential closing would take 4 x 50ms
+        assert elapsed < 0.18
+
+    @pytest.mark.asyncio
+    async def test_per_symbol_retry_does_not_hold_up_others(
+        self, mock_order_gateway, mock_audit_logger
+    ):
+        """A failing symbol retries with backoff while the rest complete."""
+        attempts = {}
+
+        async def close(symbol, position_amt, side, reduce_only):
+            attempts[symbol] = attempts.get(symbol, 0) + 1
+            if symbol == "SYM0USDT":
+                raise RuntimeError("API error")
+            if symbol == "SYM1USDT" and attempts[symbol] == 1:
+                return {"success": False, "error": "rejected"}
+            return {"success": True, "order_id": "1", "avg_price": 100.0}
+
+        mock_order_gateway.get_all_positions = AsyncMock(return_value=_positions(4))
+        mock_order_gateway.execute_market_close = close
+        manager = self._manager(mock_order_gateway, mock_audit_logger, max_retries=3)
+
+        result = await manager.execute_liquidation([p["symbol"] for p in _positions(4)])
+
+        assert attempts == {"SYM0USDT": 3, "SYM1USDT": 2, "SYM2USDT": 1, "SYM3USDT": 1}
+        assert result.positions_closed == 3
+        assert result.positions_failed == 1
+        assert result.state == LiquidationState.PARTIAL
+
+        operations = [c.kwargs["operation"] for c in mock_audit_logger.log_event.call_args_list]
+        assert operations.count("liquidation_close_position_retry") == 3
+
+    @pytest.mark.asyncio
+    async def test_near_weight_limit_serializes_requests(
+        self, mock_order_gateway, mock_audit_logger
+    ):
+        """Above the weight threshold only one request is in flight."""
+        tracker = RequestWeightTracker()
+        tracker.current_weight = 2200
+        tracker.updated_at = time.time()
+        # Keep the report in the current 1-minute window for the whole test
+        if tracker.seconds_until_reset() < 2:
+            await asyncio.sleep(tracker.seconds_until_reset() + 0.01)
+            tracker.updated_at = time.time()
+
+        closer = InFlightCounter(delay=0.01)
+        mock_order_gateway.weight_tracker = tracker
+        mock_order_gateway.get_all_positions = AsyncMock(return_value=_positions(5))
+        mock_order_gateway.execute_market_close = closer
+        manager = self._manager(mock_order_gateway, mock_audit_logger, max_concurrency=8)
+
+        result = await manager.execute_liquidation([p["symbol"] for p in _positions(5)])
+
+        assert result.positions_closed == 5
+        assert closer.peak == 1
+
+    @pytest.mark.asyncio
+    async def test_orders_cancelled_in_parallel_on_async_gateway(self, mock_audit_logger):
+        """An AsyncExecutionGateway is cancelled through its awaitable API."""
+        in_flight = peak = 0
+
+        async def cancel(symbol):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.02)
+            in_flight -= 1
+            return 2
+
+        gateway = MagicMock(spec=AsyncExecutionGateway)
+        gateway.cancel_all_orders_async = cancel
+        gateway.cancel_all_orders = MagicMock(side_effect=AssertionError("blocking call"))
+        gateway.get_all_positions = AsyncMock(return_value=[])
+        manager = self._manager(gateway, mock_audit_logger, max_concurrency=3)
+
+        result = await manager.execute_liquidation(["A", "B", "C", "D", "E"])
+
+        assert result.orders_cancelled == 10
+        assert result.orders_failed == 0
+        assert peak == 3
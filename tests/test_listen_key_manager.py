@@ -391,6 +391,27 @@ class TestPrivateUserStreamerOrderHandling:
 
             mock_handler.assert_called_once()
 
+    def test_handle_user_data_message_algo_update(self, user_streamer):
+        """Test ALGO_UPDATE payloads are relayed to the algo update callback."""
+        mock_callback = Mock()
+        user_streamer.set_algo_update_callback(mock_callback)
+
+        message = {
+            "e": "ALGO_UPDATE",
+            "o": {
+                "caid": "tpsl-abc",
+                "aid": 2148719,
+                "o": "STOP_MARKET",
+                "s": "BTCUSDT",
+                "X": "NEW",
+                "tp": "49000.00",
+            },
+        }
+
+        user_streamer._handle_user_data_message(None, message)
+
+        mock_callback.assert_called_once_with(message["o"])
+
     def test_handle_order_trade_update_sl_filled(self, user_streamer):
         """Test handling ORDER_TRADE_UPDATE for SL fill."""
         mock_callback = Mock()
@@ -112,6 +112,62 @@ class TestCandle:
                 is_closed=True,
             )
 
+    def test_from_exchange_materializes_times_lazily(self):
+        """Test trusted constructor keeps epoch ms and converts on access"""
+        candle = Candle.from_exchange(
+            symbol="BTCUSDT",
+            interval="1m",
+            open_time_ms=1638747600000,
+            close_time_ms=1638747659999,
+            open=57000.0,
+            high=57100.0,
+            low=56900.0,
+            close=57050.0,
+            volume=10.5,
+            is_closed=True,
+        )
+
+        assert candle._open_time is None
+        assert candle.open_time == datetime(2021, 12, 5, 23, 40)
+        assert candle.close_time == datetime(2021, 12, 5, 23, 40, 59, 999000)
+        assert candle.open_time_ms == 1638747600000
+        assert candle == Candle(
+            symbol="BTCUSDT",
+            interval="1m",
+            open_time=datetime(2021, 12, 5, 23, 40),
+            open=57000.0,
+            high=57100.0,
+            low=56900.0,
+            close=57050.0,
+            volume=10.5,
+            close_time=datetime(2021, 12, 5, 23, 40, 59, 999000),
+            is_closed=True,
+        )
+
+    def test_from_exchange_skips_validation(self):
+        """Test trusted constructor does not run coherence checks"""
+        candle = Candle.from_exchange("BTCUSDT", "1m", 0, 59999, 2.0, 1.0, 1.0, 2.0, 0.0, False)
+        assert candle.high == 1.0
+
+    def test_time_ms_derived_from_datetime(self):
+        """Test epoch ms are available for datetime-constructed candles"""
+        candle = Candle(
+            symbol="BTCUSDT",
+            interval="5m",
+            open_time=datetime(2025, 1, 1),
+            open=50000.0,
+            high=51000.0,
+            low=49000.0,
+            close=50500.0,
+            volume=10.0,
+            close_time=datetime(2025, 1, 1, 0, 5),
+            is_closed=True,
+        )
+        assert candle.open_time_ms == 1735689600000
+
+        candle.open_time = datetime(2025, 1, 1, 0, 1)
+        assert candle.open_time_ms == 1735689660000
+
 
 class TestSignal:
     """Tests for Signal dataclass"""
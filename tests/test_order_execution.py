@@ -3,6 +3,8 @@ OrderGateway Unit Tests
 """
 
 import logging
+import threading
+import time
 from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch, Mock
 
@@ -10,12 +12,31 @@ import pytest
 from binance.error import ClientError
 
 from src.core.exceptions import OrderExecutionError, OrderRejectedError, ValidationError
-from src.execution.order_gateway import OrderGateway
+from src.execution.order_gateway import CLIENT_ALGO_ID_PREFIX, OrderGateway
 from src.core.binance_service import BinanceServiceClient
 from src.models.order import OrderSide, OrderStatus, OrderType
 from src.models.signal import Signal, SignalType
 
 
+def _algo_orders_by_type(**responses):
+    """new_algo_order side effect answering each order type from its own queue.
+
+    TP and SL are submitted concurrently, so a single side_effect list would
+    hand out responses in whichever order the threads happen to run.
+    """
+    queues = {order_type: list(items) for order_type, items in responses.items()}
+    lock = threading.Lock()
+
+    def new_algo_order(**kwargs):
+        with lock:
+            result = queues[kwargs["type"]].pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    return new_algo_order
+
+
 class TestOrderGateway:
     """OrderGateway Unit Tests"""
 
@@ -1011,32 +1032,36 @@ class TestTPSLPlacement:
         }
 
         # TP/SL orders use new_algo_order (Algo Order API)
-        mock_client.new_algo_order.side_effect = [
-            # TP order (TAKE_PROFIT_MARKET)
-            {
-                "algoId": 123456790,
-                "symbol": "BTCUSDT",
-                "status": "NEW",
-                "type": "TAKE_PROFIT_MARKET",
-                "side": "SELL",
-                "triggerPrice": "52000.00",
-                "updateTime": 1678886401000,
-                "origQty": "0.000",
-                "avgPrice": "0.00",
-            },
-            # SL order (STOP_MARKET)
-            {
-                "algoId": 123456791,
-                "symbol": "BTCUSDT",
-                "status": "NEW",
-                "type": "STOP_MARKET",
-                "side": "SELL",
-                "triggerPrice": "49000.00",
-                "updateTime": 1678886402000,
-                "origQty": "0.000",
-                "avgPrice": "0.00",
-            },
-        ]
+        mock_client.new_algo_order.side_effect = _algo_orders_by_type(
+            TAKE_PROFIT_MARKET=[
+                # TP order (TAKE_PROFIT_MARKET)
+                {
+                    "algoId": 123456790,
+                    "symbol": "BTCUSDT",
+                    "status": "NEW",
+                    "type": "TAKE_PROFIT_MARKET",
+                    "side": "SELL",
+                    "triggerPrice": "52000.00",
+                    "updateTime": 1678886401000,
+                    "origQty": "0.000",
+                    "avgPrice": "0.00",
+                },
+            ],
+            STOP_MARKET=[
+                # SL order (STOP_MARKET)
+                {
+                    "algoId": 123456791,
+                    "symbol": "BTCUSDT",
+                    "status": "NEW",
+                    "type": "STOP_MARKET",
+                    "side": "SELL",
+                    "triggerPrice": "49000.00",
+                    "updateTime": 1678886402000,
+                    "origQty": "0.000",
+                    "avgPrice": "0.00",
+                },
+            ],
+        )
 
         entry_order, tpsl_orders = manager.execute_signal(long_entry_signal, quantity=0.001)
 
@@ -1097,30 +1122,34 @@ class TestTPSLPlacement:
         }
 
         # TP/SL orders use new_algo_order (Algo Order API)
-        mock_client.new_algo_order.side_effect = [
-            {
-                "algoId": 123456801,
-                "symbol": "BTCUSDT",
-                "status": "NEW",
-                "type": "TAKE_PROFIT_MARKET",
-                "side": "BUY",
-                "triggerPrice": "48000.00",
-                "updateTime": 1678886401000,
-                "origQty": "0.000",
-                "avgPrice": "0.00",
-            },
-            {
-                "algoId": 123456802,
-                "symbol": "BTCUSDT",
-                "status": "NEW",
-                "type": "STOP_MARKET",
-                "side": "BUY",
-                "triggerPrice": "51000.00",
-                "updateTime": 1678886402000,
-                "origQty": "0.000",
-                "avgPrice": "0.00",
-            },
-        ]
+        mock_client.new_algo_order.side_effect = _algo_orders_by_type(
+            TAKE_PROFIT_MARKET=[
+                {
+                    "algoId": 123456801,
+                    "symbol": "BTCUSDT",
+                    "status": "NEW",
+                    "type": "TAKE_PROFIT_MARKET",
+                    "side": "BUY",
+                    "triggerPrice": "48000.00",
+                    "updateTime": 1678886401000,
+                    "origQty": "0.000",
+                    "avgPrice": "0.00",
+                },
+            ],
+            STOP_MARKET=[
+                {
+                    "algoId": 123456802,
+                    "symbol": "BTCUSDT",
+                    "status": "NEW",
+                    "type": "STOP_MARKET",
+                    "side": "BUY",
+                    "triggerPrice": "51000.00",
+                    "updateTime": 1678886402000,
+                    "origQty": "0.000",
+                    "avgPrice": "0.00",
+                },
+            ],
+        )
 
         entry_order, tpsl_orders = manager.execute_signal(short_entry_signal, quantity=0.001)
 
@@ -1200,39 +1229,43 @@ class TestTPSLPlacement:
         }
 
         # TP/SL orders use new_algo_order (Algo Order API)
-        mock_client.new_algo_order.side_effect = [
-            # Initial TP fails
-            ClientError(
-                status_code=400,
-                error_code=-2010,
-                error_message="Order would immediately trigger",
-                header={},
-            ),
-            # Initial SL succeeds
-            {
-                "algoId": 123456791,
-                "symbol": "BTCUSDT",
-                "status": "NEW",
-                "type": "STOP_MARKET",
-                "side": "SELL",
-                "triggerPrice": "49000.00",
-                "updateTime": 1678886402000,
-                "origQty": "0.000",
-                "avgPrice": "0.00",
-            },
-            # Retry 1: TP succeeds
-            {
-                "algoId": 123456792,
-                "symbol": "BTCUSDT",
-                "status": "NEW",
-                "type": "TAKE_PROFIT_MARKET",
-                "side": "SELL",
-                "triggerPrice": "55000.00",
-                "updateTime": 1678886403000,
-                "origQty": "0.000",
-                "avgPrice": "0.00",
-            },
-        ]
+        mock_client.new_algo_order.side_effect = _algo_orders_by_type(
+            TAKE_PROFIT_MARKET=[
+                # Initial TP fails
+                ClientError(
+                    status_code=400,
+                    error_code=-2010,
+                    error_message="Order would immediately trigger",
+                    header={},
+                ),
+                # Retry 1: TP succeeds
+                {
+                    "algoId": 123456792,
+                    "symbol": "BTCUSDT",
+                    "status": "NEW",
+                    "type": "TAKE_PROFIT_MARKET",
+                    "side": "SELL",
+                    "triggerPrice": "55000.00",
+                    "updateTime": 1678886403000,
+                    "origQty": "0.000",
+                    "avgPrice": "0.00",
+                },
+            ],
+            STOP_MARKET=[
+                # Initial SL succeeds
+                {
+                    "algoId": 123456791,
+                    "symbol": "BTCUSDT",
+                    "status": "NEW",
+                    "type": "STOP_MARKET",
+                    "side": "SELL",
+                    "triggerPrice": "49000.00",
+                    "updateTime": 1678886402000,
+                    "origQty": "0.000",
+                    "avgPrice": "0.00",
+                },
+            ],
+        )
 
         entry_order, tpsl_orders = manager.execute_signal(long_entry_signal, quantity=0.001)
 
@@ -1270,6 +1303,166 @@ class TestTPSLPlacement:
         assert entry_order.status == OrderStatus.FILLED
         assert len(tpsl_orders) == 0
 
+    # ==================== Concurrent TP/SL Tests ====================
+
+    @staticmethod
+    def _filled_entry():
+        return {
+            "orderId": 123456789,
+            "symbol": "BTCUSDT",
+            "status": "FILLED",
+            "type": "MARKET",
+            "side": "BUY",
+            "avgPrice": "50000.00",
+            "origQty": "0.001",
+            "updateTime": 1678886400000,
+        }
+
+    @staticmethod
+    def _algo_placed(kwargs, algo_id):
+        return {
+            "algoId": algo_id,
+            "symbol": "BTCUSDT",
+            "status": "NEW",
+            "triggerPrice": kwargs["triggerPrice"],
+            "updateTime": 1678886401000,
+        }
+
+    def test_execute_signal_submits_tp_and_sl_concurrently(
+        self, manager, mock_client, mock_binance_service, long_entry_signal
+    ):
+        """TP and SL are both in flight at once, sharing one mark price lookup"""
+        mock_client.new_order.return_value = self._filled_entry()
+        # Breaks (and fails the placement) if the legs are submitted one by one
+        both_in_flight = threading.Barrier(2, timeout=2.0)
+        algo_ids = {"TAKE_PROFIT_MARKET": 901, "STOP_MARKET": 902}
+
+        def new_algo_order(**kwargs):
+            both_in_flight.wait()
+            return self._algo_placed(kwargs, algo_ids[kwargs["type"]])
+
+        mock_client.new_algo_order.side_effect = new_algo_order
+
+        _, tpsl_orders = manager.execute_signal(long_entry_signal, quantity=0.001)
+
+        assert [o.order_type for o in tpsl_orders] == [
+            OrderType.TAKE_PROFIT_MARKET,
+            OrderType.STOP_MARKET,
+        ]
+        assert [o.order_id for o in tpsl_orders] == ["901", "902"]
+        assert mock_client.new_algo_order.call_count == 2
+        mock_binance_service.get_mark_price.assert_called_once_with("BTCUSDT")
+        client_ids = {c.kwargs["clientAlgoId"] for c in mock_client.new_algo_order.call_args_list}
+        assert len(client_ids) == 2
+        assert all(c.startswith(CLIENT_ALGO_ID_PREFIX) for c in client_ids)
+        # Released once placement is done
+        assert manager._tracked_client_ids == set()
+
+    @patch("src.execution.order_gateway.time.sleep", return_value=None)
+    def test_ambiguous_failure_confirmed_by_algo_update(
+        self, mock_sleep, manager, mock_client, long_entry_signal
+    ):
+        """A timed-out SL that did land is adopted from ALGO_UPDATE, not resubmitted"""
+        mock_client.new_order.return_value = self._filled_entry()
+
+        def new_algo_order(**kwargs):
+            if kwargs["type"] == "STOP_MARKET":
+                update = {"caid": kwargs["clientAlgoId"], "aid": 4242, "X": "NEW", "tp": "49000.0"}
+                threading.Timer(0.05, manager.on_algo_update, [update]).start()
+                raise ConnectionError("Read timed out")
+            return self._algo_placed(kwargs, 901)
+
+        mock_client.new_algo_order.side_effect = new_algo_order
+
+        _, tpsl_orders = manager.execute_signal(long_entry_signal, quantity=0.001)
+
+        sl = tpsl_orders[1]
+        assert sl.order_type == OrderType.STOP_MARKET
+        assert sl.order_id == "4242"
+        assert sl.stop_price == 49000.0
+        assert mock_client.new_algo_order.call_count == 2  # No resubmission
+        # The ALGO_UPDATE wait replaced the fixed retry delay
+        assert 0.2 not in [c.args[0] for c in mock_sleep.call_args_list]
+
+    @patch("src.execution.order_gateway.time.sleep", return_value=None)
+    def test_late_order_found_by_client_id_not_resubmitted(
+        self, mock_sleep, manager, mock_client, mock_binance_service, long_entry_signal
+    ):
+        """An SL that landed without an ALGO_UPDATE is found in open algo orders"""
+        manager._confirm_timeout = 0.05
+        mock_client.new_order.return_value = self._filled_entry()
+        landed = []
+
+        def new_algo_order(**kwargs):
+            if kwargs["type"] == "STOP_MARKET":
+                landed.append(
+                    {
+                        "algoId": 4343,
+                        "clientAlgoId": kwargs["clientAlgoId"],
+                        "orderType": "STOP_MARKET",
+                        "triggerPrice": "49000.0",
+                    }
+                )
+                raise ConnectionError("Read timed out")
+            return self._algo_placed(kwargs, 901)
+
+        mock_client.new_algo_order.side_effect = new_algo_order
+        mock_binance_service.query_open_algo_orders = MagicMock(return_value=landed)
+        mock_binance_service.cancel_algo_orders_by_type = MagicMock()
+
+        _, tpsl_orders = manager.execute_signal(long_entry_signal, quantity=0.001)
+
+        sl = tpsl_orders[1]
+        assert sl.order_id == "4343"
+        assert sl.stop_price == 49000.0
+        assert mock_client.new_algo_order.call_count == 2  # No resubmission
+        mock_binance_service.query_open_algo_orders.assert_called_once_with("BTCUSDT")
+        mock_binance_service.cancel_algo_orders_by_type.assert_not_called()
+
+    def test_duplicate_rejection_of_own_client_id_keeps_order(
+        self, manager, mock_client, mock_binance_service, long_entry_signal
+    ):
+        """-4130 on a resubmitted clientAlgoId means our first submission landed"""
+        mock_client.new_algo_order.side_effect = ClientError(
+            status_code=400, error_code=-4130, error_message="closePosition order exists", header={}
+        )
+        mock_binance_service.query_open_algo_orders = MagicMock(
+            return_value=[
+                {
+                    "algoId": 11,
+                    "clientAlgoId": "tpsl-resubmitted",
+                    "orderType": "STOP_MARKET",
+                    "triggerPrice": "49000.0",
+                }
+            ]
+        )
+        mock_binance_service.cancel_algo_orders_by_type = MagicMock()
+
+        order = manager._place_sl_order(
+            long_entry_signal, OrderSide.SELL, client_algo_id="tpsl-resubmitted"
+        )
+
+        assert order.order_id == "11"
+        assert order.order_type == OrderType.STOP_MARKET
+        mock_binance_service.cancel_algo_orders_by_type.assert_not_called()
+
+    def test_duplicate_rejection_cancels_only_same_type(
+        self, manager, mock_client, mock_binance_service, long_entry_signal
+    ):
+        """-4130 on TP clears existing TPs only; the SL may have just been placed"""
+        mock_client.new_algo_order.side_effect = ClientError(
+            status_code=400, error_code=-4130, error_message="closePosition order exists", header={}
+        )
+        mock_binance_service.cancel_algo_orders_by_type = MagicMock(return_value=[{"algoId": 11}])
+        mock_binance_service.cancel_all_algo_orders = MagicMock()
+
+        assert manager._place_tp_order(long_entry_signal, OrderSide.SELL) is None
+
+        mock_binance_service.cancel_algo_orders_by_type.assert_called_once_with(
+            "BTCUSDT", ["TAKE_PROFIT_MARKET", "TAKE_PROFIT"]
+        )
+        mock_binance_service.cancel_all_algo_orders.assert_not_called()
+
 
 class TestQueryMethods:
     """Test suite for position and account query methods."""
@@ -1790,6 +1983,48 @@ class TestQueryMethods:
         # get_orders called multiple times: initial check + verification
         assert mock_client.get_orders.call_count >= 2
 
+    @pytest.mark.asyncio
+    async def test_get_all_positions_audited(self, manager, mock_client, mock_position_long):
+        """Regular query is logged at INFO and audited"""
+        mock_client.get_position_risk.return_value = mock_position_long
+
+        positions = await manager.get_all_positions(["BTCUSDT"])
+
+        assert [p["symbol"] for p in positions] == ["BTCUSDT"]
+        manager.audit_logger.log_event.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_get_all_positions_quiet(self, manager, mock_client, mock_position_long, caplog):
+        """Quiet (reconciliation) query skips the audit record and INFO logs"""
+        mock_client.get_position_risk.return_value = mock_position_long
+
+        with caplog.at_level(logging.INFO, logger="src.execution.order_gateway"):
+            positions = await manager.get_all_positions(["BTCUSDT"], quiet=True)
+
+        assert [p["symbol"] for p in positions] == ["BTCUSDT"]
+        manager.audit_logger.log_event.assert_not_called()
+        assert not [r for r in caplog.records if r.levelno >= logging.INFO]
+
+    def test_get_all_positions_sync_matches_async(self, manager, mock_client, mock_position_long):
+        """Blocking variant issues the same single positionRisk query"""
+        mock_client.get_position_risk.return_value = mock_position_long
+
+        positions = manager.get_all_positions_sync(["BTCUSDT"], quiet=True)
+
+        assert [p["symbol"] for p in positions] == ["BTCUSDT"]
+        mock_client.get_position_risk.assert_called_once_with()
+        manager.audit_logger.log_event.assert_not_called()
+
+    def test_get_all_positions_sync_api_error(self, manager, mock_client):
+        """API errors are audited and raised as OrderExecutionError"""
+        mock_client.get_position_risk.side_effect = ClientError(
+            status_code=400, error_code=-1000, error_message="Unknown error", header={}
+        )
+
+        with pytest.raises(OrderExecutionError, match="Position query failed"):
+            manager.get_all_positions_sync(["BTCUSDT"])
+        manager.audit_logger.log_event.assert_called_once()
+
 
 # ==================== Price Formatting Tests (Task 6.5) ====================
 
@@ -1933,25 +2168,21 @@ class TestPriceFormatting:
 
     def test_cache_expires_after_24_hours(self, manager):
         """Cache expires after 24 hours"""
-        from datetime import datetime, timedelta
-
         # Set cache timestamp to 25 hours ago
-        manager._cache_timestamp = datetime.now() - timedelta(hours=25)
+        manager.exchange_info.updated_at = time.time() - 25 * 3600
 
         assert manager._is_cache_expired() is True
 
     def test_cache_valid_within_24_hours(self, manager):
         """Cache is valid within 24 hours"""
-        from datetime import datetime, timedelta
-
         # Set cache timestamp to 23 hours ago
-        manager._cache_timestamp = datetime.now() - timedelta(hours=23)
+        manager.exchange_info.updated_at = time.time() - 23 * 3600
 
         assert manager._is_cache_expired() is False
 
     def test_cache_expired_when_never_set(self, manager):
         """Cache is expired when never set (None)"""
-        assert manager._cache_timestamp is None
+        assert manager.exchange_info.updated_at is None
         assert manager._is_cache_expired() is True
 
     # ========== _refresh_exchange_info() Tests ==========
@@ -1963,21 +2194,21 @@ class TestPriceFormatting:
         manager._refresh_exchange_info()
 
         # Verify all symbols cached
-        assert "BTCUSDT" in manager._exchange_info_cache
-        assert "BNBUSDT" in manager._exchange_info_cache
-        assert "ETHUSDT" in manager._exchange_info_cache
-        assert "DOGEUSDT" in manager._exchange_info_cache
-        assert "1000PEPEUSDT" in manager._exchange_info_cache
+        assert "BTCUSDT" in manager.exchange_info.filters
+        assert "BNBUSDT" in manager.exchange_info.filters
+        assert "ETHUSDT" in manager.exchange_info.filters
+        assert "DOGEUSDT" in manager.exchange_info.filters
+        assert "1000PEPEUSDT" in manager.exchange_info.filters
 
         # Verify tick sizes
-        assert manager._exchange_info_cache["BTCUSDT"]["tickSize"] == 0.01
-        assert manager._exchange_info_cache["BNBUSDT"]["tickSize"] == 0.001
-        assert manager._exchange_info_cache["ETHUSDT"]["tickSize"] == 0.1
-        assert manager._exchange_info_cache["DOGEUSDT"]["tickSize"] == 0.0001
-        assert manager._exchange_info_cache["1000PEPEUSDT"]["tickSize"] == 0.00001
+        assert manager.exchange_info.filters["BTCUSDT"]["tickSize"] == 0.01
+        assert manager.exchange_info.filters["BNBUSDT"]["tickSize"] == 0.001
+        assert manager.exchange_info.filters["ETHUSDT"]["tickSize"] == 0.1
+        assert manager.exchange_info.filters["DOGEUSDT"]["tickSize"] == 0.0001
+        assert manager.exchange_info.filters["1000PEPEUSDT"]["tickSize"] == 0.00001
 
         # Verify cache timestamp set
-        assert manager._cache_timestamp is not None
+        assert manager.exchange_info.updated_at is not None
 
     def test_refresh_exchange_info_api_error(self, manager, mock_client):
         """Exchange info fetch API error raises OrderExecutionError"""
@@ -2034,12 +2265,10 @@ class TestPriceFormatting:
 
     def test_get_tick_size_expired_cache_refreshes(self, manager, mock_client, mock_exchange_info):
         """Expired cache triggers refresh before retrieval"""
-        from datetime import datetime, timedelta
-
         # Pre-populate cache with expired timestamp
         mock_client.exchange_info.return_value = mock_exchange_info
         manager._refresh_exchange_info()
-        manager._cache_timestamp = datetime.now() - timedelta(hours=25)  # Expire cache
+        manager.exchange_info.updated_at = time.time() - 25 * 3600  # Expire cache
 
         # Reset mock to count refresh calls
         mock_client.reset_mock()
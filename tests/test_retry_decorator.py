@@ -2,12 +2,12 @@
 Unit tests for retry_with_backoff decorator (Task 6.6).
 """
 
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from binance.error import ClientError, ServerError
 
-from src.core.retry import retry_with_backoff
+from src.core.retry import async_retry_with_backoff, retry_with_backoff
 
 
 class TestRetryDecorator:
@@ -190,3 +190,77 @@ class TestRetryDecorator:
 
         assert my_api_call.__name__ == "my_api_call"
         assert "Place an order" in my_api_call.__doc__
+
+
+class TestAsyncRetryDecorator:
+    """Test suite for async_retry_with_backoff."""
+
+    @pytest.mark.asyncio
+    async def test_retry_on_server_error_with_async_sleep(self):
+        """Backoff awaits asyncio.sleep instead of blocking in time.sleep."""
+        mock_func = AsyncMock(
+            side_effect=[
+                ServerError(status_code=503, message="Service unavailable"),
+                ServerError(status_code=500, message="Internal error"),
+                {"orderId": 42},
+            ]
+        )
+
+        @async_retry_with_backoff(max_retries=3, initial_delay=1.0, backoff_factor=2.0)
+        async def api_call():
+            return await mock_func()
+
+        with patch("src.core.retry.asyncio.sleep", new=AsyncMock()) as mock_sleep, patch(
+            "time.sleep"
+        ) as mock_time_sleep:
+            result = await api_call()
+
+        assert result == {"orderId": 42}
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [1.0, 2.0]
+        mock_time_sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_no_retry_on_fatal_client_error(self):
+        """Fatal client errors propagate on the first attempt."""
+        mock_func = AsyncMock(
+            side_effect=ClientError(
+                status_code=400,
+                error_code=-1121,
+                error_message="Invalid symbol",
+                header={},
+            )
+        )
+
+        @async_retry_with_backoff(max_retries=3, initial_delay=0.01)
+        async def api_call():
+            return await mock_func()
+
+        with pytest.raises(ClientError):
+            await api_call()
+
+        assert mock_func.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_max_retries_exhausted(self):
+        """The last error is re-raised once retries are used up."""
+        mock_func = AsyncMock(side_effect=ServerError(status_code=500, message="Persistent"))
+
+        @async_retry_with_backoff(max_retries=2, initial_delay=0.001)
+        async def api_call():
+            return await mock_func()
+
+        with pytest.raises(ServerError):
+            await api_call()
+
+        assert mock_func.call_count == 3
+
+    def test_decorator_preserves_function_metadata(self):
+        """Test that decorator preserves original coroutine function metadata."""
+
+        @async_retry_with_backoff(max_retries=2)
+        async def my_api_call(symbol: str):
+            """Query an order."""
+            return {"symbol": symbol}
+
+        assert my_api_call.__name__ == "my_api_call"
+        assert "Query an order" in my_api_call.__doc__